@@ -0,0 +1,9 @@
+"""
+Python host tests: make the simulator core (ui-simulator/lps_core) importable
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "ui-simulator"))
@@ -0,0 +1,149 @@
+"""
+Python host tests: reused buffers and per-section allocation tracking (lps_core)
+
+Run:        python -m pytest tests
+
+- AllocationTracker reports what a section allocates, keeps, and counts, nested or not
+- TrendStore.window reduces columns like a NaN-aware reference and allocates ~nothing once warm
+- Scope and spectrum traces reuse their point lists; scratch buffers stay out of snapshots
+"""
+
+import tracemalloc
+import warnings
+
+import numpy as np
+import pytest
+
+from lps_core import AllocationTracker, BufferPool, DataSimulator, TrendStore
+
+FRAME_S = 1 / 30
+
+
+@pytest.fixture
+def tracing():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+# =============================================================================
+# ALLOCATION TRACKER
+# =============================================================================
+
+def test_tracker_sections(tracing):
+    calls = []
+    tracker = AllocationTracker({"calls": lambda: len(calls)})
+    kept = []
+    for _ in range(3):
+        tracker.begin("outer")
+        tracker.begin("temporary")
+        scratch = bytearray(200_000)
+        del scratch
+        calls.append(1)
+        tracker.end("temporary")
+        tracker.begin("kept")
+        kept.append(bytearray(50_000))
+        tracker.end("kept")
+        tracker.begin("noop")
+        tracker.end("noop")
+        tracker.end("outer")
+        tracker.end_frame()
+
+    report = tracker.report()
+    assert tracker.frames == 3 and report["noop"]["frames"] == 3
+    assert report["temporary"]["allocated"] >= 200_000
+    assert report["temporary"]["retained"] < 1_000
+    assert report["temporary"]["calls"] == 1
+    assert report["kept"]["retained"] >= 50_000
+    assert report["noop"]["allocated"] < 1_000 and report["noop"]["calls"] == 0
+    # The enclosing section sees the peak of its inner sections
+    assert report["outer"]["allocated"] >= 200_000
+    assert report["outer"]["retained"] >= 50_000
+
+
+def test_buffer_pool_grows_only():
+    pool = BufferPool()
+    a = pool.get("x", (100, 3))
+    b = pool.get("x", (40, 3))
+    assert pool.allocations == 1 and b.base is a.base and b.shape == (40, 3)
+    pool.get("x", (40, 4))
+    pool.get("x", (40, 4), np.intp)
+    assert pool.allocations == 3
+
+
+# =============================================================================
+# TREND WINDOWS
+# =============================================================================
+
+def filled_store(seconds=3 * 3600):
+    rng = np.random.default_rng(4)
+    store = TrendStore(2)
+    for t in np.arange(0.0, seconds, 0.5):
+        if 1800 <= t < 2400:
+            continue                  # Gap: NaN buckets inside the window
+        store.add(float(t), rng.random(8))
+    return store
+
+
+def test_window_columns_match_nan_reference():
+    store = filled_store()
+    end = store.t_last
+    for span in (60.0, 1000.0, 3600.0, 3 * 3600.0):
+        level = store.level_for(end - span, end)
+        buckets = [array.copy() for array in store.window(end - span, end, 10_000)]
+        n = len(buckets[0])
+        for columns in (7, 100, 700):
+            times, mins, maxs, means = store.window(end - span, end, columns)
+            if n <= columns:
+                for got, expected in zip((times, mins, maxs, means), buckets):
+                    np.testing.assert_array_equal(got, expected)
+                continue
+            edges = [c * n // columns for c in range(columns)] + [n]
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)    # All-NaN columns (gap)
+                for c in range(columns):
+                    part = slice(edges[c], edges[c + 1])
+                    np.testing.assert_array_equal(mins[c], np.nanmin(buckets[1][part], axis=0))
+                    np.testing.assert_array_equal(maxs[c], np.nanmax(buckets[2][part], axis=0))
+                    np.testing.assert_allclose(means[c], np.nanmean(buckets[3][part], axis=0),
+                                               rtol=1e-12)
+            assert times[0] == pytest.approx(buckets[0][0] + (0.5 * n / columns - 0.5) * level.period)
+
+
+def test_window_steady_state_allocates_nothing(tracing):
+    store = filled_store()
+    end = store.t_last
+    spans = (60.0, 600.0, 3600.0, 3 * 3600.0)
+    for span in spans:
+        store.window(end - span, end, 700)
+    allocations = store.buffers.allocations
+    for span in spans:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        store.window(end - span, end, 700)
+        current, peak = tracemalloc.get_traced_memory()
+        assert peak - before < 16_000 and current - before < 1_000
+    assert store.buffers.allocations == allocations
+
+
+# =============================================================================
+# SIMULATOR TRACES
+# =============================================================================
+
+def test_traces_reuse_point_lists_outside_snapshots():
+    sim = DataSimulator(seed=3)
+    sim.update(FRAME_S)
+    scope = sim.get_oscilloscope_points("A", 300, 60, 20, 100)
+    spectrum = sim.get_spectrum_points("B", 300, 60, 20, 100)
+    first = [list(point) for point in scope]
+    for _ in range(4):                # Next synthesized block (0.1 s)
+        sim.update(FRAME_S)
+    assert sim.get_oscilloscope_points("A", 300, 60, 20, 100) is scope
+    assert sim.get_spectrum_points("B", 300, 60, 20, 100) is spectrum
+    assert [x for x, _ in scope] == list(range(20, 320))
+    assert all(100 <= y <= 160 for _, y in scope) and scope != first
+
+    fork = DataSimulator.from_snapshot(sim.snapshot())
+    assert fork.buffers.nbytes == 0 and fork.history.buffers.nbytes == 0
+    fork.update(FRAME_S)
+    assert len(fork.get_oscilloscope_points("A", 300, 60, 20, 100)) == 300
@@ -0,0 +1,121 @@
+"""
+Python host tests: streaming anomaly detection (lps_core)
+
+Run:        python -m pytest tests
+
+- A NORMAL session, cold start and time-scale changes included, raises nothing
+- Injected faults are flagged on the right rail and metric before the protection trips
+- The detector is vectorized: per-lane state is fixed-size and lanes are independent
+"""
+
+import numpy as np
+import pytest
+
+from lps_core import AnomalyDetector, DataSimulator, SimulationMode
+
+FRAME_S = 1 / 30
+
+
+@pytest.fixture(scope="module")
+def settled():
+    """Snapshot of a simulator at thermal equilibrium (5 h simulated in 1 s steps)"""
+    sim = DataSimulator(seed=3)
+    sim.time_scale = 600.0
+    for _ in range(30):
+        sim.update(1.0)
+    return sim.snapshot()
+
+
+def relearned(blob, time_scale):
+    """Fork of the settled state, run at the new time scale until the detector is warm again"""
+    sim = DataSimulator.from_snapshot(blob)
+    sim.time_scale = time_scale
+    while not sim.anomaly.warm.all():
+        sim.update(FRAME_S)
+    for _ in range(100):
+        sim.update(FRAME_S)
+        assert sim.anomalies() == []
+    return sim
+
+
+def first_warning_and_trip(sim, mode, rail, frames):
+    """Frames of the first early warning and of the first fault after injection"""
+    sim.set_simulation_mode(mode, rail)
+    warning = trip = None
+    for frame in range(frames):
+        sim.update(FRAME_S)
+        if warning is None and sim.anomalies():
+            warning = (frame, sim.anomalies())
+        if sim.get_all_problems():
+            trip = frame
+            break
+    return warning, trip
+
+
+# =============================================================================
+# SIMULATOR INTEGRATION
+# =============================================================================
+
+def test_normal_session_is_quiet():
+    sim = DataSimulator(seed=11)
+    for time_scale, frames in ((1.0, 2400), (60.0, 200), (600.0, 150), (1.0, 2400)):
+        sim.time_scale = time_scale
+        for _ in range(frames):
+            sim.update(FRAME_S)
+            assert sim.anomalies() == []
+    assert sim.anomaly.warm.all()
+
+
+def test_overheating_warned_long_before_otp(settled):
+    warning, trip = first_warning_and_trip(relearned(settled, 600.0), SimulationMode.HOT, "A", 1000)
+    assert trip is not None and warning is not None
+    frame, anomalies = warning
+    assert ("A", "temperature") in [(rail, metric) for rail, metric, _ in anomalies]
+    assert all(deviation > 0 for _, metric, deviation in anomalies if metric == "temperature")
+    assert frame < trip // 10
+
+
+def test_overload_warned_before_ocp(settled):
+    warning, trip = first_warning_and_trip(relearned(settled, 1.0), SimulationMode.LOAD, "B", 300)
+    assert trip is not None and warning is not None
+    assert warning[0] < trip
+    assert {(rail, metric) for rail, metric, _ in warning[1]} == {("B", "current")}
+
+
+def test_tripped_rail_relearns_after_rearm(settled):
+    sim = relearned(settled, 1.0)
+    sim.set_simulation_mode(SimulationMode.HIGH_V, "A")
+    for _ in range(30):
+        sim.update(FRAME_S)
+    assert not sim.data.rail_a.enabled
+    sim.set_simulation_mode(SimulationMode.NORMAL, "A")
+    assert not sim.anomaly.warm[0] and sim.anomaly.warm[1]
+    for _ in range(2000):
+        sim.update(FRAME_S)
+        assert sim.anomalies() == []
+    assert sim.anomaly.warm.all()
+
+
+# =============================================================================
+# VECTORIZED DETECTOR
+# =============================================================================
+
+def test_lanes_are_independent_and_state_is_fixed_size():
+    rng = np.random.default_rng(0)
+    n_rails, floors = 500, (0.005, 2.0, 0.2, 0.5)
+    detector = AnomalyDetector(n_rails, floors)
+    base = np.array([12.0, 150.0, 40.0, 5.0])
+    noise = np.array(floors)
+    state = {name: value.nbytes for name, value in vars(detector).items()
+             if isinstance(value, np.ndarray)}
+    for step in range(400):
+        x = base + rng.standard_normal((n_rails, 4)) * noise
+        if step >= 250:
+            x[123, 2] += 0.02 * (step - 250)   # 0.1 σ/sample drift on one lane
+        detector.update(x, 1.0)
+        if step < 250:
+            assert not detector.alarm.any()
+    assert detector.alarm[123, 2] and detector.alarm.sum() == 1
+    assert detector.ewma[123, 2] > 0
+    assert {name: value.nbytes for name, value in vars(detector).items()
+            if isinstance(value, np.ndarray)} == state
@@ -0,0 +1,180 @@
+"""
+Python host tests: firmware protection loop co-simulation (lps_core)
+
+Run:        python -m pytest tests
+
+- run() with fast-forward ends in the same state as stepping every loop() iteration
+- OVP, OVP PRE, OCP and OTP trip after their .ino confirmation delay, not before
+- getActiveFaultType() priority and OTP re-arming below TEMP_RESET
+"""
+
+import random
+
+import pytest
+
+from lps_core.controller import (
+    FirmwareController, FIRMWARE_LOOP_MS,
+    FAULT_OVP, FAULT_OCP, FAULT_OTP, FAULT_BACKFEED, FAULT_OVP_PRE, FAULT_NONE,
+)
+from lps_core.firmware import (
+    V_OUT_MAX, V_PRE_MAX, I_MAX_HIGH_V, BACKFEED_THRESHOLD,
+    TEMP_SHUTDOWN, TEMP_RESET, TEMP_WARNING, OCP_DELAY_MS, OVP_DELAY_MS,
+)
+
+NOMINAL = dict(v_out=(12.0, 12.0), v_pre=(14.0, 14.0), current_ma=(200.0, 200.0),
+               temp_radiator=40.0)
+
+
+def state(ctrl):
+    return {name: getattr(ctrl, name) for name in FirmwareController.__slots__}
+
+
+def settled():
+    ctrl = FirmwareController()
+    ctrl.measure(**NOMINAL)
+    ctrl.run(0.1)
+    return ctrl
+
+
+# =============================================================================
+# FAST-FORWARD VS STEPPED LOOP
+# =============================================================================
+
+@pytest.mark.parametrize("seed", range(8))
+def test_fast_forward_matches_every_iteration(seed):
+    rng = random.Random(seed)
+    fast, slow = FirmwareController(), FirmwareController()
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.04:
+            name = rng.choice(("retry", "enter_purist", "exit_purist"))
+            getattr(fast, name)()
+            getattr(slow, name)()
+        elif action < 0.06:
+            rail = rng.randrange(2)
+            fast.reset_rail(rail)
+            slow.reset_rail(rail)
+        else:
+            # Values straddling every threshold, including the OTP hysteresis band
+            sample = dict(
+                v_out=[rng.choice((12.0, V_OUT_MAX + rng.uniform(-0.3, 0.5))) for _ in range(2)],
+                v_pre=[rng.choice((14.0, V_PRE_MAX + rng.uniform(-0.3, 0.5))) for _ in range(2)],
+                current_ma=[rng.choice((200.0, I_MAX_HIGH_V + 20.0, BACKFEED_THRESHOLD - 5.0))
+                            if rng.random() < 0.3 else rng.uniform(0.0, 450.0) for _ in range(2)],
+                temp_radiator=rng.choice((40.0, TEMP_RESET - 1.0, TEMP_WARNING + 5.0,
+                                          TEMP_SHUTDOWN + 1.0)),
+            )
+            fast.measure(**sample)
+            slow.measure(**sample)
+        duration = rng.choice((0.001, 0.004, 0.02, 0.06, 0.25, 1.0))
+        fast.run(duration, True)
+        slow.run(duration, False)
+        assert state(fast) == state(slow)
+    assert sum(slow.trips) > 0 and slow.loops == fast.loops
+
+
+# =============================================================================
+# TRIP DELAYS
+# =============================================================================
+
+def trip_time_ms(ctrl, **overrides):
+    """millis between the first iteration that sees the fault and the trip"""
+    ctrl.measure(**{**NOMINAL, **overrides})
+    first = ctrl.millis + ctrl.period_ms
+    before = sum(ctrl.trips)
+    while sum(ctrl.trips) == before:
+        ctrl.step()
+        assert ctrl.millis - first < 1000
+    return ctrl.millis - first
+
+
+@pytest.mark.parametrize("overrides, fault, delay_ms", [
+    (dict(v_out=(V_OUT_MAX + 0.5, 12.0)), FAULT_OVP, OVP_DELAY_MS),
+    (dict(v_pre=(14.0, V_PRE_MAX + 0.5)), FAULT_OVP_PRE, OVP_DELAY_MS),
+    (dict(current_ma=(I_MAX_HIGH_V + 10.0, 200.0)), FAULT_OCP, OCP_DELAY_MS),
+    (dict(temp_radiator=TEMP_SHUTDOWN + 1.0), FAULT_OTP, OVP_DELAY_MS),
+])
+def test_trip_after_confirmation_delay(overrides, fault, delay_ms):
+    ctrl = settled()
+    elapsed = trip_time_ms(ctrl, **overrides)
+    # checkProtections() compares `millis() - start > DELAY` once per loop
+    assert delay_ms < elapsed <= delay_ms + FIRMWARE_LOOP_MS
+    assert ctrl.trips[fault] == 1 and sum(ctrl.trips) == 1
+    # The latched fault disarms its timer on the next pass
+    ctrl.step()
+    assert not ctrl.armed and ctrl.trips[fault] == 1
+
+
+@pytest.mark.parametrize("overrides", [
+    dict(v_out=(V_OUT_MAX + 0.5, 12.0)),
+    dict(current_ma=(I_MAX_HIGH_V + 10.0, 200.0)),
+    dict(temp_radiator=TEMP_SHUTDOWN + 1.0),
+])
+def test_glitch_shorter_than_delay_disarms(overrides):
+    ctrl = settled()
+    ctrl.measure(**{**NOMINAL, **overrides})
+    ctrl.run((OVP_DELAY_MS - 2 * FIRMWARE_LOOP_MS) / 1000.0, False)
+    assert ctrl.armed
+    ctrl.measure(**NOMINAL)
+    ctrl.run(0.5, False)
+    assert not ctrl.armed and sum(ctrl.trips) == 0 and all(ctrl.output_enabled)
+
+
+def test_backfeed_and_thresholds():
+    ctrl = settled()
+    # Exactly at the limits: `>` comparisons, nothing arms
+    ctrl.measure(**{**NOMINAL, "current_ma": (I_MAX_HIGH_V, BACKFEED_THRESHOLD)})
+    ctrl.run(1.0, False)
+    assert sum(ctrl.trips) == 0 and not ctrl.armed
+    # Backfeed latches on the first iteration
+    ctrl.measure(**{**NOMINAL, "current_ma": (200.0, BACKFEED_THRESHOLD - 1.0)})
+    ctrl.step()
+    assert ctrl.backfeed == [False, True] and ctrl.output_enabled == [True, False]
+
+
+# =============================================================================
+# FAULT PRIORITY AND OTP RE-ARM
+# =============================================================================
+
+def test_active_fault_priority():
+    ctrl = FirmwareController()
+    order = [("ovp", FAULT_OVP), ("ocp", FAULT_OCP), ("ovp_pre", FAULT_OVP_PRE),
+             ("backfeed", FAULT_BACKFEED)]
+    assert ctrl.active_fault_type(0) == FAULT_NONE
+    ctrl.otp = True
+    assert ctrl.active_fault_type(0) == FAULT_OTP
+    for name, _ in reversed(order):
+        getattr(ctrl, name)[0] = True
+        assert ctrl.active_fault_type(0) == dict(order)[name]
+    # Highest first: clearing each flag reveals the next one
+    for i, (name, _) in enumerate(order):
+        assert ctrl.active_fault_type(0) == order[i][1]
+        getattr(ctrl, name)[0] = False
+    assert ctrl.active_fault_type(0) == FAULT_OTP
+    assert ctrl.active_fault_type(1) == FAULT_OTP
+
+
+def test_otp_rearms_below_reset():
+    ctrl = settled()
+    trip_time_ms(ctrl, temp_radiator=TEMP_SHUTDOWN + 1.0)
+    assert ctrl.otp and ctrl.output_enabled == [False, False]
+    # Hysteresis band: still latched
+    ctrl.measure(**{**NOMINAL, "temp_radiator": TEMP_RESET + 1.0})
+    ctrl.run(1.0, False)
+    assert ctrl.otp and ctrl.otp_resets == 0
+    assert ctrl.active_fault_type(0) == FAULT_OTP
+    ctrl.measure(**{**NOMINAL, "temp_radiator": TEMP_RESET - 1.0})
+    ctrl.step()
+    assert not ctrl.otp and ctrl.otp_resets == 1
+    assert ctrl.output_enabled == [True, True]
+    assert ctrl.active_fault_type(0) == FAULT_NONE
+
+
+def test_otp_rearm_keeps_latched_rail_off():
+    ctrl = settled()
+    trip_time_ms(ctrl, v_out=(V_OUT_MAX + 0.5, 12.0))
+    trip_time_ms(ctrl, temp_radiator=TEMP_SHUTDOWN + 1.0)
+    ctrl.measure(**{**NOMINAL, "temp_radiator": TEMP_RESET - 1.0})
+    ctrl.step()
+    assert not ctrl.otp and ctrl.output_enabled == [False, True]
+    assert ctrl.active_fault_type(0) == FAULT_OVP
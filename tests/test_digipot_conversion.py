@@ -0,0 +1,232 @@
+"""
+=============================================================================
+   HOST TEST (Python) - DIGIPOT <-> VOLTAGE CONVERSIONS
+   LPS Audiophile V2.4.5 / UI simulator lps_core
+=============================================================================
+
+Run:        python -m pytest tests
+
+Python counterpart of test_digipot_conversion.cpp, as vectorized sweeps:
+- All 256 digipot positions and a dense voltage grid (3-20 V)
+- Scalar and vectorized implementations agree exactly
+- Range, monotonicity, reversibility and nearest-step properties
+- Differential check against the firmware's 32-bit float arithmetic
+- Differential check against the C++ results (Result_digipot_conversion.cpp)
+"""
+
+import os
+import re
+
+import numpy as np
+import pytest
+
+from lps_core.firmware import (
+    DIGIPOT_STEPS, R_DIGIPOT_FULL, R_FIXED_FB, R_SHUNT_FB, R1_FB, V_REF_LM317,
+    V_HEADROOM, V_OUT_MIN, V_OUT_MAX_SET, V_DIV_RATIO, V_REF, ADC_RESOLUTION,
+    adc_voltage, digipot_to_voltage, digipot_voltages, get_adaptive_current_limit,
+    voltage_to_digipot, voltages_to_digipot,
+)
+
+RESULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "Result_digipot_conversion.cpp")
+
+POSITIONS = np.arange(DIGIPOT_STEPS + 1)
+VOLTAGES = digipot_voltages(POSITIONS)
+GRID = np.linspace(3.0, 20.0, 170_001)           # 0.1 mV pitch, beyond both clamps
+GRID_POSITIONS = voltages_to_digipot(GRID)
+# Positions below the R_SHUNT // R_digipot saturation (15 V reached at pos 129-130)
+USEFUL = VOLTAGES < V_OUT_MAX_SET
+
+
+# =============================================================================
+# FIRMWARE ARITHMETIC (AVR float = 32 bits)
+# =============================================================================
+
+def firmware_voltages_f32(positions: np.ndarray) -> np.ndarray:
+    """digipotToVoltage() evaluated in float32, operation by operation"""
+    f = np.float32
+    r_wiper = positions.astype(f) * (f(R_DIGIPOT_FULL) / f(DIGIPOT_STEPS))
+    r_eff = (r_wiper * f(R_SHUNT_FB)) / (r_wiper + f(R_SHUNT_FB))
+    r2 = f(R_FIXED_FB) + r_eff
+    v_pre = f(V_REF_LM317) * (f(1.0) + r2 / f(R1_FB))
+    return np.clip(v_pre - f(V_HEADROOM), f(V_OUT_MIN), f(V_OUT_MAX_SET))
+
+
+def firmware_positions_f32(voltages: np.ndarray) -> np.ndarray:
+    """voltageToDigipot() evaluated in float32, operation by operation"""
+    f = np.float32
+    v_out = np.clip(voltages.astype(f), f(V_OUT_MIN), f(V_OUT_MAX_SET))
+    r2 = ((v_out + f(V_HEADROOM)) / f(V_REF_LM317) - f(1.0)) * f(R1_FB)
+    r_eff = r2 - f(R_FIXED_FB)
+    r_wiper = (r_eff * f(R_SHUNT_FB)) / (f(R_SHUNT_FB) - r_eff)
+    pos = np.floor(r_wiper / (f(R_DIGIPOT_FULL) / f(DIGIPOT_STEPS)) + f(0.5))
+    return np.where(r_eff <= 0, 0, np.clip(pos, 0, DIGIPOT_STEPS)).astype(int)
+
+
+# =============================================================================
+# SCALAR vs VECTORIZED
+# =============================================================================
+
+def test_vectorized_voltages_match_scalar():
+    scalar = np.array([digipot_to_voltage(int(pos)) for pos in POSITIONS])
+    np.testing.assert_array_equal(VOLTAGES, scalar)
+
+
+def test_vectorized_positions_match_scalar():
+    sample = GRID[::17]
+    scalar = np.array([voltage_to_digipot(float(v)) for v in sample])
+    np.testing.assert_array_equal(GRID_POSITIONS[::17], scalar)
+
+
+# =============================================================================
+# PROPERTIES
+# =============================================================================
+
+def test_range():
+    assert VOLTAGES.min() == V_OUT_MIN
+    assert VOLTAGES.max() == V_OUT_MAX_SET
+    assert GRID_POSITIONS.min() == 0
+    assert GRID_POSITIONS.max() <= DIGIPOT_STEPS
+
+
+def test_clamping():
+    assert digipot_to_voltage(0) == V_OUT_MIN          # 4.98 V before the clamp
+    assert voltage_to_digipot(4.0) == 0
+    assert voltage_to_digipot(-1.0) == 0
+    assert voltage_to_digipot(20.0) == voltage_to_digipot(V_OUT_MAX_SET)
+    below = GRID < V_OUT_MIN
+    above = GRID > V_OUT_MAX_SET
+    assert (GRID_POSITIONS[below] == voltage_to_digipot(V_OUT_MIN)).all()
+    assert (GRID_POSITIONS[above] == voltage_to_digipot(V_OUT_MAX_SET)).all()
+
+
+def test_monotonicity():
+    assert (np.diff(VOLTAGES) >= 0).all()
+    # Strictly increasing until saturation: every useful step is distinct
+    assert (np.diff(VOLTAGES[USEFUL]) > 0).all()
+    assert (np.diff(GRID_POSITIONS) >= 0).all()
+
+
+def test_saturation_zone():
+    assert USEFUL.sum() == 130                          # pos 0-129
+    assert (VOLTAGES[~USEFUL] == V_OUT_MAX_SET).all()
+
+
+def test_reversibility_positions():
+    """Every useful position survives position -> voltage -> position exactly"""
+    np.testing.assert_array_equal(voltages_to_digipot(VOLTAGES[USEFUL]), POSITIONS[USEFUL])
+
+
+def test_reversibility_grid():
+    """voltage -> position -> voltage -> position is idempotent"""
+    snapped = digipot_voltages(GRID_POSITIONS)
+    np.testing.assert_array_equal(voltages_to_digipot(snapped), GRID_POSITIONS)
+
+
+def test_nearest_step():
+    """The chosen position brackets the target between its two neighbours"""
+    inside = (GRID >= V_OUT_MIN) & (GRID <= V_OUT_MAX_SET)
+    pos = GRID_POSITIONS[inside]
+    lower = digipot_voltages(np.maximum(pos - 1, 0))
+    upper = digipot_voltages(np.minimum(pos + 1, DIGIPOT_STEPS))
+    assert ((GRID[inside] >= lower) & (GRID[inside] <= upper)).all()
+
+
+def test_resolution():
+    steps_mv = np.diff(VOLTAGES[USEFUL]) * 1000.0
+    # Average over the full travel as in the C++ test, actual steps are very uneven
+    assert (VOLTAGES[-1] - VOLTAGES[0]) / DIGIPOT_STEPS * 1000.0 == pytest.approx(39.2, abs=0.05)
+    assert steps_mv.max() > 100.0 * steps_mv.min()
+
+
+# =============================================================================
+# DIFFERENTIAL: FIRMWARE FLOAT32
+# =============================================================================
+
+def test_float32_voltages():
+    np.testing.assert_allclose(firmware_voltages_f32(POSITIONS), VOLTAGES, rtol=0, atol=1e-5)
+
+
+def test_float32_positions():
+    """Double and float32 only disagree on rounding ties, by a single step"""
+    firmware = firmware_positions_f32(GRID)
+    diff = np.abs(firmware - GRID_POSITIONS)
+    assert diff.max() <= 1
+    assert np.count_nonzero(diff) <= len(GRID) * 1e-4
+    # No tie on the positions themselves: the UI and the firmware agree
+    np.testing.assert_array_equal(firmware_positions_f32(firmware_voltages_f32(POSITIONS[USEFUL])),
+                                  POSITIONS[USEFUL])
+
+
+# =============================================================================
+# DIFFERENTIAL: C++ RESULTS
+# =============================================================================
+
+def _cpp_results() -> str:
+    with open(RESULTS_FILE, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_cpp_run_passed():
+    match = re.search(r"RESULTS: (\d+) PASS, (\d+) FAIL", _cpp_results())
+    assert match is not None
+    assert int(match.group(1)) > 0 and int(match.group(2)) == 0
+
+
+def test_cpp_conversion_table():
+    rows = re.findall(r"^\|\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\d+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)\s*\|$",
+                      _cpp_results(), re.MULTILINE)
+    assert len(rows) == 8
+    table = np.array(rows, dtype=float)
+    pos = table[:, 0].astype(int)
+    r_wiper = pos * (R_DIGIPOT_FULL / DIGIPOT_STEPS)
+    r_eff = r_wiper * R_SHUNT_FB / (r_wiper + R_SHUNT_FB)
+    v_pre = V_REF_LM317 * (1.0 + (R_FIXED_FB + r_eff) / R1_FB)
+    np.testing.assert_allclose(table[:, 1], r_wiper, atol=0.5)
+    np.testing.assert_allclose(table[:, 2], r_eff, atol=0.5)
+    np.testing.assert_allclose(table[:, 3], v_pre, atol=0.005 + 1e-9)
+    np.testing.assert_allclose(table[:, 4], digipot_voltages(pos), atol=0.005 + 1e-9)
+
+
+def test_cpp_resolution():
+    match = re.search(r"resolution = ([\d.]+) mV/step", _cpp_results())
+    assert match is not None
+    resolution = (digipot_to_voltage(DIGIPOT_STEPS) - digipot_to_voltage(0)) / DIGIPOT_STEPS * 1000.0
+    assert round(resolution, 1) == float(match.group(1))
+
+
+def test_cpp_cases():
+    """The point checks of test_digipot_conversion.cpp"""
+    assert digipot_to_voltage(0) == pytest.approx(5.0, abs=0.1)
+    assert digipot_to_voltage(255) == pytest.approx(15.0, abs=0.1)
+    assert digipot_to_voltage(128) == pytest.approx(15.0, abs=0.1)
+    assert digipot_to_voltage(64) == pytest.approx(14.6, abs=0.3)
+    assert voltage_to_digipot(5.0) == 0
+    assert 120 <= voltage_to_digipot(15.0) <= 140
+    assert 120 <= voltage_to_digipot(20.0) <= 140
+    for pos in range(0, 126, 25):
+        assert abs(voltage_to_digipot(digipot_to_voltage(pos)) - pos) <= 3
+
+
+# =============================================================================
+# ADAPTIVE OCP LIMIT AND ADC
+# =============================================================================
+
+@pytest.mark.parametrize("v_out, limit", [
+    (5.0, 350.0), (6.99, 350.0), (7.0, 450.0), (8.0, 450.0), (9.99, 450.0),
+    (10.0, 500.0), (12.0, 500.0), (15.0, 500.0),
+])
+def test_adaptive_current_limit(v_out, limit):
+    assert get_adaptive_current_limit(v_out) == limit
+
+
+def test_adc_quantization():
+    lsb = V_REF / ADC_RESOLUTION * V_DIV_RATIO
+    full_scale = V_REF * V_DIV_RATIO
+    grid = np.linspace(0.0, 22.0, 4401)
+    measured = np.array([adc_voltage(float(v)) for v in grid])
+    assert (np.diff(measured) >= 0).all()
+    in_range = grid <= full_scale
+    assert np.abs(measured[in_range] - grid[in_range]).max() <= lsb / 2 + 1e-9
+    assert measured[~in_range].max() == pytest.approx(full_scale)
+    assert adc_voltage(-1.0) == 0.0
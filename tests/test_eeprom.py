@@ -0,0 +1,125 @@
+"""
+Python host tests: emulated EEPROM persistence and crash recovery (lps_core)
+
+Run:        python -m pytest tests
+
+- a session killed without close() reloads its last journaled save, counters included
+- a torn journal record followed by garbage stops replay at the last complete write
+- wear and byte_writes survive reloads and stay consistent
+- the language byte uses the firmware codes and survives a restart
+"""
+
+import os
+
+import pytest
+
+from lps_core import EnergyPersistence, EepromJournal, EepromImage, Language, SystemData
+from lps_core.eeprom import EEPROM_LANGUAGE
+
+
+def state(persistence):
+    image = persistence.image
+    return (bytes(image.data), image.wear.tobytes(), image.byte_writes,
+            persistence.saves, persistence.hours)
+
+
+def kill(persistence):
+    """Process killed once the writer thread has synced what was queued (no checkpoint)"""
+    persistence._queue.put(None)
+    persistence._writer.join()
+    persistence._writer = None
+
+
+def run_session(path, saves, checkpoint_records=8):
+    persistence = EnergyPersistence(path, interval_s=1.0)
+    persistence.CHECKPOINT_RECORDS = checkpoint_records
+    data = SystemData()
+    states = []
+    t = 0.0
+    for i in range(saves):
+        if i == saves - 3:
+            persistence.CHECKPOINT_RECORDS = 10 ** 6    # Last writes stay in the journal
+        data.energy_wh_a += 0.37
+        data.energy_wh_b += 0.11 * (i % 3)
+        data.uptime_seconds += 1
+        t += 1.25
+        persistence.tick(t, data)
+        if persistence.saves != len(states):
+            states.append(state(persistence))
+    return persistence, states
+
+
+# =============================================================================
+# CRASH RECOVERY
+# =============================================================================
+
+def test_killed_session_reloads_last_save(tmp_path):
+    path = str(tmp_path / "eeprom.bin")
+    persistence, states = run_session(path, 40)
+    kill(persistence)
+    assert os.path.exists(path)                     # At least one checkpoint happened
+    reloaded = EnergyPersistence(path)
+    assert state(reloaded) == states[-1]
+    assert reloaded.image.byte_writes == sum(reloaded.image.wear)
+    kill(reloaded)
+
+
+@pytest.mark.parametrize("cut", [1, 7, 15])
+def test_torn_record_and_garbage(tmp_path, cut):
+    path = str(tmp_path / "eeprom.bin")
+    persistence, states = run_session(path, 40)
+    kill(persistence)
+    journal = path + ".journal"
+    size = os.path.getsize(journal)
+    assert EepromJournal(path).load(EepromImage()) and size > 0
+    with open(journal, "r+b") as f:
+        f.truncate(size - cut)                      # Inside the last record
+        f.seek(0, os.SEEK_END)
+        f.write(b"\x00\x00\x04\x00" + os.urandom(64))
+    reloaded = EnergyPersistence(path)
+    assert state(reloaded) == states[-2]
+    data, wear, byte_writes, saves, hours = state(reloaded)
+    assert saves == len(states) - 1 and hours == pytest.approx(states[-1][4] - 1.25 / 3600)
+    assert byte_writes == sum(reloaded.image.wear)
+    # The torn write is replayed by the next save, wearing the same cells again
+    data_in = SystemData()
+    reloaded.restore(data_in)
+    reloaded.save(data_in)
+    reloaded.close(data_in)
+    final = EnergyPersistence(path)
+    assert final.saves == saves + 2
+    assert final.image.byte_writes == sum(final.image.wear) >= byte_writes
+    kill(final)
+
+
+def test_close_checkpoints_and_empties_journal(tmp_path):
+    path = str(tmp_path / "eeprom.bin")
+    persistence, states = run_session(path, 12)
+    data = SystemData()
+    persistence.restore(data)
+    persistence.close(data)
+    assert os.path.getsize(path + ".journal") == 0
+    reloaded = EnergyPersistence(path)
+    assert reloaded.journal.records == 0
+    assert reloaded.saves == states[-1][3] + 1
+    assert reloaded.hours == pytest.approx(states[-1][4])
+    assert reloaded.report()["byte_writes"] == sum(reloaded.image.wear)
+    kill(reloaded)
+
+
+# =============================================================================
+# LANGUAGE
+# =============================================================================
+
+def test_language_round_trip(tmp_path):
+    path = str(tmp_path / "eeprom.bin")
+    persistence = EnergyPersistence(path)
+    assert persistence.language() is None           # Blank cell: keep the default
+    persistence.save_language(Language.DE)
+    assert persistence.image.read(EEPROM_LANGUAGE, 1) == b"\x02"   # LANG_DE
+    persistence.save_language(Language.ES)
+    writes = persistence.image.byte_writes
+    persistence.save_language(Language.ES)          # EEPROM.update: unchanged byte
+    assert persistence.image.byte_writes == writes
+    kill(persistence)
+    assert EnergyPersistence(path).language() is Language.ES
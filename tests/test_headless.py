@@ -0,0 +1,53 @@
+"""
+Python host tests: headless library mode (lps_core)
+
+Run:        python -m pytest tests
+
+- every lps_core module imports and a seeded simulation runs with pygame
+  blocked (fresh interpreter, sys.modules["pygame"] = None)
+- every name of lps_core.__all__ resolves
+"""
+
+import os
+import subprocess
+import sys
+
+import lps_core
+
+SCRIPT = """
+import importlib, pkgutil, sys
+sys.modules["pygame"] = None                 # Any "import pygame" raises ImportError
+import lps_core
+for module in pkgutil.iter_modules(lps_core.__path__):
+    importlib.import_module("lps_core." + module.name)
+from lps_core import DataSimulator, Language, SimulationMode, T, Translations
+sim = DataSimulator(seed=1234)
+sim.set_simulation_mode(SimulationMode.HOT)
+for _ in range(600):
+    sim.update(1.0)
+Translations.set_language(Language.DE)
+print(sim.data.rail_a.temperature_c, T("page_health"))
+"""
+
+
+def run_headless(script):
+    ui_dir = os.path.dirname(os.path.dirname(os.path.abspath(lps_core.__file__)))
+    env = dict(os.environ, PYTHONPATH=ui_dir)
+    return subprocess.run([sys.executable, "-c", script], cwd=ui_dir, env=env,
+                          capture_output=True, text=True, timeout=120)
+
+
+def test_core_runs_without_pygame():
+    result = run_headless(SCRIPT)
+    assert result.returncode == 0, result.stderr
+    temperature, title = result.stdout.split(maxsplit=1)
+    assert float(temperature) > 30.0          # 10 simulated minutes of HOT
+    assert title.strip()
+    # The same simulation is reproducible from its seed
+    assert run_headless(SCRIPT).stdout == result.stdout
+
+
+def test_public_names_resolve():
+    assert len(set(lps_core.__all__)) == len(lps_core.__all__)
+    for name in lps_core.__all__:
+        assert getattr(lps_core, name) is not None, name
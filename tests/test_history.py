@@ -0,0 +1,110 @@
+"""
+Python host tests: multi-resolution trend store (lps_core)
+
+Run:        python -m pytest tests
+
+- every level of the pyramid equals a brute-force aggregation of the raw
+  samples (1 s buckets, then means of closed child buckets)
+- seconds skipped by a large step repeat the sample and weigh in the parents
+- window() reads the finest level still holding the range, never more than
+  TREND_MAX_BUCKETS buckets, and returns at most one value per column
+"""
+
+import numpy as np
+import pytest
+
+from lps_core import BufferPool, TrendStore
+from lps_core.history import TREND_MAX_BUCKETS
+
+LEVELS = ((1.0, 14400), (60.0, 240), (3600.0, 10))     # 4 h at 1 s: nothing evicted
+
+
+def read(level, first, last):
+    return level.read(first, last, np.arange(first, last + 1), BufferPool())
+
+
+def aggregate(index, mins, maxs, means, ratio):
+    """Parent buckets of closed child buckets: min of mins, max of maxs, mean of means"""
+    keys, starts, counts = np.unique(index // ratio, return_index=True, return_counts=True)
+    return (keys, np.minimum.reduceat(mins, starts), np.maximum.reduceat(maxs, starts),
+            np.add.reduceat(means, starts) / counts[:, None])
+
+
+# =============================================================================
+# PYRAMID
+# =============================================================================
+
+def test_levels_match_brute_force():
+    rng = np.random.default_rng(4)
+    store = TrendStore(1, LEVELS)
+    times = np.cumsum(rng.uniform(0.1, 0.9, 25_000))       # ~3.5 h, no skipped second
+    values = rng.normal(0.0, 1.0, (len(times), 4))
+    for t, row in zip(times, values):
+        store.add(t, row)
+
+    # 1 s level: every sample of the second
+    seconds = np.floor(times).astype(int)
+    index, mins, maxs, means = aggregate(seconds, values, values, values, 1)
+    child = None
+    for level in store.levels:
+        if child is not None:
+            # Only closed child buckets reach the parent
+            closed = index <= child.last
+            index, mins, maxs, means = aggregate(index[closed], mins[closed], maxs[closed],
+                                                 means[closed], child.ratio)
+        got = read(level, index[0], index[-1])
+        np.testing.assert_allclose(got[0], mins, rtol=1e-12)
+        np.testing.assert_allclose(got[1], maxs, rtol=1e-12)
+        np.testing.assert_allclose(got[2], means, rtol=1e-12)
+        child = level
+    assert len(index) == 4                    # Hours 0-2 closed, hour 3 in progress
+
+
+def test_skipped_seconds_repeat_the_sample():
+    store = TrendStore(1, LEVELS)
+    v0, v1, v2 = np.full(4, 1.0), np.full(4, 4.0), np.full(4, 10.0)
+    store.add(0.5, v0)
+    store.add(10.5, v1)                       # Seconds 1-9 take the new sample
+    store.add(61.0, v2)                       # Seconds 11-60 too
+    mins, maxs, means = read(store.levels[0], 0, 61)
+    np.testing.assert_array_equal(means[:, 0], [1.0] + [4.0] * 10 + [10.0] * 51)
+    np.testing.assert_array_equal(mins, maxs)
+    # Minute 0 is closed: every second weighs the same
+    mins, maxs, means = read(store.levels[1], 0, 0)
+    assert means[0, 0] == pytest.approx((1.0 + 10 * 4.0 + 49 * 10.0) / 60)
+    assert (mins[0, 0], maxs[0, 0]) == (1.0, 10.0)
+
+
+# =============================================================================
+# WINDOW
+# =============================================================================
+
+@pytest.fixture(scope="module")
+def long_store():
+    """30 h of history in 30 s steps: the 1 s level only holds the last 2 h"""
+    store = TrendStore(1)
+    for k in range(3600):
+        store.add(k * 30.0, np.full(4, float(k)))
+    return store
+
+
+@pytest.mark.parametrize("span, period", [(60.0, 1.0), (3600.0, 1.0), (6 * 3600.0, 60.0),
+                                          (24 * 3600.0, 60.0)])
+def test_window_reads_finest_level(long_store, span, period):
+    end = long_store.t_last
+    level = long_store.level_for(end - span, end)
+    assert level.period == period
+    assert span / level.period <= TREND_MAX_BUCKETS
+    times, mins, maxs, means = long_store.window(end - span, end, 700)
+    assert len(times) == len(mins) == len(maxs) == len(means) <= 700
+    assert times[0] >= end - span and times[-1] <= end + level.period
+    assert np.all(np.diff(times) > 0)
+    assert not np.isnan(means).any()
+
+
+def test_window_past_eviction_uses_coarser_level(long_store):
+    end = (long_store.t_last // 3600.0 - 3) * 3600.0   # Older than the 2 h at 1 s
+    assert long_store.level_for(end - 600.0, end).period == 60.0
+    times, mins, maxs, means = long_store.window(end - 600.0, end, 700)
+    assert len(times) == 10
+    assert np.all(mins <= means) and np.all(means <= maxs)
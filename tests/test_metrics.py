@@ -0,0 +1,180 @@
+"""
+Python host tests: streaming quality metrics (lps_core)
+
+Run:        python -m pytest tests
+
+- Ema, Welford and RollingExtrema against brute-force references
+- a held sample of weight/span/n k equals k identical per-sample updates
+- MetricsEngine stepped once per frame matches a per-loop() reference
+  whatever the frame length, in normal and purist modes
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from lps_core import Ema, MetricsEngine, RailData, RollingExtrema, StabilityScore, Welford
+from lps_core.controller import FIRMWARE_LOOP_MS
+from lps_core.firmware import PURIST_MEASURE_INTERVAL_MS, SMOOTH_FACTOR, STABILITY_SMOOTH
+
+LOOP_S = FIRMWARE_LOOP_MS / 1000.0
+
+
+# =============================================================================
+# PRIMITIVES
+# =============================================================================
+
+def test_ema_firmware_formula_and_held_samples():
+    rng = random.Random(1)
+    ema, reference = Ema(SMOOTH_FACTOR), 0.0
+    for _ in range(200):
+        x = rng.uniform(0.0, 500.0)
+        reference = reference * (1.0 - SMOOTH_FACTOR) + x * SMOOTH_FACTOR
+        assert ema.update(x) == reference         # Bit-exact for one iteration
+
+    held, stepped = Ema(SMOOTH_FACTOR, 10.0), Ema(SMOOTH_FACTOR, 10.0)
+    for k in (1, 2, 7, 40):
+        x = rng.uniform(0.0, 500.0)
+        held.update(x, k)
+        for _ in range(k):
+            stepped.update(x)
+        assert held.value == pytest.approx(stepped.value, rel=1e-12)
+    # Fractional iterations compose
+    half = Ema(SMOOTH_FACTOR, 10.0)
+    half.update(100.0, 0.5)
+    half.update(100.0, 0.5)
+    assert half.value == pytest.approx(Ema(SMOOTH_FACTOR, 10.0).update(100.0), rel=1e-12)
+
+
+def test_welford_matches_numpy_and_weights():
+    rng = np.random.default_rng(2)
+    samples = 1e6 + rng.normal(0.0, 1e-3, 5000)   # Large offset: naive Σx² would cancel
+    stats = Welford()
+    assert stats.variance == 0.0
+    for x in samples:
+        stats.update(float(x))
+    assert stats.count == len(samples)
+    assert stats.mean == pytest.approx(samples.mean(), rel=1e-14)
+    assert stats.variance == pytest.approx(samples.var(ddof=1), rel=1e-9)
+
+    weights = rng.integers(1, 6, 300)
+    values = rng.normal(12.0, 0.01, 300)
+    weighted = Welford()
+    for x, w in zip(values, weights):
+        weighted.update(float(x), int(w))
+    repeated = np.repeat(values, weights)
+    assert weighted.count == len(repeated)
+    assert weighted.mean == pytest.approx(repeated.mean(), rel=1e-14)
+    assert weighted.std == pytest.approx(repeated.std(ddof=1), rel=1e-9)
+    constant = Welford()
+    for _ in range(10_000):
+        constant.update(0.1 + 0.2)
+    assert constant.std >= 0.0
+
+
+@pytest.mark.parametrize("window", [1, 5, 64, 256])
+def test_rolling_extrema_matches_brute_force(window):
+    rng = random.Random(window)
+    extrema = RollingExtrema(window)
+    seen = []
+    for _ in range(1000):
+        x = float(rng.randint(0, 40))                # Ties exercise the deque ordering
+        extrema.update(x)
+        seen.append(x)
+        assert extrema.min == min(seen[-window:])
+        assert extrema.max == max(seen[-window:])
+
+
+def test_rolling_extrema_spans_equal_repeated_samples():
+    rng = random.Random(3)
+    window = 100.5
+    held, stepped = RollingExtrema(window), RollingExtrema(window)
+    for _ in range(400):
+        x, k = rng.uniform(-1.0, 1.0), rng.randint(1, 30)
+        held.update(x, k)
+        for _ in range(k):
+            stepped.update(x)
+        assert (held.min, held.max) == (stepped.min, stepped.max)
+
+
+def test_stability_score_firmware_formula():
+    score = StabilityScore()
+    expected, prev = 100.0, (0.0, 0.0)
+    for currents in ((150.0, 100.0), (150.0, 100.0), (400.0, 100.0), (400.0, 2000.0)):
+        instability = (abs(currents[0] - prev[0]) + abs(currents[1] - prev[1])) / 10.0
+        expected = (expected * STABILITY_SMOOTH
+                    + (100.0 - min(max(instability, 0.0), 100.0)) * (1.0 - STABILITY_SMOOTH))
+        prev = currents
+        assert score.update(currents) == pytest.approx(expected, rel=1e-15)
+
+
+# =============================================================================
+# MEASUREMENT ENGINE VS PER-LOOP REFERENCE
+# =============================================================================
+
+def rails_sequence(seed, n):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield [RailData(voltage_actual=rng.gauss(12.0, 0.01),
+                        current_ma=rng.choice((150.0, 150.0, 420.0, -30.0)) + rng.gauss(0, 5),
+                        temperature_c=rng.uniform(30.0, 75.0)) for _ in range(2)]
+
+
+def engine_state(engine):
+    return [engine.stability.value, engine.quality, engine.temp_radiator] + [
+        value for r in range(engine.n_rails) for value in (
+            engine.smooth_i[r].value, engine.voltage_stats[r].mean, engine.voltage_stats[r].std,
+            engine.voltage_range[r].min, engine.voltage_range[r].max,
+            engine.current_range[r].min, engine.current_range[r].max)]
+
+
+@pytest.mark.parametrize("loops_per_frame", [(1,), (11,), (1, 3, 11, 67)])
+def test_engine_matches_per_loop_reference(loops_per_frame):
+    rng = random.Random(4)
+    framed, reference = MetricsEngine(), MetricsEngine()
+    for rails in rails_sequence(5, 150):
+        k = rng.choice(loops_per_frame)
+        framed.update(rails, k * LOOP_S)
+        for _ in range(k):
+            reference.update(rails)
+        assert engine_state(framed) == pytest.approx(engine_state(reference), rel=1e-9)
+
+
+def test_engine_purist_measures_every_interval():
+    rng = random.Random(6)
+    framed, reference = MetricsEngine(), MetricsEngine()
+    interval_s = PURIST_MEASURE_INTERVAL_MS / 1000.0
+    first = next(rails_sequence(7, 1))
+    framed.update(first)
+    reference.update(first)
+    score = framed.stability.value
+    for rails in rails_sequence(8, 100):
+        measures = rng.choice((1, 2, 5))
+        framed.update(rails, measures * interval_s, purist=True)
+        # One readAllMeasures() per interval, no updateStabilityScore()
+        for r, rail in enumerate(rails):
+            for _ in range(measures):
+                reference.smooth_i[r].update(max(rail.current_ma, 0.0))
+            assert framed.smooth_i[r].value == pytest.approx(reference.smooth_i[r].value,
+                                                             rel=1e-9)
+        assert framed.stability.value == score
+
+
+def test_time_constant_independent_of_frame_rate():
+    """A current step settles in the same simulated time at 60 fps, 5 fps or ×10 speed"""
+    results = []
+    for frame_s in (1 / 60, 0.2, 10 / 30):
+        engine = MetricsEngine()
+        steady = [RailData(current_ma=150.0), RailData(current_ma=100.0)]
+        stepped = [RailData(current_ma=400.0), RailData(current_ma=100.0)]
+        engine.update(steady, 1.0)
+        engine.update(stepped, frame_s)
+        engine.update(stepped, 2.0 - frame_s)
+        results.append((engine.smooth_i[0].value, engine.stability.value))
+    for smooth_i, stability in results[1:]:
+        assert smooth_i == pytest.approx(results[0][0], rel=1e-9)
+        assert stability == pytest.approx(results[0][1], rel=1e-9)
+    engine = MetricsEngine()
+    engine.update([RailData(current_ma=150.0)] * 2, 0.0)
+    assert engine.samples == 0 and engine.smooth_i[0].value == 0.0
@@ -0,0 +1,132 @@
+"""
+Python host tests: rail physics model (lps_core)
+
+Run:        python -m pytest tests
+
+- in regulation the LT3045 bank holds the setpoint, V_PRE sits V_HEADROOM above it
+- a mains sag drops V_PRE: the output follows V_PRE - LT3045_DROPOUT_V, below the setpoint
+- an overload trips OCP on the faulty rail only, the other rail keeps regulating
+- an obstructed vent heats the shared NTC up to TEMP_SHUTDOWN: OTP cuts both rails
+- every injected fault (RIPPLE, LOAD, LOW_V, HIGH_V) leaves the other rail untouched
+"""
+
+import numpy as np
+import pytest
+
+from lps_core import RailPhysicsModel, SimulationMode
+from lps_core.firmware import TEMP_SHUTDOWN, V_HEADROOM
+from lps_core.physics import LT3045_DROPOUT_V
+
+TARGETS = (12.0, 5.0)
+
+
+def run(model, seconds, targets=TARGETS, dt=0.05):
+    for _ in range(int(round(seconds / dt))):
+        model.step(dt, targets)
+    return model
+
+
+def settled(mode=SimulationMode.NORMAL, rail=0, seconds=60.0, **kwargs):
+    model = RailPhysicsModel(seeds=np.random.SeedSequence(7).spawn(2), **kwargs)
+    run(model, 2.0)
+    model.set_mode(rail, mode)
+    return run(model, seconds)
+
+
+# =============================================================================
+# REGULATION
+# =============================================================================
+
+@pytest.mark.parametrize("targets", [(5.0, 15.0), (12.0, 5.0), (9.0, 7.5)])
+def test_output_regulates_to_setpoint(targets):
+    model = RailPhysicsModel(seeds=np.random.SeedSequence(7).spawn(2))
+    run(model, 5.0, targets)
+    assert model.v_out == pytest.approx(targets, abs=1e-4)
+    assert model.v_pre == pytest.approx(np.add(targets, V_HEADROOM), abs=1e-4)
+    assert model.enabled.all()
+    assert not (model.ovp | model.ovp_pre | model.ocp | model.otp).any()
+
+
+def test_low_mains_drops_out():
+    model = settled(SimulationMode.LOW_V)
+    # V_PRE can no longer reach setpoint + headroom; the LDO keeps its dropout
+    assert model.v_pre[0] < TARGETS[0] + LT3045_DROPOUT_V
+    assert model.v_out[0] == pytest.approx(model.v_pre[0] - LT3045_DROPOUT_V, abs=1e-3)
+    assert model.v_out[0] < TARGETS[0]
+    assert model.v_out[1] == pytest.approx(TARGETS[1], abs=1e-4)
+    # Dropout also costs rejection: ripple rises on the sagging rail
+    assert model.ripple_uv[0] > 10.0 * settled().ripple_uv[0]
+
+
+# =============================================================================
+# PROTECTIONS
+# =============================================================================
+
+def test_overload_trips_ocp():
+    model = settled(SimulationMode.LOAD, seconds=2.0)
+    assert model.ocp.tolist() == [True, False]
+    assert model.enabled.tolist() == [False, True]
+    run(model, 1.0)
+    assert model.v_out[0] < 0.01 and model.current_ma[0] < 1.0
+    assert model.v_out[1] == pytest.approx(TARGETS[1], abs=1e-4)
+
+
+def test_obstructed_vent_trips_otp():
+    model = RailPhysicsModel(load_ma=(300.0, 100.0), seeds=np.random.SeedSequence(7).spawn(2))
+    model.set_mode(0, SimulationMode.HOT)
+    for _ in range(3600):
+        model.step(1.0, (5.0, 5.0))
+        if model.otp.any():
+            break
+    assert model.temp_c.max() >= TEMP_SHUTDOWN
+    # A single NTC: OTP shuts both rails down
+    assert model.otp.all() and not model.enabled.any()
+    assert not (model.ovp | model.ovp_pre | model.ocp).any()
+
+
+def test_open_feedback_trips_pre_regulator_ovp():
+    model = settled(SimulationMode.HIGH_V, seconds=2.0)
+    assert model.ovp_pre.tolist() == [True, False]
+    assert model.enabled.tolist() == [False, True]
+
+
+def test_reset_rearms_rail():
+    model = settled(SimulationMode.LOAD, seconds=2.0)
+    model.set_mode(0, SimulationMode.NORMAL)
+    run(model, 2.0)
+    model.reset_faults(0)
+    run(model, 2.0)
+    assert not model.ocp.any() and model.enabled.all()
+    assert model.v_out == pytest.approx(TARGETS, abs=1e-4)
+
+
+# =============================================================================
+# FAULT INDEPENDENCE
+# =============================================================================
+
+@pytest.mark.parametrize("rail", [0, 1])
+@pytest.mark.parametrize("mode", [SimulationMode.RIPPLE, SimulationMode.LOAD,
+                                  SimulationMode.LOW_V, SimulationMode.HIGH_V])
+def test_fault_stays_on_its_rail(mode, rail):
+    reference = settled()
+    model = settled(mode, rail)
+    other = 1 - rail
+    faults = model.ovp | model.ovp_pre | model.ocp | model.otp
+    assert not faults[other] and model.enabled[other]
+    assert model.v_out[other] == pytest.approx(reference.v_out[other], abs=1e-4)
+    assert model.current_ma[other] == pytest.approx(reference.current_ma[other], abs=1e-2)
+    assert model.ripple_uv[other] == pytest.approx(reference.ripple_uv[other], rel=1e-6)
+    # ... while the faulty rail departs from the reference (a 5 V rail rides
+    # through the mains sag: only its unregulated input shows it)
+    changed = (faults[rail] or
+               abs(model.v_in[rail] - reference.v_in[rail]) > 1.0 or
+               model.ripple_uv[rail] > 2.0 * reference.ripple_uv[rail])
+    assert changed
+
+
+def test_ripple_fault_raises_ripple_only():
+    reference = settled()
+    model = settled(SimulationMode.RIPPLE)
+    assert model.ripple_uv[0] > 10.0 * reference.ripple_uv[0]
+    assert model.v_out[0] == pytest.approx(TARGETS[0], abs=1e-4)
+    assert model.enabled.all()
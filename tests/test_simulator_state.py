@@ -0,0 +1,152 @@
+"""
+Python host tests: seeded random streams and simulator snapshots (lps_core)
+
+Run:        python -m pytest tests
+
+- Same seed, same run; per-rail streams independent of the other rail
+- snapshot() / from_snapshot() / restore() resume bit-exactly
+- Corrupt or foreign snapshots are rejected
+- Snapshots are plain data (npz + JSON, no pickle) and round-trip byte for byte
+"""
+
+import io
+import pickle
+import zlib
+
+import numpy as np
+import pytest
+
+from lps_core import DataSimulator, NoiseSynthesizer, RailStreams, SimulationMode, rail_seeds
+from lps_core.simulator import SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _SNAPSHOT_HEADER
+
+FRAME_S = 1 / 30
+
+
+def run(sim, frames, fault_at=None):
+    """Readings per frame and final sample ring"""
+    readings = []
+    for frame in range(frames):
+        if frame == fault_at:
+            sim.set_simulation_mode(SimulationMode.HIGH_V, "B")
+        sim.update(FRAME_S)
+        readings.append([value for rail in sim.rails() for value in
+                         (rail.voltage_actual, rail.current_ma, rail.temperature_c, rail.ripple_uv)])
+    return np.array(readings), sim.synth.ring.buffer.copy()
+
+
+def assert_same_run(a, b):
+    np.testing.assert_array_equal(a[0], b[0])
+    np.testing.assert_array_equal(a[1], b[1])
+
+
+# =============================================================================
+# SEEDED STREAMS
+# =============================================================================
+
+def test_same_seed_same_run():
+    assert_same_run(run(DataSimulator(seed=7), 200, 50), run(DataSimulator(seed=7), 200, 50))
+    other = run(DataSimulator(seed=8), 200, 50)
+    assert not np.array_equal(run(DataSimulator(seed=7), 200, 50)[0], other[0])
+
+
+def test_unseeded_run_replays_from_reported_seed():
+    first = DataSimulator()
+    assert_same_run(run(DataSimulator(seed=first.seed), 100), run(first, 100))
+
+
+def test_rail_streams_are_independent():
+    _, seeds = rail_seeds(42, 2, 1)
+    _, alone = rail_seeds(42, 1, 1)
+    pair = RailStreams([rail[0] for rail in seeds], 4, block=16)
+    single = RailStreams([alone[0][0]], 4, block=16)
+    for _ in range(40):                                  # Crosses block refills
+        np.testing.assert_array_equal(pair.next()[0], single.next()[0])
+
+
+def test_synth_rail_unaffected_by_other_rail():
+    _, seeds = rail_seeds(3, 2, 1)
+    quiet = NoiseSynthesizer(seeds=[rail[0] for rail in seeds])
+    _, seeds = rail_seeds(3, 2, 1)
+    noisy = NoiseSynthesizer(seeds=[rail[0] for rail in seeds])
+    quiet.update(0.5, np.array([5.0, 5.0]), np.array([0.3, 0.3]))
+    noisy.update(0.5, np.array([5.0, 500.0]), np.array([0.3, 3.0]))
+    np.testing.assert_array_equal(quiet.ring.buffer[0], noisy.ring.buffer[0])
+    assert not np.array_equal(quiet.ring.buffer[1], noisy.ring.buffer[1])
+
+
+# =============================================================================
+# SNAPSHOTS
+# =============================================================================
+
+def test_fork_resumes_exactly():
+    sim = DataSimulator(seed=11)
+    run(sim, 150)
+    fork = DataSimulator.from_snapshot(sim.snapshot())
+    assert_same_run(run(sim, 300, 20), run(fork, 300, 20))
+    assert fork.fault_event_count == sim.fault_event_count > 0
+
+
+def test_restore_in_place():
+    sim = DataSimulator(seed=5)
+    run(sim, 100)
+    blob = sim.snapshot()
+    ring = sim.synth.ring
+    first = run(sim, 200, 10)
+    sim.restore(blob)
+    assert sim.synth.ring is ring                        # Audio / Welch readers keep it
+    assert_same_run(run(sim, 200, 10), first)
+
+
+def test_corrupt_snapshot_rejected():
+    sim = DataSimulator(seed=1)
+    blob = sim.snapshot()
+    with pytest.raises(ValueError, match="CRC"):
+        sim.restore(blob[:-1] + bytes([blob[-1] ^ 1]))
+    with pytest.raises(ValueError):
+        DataSimulator.from_snapshot(b"LPSE" + blob[4:])
+    with pytest.raises(ValueError):
+        DataSimulator.from_snapshot(blob[:5])
+
+
+def framed(payload):
+    return _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, zlib.crc32(payload)) + payload
+
+
+def test_snapshot_round_trip_and_determinism():
+    sim = DataSimulator(seed=21)
+    run(sim, 120, 60)                                    # Mid-fault: latched rail, armed timers
+    blob = sim.snapshot()
+    other = DataSimulator(seed=99)
+    run(other, 30)
+    other.restore(blob)
+    assert other.snapshot() == blob
+    assert DataSimulator.from_snapshot(blob).snapshot() == blob
+    expected = run(sim, 250)
+    assert_same_run(run(other, 250), expected)
+    assert other.seed == sim.seed and other.get_all_problems() == sim.get_all_problems()
+
+
+def test_snapshot_is_plain_data():
+    sim = DataSimulator(seed=2)
+    run(sim, 40)
+    payload = sim.snapshot()[_SNAPSHOT_HEADER.size:]
+    with np.load(io.BytesIO(payload), allow_pickle=False) as archive:
+        assert all(archive[key].dtype != object for key in archive.files)
+
+    # A pickle with a valid header and CRC is never unpickled
+    class Boom:
+        def __reduce__(self):
+            return (pytest.fail, ("unpickled",))
+
+    before = sim.snapshot()
+    with pytest.raises(ValueError):
+        sim.restore(framed(pickle.dumps(Boom())))
+    with pytest.raises(ValueError):
+        DataSimulator.from_snapshot(framed(pickle.dumps({"seed": 1})))
+
+    # Wrong array shape: rejected before anything is modified
+    smaller = DataSimulator(seed=2)
+    smaller.model.noise._buffer = np.zeros((2, 16, 4))
+    with pytest.raises(ValueError, match="shape"):
+        sim.restore(smaller.snapshot())
+    assert sim.snapshot() == before
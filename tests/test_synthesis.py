@@ -0,0 +1,130 @@
+"""
+Python host tests: noise synthesis and streaming Welch spectrum (lps_core)
+
+Run:        python -m pytest tests
+
+- a 1 µV RMS synthesized noise integrates back to ~1 µV over 10 Hz - 5 kHz,
+  ripple lines excluded
+- incremental updates over a partially read ring equal a batch Welch
+  estimate over the same segments
+- the synthesized ripple has the model's peak-to-peak ripple_uv, with its
+  100 Hz line at the truncated sawtooth share of it
+"""
+
+import numpy as np
+import pytest
+
+from lps_core import DataSimulator, NoiseSynthesizer, SampleRing, SimulationMode, WelchSpectrum
+from lps_core.synthesis import RIPPLE_HARMONICS, SYNTH_BLOCK, SYNTH_SAMPLE_RATE
+
+
+def batch_welch(samples, starts, nperseg=WelchSpectrum.NPERSEG, fs=SYNTH_SAMPLE_RATE):
+    """One-sided Hann-window Welch density from explicit segment starts"""
+    window = np.hanning(nperseg)
+    segments = np.stack([samples[:, s:s + nperseg] for s in starts]) * window
+    psd = np.mean(np.abs(np.fft.rfft(segments, axis=-1)) ** 2, axis=0)
+    psd *= 2.0 / (fs * np.sum(window ** 2))
+    psd[:, [0, -1]] /= 2.0
+    return psd
+
+
+# =============================================================================
+# CALIBRATION
+# =============================================================================
+
+def test_band_rms_of_unit_noise():
+    synth = NoiseSynthesizer(seeds=np.random.SeedSequence(3).spawn(2))
+    welch = WelchSpectrum(synth.ring)
+    ripple_uv, noise_uv = np.array([0.0, 5.0]), np.array([1.0, 1.0])
+    readings = []
+    for block in range(400):
+        synth.update(0.1, ripple_uv, noise_uv)
+        welch.update()
+        if block >= 2 * welch.WELCH_SEGMENTS and block % 8 == 0:   # Non-overlapping windows
+            readings.append(welch.band_rms_uv(10.0, 5000.0, synth.ripple_freqs))
+    measured = np.mean(readings, axis=0)
+    # Share of the synthesized 1 µV that lies inside the band (1/f template)
+    shape, freqs = synth._noise_shape, synth.freqs
+    in_band = np.sqrt(np.sum(shape[(freqs >= 10.0) & (freqs <= 5000.0)] ** 2) / np.sum(shape ** 2))
+    np.testing.assert_allclose(measured, in_band, rtol=0.01)
+    np.testing.assert_allclose(measured, 1.0, atol=0.03)
+    # The 5 µV ripple on rail B is excluded, not integrated
+    assert measured[1] == pytest.approx(measured[0], rel=0.02)
+
+
+def test_density_of_white_noise():
+    rng = np.random.default_rng(5)
+    ring = SampleRing(1, 1 << 16)
+    welch = WelchSpectrum(ring)
+    ring.write(rng.normal(0.0, 1.0, (1, 9 * 1024)))
+    welch.update()
+    # σ = 1 µV spread over fs/2: flat density 1/√(fs/2) µV/√Hz
+    expected_nv = 1000.0 / np.sqrt(SYNTH_SAMPLE_RATE / 2.0)
+    assert np.median(welch.density_nv()[0, 1:-1]) == pytest.approx(expected_nv, rel=0.05)
+    assert welch.band_rms_uv(0.0, SYNTH_SAMPLE_RATE / 2.0)[0] == pytest.approx(1.0, rel=0.03)
+
+
+def test_ripple_matches_model():
+    sim = DataSimulator(seed=11)
+    sim.set_simulation_mode(SimulationMode.RIPPLE, "A")
+    for _ in range(100):
+        sim.update(0.05)
+    synth = sim.synth
+    block = synth.ring.read(synth.last_block_start(), np.empty((2, SYNTH_BLOCK)))
+    ripple_uv = sim.model.ripple_uv
+    assert ripple_uv[0] > 50.0 * sim.model.noise_uv[0]   # Ripple dominates rail A
+    # ripple_uv is peak-to-peak (reservoir sawtooth behind the PSRR)
+    assert np.ptp(block[0]) == pytest.approx(ripple_uv[0], rel=0.03)
+    # 100 Hz line: fundamental of a sawtooth truncated at RIPPLE_HARMONICS
+    x = np.linspace(0.0, 2.0 * np.pi, 100001)
+    saw = sum(np.sin(h * x) / h for h in range(1, RIPPLE_HARMONICS + 1))
+    k = int(np.argmin(np.abs(synth.freqs - synth.ripple_freqs[0])))
+    line_uv = 2.0 * np.abs(np.fft.rfft(block, axis=1)[:, k]) / SYNTH_BLOCK
+    assert line_uv[0] == pytest.approx(ripple_uv[0] / np.ptp(saw), rel=0.01)
+    assert line_uv[1] == pytest.approx(ripple_uv[1] / np.ptp(saw), abs=0.05)
+
+
+# =============================================================================
+# INCREMENTAL VS BATCH
+# =============================================================================
+
+@pytest.mark.parametrize("seed", range(4))
+def test_incremental_matches_batch(seed):
+    rng = np.random.default_rng(seed)
+    ring = SampleRing(2, 8 * 1024)
+    welch = WelchSpectrum(ring)
+    total = 40 * 1024
+    samples = rng.normal(0.0, 1.0, (2, total)) + np.sin(np.arange(total) * 0.3)
+    position = 0
+    while position < total:
+        # Irregular chunks: segments straddle chunk ends and wait for more data
+        n = min(int(rng.integers(1, 2000)), total - position)
+        ring.write(samples[:, position:position + n])
+        position += n
+        welch.update()
+        done = welch.position // welch.HOP         # Segments integrated so far
+        assert welch.position + welch.NPERSEG > ring.written
+        if done:
+            starts = [j * welch.HOP for j in range(max(0, done - welch.WELCH_SEGMENTS), done)]
+            assert welch.count == len(starts)
+            np.testing.assert_allclose(welch.psd, batch_welch(samples, starts),
+                                       rtol=1e-9, atol=1e-15)
+    assert done > 3 * welch.WELCH_SEGMENTS        # Several periodic resyncs of the sum
+
+
+def test_lagging_reader_resumes_on_recent_data():
+    rng = np.random.default_rng(9)
+    ring = SampleRing(1, 8 * 1024)
+    welch = WelchSpectrum(ring)
+    samples = rng.normal(0.0, 1.0, (1, 30 * 1024))
+    ring.write(samples[:, :2048])
+    welch.update()
+    for start in range(2048, samples.shape[1], 4096):   # Far beyond the ring capacity
+        ring.write(samples[:, start:start + 4096])
+    assert welch.update() == welch.MAX_BATCH
+    end = samples.shape[1]
+    first = end - welch.NPERSEG - (welch.MAX_BATCH - 1) * welch.HOP
+    starts = [first + j * welch.HOP for j in range(welch.MAX_BATCH)]
+    # The segments read before the gap stay in the running average
+    previous = [0, welch.HOP, 2 * welch.HOP]
+    np.testing.assert_allclose(welch.psd, batch_welch(samples, previous + starts), rtol=1e-9)
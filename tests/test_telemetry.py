@@ -0,0 +1,414 @@
+"""
+Python host tests: local telemetry server (lps_core.telemetry)
+
+Run:        python -m pytest tests
+
+- Fault transitions recorded by DataSimulator
+- First stream message is a full snapshot, then deltas against it
+- Fault events batched into the stream and served over HTTP
+- A client that stops reading is conflated instead of buffered
+- Hundreds of concurrent subscribers converge on the latest snapshot
+- Remote-control batches reach the main loop whole and get one reply each
+- Fragmented control messages are reassembled; unmasked or oversized ones close the connection
+- Remote control needs the run's token, refuses browser origins, and JSON only on /command
+- Importing lps_core (or the UI module) does not load asyncio until telemetry is used
+"""
+
+import base64
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from lps_core import DataSimulator, SimulationMode, TelemetryServer
+from lps_core.telemetry import snapshot, ws_accept_key
+
+
+# =============================================================================
+# MINIMAL CLIENT
+# =============================================================================
+
+class Subscriber:
+    """Blocking WebSocket client reassembling snapshots from deltas"""
+
+    def __init__(self, port, rcvbuf=None, path="/stream", token=None):
+        self.sock = socket.socket()
+        if rcvbuf is not None:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)
+        self.sock.settimeout(5.0)
+        self.sock.connect(("127.0.0.1", port))
+        key = base64.b64encode(os.urandom(16)).decode()
+        auth = f"Authorization: Bearer {token}\r\n" if token else ""
+        response = handshake(self.sock, path, key, auth)
+        assert response.startswith(b"HTTP/1.1 101")
+        assert f"Sec-WebSocket-Accept: {ws_accept_key(key)}".encode() in response
+        self.state = {}
+        self.messages = []
+
+    def _read(self, n):
+        data = b""
+        while len(data) < n:
+            chunk = self.sock.recv(n - len(data))
+            if not chunk:
+                raise ConnectionError("closed")
+            data += chunk
+        return data
+
+    def receive_frame(self):
+        head = self._read(2)
+        n = head[1] & 0x7F
+        if n == 126:
+            n = struct.unpack("!H", self._read(2))[0]
+        elif n == 127:
+            n = struct.unpack("!Q", self._read(8))[0]
+        return head[0] & 0x0F, self._read(n)
+
+    def receive(self):
+        opcode, payload = self.receive_frame()
+        assert opcode == 0x1
+        message = json.loads(payload)
+        if "base" not in message:
+            return message
+        if message["base"] < 0:
+            self.state = dict(message["delta"])
+        else:
+            self.state.update(message["delta"])
+        self.messages.append(message)
+        return message
+
+    def send(self, obj):
+        self.send_frame(json.dumps(obj).encode())
+
+    def send_frame(self, payload, opcode=0x1, fin=True, masked=True):
+        first = (0x80 if fin else 0) | opcode
+        bit = 0x80 if masked else 0
+        n = len(payload)
+        if n < 126:
+            head = struct.pack("!BB", first, bit | n)
+        elif n < 0x10000:
+            head = struct.pack("!BBH", first, bit | 126, n)
+        else:
+            head = struct.pack("!BBQ", first, bit | 127, n)
+        if masked:
+            mask = os.urandom(4)
+            head += mask
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        self.sock.sendall(head + payload)
+
+    def receive_until(self, seq):
+        while not self.messages or self.messages[-1]["seq"] < seq:
+            self.receive()
+
+    def close(self):
+        self.sock.close()
+
+
+def handshake(sock, path, key, extra=""):
+    """Sends a WebSocket upgrade request, returns the response head"""
+    sock.sendall(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n"
+                 f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+                 f"Sec-WebSocket-Version: 13\r\n{extra}\r\n".encode())
+    response = b""
+    while b"\r\n\r\n" not in response:
+        chunk = sock.recv(1)
+        if not chunk:
+            break
+        response += chunk
+    return response
+
+
+@pytest.fixture
+def server():
+    server = TelemetryServer(port=0, interval=0.0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def publish(server, sim):
+    assert server.publish(sim)
+    return server.publishes
+
+
+def wait_clients(server, n):
+    deadline = time.monotonic() + 5.0
+    while server.clients < n:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def wait_published(server, count):
+    deadline = time.monotonic() + 5.0
+    while server.publishes < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+# =============================================================================
+# FAULT EVENTS
+# =============================================================================
+
+def test_fault_transitions():
+    sim = DataSimulator()
+    sim.set_simulation_mode(SimulationMode.HIGH_V, "A")
+    for _ in range(120):
+        sim.update(1 / 30)
+    raised = sim.fault_events_since(0)
+    assert raised and all(e.rail == "A" and e.active for e in raised)
+    sim.set_simulation_mode(SimulationMode.NORMAL)
+    sim.update(1 / 30)
+    cleared = sim.fault_events_since(len(raised))
+    assert {(e.fault, e.active) for e in cleared} == {(e.fault, False) for e in raised}
+    assert [e.seq for e in sim.fault_events_since(0)] == list(range(sim.fault_event_count))
+    assert sim.get_all_problems() == []
+
+
+# =============================================================================
+# STREAM AND HTTP
+# =============================================================================
+
+def test_full_snapshot_then_deltas(server):
+    sim = DataSimulator()
+    sim.update(1 / 30)
+    publish(server, sim)
+    client = Subscriber(server.port)
+    first = client.receive()
+    assert first["base"] == -1 and first["delta"] == snapshot(sim)
+    for _ in range(5):
+        sim.update(1 / 30)
+        publish(server, sim)
+    client.receive_until(5)
+    assert all(m["base"] == m["seq"] - 1 for m in client.messages[1:])
+    assert all(len(m["delta"]) < len(first["delta"]) for m in client.messages[1:])
+    assert client.state == snapshot(sim)
+    client.close()
+
+
+def test_fault_events_and_http(server):
+    sim = DataSimulator()
+    client = Subscriber(server.port)
+    wait_clients(server, 1)
+    sim.set_simulation_mode(SimulationMode.HIGH_V)
+    for _ in range(120):
+        sim.update(1 / 30)
+    seq = publish(server, sim) - 1
+    client.receive_until(seq)
+    events = [e for m in client.messages for e in m["events"]]
+    assert {(e["rail"], e["active"]) for e in events} == {("A", True), ("B", True)}
+
+    url = f"http://127.0.0.1:{server.port}"
+    with urllib.request.urlopen(url + "/snapshot") as response:
+        body = json.loads(response.read())
+    assert body["seq"] == seq and body["snapshot"]["mode"] == "HIGH_V"
+    with urllib.request.urlopen(url + "/faults") as response:
+        assert json.loads(response.read())["events"] == events
+    with pytest.raises(urllib.error.HTTPError):
+        urllib.request.urlopen(url + "/missing")
+    client.close()
+
+
+def test_slow_client_is_conflated(server):
+    sim = DataSimulator()
+    slow = Subscriber(server.port, rcvbuf=4096)
+    wait_clients(server, 1)
+    for _ in range(3000):
+        sim.update(1 / 30)
+        publish(server, sim)
+    wait_published(server, 3000)
+    slow.receive_until(2999)
+    assert server.conflated > 0
+    assert any(m["seq"] - m["base"] > 1 for m in slow.messages)
+    assert len(slow.messages) < 3000
+    assert slow.state == snapshot(sim)
+    slow.close()
+
+
+def test_hundreds_of_subscribers(server):
+    sim = DataSimulator()
+    clients = [Subscriber(server.port) for _ in range(200)]
+    wait_clients(server, len(clients))
+    for _ in range(10):
+        sim.update(1 / 30)
+        publish(server, sim)
+    for client in clients:
+        client.receive_until(9)
+        assert client.state == snapshot(sim)
+        client.close()
+    assert server.peak_clients == 200
+
+
+# =============================================================================
+# REMOTE CONTROL
+# =============================================================================
+
+class MainLoop:
+    """Stands in for the app: applies each poll as one frame, echoes arguments"""
+
+    def __init__(self, server):
+        self.server = server
+        self.batches = []
+        self.running = True
+        self.thread = threading.Thread(target=self.run)
+        self.thread.start()
+
+    def run(self):
+        frame = 0
+        while self.running:
+            commands = self.server.poll_commands()
+            if commands:
+                frame += 1
+                self.batches.append([c.name for c in commands])
+                for command in commands:
+                    if command.name == "echo":
+                        self.server.reply(command, command.args, frame=frame)
+                    else:
+                        self.server.reply(command, error=f"unknown command: {command.name}",
+                                          frame=frame)
+            time.sleep(0.005)
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+
+
+def post_commands(server, body, headers=None):
+    if headers is None:
+        headers = {"Content-Type": "application/json", "Authorization": f"Bearer {server.token}"}
+    request = urllib.request.Request(f"http://127.0.0.1:{server.port}/command", method="POST",
+                                     data=body if isinstance(body, bytes) else
+                                     json.dumps(body).encode(), headers=headers)
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())["replies"]
+
+
+def test_http_command_batch(server):
+    loop = MainLoop(server)
+    replies = post_commands(server, [{"id": 1, "cmd": "echo", "page": 3},
+                                     {"id": 2, "cmd": "nope"}, {"id": 3, "cmd": "echo"}])
+    loop.stop()
+    assert [r["id"] for r in replies] == [1, 2, 3]
+    assert replies[0] == {"id": 1, "ok": True, "frame": 1, "result": {"page": 3}}
+    assert not replies[1]["ok"] and "nope" in replies[1]["error"]
+    assert loop.batches == [["echo", "nope", "echo"]]
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post_commands(server, b"{not json")
+    assert error.value.code == 400
+
+
+def test_websocket_control(server):
+    woken = threading.Event()
+    server.on_command = woken.set
+    loop = MainLoop(server)
+    control = Subscriber(server.port, path="/control", token=server.token)
+    control.send([{"id": i, "cmd": "echo", "i": i} for i in range(50)])
+    replies = [control.receive() for _ in range(50)]
+    control.send("not a command")
+    unknown = control.receive()
+    loop.stop()
+    control.close()
+    assert woken.is_set()
+    assert [r["result"]["i"] for r in replies] == list(range(50))
+    assert len({r["frame"] for r in replies}) == 1          # One batch, one frame
+    assert not unknown["ok"]
+
+
+def test_websocket_fragmented_command(server):
+    loop = MainLoop(server)
+    control = Subscriber(server.port, path="/control", token=server.token)
+    payload = json.dumps([{"id": i, "cmd": "echo", "i": i} for i in range(20)]).encode()
+    third = len(payload) // 3
+    control.send_frame(payload[:third], fin=False)
+    control.send_frame(b"still there?", opcode=0x9)             # Ping between fragments
+    control.send_frame(payload[third:2 * third], opcode=0x0, fin=False)
+    control.send_frame(payload[2 * third:], opcode=0x0)
+    pong = control.receive_frame()
+    replies = [control.receive() for _ in range(20)]
+    loop.stop()
+    control.close()
+    assert pong == (0xA, b"still there?")
+    assert [r["result"]["i"] for r in replies] == list(range(20))
+    assert loop.batches == [["echo"] * 20]                  # One message, one batch
+
+
+def closed_with(control):
+    opcode, payload = control.receive_frame()
+    assert opcode == 0x8
+    with pytest.raises(ConnectionError):
+        control.receive_frame()
+    control.close()
+    return struct.unpack("!H", payload)[0]
+
+
+def test_websocket_rejects_bad_frames(server):
+    control = Subscriber(server.port, path="/control", token=server.token)
+    control.send_frame(b'{"cmd": "echo"}', masked=False)
+    assert closed_with(control) == 1002
+
+    control = Subscriber(server.port, path="/control", token=server.token)
+    control.send_frame(b"[]", opcode=0x0)                   # Continuation with no message
+    assert closed_with(control) == 1002
+
+    control = Subscriber(server.port, path="/control", token=server.token)
+    control.send_frame(b" " * 40_000, fin=False)
+    control.send_frame(b" " * 40_000, opcode=0x0)           # Total above WS_MAX_INCOMING
+    assert closed_with(control) == 1009
+    assert server.poll_commands() == []
+
+
+# =============================================================================
+# LAZY IMPORT
+# =============================================================================
+
+def test_import_does_not_load_asyncio():
+    core = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ui-simulator")
+    code = (
+        "import sys, lps_core, lps_duo_pro\n"
+        "assert 'asyncio' not in sys.modules and 'lps_core.telemetry' not in sys.modules\n"
+        "assert 'TelemetryServer' in dir(lps_core)\n"
+        "from lps_core import TELEMETRY_PORT, TelemetryServer\n"
+        "assert 'asyncio' in sys.modules and lps_core.TelemetryServer is TelemetryServer\n"
+    )
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    subprocess.run([sys.executable, "-c", code], cwd=core, env=env, check=True)
+
+
+# =============================================================================
+# ACCESS CONTROL
+# =============================================================================
+
+def control_status(server, extra):
+    sock = socket.create_connection(("127.0.0.1", server.port), timeout=5.0)
+    try:
+        return handshake(sock, "/control", base64.b64encode(os.urandom(16)).decode(), extra)
+    finally:
+        sock.close()
+
+
+def test_control_requires_token_and_no_origin(server):
+    bearer = f"Authorization: Bearer {server.token}\r\n"
+    assert control_status(server, "").startswith(b"HTTP/1.1 401")
+    assert control_status(server, "Authorization: Bearer wrong\r\n").startswith(b"HTTP/1.1 401")
+    assert control_status(server, bearer + "Origin: https://example.com\r\n").startswith(
+        b"HTTP/1.1 403")
+    assert control_status(server, bearer).startswith(b"HTTP/1.1 101")
+    assert TelemetryServer(port=0).token != server.token            # Per run
+
+    batch = [{"id": 1, "cmd": "echo"}]
+    json_auth = {"Content-Type": "application/json", "Authorization": f"Bearer {server.token}"}
+    for headers, status in (
+            ({"Content-Type": "application/json"}, 401),
+            ({**json_auth, "Origin": "http://localhost:8000"}, 403),
+            ({**json_auth, "Content-Type": "text/plain"}, 415),      # "Simple" cross-site POST
+            ({"Authorization": f"Bearer {server.token}"}, 415)):
+        with pytest.raises(urllib.error.HTTPError) as error:
+            post_commands(server, json.dumps(batch).encode(), headers)
+        assert error.value.code == status
+    assert server.poll_commands() == []
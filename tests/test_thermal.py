@@ -0,0 +1,131 @@
+"""
+Python host tests: multi-node thermal network (lps_core)
+
+Run:        python -m pytest tests
+
+- N ticks of the exact discretization (Ad, Bd) equal the closed-form response at N·h
+- the closed form agrees with a fine RK4 integration of C·dT/dt = -G·T + u
+- the steady state solves G·T = P + g_ext·T_room and balances the dissipated power
+- otp_eta() falls on the tick where the stepped model crosses TEMP_SHUTDOWN
+"""
+
+import copy
+
+import numpy as np
+import pytest
+
+from lps_core import RailPhysicsModel, SimulationMode, ThermalNetwork
+from lps_core.firmware import TEMP_SHUTDOWN
+
+
+def loaded_network(config=((5.0, 1.0), 3.0)):
+    net = ThermalNetwork(2, room_temp=25.0)
+    net.set_config(*config)
+    net.power[net.TRANSFO] = 1.8
+    net.power[net.lm338] = (3.7, 1.2)
+    net.power[net.lt3045] = (0.8, 0.3)
+    net.temps = net.temps + np.linspace(0.0, 14.0, net.n_nodes)   # Not at rest
+    return net
+
+
+def rk4(net, t_end, h):
+    g, _ = net._conductance(net._config)
+    u = net._input().copy()
+    temps = net.temps.copy()
+
+    def slope(x):
+        return (u - g @ x) / net.capacity
+
+    for _ in range(int(round(t_end / h))):
+        k1 = slope(temps)
+        k2 = slope(temps + 0.5 * h * k1)
+        k3 = slope(temps + 0.5 * h * k2)
+        k4 = slope(temps + h * k3)
+        temps = temps + h / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4)
+    return temps
+
+
+# =============================================================================
+# DISCRETIZATION
+# =============================================================================
+
+@pytest.mark.parametrize("h, n", [(0.005, 400), (0.05, 600), (1.0, 900)])
+def test_stepping_matches_closed_form(h, n):
+    net = loaded_network()
+    expected = net.temperatures_at(n * h)
+    for _ in range(n):
+        net.step(h)
+    np.testing.assert_allclose(net.temps, expected, rtol=0, atol=1e-9)
+
+
+def test_closed_form_matches_rk4():
+    net = loaded_network()
+    # LM338 node: τ ≈ C·Rth ≈ 3 s, RK4 at 10 ms is far below its error budget
+    for t in (0.5, 5.0, 60.0):
+        np.testing.assert_allclose(net.temperatures_at(t), rk4(net, t, 0.01),
+                                   rtol=0, atol=1e-8)
+
+
+def test_config_change_uses_new_coefficients():
+    a, b = loaded_network(((1.0, 1.0), 1.0)), loaded_network(((1.0, 1.0), 1.0))
+    a.step(1.0)
+    b.step(1.0)
+    a.set_config((5.0, 1.0), 3.0)
+    expected = a.temperatures_at(10.0)
+    for _ in range(10):
+        a.step(1.0)
+        b.step(1.0)
+    np.testing.assert_allclose(a.temps, expected, rtol=0, atol=1e-9)
+    assert a.temps[a.heatsink[0]] > b.temps[b.heatsink[0]]
+
+
+# =============================================================================
+# STEADY STATE
+# =============================================================================
+
+def test_steady_state_solves_conductance():
+    net = loaded_network()
+    g, g_ext = net._conductance(net._config)
+    u = net.power.copy()
+    u[net.ENCLOSURE] += g_ext * net.room_temp
+    t_ss = net.steady_state()
+    np.testing.assert_allclose(t_ss, np.linalg.inv(g) @ u, rtol=1e-12)
+    # Everything dissipated leaves through the enclosure
+    assert g_ext * (t_ss[net.ENCLOSURE] - net.room_temp) == pytest.approx(net.power.sum())
+    np.testing.assert_allclose(net.temperatures_at(1e6), t_ss, rtol=0, atol=1e-9)
+    net.temps = t_ss.copy()
+    net.step(0.05)
+    np.testing.assert_allclose(net.temps, t_ss, rtol=0, atol=1e-9)
+
+
+# =============================================================================
+# OTP ETA
+# =============================================================================
+
+@pytest.mark.parametrize("rail", [0, 1])
+def test_otp_eta_matches_stepped_crossing(rail):
+    model = RailPhysicsModel(seeds=np.random.SeedSequence(1).spawn(2))
+    model.set_mode(0, SimulationMode.HOT)
+    model.set_mode(1, SimulationMode.LOAD)
+    for _ in range(100):
+        model.step(0.05, [12.0, 12.0])
+    eta = model.otp_eta(rail)
+    assert eta is not None and eta > 60.0
+
+    h = 1.0
+    net = copy.deepcopy(model.thermal)
+    node = net.heatsink[rail]
+    ticks = 0
+    while net.temps[node] < TEMP_SHUTDOWN:
+        net.step(h)
+        ticks += 1
+        assert ticks * h <= 4 * 3600.0
+    assert (ticks - 1) * h < eta <= ticks * h
+
+
+def test_otp_eta_none_when_never_reached():
+    net = ThermalNetwork(2)
+    net.power[net.lm338] = 0.5
+    assert net.time_to_threshold(net.heatsink[0], TEMP_SHUTDOWN) is None
+    net.temps[net.heatsink[0]] = TEMP_SHUTDOWN + 1.0
+    assert net.time_to_threshold(net.heatsink[0], TEMP_SHUTDOWN) == 0.0
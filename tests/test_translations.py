@@ -0,0 +1,104 @@
+"""
+Python host tests: compiled translation tables and external catalogs (lps_core)
+
+Run:        python -m pytest tests
+
+- compiled tables resolve every key, with the English fallback
+- a catalog missing keys, or with an unknown language, changes nothing
+- a valid catalog replaces whole languages at once and survives compile()
+"""
+
+import json
+
+import pytest
+
+from lps_core import Language, T, Translations
+
+
+@pytest.fixture(autouse=True)
+def pristine_translations():
+    current = Translations.get_current_language()
+    yield
+    Translations._catalogs = {}
+    Translations.compile()
+    Translations.set_language(current)
+
+
+def write_catalog(tmp_path, catalog, name="catalog.json"):
+    path = tmp_path / name
+    path.write_text(json.dumps(catalog), encoding="utf-8")
+    return str(path)
+
+
+def full(prefix):
+    return {key: f"{prefix} {key}" for key in Translations.STRINGS} | {"extra_key": prefix}
+
+
+# =============================================================================
+# COMPILED TABLES
+# =============================================================================
+
+def test_tables_cover_every_key_with_english_fallback():
+    for lang in Language:
+        Translations.set_language(lang)
+        for key, entry in Translations.STRINGS.items():
+            assert T(key) == entry.get(lang.name, entry.get("EN", key))
+    assert T("no_such_key") == "no_such_key"
+
+
+def test_next_language_cycles_over_languages():
+    Translations.set_language(Language.FR)
+    seen = []
+    for _ in Language:
+        Translations.next_language()
+        seen.append(Translations.get_current_language())
+    assert set(seen) == set(Language) and seen[-1] is Language.FR
+
+
+# =============================================================================
+# CATALOGS
+# =============================================================================
+
+def test_missing_keys_rejected_without_changes(tmp_path):
+    Translations.set_language(Language.DE)
+    before = {lang: dict(Translations._tables[lang]) for lang in Language}
+    partial = dict(full("ES"))
+    missing = sorted(Translations.STRINGS)[:3]
+    for key in missing:
+        del partial[key]
+    # The valid DE table comes first: it must not be applied either
+    path = write_catalog(tmp_path, {"DE": full("DE"), "ES": partial})
+    with pytest.raises(ValueError, match="ES is missing 3 keys") as info:
+        Translations.load_catalog(path)
+    assert all(key in str(info.value) for key in missing)
+    assert {lang: Translations._tables[lang] for lang in Language} == before
+    assert T("page_listen") == before[Language.DE]["page_listen"]
+
+
+def test_unknown_language_and_extension_rejected(tmp_path):
+    before = {lang: dict(Translations._tables[lang]) for lang in Language}
+    path = write_catalog(tmp_path, {"DE": full("DE"), "IT": full("IT")})
+    with pytest.raises(ValueError, match="Unknown language 'IT'"):
+        Translations.load_catalog(path)
+    with pytest.raises(ValueError, match="No translation loader"):
+        Translations.load_catalog(str(tmp_path / "catalog.xliff"))
+    assert {lang: Translations._tables[lang] for lang in Language} == before
+
+
+def test_catalog_replaces_languages_and_survives_compile(tmp_path):
+    Translations.set_language(Language.ES)
+    english = dict(Translations._tables[Language.EN])
+    path = write_catalog(tmp_path, {"ES": full("ES"), "DE": full("DE")})
+    Translations.load_catalog(path)
+    assert T("page_listen") == "ES page_listen" and T("extra_key") == "ES"
+    assert Translations._tables[Language.DE]["page_listen"] == "DE page_listen"
+    assert Translations._tables[Language.EN] == english
+
+    Translations.compile()
+    assert T("page_listen") == "ES page_listen"
+    # A later catalog only overrides what it provides
+    Translations.load_catalog(write_catalog(tmp_path, {"ES": full("ES2")}, "b.json"))
+    Translations.compile()
+    assert T("page_listen") == "ES2 page_listen"
+    Translations.set_language(Language.DE)
+    assert T("page_listen") == "DE page_listen"
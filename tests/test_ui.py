@@ -0,0 +1,690 @@
+"""
+Python host tests: pygame UI building blocks, headless (lps_duo_pro)
+
+Run:        python -m pytest tests
+
+- importing lps_duo_pro executes neither pygame, NumPy nor sounddevice; pages
+  are built on first visit and startup times are recorded
+- LayoutEngine reproduces the 800x480 reference tables and scales x/width
+  with the screen width, y/height with the screen height
+- FrameScheduler skips frames while the displayed state is unchanged
+- ButtonGrid hit-testing and dispatch agree with a linear scan of the buttons
+- GestureRecognizer tap, long press and swipe thresholds, pause before
+  release, claimed and multi-touch contacts
+- the dashboard budget always renders the oldest stale tile (no starvation)
+- AudioSonifier buffers carry the rails' 100 Hz ripple and noise at their
+  level, and a disabled rail is silent
+- SETTING sliders snap to the firmware's digipot step, preview while
+  dragging and apply on release or after the debounce; the track is cached
+- TRENDS zoom stays within its spans, panning stops at the start of the
+  history and returns to live at the present; every span draws
+- remote checkpoint/restore files stay inside the remote directory
+"""
+
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+import numpy as np                                           # noqa: E402
+
+import lps_duo_pro as ui                                     # noqa: E402
+from lps_core import (DataSimulator, Language, NoiseSynthesizer,  # noqa: E402
+                      SimulationMode)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pygame_headless():
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+# =============================================================================
+# STARTUP
+# =============================================================================
+
+def test_import_defers_heavy_modules():
+    script = (
+        "import sys, lps_duo_pro\n"
+        "heavy = ('pygame.base', 'numpy._core', 'numpy.core', 'sounddevice')\n"
+        "loaded = lambda: [m for m in heavy if m in sys.modules]\n"
+        "assert loaded() == [], loaded()\n"
+        "lps_duo_pro.Translations.set_language(lps_duo_pro.Language.EN)\n"
+        "assert lps_duo_pro.T('page_health') and loaded() == [], loaded()\n"
+        "lps_duo_pro.DataSimulator(seed=1).update(0.1)\n"
+        "assert 'pygame.base' not in sys.modules and 'sounddevice' not in sys.modules\n"
+    )
+    ui_dir = os.path.dirname(ui.__file__)
+    subprocess.run([sys.executable, "-c", script], cwd=ui_dir, check=True, timeout=60)
+
+
+def test_pages_built_on_first_visit():
+    app = ui.LPSDuoProApp(size=(400, 240), seed=1)
+    try:
+        assert app.pages == [None] * len(app.page_classes)
+        assert set(app.startup_times) == {"import", "init"}
+        app.navigate(6)
+        app.draw_page(app.current_page, app.screen)
+        assert [i for i, page in enumerate(app.pages) if page is not None] == [6]
+        assert isinstance(app.pages[6], app.page_classes[6])
+        assert app.get_page(6) is app.pages[6]
+    finally:
+        app.fault_log.close()
+
+
+# =============================================================================
+# LAYOUT ENGINE
+# =============================================================================
+
+def axis(key):
+    """Layout key convention: x/width follow the width, y/height/spacing the height"""
+    if key == "x" or key.endswith(("_x", "width")):
+        return "x"
+    if key == "y" or key.endswith(("_y", "height", "spacing")):
+        return "y"
+    return None
+
+
+def expected(key, value, sx, sy):
+    if isinstance(value, dict):
+        return pygame.Rect(round(value["x"] * sx), round(value["y"] * sy),
+                           round(value["width"] * sx), round(value["height"] * sy))
+    scale = {"x": sx, "y": sy, None: None}[axis(key)]
+    if scale is None:
+        return value
+    if isinstance(value, tuple):
+        return tuple(round(v * scale) for v in value)
+    return round(value * scale)
+
+
+def test_reference_size_reproduces_tables():
+    layout = ui.LayoutEngine(ui.PAGE_LAYOUTS)
+    assert layout.resolve((800, 480), Language.FR)
+    assert layout.scale == 1.0 and layout.size == (800, 480)
+    for name, table in ui.PAGE_LAYOUTS.items():
+        assert set(layout[name]) == set(table)
+        for key, value in table.items():
+            if isinstance(value, dict):
+                assert layout[name][key] == pygame.Rect(value["x"], value["y"],
+                                                        value["width"], value["height"])
+            else:
+                assert layout[name][key] == value
+    for name in ui.FONT_SIZES:
+        assert layout.font_size(name) == ui.FONT_SIZES[name]
+    assert not layout.resolve((800, 480), Language.FR)
+    assert not layout.resolve([800, 480], Language.FR)
+    assert layout.resolutions == 1
+
+
+@pytest.mark.parametrize("size", [(1024, 600), (480, 272), (800, 600)])
+def test_scaled_sizes(size):
+    layout = ui.LayoutEngine(ui.PAGE_LAYOUTS)
+    layout.resolve(size, Language.EN)
+    sx, sy = size[0] / 800, size[1] / 480
+    for name, table in ui.PAGE_LAYOUTS.items():
+        for key, value in table.items():
+            assert layout[name][key] == expected(key, value, sx, sy), (name, key)
+    assert layout.x(800) == size[0] and layout.y(480) == size[1]
+    assert layout.font_size("medium") == max(8, round(28 * min(sx, sy)))
+    assert layout.center_x == size[0] // 2
+
+
+def test_language_change_keeps_geometry_and_drops_titles():
+    layout = ui.LayoutEngine(ui.PAGE_LAYOUTS)
+    layout.resolve((480, 272), Language.FR)
+    nav = layout["app"]["nav_height"]
+    font = pygame.font.Font(None, layout.font_size("large"))
+    surf, pos = layout.title("page_listen", font, 10)
+    assert layout.title("page_listen", font, 10)[0] is surf
+    assert pos == (layout.center_x - surf.get_width() // 2, 10)
+    assert layout.resolve((480, 272), Language.DE)
+    assert layout["app"]["nav_height"] == nav == 20
+    assert layout.title("page_listen", font, 10)[0] is not surf
+    assert layout.resolutions == 2
+
+
+# =============================================================================
+# BUTTON GRID
+# =============================================================================
+
+def random_buttons(rng, n=60, size=(800, 480), overlap=True):
+    """Buttons of every size, many straddling one or more grid cell boundaries"""
+    buttons = []
+    while len(buttons) < n:
+        w, h = rng.randint(1, 200), rng.randint(1, 120)
+        x, y = rng.randint(-20, size[0] - 1), rng.randint(-20, size[1] - 1)
+        button = ui.Button(x, y, w, h, str(len(buttons)))
+        if overlap or button.rect.collidelist([b.rect for b in buttons]) < 0:
+            buttons.append(button)
+    return buttons
+
+
+def linear_hit(buttons, pos):
+    return next((b for b in buttons if b.rect.collidepoint(pos)), None)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_grid_hit_matches_linear_scan(seed):
+    rng = random.Random(seed)
+    buttons = random_buttons(rng)
+    grid = ui.ButtonGrid(buttons)
+    points = [(rng.randint(-30, 830), rng.randint(-30, 510)) for _ in range(3000)]
+    # Edges and corners: right/bottom are exclusive, cells are CELL px wide
+    for b in buttons:
+        r = b.rect
+        points += [r.topleft, (r.right - 1, r.bottom - 1), (r.right, r.top), (r.left, r.bottom),
+                   (r.left - 1, r.top)]
+    points += [(c * ui.ButtonGrid.CELL + d, c * ui.ButtonGrid.CELL + d)
+               for c in range(-1, 13) for d in (-1, 0)]
+    for pos in points:
+        assert grid.hit(pos) is linear_hit(buttons, pos), pos
+
+
+def test_grid_dispatch_matches_all_buttons():
+    # Pages never overlap their buttons: then only the hit and tracked ones matter
+    gridded = random_buttons(random.Random(7), 25, overlap=False)
+    reference = random_buttons(random.Random(7), 25, overlap=False)
+    grid = ui.ButtonGrid(gridded)
+    rng = random.Random(8)
+    for step in range(2000):
+        pos = (rng.randint(0, 799), rng.randint(0, 479))
+        kind = rng.choice((pygame.MOUSEMOTION, pygame.MOUSEMOTION,
+                           pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+        attrs = {"pos": pos} if kind == pygame.MOUSEMOTION else {"pos": pos, "button": 1}
+        event = pygame.event.Event(kind, attrs)
+        clicked = grid.handle_event(event)
+        expected = False
+        for button in reference:
+            expected |= button.handle_event(event)
+        assert clicked == expected, step
+        assert ([(b.hover, b.pressed) for b in gridded] ==
+                [(b.hover, b.pressed) for b in reference]), step
+
+
+# =============================================================================
+# GESTURES
+# =============================================================================
+
+FRAME = 1 / 60
+
+
+def mouse(kind, pos, **attrs):
+    if kind != pygame.MOUSEMOTION:
+        attrs.setdefault("button", 1)
+    return pygame.event.Event(kind, pos=pos, **attrs)
+
+
+def finger(kind, finger_id, pos, size=(800, 480)):
+    return pygame.event.Event(kind, finger_id=finger_id, x=pos[0] / size[0], y=pos[1] / size[1])
+
+
+def kinds(gestures):
+    return [g.kind for g in gestures]
+
+
+def stroke(recognizer, start, end, duration, t=0.0, pause=0.0, release=True):
+    """Mouse press, straight move at 60 Hz, optional pause, release; all gestures"""
+    gestures = recognizer.process([mouse(pygame.MOUSEBUTTONDOWN, start)], t)
+    steps = max(1, int(round(duration / FRAME)))
+    for i in range(1, steps + 1):
+        t += FRAME
+        pos = (start[0] + (end[0] - start[0]) * i / steps,
+               start[1] + (end[1] - start[1]) * i / steps)
+        gestures += recognizer.process([mouse(pygame.MOUSEMOTION, pos)], t)
+    while pause > 1e-9:
+        t += min(FRAME, pause)
+        pause -= FRAME
+        gestures += recognizer.process([], t)
+    if release:
+        gestures += recognizer.process([mouse(pygame.MOUSEBUTTONUP, end)], t + FRAME)
+    return gestures
+
+
+def test_tap_within_slop():
+    recognizer = ui.GestureRecognizer()
+    assert kinds(stroke(recognizer, (100, 100), (100 + ui.TAP_SLOP_PX - 1, 100), 0.1)) == ["tap"]
+    gestures = stroke(recognizer, (100, 100), (100 + ui.TAP_SLOP_PX + 1, 100), 0.1)
+    assert kinds(gestures)[0] == "drag_start" and "tap" not in kinds(gestures)
+    assert kinds(gestures)[-1] == "drag_end"
+    assert not recognizer.contacts
+
+
+def test_long_press_threshold():
+    recognizer = ui.GestureRecognizer()
+    recognizer.process([mouse(pygame.MOUSEBUTTONDOWN, (50, 50))], 0.0)
+    assert recognizer.process([], ui.LONG_PRESS_S - 0.01) == []
+    long_press = recognizer.process([], ui.LONG_PRESS_S)
+    assert kinds(long_press) == ["long_press"] and long_press[0].pos == (50, 50)
+    assert recognizer.process([], ui.LONG_PRESS_S + 0.5) == []       # Fired once
+    # Neither a tap nor a drag afterwards
+    assert recognizer.process([mouse(pygame.MOUSEMOTION, (90, 50)),
+                               mouse(pygame.MOUSEBUTTONUP, (90, 50))], 1.5) == []
+
+
+def test_swipe_thresholds():
+    recognizer = ui.GestureRecognizer()
+    right = stroke(recognizer, (100, 240), (100 + ui.SWIPE_MIN_PX + 30, 250), 0.15)
+    swipe = [g for g in right if g.kind == "swipe"]
+    assert len(swipe) == 1 and swipe[0].direction == 1
+    assert swipe[0].velocity[0] >= ui.SWIPE_MIN_SPEED
+    left = stroke(recognizer, (500, 240), (500 - ui.SWIPE_MIN_PX - 30, 240), 0.15, t=2.0)
+    assert [g.direction for g in left if g.kind == "swipe"] == [-1]
+    # Too short, too slow, too vertical: drags only
+    for end, duration in (((100 + ui.SWIPE_MIN_PX - 10, 240), 0.05),
+                          ((100 + ui.SWIPE_MIN_PX + 30, 240), 2.0),
+                          ((250, 400), 0.1)):
+        gestures = stroke(recognizer, (100, 240), end, duration, t=5.0)
+        assert "swipe" not in kinds(gestures) and kinds(gestures)[-1] == "drag_end"
+
+
+def test_pause_before_release_zeroes_velocity():
+    recognizer = ui.GestureRecognizer()
+    short = stroke(recognizer, (100, 240), (400, 240), 0.15, pause=ui.SWIPE_MAX_PAUSE_S / 2)
+    assert "swipe" in kinds(short)
+    paused = stroke(recognizer, (100, 240), (400, 240), 0.15, t=3.0,
+                    pause=ui.SWIPE_MAX_PAUSE_S + 0.1)
+    assert "swipe" not in kinds(paused)
+    assert paused[-1].kind == "drag_end" and paused[-1].velocity == (0.0, 0.0)
+
+
+def test_claimed_and_multi_touch_contacts_do_not_swipe():
+    recognizer = ui.GestureRecognizer()
+    gestures = stroke(recognizer, (100, 240), (400, 240), 0.15, release=False)
+    recognizer.claim(ui.MOUSE_CONTACT)
+    gestures += recognizer.process([mouse(pygame.MOUSEBUTTONUP, (400, 240))], 0.3)
+    assert "swipe" not in kinds(gestures) and kinds(gestures)[-1] == "drag_end"
+
+    # Two fingers: a pinch or two-finger drag is never a page swipe
+    t = 1.0
+    gestures = recognizer.process([finger(pygame.FINGERDOWN, 1, (100, 200)),
+                                   finger(pygame.FINGERDOWN, 2, (100, 300))], t)
+    for i in range(1, 10):
+        t += FRAME
+        gestures += recognizer.process([finger(pygame.FINGERMOTION, 1, (100 + 35 * i, 200)),
+                                        finger(pygame.FINGERMOTION, 2, (100 + 35 * i, 300))], t)
+    gestures += recognizer.process([finger(pygame.FINGERUP, 1, (415, 200))], t + FRAME)
+    gestures += recognizer.process([finger(pygame.FINGERUP, 2, (415, 300))], t + 2 * FRAME)
+    assert "swipe" not in kinds(gestures) and kinds(gestures).count("drag_end") == 2
+    # A single finger swipes again once all contacts are lifted
+    gestures = recognizer.process([finger(pygame.FINGERDOWN, 3, (100, 200))], 3.0)
+    for i in range(1, 10):
+        gestures += recognizer.process([finger(pygame.FINGERMOTION, 3, (100 + 35 * i, 200))],
+                                       3.0 + i * FRAME)
+    gestures += recognizer.process([finger(pygame.FINGERUP, 3, (415, 200))], 3.0 + 10 * FRAME)
+    assert "swipe" in kinds(gestures)
+
+
+def test_touch_synthesized_mouse_events_ignored():
+    recognizer = ui.GestureRecognizer()
+    events = [mouse(pygame.MOUSEBUTTONDOWN, (10, 10), touch=True),
+              mouse(pygame.MOUSEBUTTONUP, (10, 10), touch=True)]
+    assert recognizer.process(events, 0.0) == [] and not recognizer.contacts
+
+
+# =============================================================================
+# FRAME SCHEDULER
+# =============================================================================
+
+def idle_scheduler(**kwargs):
+    """Scheduler whose last input is older than the active hold"""
+    scheduler = ui.FrameScheduler(**kwargs)
+    scheduler._last_input = scheduler._last_frame - 2 * ui.ACTIVE_HOLD_S
+    return scheduler
+
+
+def test_should_draw_skips_unchanged_state():
+    scheduler = idle_scheduler()
+    assert scheduler.should_draw(("ECOUTE", 12.0, 150), False)
+    for _ in range(5):
+        assert not scheduler.should_draw(("ECOUTE", 12.0, 150), False)
+        assert not scheduler.active              # Next wait uses the idle interval
+    assert scheduler.should_draw(("ECOUTE", 12.0, 151), False)
+    assert not scheduler.should_draw(("ECOUTE", 12.0, 151), False)
+    # Input forces a frame; animated pages (state None) always draw at full rate
+    assert scheduler.should_draw(("ECOUTE", 12.0, 151), True)
+    assert scheduler.should_draw(None, False) and scheduler.active
+    assert scheduler.should_draw(None, False)
+
+
+def test_recent_input_keeps_full_rate():
+    scheduler = ui.FrameScheduler()              # Construction counts as the last input
+    assert scheduler.should_draw("state", False)
+    assert scheduler.should_draw("state", False) and scheduler.active
+    scheduler._last_input -= 2 * ui.ACTIVE_HOLD_S
+    assert not scheduler.should_draw("state", False) and not scheduler.active
+
+
+def test_fixed_rate_always_draws():
+    scheduler = idle_scheduler(adaptive=False)
+    for _ in range(3):
+        assert scheduler.should_draw("state", False) and scheduler.active
+
+
+def test_wait_events_wakes_on_input():
+    scheduler = idle_scheduler()
+    scheduler.should_draw("state", False)
+    scheduler.wait_events()
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+    events = scheduler.wait_events()
+    assert any(event.type == pygame.USEREVENT for event in events)
+    assert scheduler.input_time is not None
+    scheduler.record_latency()
+    assert scheduler.latency_count == 1 and scheduler.input_time is None
+
+
+# =============================================================================
+# DASHBOARD
+# =============================================================================
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    app = ui.LPSDuoProApp(size=(400, 240), dashboard=True, seed=1)
+    app.boot_screen = False
+    dash = app.dashboard
+    dash.order = []
+    render_tile = dash._render_tile
+
+    def recorded(index):
+        dash.order.append((dash.frames, index))
+        render_tile(index)
+
+    monkeypatch.setattr(dash, "_render_tile", recorded)
+    yield dash
+    app.fault_log.close()
+
+
+def invalidate(dash):
+    """Every tile stale: worst case for the budget"""
+    dash._keys = [object()] * len(dash.rects)
+    dash._stale = None
+
+
+def frame_renders(dash, frame):
+    return [index for f, index in dash.order if f == frame]
+
+
+def test_first_pass_renders_every_tile_once(dashboard):
+    dashboard.budget = 0.0                    # Only the mandatory first tile per frame
+    n = len(dashboard.rects)
+    for frame in range(1, n + 1):
+        assert dashboard.render() == 1
+    assert sorted(index for _, index in dashboard.order) == list(range(n))
+    assert all(tile is not None for tile in dashboard.tiles)
+    assert dashboard.deferred >= sum(range(n))    # Animated pages stay stale
+
+
+def test_oldest_stale_tile_always_rendered(dashboard):
+    dashboard.budget = 0.0
+    n = len(dashboard.rects)
+    for _ in range(4 * n):
+        invalidate(dashboard)
+        rendered_at = list(dashboard._rendered_at)
+        oldest = min(range(n), key=lambda i: (rendered_at[i], i))
+        dashboard.render()
+        assert frame_renders(dashboard, dashboard.frames) == [oldest]
+    # Strict rotation: every page rendered 4 times
+    assert dashboard.renders == [4] * n
+
+
+def test_heavy_page_is_not_starved(dashboard):
+    dashboard.budget = 0.050
+    n = len(dashboard.rects)
+    heavy = 3
+    last = {}
+    for _ in range(6 * n):
+        invalidate(dashboard)
+        dashboard.cost[heavy] = 1.0           # Never fits in the budget next to another tile
+        dashboard.render()
+        for index in frame_renders(dashboard, dashboard.frames):
+            last[index] = dashboard.frames
+        # Every tile, the heavy one included, comes back within one rotation
+        for index in range(n):
+            if dashboard.frames > 2 * n:
+                assert dashboard.frames - last[index] <= n, (index, dashboard.frames)
+    heavy_frames = [f for f, index in dashboard.order if index == heavy]
+    assert all(frame_renders(dashboard, f)[0] == heavy for f in heavy_frames[1:])
+    assert dashboard.renders[heavy] >= 5 and dashboard.deferred > 0
+
+
+# =============================================================================
+# AUDIO
+# =============================================================================
+
+def listen(advance, seconds=2.0, volume=0.1):
+    """Renders audio frame by frame while the synthesizer advances (no audio device)"""
+    sonifier = ui.AudioSonifier(advance())
+    sonifier.volume = volume
+    frames = round(ui.AUDIO_SAMPLE_RATE / 30)
+    sonifier.render(frames)                   # First read resyncs behind the writer
+    chunks = []
+    for _ in range(round(seconds * 30)):
+        advance()
+        chunks.append(sonifier.render(frames))
+    assert sonifier.underruns == 0
+    return np.concatenate(chunks)
+
+
+def test_audio_follows_ripple():
+    sim = DataSimulator(seed=5)
+    sim.set_simulation_mode(SimulationMode.RIPPLE, "A")
+    for _ in range(60):
+        sim.update(1 / 30)
+
+    def advance():
+        sim.update(1 / 30)
+        return sim.synth.ring
+
+    audio = listen(advance)
+    scale = 0.1 / ui.AUDIO_FULL_SCALE_UV
+    # Ripple dominates both rails: strongest line at 100 Hz, in the ratio of the models
+    spectrum = np.abs(np.fft.rfft(audio, axis=0))
+    freqs = np.fft.rfftfreq(len(audio), 1.0 / ui.AUDIO_SAMPLE_RATE)
+    peak = spectrum[1:].argmax(axis=0) + 1
+    assert freqs[peak] == pytest.approx([100.0, 100.0], abs=1.0)
+    ripple_uv = sim.model.ripple_uv
+    assert spectrum[peak[0], 0] / spectrum[peak[1], 1] == pytest.approx(
+        ripple_uv[0] / ripple_uv[1], rel=0.05)
+    # Rail A (RIPPLE, noise negligible) spans its pk-pk ripple
+    assert np.ptp(audio[:, 0]) == pytest.approx(ripple_uv[0] * scale, rel=0.05)
+
+
+def test_audio_follows_noise():
+    synth = NoiseSynthesizer(seeds=np.random.SeedSequence(5).spawn(2))
+    ripple_uv, noise_uv = np.zeros(2), np.array([1.0, 4.0])
+
+    def advance():
+        synth.update(1 / 30, ripple_uv, noise_uv)
+        return synth.ring
+
+    for _ in range(30):                       # Fill the ring past the reader latency
+        advance()
+    audio = listen(advance)
+    rms = np.sqrt(np.mean(audio.astype(float) ** 2, axis=0))
+    assert rms[1] / rms[0] == pytest.approx(4.0, rel=0.1)
+    # Linear interpolation keeps most of the band (white noise: √(2/3))
+    assert rms[0] == pytest.approx(0.1 / ui.AUDIO_FULL_SCALE_UV, rel=0.25)
+
+
+def test_disabled_rail_is_silent():
+    sim = DataSimulator(seed=5)
+    sim.set_simulation_mode(SimulationMode.LOAD, "B")
+    for _ in range(60):                       # OCP trips, then the ring flushes
+        sim.update(1 / 30)
+    assert not sim.model.enabled[1]
+
+    def advance():
+        sim.update(1 / 30)
+        return sim.synth.ring
+
+    audio = listen(advance)
+    assert np.ptp(audio[:, 0]) > 0.0
+    assert not audio[:, 1].any()
+
+
+# =============================================================================
+# SETTING
+# =============================================================================
+
+@pytest.fixture
+def app():
+    app = ui.LPSDuoProApp(size=(800, 480), seed=1)
+    app.boot_screen = False
+    yield app
+    app.fault_log.close()
+
+
+def open_page(app, page_class):
+    index = app.page_classes.index(page_class)
+    app.navigate(index)
+    return app.get_page(index)
+
+
+def test_slider_snaps_to_digipot_steps(app):
+    page = open_page(app, ui.PageSetting)
+    steps = ui.digipot_voltages(range(page.POS_MAX + 2))   # POS_MAX + 1 clips to 15 V
+    rect = page.slider_rects[0]
+    for x in range(rect.x - 5, rect.right + 5):
+        frac = min(max((x - rect.x) / (rect.width - 1), 0.0), 1.0)
+        volts = ui.V_OUT_MIN + frac * (ui.V_OUT_MAX_SET - ui.V_OUT_MIN)
+        pos = page._x_position(0, x)
+        # voltageToDigipot rounds the wiper resistance: the step brackets the finger
+        assert pos == ui.voltage_to_digipot(volts) <= page.POS_MAX
+        assert steps[max(pos - 1, 0)] <= volts <= steps[pos + 1], x
+
+
+def test_drag_previews_then_applies_on_release(app):
+    page = open_page(app, ui.PageSetting)
+    sim = app.simulator
+    rect = page.slider_rects[1]
+    start = sim.get_digipot("B")
+    assert page.handle_gesture(ui.Gesture("drag_start", rect.center, 1))
+    x = rect.x + rect.width // 4
+    page.handle_gesture(ui.Gesture("drag", (x, rect.centery), 1))
+    page.update(0.0)                          # Within the debounce: preview only
+    assert page.positions[1] == page._x_position(1, x) != start
+    assert sim.get_digipot("B") == start
+    page.handle_gesture(ui.Gesture("drag_end", (x, rect.centery), 1))
+    assert sim.get_digipot("B") == page.positions[1]
+    assert sim.data.rail_b.voltage_target == ui.digipot_to_voltage(page.positions[1])
+
+
+def test_keys_apply_after_debounce_within_range(app, monkeypatch):
+    page = open_page(app, ui.PageSetting)
+    sim = app.simulator
+    right = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)
+    for _ in range(page.POS_MAX + 5):
+        page.handle_event(right)
+    assert page.positions[0] == page.POS_MAX
+    page.update(0.0)
+    assert sim.get_digipot("A") != page.POS_MAX
+    monkeypatch.setattr(page, "APPLY_DEBOUNCE_S", 0.0)
+    page.update(0.0)
+    assert sim.get_digipot("A") == page.POS_MAX
+    assert sim.data.rail_a.voltage_target == pytest.approx(ui.V_OUT_MAX_SET, abs=0.05)
+
+
+def test_slider_track_is_cached(app, monkeypatch):
+    page = open_page(app, ui.PageSetting)
+    ui.StaticCache.clear()
+    built = []
+    create = page._create_track
+    monkeypatch.setattr(page, "_create_track", lambda: built.append(1) or create())
+    rect = page.slider_rects[0]
+    page.handle_gesture(ui.Gesture("drag_start", rect.center, 1))
+    for x in range(rect.x, rect.right, 7):
+        page.handle_gesture(ui.Gesture("drag", (x, rect.centery), 1))
+        page.draw(app.screen)
+    assert built == [1]
+
+
+# =============================================================================
+# TRENDS
+# =============================================================================
+
+def key(k):
+    return pygame.event.Event(pygame.KEYDOWN, key=k)
+
+
+def test_trend_pan_and_zoom(app):
+    sim = app.simulator
+    sim.time_scale = 600.0
+    for _ in range(200):                      # ~1 h 07 simulated
+        sim.update(1 / 30)
+    page = open_page(app, ui.PageTrend)
+    for _ in range(10):
+        page.handle_event(key(pygame.K_UP))
+    assert page.span == page.SPANS[0]
+    page.handle_event(key(pygame.K_LEFT))
+    assert page.t_end == pytest.approx(sim.sim_time - page.span / 4)
+    for _ in range(1000):
+        page.handle_event(key(pygame.K_LEFT))
+    assert page.t_end == pytest.approx(sim.history.t_first + page.span)
+    for _ in range(1000):
+        page.handle_event(key(pygame.K_RIGHT))
+        if page.t_end is None:
+            break
+    assert page.t_end is None                 # Back to live
+
+    for index in range(len(page.SPANS)):
+        page.span_idx = index
+        for end in (None, sim.history.t_first + page.span):
+            page.t_end = end
+            page.draw(app.screen)
+    for _ in range(10):
+        page.handle_event(key(pygame.K_DOWN))
+    assert page.span == page.SPANS[-1]
+
+
+# =============================================================================
+# REMOTE FILES
+# =============================================================================
+
+@pytest.fixture
+def remote_app(tmp_path):
+    app = ui.LPSDuoProApp(size=(400, 240), seed=1, remote_dir=str(tmp_path / "remote"))
+    yield app
+    app.fault_log.close()
+
+
+def test_remote_files_stay_in_remote_dir(remote_app, tmp_path):
+    sim = remote_app.simulator
+    sim.update(1 / 30)
+    assert remote_app.remote_checkpoint("a.snap")["path"] == "a.snap"
+    assert (tmp_path / "remote" / "a.snap").is_file()
+    expected = sim.snapshot()
+    sim.update(1 / 30)
+    remote_app.remote_restore(path="a.snap")
+    assert sim.snapshot() == expected
+
+    (tmp_path / "outside").mkdir()
+    os.symlink(tmp_path / "outside", tmp_path / "remote" / "link")
+    os.symlink(tmp_path / "outside" / "b.snap", tmp_path / "remote" / "b.snap")
+    for name in ("/tmp/a.snap", str(tmp_path / "remote" / "a.snap"), "../a.snap",
+                 "link/a.snap", "b.snap", "..", ".", "..\\a.snap"):
+        with pytest.raises(ValueError):
+            remote_app.remote_checkpoint(name)
+        with pytest.raises(ValueError):
+            remote_app.remote_restore(path=name)
+    assert list((tmp_path / "outside").iterdir()) == []
+
+    remote_app.remote_dir = None
+    with pytest.raises(ValueError):
+        remote_app.remote_checkpoint("a.snap")
+
+
+def test_remote_state_round_trip(remote_app):
+    sim = remote_app.simulator
+    state = remote_app.remote_checkpoint()["state"]
+    expected = sim.snapshot()
+    sim.update(1 / 30)
+    remote_app.remote_restore(state=state)
+    assert sim.snapshot() == expected
+    with pytest.raises(ValueError):
+        remote_app.remote_restore(state="not base64!")
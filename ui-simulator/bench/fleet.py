@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Débit d'AnomalyDetector pour une flotte de rails (tableau README "Early Warnings")
+
+Usage:      python bench/fleet.py [N_RAILS ...]
+
+Chaque taille de flotte reçoit des mesures bruitées autour d'un point de
+fonctionnement, est chauffée jusqu'à ce que toutes les voies soient
+apprises, puis chronométrée sur des appels update() successifs (médiane
+de plusieurs répétitions, un cœur).
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from lps_core import AnomalyDetector
+from lps_core.simulator import ANOMALY_FLOORS
+
+DEFAULT_SIZES = (2, 1_000, 10_000, 100_000)
+STEP_S = 0.5                   # Pas simulé entre deux échantillons
+READINGS = 8                   # Échantillons pré-tirés, rejoués en boucle
+OPERATING_POINT = (12.0, 150.0, 40.0, 5.0)   # V, mA, °C, µV
+
+
+def readings(n_rails: int, rng: np.random.Generator) -> np.ndarray:
+    """(READINGS, n_rails, métriques): point de fonctionnement + bruit de mesure"""
+    shape = (READINGS, n_rails, len(ANOMALY_FLOORS))
+    return np.asarray(OPERATING_POINT) + rng.standard_normal(shape) * np.asarray(ANOMALY_FLOORS)
+
+
+def bench(n_rails: int, repeats: int = 7) -> float:
+    """Durée médiane d'un update() (s) sur une flotte de n_rails déjà apprise"""
+    rng = np.random.default_rng(n_rails)
+    samples = readings(n_rails, rng)
+    detector = AnomalyDetector(n_rails, ANOMALY_FLOORS)
+    i = 0
+    while not detector.warm.all():
+        detector.update(samples[i % READINGS], STEP_S)
+        i += 1
+    
+    def one():
+        nonlocal i
+        detector.update(samples[i % READINGS], STEP_S)
+        i += 1
+    
+    number = max(5, min(2000, 2_000_000 // n_rails))
+    return sorted(timeit.repeat(one, number=number, repeat=repeats))[repeats // 2] / number
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    metrics = len(ANOMALY_FLOORS)
+    print(f"| Rails ({metrics} metrics each) | Time per update | Metric samples/s |")
+    print("|------------------------|-----------------|------------------|")
+    for n_rails in sizes:
+        t = bench(n_rails)
+        rails = f"{n_rails:,}".replace(",", " ")
+        print(f"| {rails} | {t * 1e3:.3f} ms | {n_rails * metrics / t / 1e6:.1f} M |")
+
+
+if __name__ == "__main__":
+    main()
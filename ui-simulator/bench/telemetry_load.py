@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Charge du serveur de télémétrie: coût CPU par abonné /stream (README "Telemetry")
+
+Usage:      python bench/telemetry_load.py [N_CLIENTS ...]
+
+Les abonnés tournent dans un processus séparé qui vide ses sockets sans
+rien analyser: seul le thread serveur est mesuré (horloge CPU du thread,
+Linux/macOS). Chaque instantané vient d'un DataSimulator qui avance d'une
+image; la mesure attend que le thread serveur ait traité la diffusion.
+"""
+
+import asyncio
+import base64
+import multiprocessing
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lps_core import DataSimulator, TelemetryServer
+from lps_core.telemetry import snapshot
+
+DEFAULT_SIZES = (1, 100, 300, 800)
+SNAPSHOTS = 200                # Diffusions mesurées par taille
+FRAME_S = 1 / 30
+
+
+def subscribers(port: int, n_clients: int, ready, stop):
+    """Processus abonnés: n_clients WebSocket /stream vidés en continu"""
+    selector = selectors.DefaultSelector()
+    for i in range(n_clients):
+        sock = socket.create_connection(("127.0.0.1", port))
+        key = base64.b64encode(i.to_bytes(16, "big")).decode()
+        sock.sendall(f"GET /stream HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n"
+                     f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+                     f"Sec-WebSocket-Version: 13\r\n\r\n".encode())
+        head = b""
+        while b"\r\n\r\n" not in head:
+            head += sock.recv(1)
+        if not head.startswith(b"HTTP/1.1 101"):
+            raise ConnectionError(head.decode(errors="replace"))
+        sock.setblocking(False)
+        selector.register(sock, selectors.EVENT_READ)
+    ready.set()
+    while not stop.is_set():
+        for key, _ in selector.select(0.1):
+            try:
+                key.fileobj.recv(1 << 16)
+            except BlockingIOError:
+                pass
+
+
+def thread_cpu(thread: threading.Thread) -> float:
+    return time.clock_gettime(time.pthread_getcpuclockid(thread.ident))
+
+
+def bench(n_clients: int):
+    """(µs CPU serveur par instantané, par abonné, ms de rendu par instantané)"""
+    server = TelemetryServer(port=0, interval=0.0)
+    port = server.start()
+    worker = next(t for t in threading.enumerate() if t.name == "telemetry")
+    context = multiprocessing.get_context("spawn")
+    ready, stop = context.Event(), context.Event()
+    process = context.Process(target=subscribers, args=(port, n_clients, ready, stop))
+    process.start()
+    try:
+        ready.wait()
+        while server.clients < n_clients:
+            time.sleep(0.01)
+        sim = DataSimulator(seed=1)
+
+        def settle():
+            # FIFO de la boucle: la diffusion déjà confiée est traitée au retour
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), server._loop).result()
+
+        render = 0.0
+        cpu = thread_cpu(worker)
+        for _ in range(SNAPSHOTS):
+            sim.update(FRAME_S)
+            t0 = time.perf_counter()
+            snapshot(sim)
+            render += time.perf_counter() - t0
+            server.publish(sim)
+            settle()
+        cpu = thread_cpu(worker) - cpu
+    finally:
+        stop.set()
+        process.join()
+        server.stop()
+    per_snapshot = cpu / SNAPSHOTS
+    return per_snapshot * 1e6, per_snapshot / n_clients * 1e6, render / SNAPSHOTS * 1e3
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    print("| Subscribers | Server CPU per snapshot | Per subscriber | Snapshot build |")
+    print("|-------------|-------------------------|----------------|----------------|")
+    for n_clients in sizes:
+        total, each, render = bench(n_clients)
+        print(f"| {n_clients} | {total / 1e3:.2f} ms | {each:.1f} µs | {render:.3f} ms |")
+
+
+if __name__ == "__main__":
+    main()
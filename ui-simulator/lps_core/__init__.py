@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+LPS DUO PRO - Cœur de simulation sans dépendance pygame
+
+Traductions, constantes firmware, structures de données, logique de
+protection du firmware co-simulée, modèle physique des rails, synthèse
+bruit/ripple, flux aléatoires par rail, historique multi-résolution,
+métriques qualité, alertes précoces en flux, EEPROM émulée, journal des fautes
+(SQLite), générateur de données (instantanés binaires), serveur de télémétrie local,
+tampons réutilisés et mesure des allocations par section de rendu.
+Utilisable en traitement par lots ou sur serveur sans pile d'affichage:
+    
+    from lps_core import DataSimulator, SimulationMode
+    
+    sim = DataSimulator(seed=1234)
+    sim.set_simulation_mode(SimulationMode.HOT)
+    for _ in range(3600):
+        sim.update(1.0)
+    print(sim.data.rail_a.temperature_c)
+
+NumPy n'est chargé qu'au premier usage du modèle (import différé), et le
+serveur de télémétrie (asyncio, ssl) qu'au premier accès à l'un de ses noms.
+"""
+
+from .lazy import lazy_import
+from .translations import Language, Translations, T
+from .firmware import (
+    V_OUT_MAX, V_OUT_RESET, V_PRE_MAX, BACKFEED_THRESHOLD,
+    I_MAX_LOW_V, I_MAX_MID_V, I_MAX_HIGH_V,
+    TEMP_WARNING, TEMP_SHUTDOWN, TEMP_RESET,
+    V_OUT_MIN, V_OUT_MAX_SET, V_HEADROOM,
+    OCP_DELAY_S, OVP_DELAY_S, DIGIPOT_STEPS, SMOOTH_FACTOR, STABILITY_SMOOTH,
+    get_adaptive_current_limit, adc_voltage, digipot_to_voltage, voltage_to_digipot,
+    digipot_voltages, voltages_to_digipot,
+    quality_index, quality_label_key, temperature_label_key,
+)
+from .data import SimulationMode, RailData, SystemData, FaultEvent
+from .controller import (
+    FirmwareController, FIRMWARE_LOOP_MS, FAULT_CODES, FAULT_NONE,
+    FAULT_OVP, FAULT_OCP, FAULT_OTP, FAULT_BACKFEED, FAULT_OVP_PRE,
+)
+from .streams import RailStreams, rail_seeds, STREAM_BLOCK
+from .physics import ThermalNetwork, RailPhysicsModel, MAINS_FREQ_HZ
+from .eeprom import EepromImage, EepromJournal, EnergyPersistence, EEPROM_SAVE_INTERVAL_S
+from .allocations import BufferPool, AllocationTracker
+from .history import TrendStore, TREND_CHANNELS, TREND_LEVELS
+from .metrics import Ema, Welford, RollingExtrema, StabilityScore, MetricsEngine
+from .anomaly import AnomalyDetector, DETECT_Z, DETECT_EWMA, DETECT_CUSUM
+from .synthesis import (
+    SampleRing, NoiseSynthesizer, WelchSpectrum, nice_full_scale,
+    SYNTH_SAMPLE_RATE, SYNTH_BLOCK, SYNTH_RING, SPEC_NOISE_UV_RMS,
+)
+from .simulator import (
+    DataSimulator, FAULT_EVENT_BUFFER, RIPPLE_ALARM_UV, SNAPSHOT_VERSION, ANOMALY_METRICS,
+)
+from .faultlog import FaultLog, FaultView, FaultRecord, FAULT_LOG_CHUNK
+
+# Télémétrie importée au premier accès: asyncio coûte ~40 ms au démarrage
+_TELEMETRY_NAMES = (
+    "TelemetryServer", "RemoteCommand", "TELEMETRY_HOST", "TELEMETRY_PORT", "TELEMETRY_INTERVAL_S",
+)
+
+__version__ = "92"
+
+__all__ = [
+    "lazy_import",
+    "Language", "Translations", "T",
+    "V_OUT_MAX", "V_OUT_RESET", "V_PRE_MAX", "BACKFEED_THRESHOLD",
+    "I_MAX_LOW_V", "I_MAX_MID_V", "I_MAX_HIGH_V",
+    "TEMP_WARNING", "TEMP_SHUTDOWN", "TEMP_RESET",
+    "V_OUT_MIN", "V_OUT_MAX_SET", "V_HEADROOM",
+    "OCP_DELAY_S", "OVP_DELAY_S", "DIGIPOT_STEPS", "SMOOTH_FACTOR", "STABILITY_SMOOTH",
+    "get_adaptive_current_limit", "adc_voltage", "digipot_to_voltage", "voltage_to_digipot",
+    "digipot_voltages", "voltages_to_digipot",
+    "quality_index", "quality_label_key", "temperature_label_key",
+    "SimulationMode", "RailData", "SystemData", "FaultEvent",
+    "FirmwareController", "FIRMWARE_LOOP_MS", "FAULT_CODES", "FAULT_NONE",
+    "FAULT_OVP", "FAULT_OCP", "FAULT_OTP", "FAULT_BACKFEED", "FAULT_OVP_PRE",
+    "RailStreams", "rail_seeds", "STREAM_BLOCK",
+    "ThermalNetwork", "RailPhysicsModel", "MAINS_FREQ_HZ",
+    "EepromImage", "EepromJournal", "EnergyPersistence", "EEPROM_SAVE_INTERVAL_S",
+    "BufferPool", "AllocationTracker",
+    "TrendStore", "TREND_CHANNELS", "TREND_LEVELS",
+    "Ema", "Welford", "RollingExtrema", "StabilityScore", "MetricsEngine",
+    "AnomalyDetector", "DETECT_Z", "DETECT_EWMA", "DETECT_CUSUM",
+    "SampleRing", "NoiseSynthesizer", "WelchSpectrum", "nice_full_scale",
+    "SYNTH_SAMPLE_RATE", "SYNTH_BLOCK", "SYNTH_RING", "SPEC_NOISE_UV_RMS",
+    "DataSimulator", "FAULT_EVENT_BUFFER", "RIPPLE_ALARM_UV", "SNAPSHOT_VERSION", "ANOMALY_METRICS",
+    "FaultLog", "FaultView", "FaultRecord", "FAULT_LOG_CHUNK",
+    "TelemetryServer", "RemoteCommand", "TELEMETRY_HOST", "TELEMETRY_PORT", "TELEMETRY_INTERVAL_S",
+]
+
+
+def __getattr__(name: str):
+    """Noms de la télémétrie résolus (puis mis en cache) au premier accès"""
+    if name in _TELEMETRY_NAMES:
+        from . import telemetry
+        value = getattr(telemetry, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TELEMETRY_NAMES))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Tampons réutilisés et mesure des allocations par section de rendu (tracemalloc)
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+# =============================================================================
+# TAMPONS NUMPY RÉUTILISÉS
+# =============================================================================
+
+class BufferPool:
+    """Tampons de travail nommés, réutilisés d'un appel à l'autre
+    
+    `get(name, shape)` rend une vue sur un tableau gardé par nom, de type
+    `dtype`, dont la première dimension n'est jamais réduite: une fenêtre
+    qui varie d'une ligne ne réalloue rien. Le tableau n'est remplacé que
+    si le type ou les autres dimensions changent, ou s'il est trop court.
+    Le contenu d'une vue n'est valable que jusqu'au `get` suivant du même
+    nom. `points(name, n)` garde de même les listes de points [x, y]
+    modifiables passées à pygame.draw (qui refuse les tableaux sans
+    conversion lente). Les tampons ne sont pas un état: ni les instantanés
+    ni les copies ne les emportent.
+    """
+    
+    def __init__(self):
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._points: Dict[str, List[List[int]]] = {}
+        self.allocations = 0
+    
+    def get(self, name: str, shape: Tuple[int, ...], dtype=float) -> np.ndarray:
+        buffer = self._buffers.get(name)
+        if (buffer is None or buffer.dtype != dtype or buffer.shape[1:] != shape[1:]
+                or buffer.shape[0] < shape[0]):
+            buffer = self._buffers[name] = np.empty(shape, dtype)
+            self.allocations += 1
+        return buffer[:shape[0]]
+    
+    def points(self, name: str, n: int) -> List[List[int]]:
+        """Liste de n points [x, y] réutilisée, à remplir sur place"""
+        points = self._points.get(name)
+        if points is None or len(points) != n:
+            points = self._points[name] = [[0, 0] for _ in range(n)]
+            self.allocations += 1
+        return points
+    
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+    
+    def __getstate__(self):
+        return {"_buffers": {}, "_points": {}, "allocations": 0}
+
+
+# =============================================================================
+# ALLOCATIONS PAR SECTION ET PAR FRAME
+# =============================================================================
+
+class AllocationTracker:
+    """Octets alloués par section de rendu et par frame (tracemalloc)
+    
+    `begin(name)` / `end(name)` encadrent une section (une page, la barre
+    de navigation): la pointe de mémoire tracée au-dessus du début donne
+    les octets alloués pendant la section (temporaires compris), l'écart
+    fin - début ceux qu'elle a conservés. Les compteurs externes (surfaces
+    créées par les pools, textes rendus) sont relevés de la même façon:
+    tracemalloc ne voit que le tas Python et NumPy, pas les pixels SDL.
+    `end_frame()` clôt la frame; le rapport donne moyenne et maximum par
+    frame où la section a été dessinée.
+    
+    tracemalloc ralentit tout le processus: outil de diagnostic activé à
+    la demande, sans coût quand il est arrêté.
+    """
+    
+    def __init__(self, counters: Optional[Dict[str, Callable[[], int]]] = None):
+        self.counters = counters or {}
+        self.frames = 0
+        self._open: Dict[str, Tuple[int, int, List[int]]] = {}
+        self._frame: Dict[str, List[int]] = {}
+        # Par section: frames, somme et maximum de chaque mesure
+        self._sections: Dict[str, Dict[str, List[float]]] = {}
+        self._started_here = False
+    
+    @property
+    def active(self) -> bool:
+        return tracemalloc.is_tracing()
+    
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_here = True
+    
+    def stop(self):
+        if self._started_here:
+            tracemalloc.stop()
+            self._started_here = False
+    
+    def begin(self, name: str):
+        counts = [counter() for counter in self.counters.values()]
+        current, peak = tracemalloc.get_traced_memory()
+        # Pointe remise au niveau courant; celle de la section englobante est reportée
+        for open_name, (start, outer_peak, open_counts) in self._open.items():
+            self._open[open_name] = (start, max(outer_peak, peak), open_counts)
+        tracemalloc.reset_peak()
+        self._open[name] = (current, current, counts)
+    
+    def end(self, name: str):
+        current, peak = tracemalloc.get_traced_memory()
+        start, outer_peak, counts = self._open.pop(name)
+        for open_name, (o_start, o_peak, o_counts) in self._open.items():
+            self._open[open_name] = (o_start, max(o_peak, peak), o_counts)
+        values = [max(peak, outer_peak) - start, current - start]
+        values += [counter() - before for counter, before in zip(self.counters.values(), counts)]
+        frame = self._frame.get(name)
+        if frame is None:
+            self._frame[name] = values
+        else:
+            # Section dessinée plusieurs fois dans la frame (tuiles): cumul
+            self._frame[name] = [a + b for a, b in zip(frame, values)]
+    
+    def end_frame(self):
+        self.frames += 1
+        for name, values in self._frame.items():
+            section = self._sections.setdefault(name, {"frames": [0.0]})
+            section["frames"][0] += 1
+            for key, value in zip(self.keys, values):
+                total = section.setdefault(key, [0.0, 0.0])
+                total[0] += value
+                total[1] = max(total[1], value)
+        self._frame.clear()
+    
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        return ("allocated", "retained") + tuple(self.counters)
+    
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Par section: frames dessinées, moyenne et maximum par frame de chaque mesure"""
+        report = {}
+        for name, section in self._sections.items():
+            frames = section["frames"][0]
+            entry = {"frames": int(frames)}
+            for key in self.keys:
+                total, peak = section.get(key, (0.0, 0.0))
+                entry[key] = total / frames
+                entry[key + "_max"] = peak
+            report[name] = entry
+        return report
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Détection d'anomalies en flux: z-score glissant, carte EWMA et CUSUM par métrique
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Sequence
+
+from .lazy import lazy_import
+from .snapshots import get_fields, set_fields
+
+np = lazy_import("numpy")
+
+
+# =============================================================================
+# DÉTECTEURS EN FLUX (O(1) par métrique, vectorisés sur toutes les voies)
+# =============================================================================
+
+SETTLE_S = 1.0                 # Transitoire ignoré après un reset (établissement sortie)
+WARMUP_SAMPLES = 100           # Apprentissage ensuite: au moins 100 échantillons
+WARMUP_S = 60.0                # ... et 60 s de temps simulé depuis le reset
+LEVEL_TAU_S = 30.0             # Niveau prévu (Holt), constante de temps simulé
+TREND_TAU_S = 100.0            # Pente prévue
+GAIN_MAX = 0.2                 # Gains bornés par échantillon (grands pas accélérés)
+RELEARN_DT_RATIO = 4.0         # Changement d'accélération du temps: tout réapprendre
+VARIANCE_ALPHA = 0.01          # Variance des résidus: mémoire ~100 échantillons
+ALARM_LEARNING = 0.1           # Niveau ralenti pendant une alarme
+Z_LIMIT = 6.0                  # Résidu instantané (σ)
+EWMA_LAMBDA = 0.05             # Carte EWMA des résidus réduits
+EWMA_LIMIT = 5.0               # Limites de contrôle (σ de la statistique EWMA)
+CUSUM_K = 0.5                  # Tolérance CUSUM (σ)
+CUSUM_H = 15.0                 # Seuil de décision CUSUM (σ cumulés)
+
+DETECT_Z = 1                   # Bits de AnomalyDetector.flags: détecteur(s) déclenché(s)
+DETECT_EWMA = 2
+DETECT_CUSUM = 4
+
+
+class AnomalyDetector:
+    """Alertes précoces par métrique: z-score, carte EWMA et CUSUM bilatéral
+    
+    Chaque voie (rail, métrique) suit une prévision niveau + pente (Holt en
+    temps simulé) et la variance de ses résidus: une mise en température
+    normale est prévue, seul un écart à la prévision compte, quelle que
+    soit l'accélération du temps. Le résidu réduit z alimente trois
+    détecteurs: |z| attrape les sauts, la carte EWMA les décalages modérés
+    et le CUSUM les dérives lentes, avant qu'un seuil de protection ne soit
+    atteint. Quelques flottants par voie, un passage NumPy pour toutes les
+    voies à chaque pas.
+    
+    Après un reset, la prévision part d'une régression linéaire sur la
+    période d'apprentissage (sommes courantes, O(1)): la pente de départ
+    est juste même en pleine chauffe. Pendant une alarme, pente et variance
+    sont figées et le niveau n'apprend plus qu'au dixième: une dérive reste
+    signalée au lieu d'être absorbée. `floors` borne σ par métrique (bruit
+    de mesure).
+    """
+    
+    STATE_FIELDS = ("elapsed", "warm", "level", "trend", "var", "ewma", "cusum_hi", "cusum_lo",
+                    "z", "flags", "alarm", "count", "_st", "_stt", "_sx", "_stx", "_sxx",
+                    "_all_warm", "_dt")
+    
+    def __init__(self, n_rails: int, floors: Sequence[float]):
+        shape = (n_rails, len(floors))
+        self.floors = np.asarray(floors, dtype=float)
+        self.elapsed = np.zeros(n_rails)
+        self.warm = np.zeros(n_rails, dtype=bool)
+        self.level = np.zeros(shape)
+        self.trend = np.zeros(shape)
+        self.var = np.zeros(shape)
+        self.ewma = np.zeros(shape)
+        self.cusum_hi = np.zeros(shape)
+        self.cusum_lo = np.zeros(shape)
+        self.z = np.zeros(shape)
+        self.flags = np.zeros(shape, dtype=np.uint8)
+        self.alarm = np.zeros(shape, dtype=bool)
+        # Régression d'apprentissage: échantillons retenus, sommes (x relatifs au premier)
+        self.count = np.zeros(n_rails)
+        self._st = np.zeros(n_rails)
+        self._stt = np.zeros(n_rails)
+        self._sx = np.zeros(shape)
+        self._stx = np.zeros(shape)
+        self._sxx = np.zeros(shape)
+        self._all_warm = False
+        self._dt = 0.0
+        self._ewma_limit = EWMA_LIMIT * math.sqrt(EWMA_LAMBDA / (2.0 - EWMA_LAMBDA))
+        self._residual = np.empty(shape)
+        self._sigma = np.empty(shape)
+        self._tmp = np.empty(shape)
+        self._hit = np.empty(shape, dtype=bool)
+    
+    def update(self, x: np.ndarray, dt: float) -> np.ndarray:
+        """Un échantillon (n_rails, n_metrics) dt secondes simulées après le précédent
+        
+        Retourne les alarmes (tableau mis à jour sur place).
+        """
+        # Niveau et pente appris à l'ancien pas: leur bruit fausserait la prévision
+        if dt > 0:
+            if self._dt > 0 and not 1.0 / RELEARN_DT_RATIO <= dt / self._dt <= RELEARN_DT_RATIO:
+                for rail in range(len(self.warm)):
+                    self.reset_rail(rail)
+            self._dt = dt
+        self.elapsed += dt
+        tmp, residual, sigma, z = self._tmp, self._residual, self._sigma, self.z
+        np.multiply(self.trend, dt, out=tmp)
+        self.level += tmp
+        all_warm = self._all_warm or self._learn(x)
+        np.subtract(x, self.level, out=residual)
+        np.sqrt(self.var, out=sigma)
+        np.maximum(sigma, self.floors, out=sigma)
+        np.divide(residual, sigma, out=z)
+        if not all_warm:
+            z *= self.warm[:, None]
+        
+        # Cartes de contrôle sur le résidu réduit; sommes CUSUM bornées pour
+        # revenir au calme en un temps fini après une dérive
+        self.ewma *= 1.0 - EWMA_LAMBDA
+        np.multiply(z, EWMA_LAMBDA, out=tmp)
+        self.ewma += tmp
+        self.cusum_hi += z
+        self.cusum_hi -= CUSUM_K
+        np.maximum(self.cusum_hi, 0.0, out=self.cusum_hi)
+        np.minimum(self.cusum_hi, 2.0 * CUSUM_H, out=self.cusum_hi)
+        self.cusum_lo -= z
+        self.cusum_lo -= CUSUM_K
+        np.maximum(self.cusum_lo, 0.0, out=self.cusum_lo)
+        np.minimum(self.cusum_lo, 2.0 * CUSUM_H, out=self.cusum_lo)
+        
+        flags, hit = self.flags, self._hit
+        np.greater(np.abs(z, out=tmp), Z_LIMIT, out=hit)
+        np.copyto(flags, hit)
+        np.greater(np.abs(self.ewma, out=tmp), self._ewma_limit, out=hit)
+        flags += hit * np.uint8(DETECT_EWMA)
+        np.maximum(self.cusum_hi, self.cusum_lo, out=tmp)
+        np.greater(tmp, CUSUM_H, out=hit)
+        flags += hit * np.uint8(DETECT_CUSUM)
+        np.not_equal(flags, 0, out=self.alarm)
+        
+        # Correction d'erreur (Holt), gains en temps simulé; en alarme, pente
+        # et variance figées, niveau ralenti: la dérive reste visible
+        a_level = min(-math.expm1(-dt / LEVEL_TAU_S), GAIN_MAX)
+        a_trend = min(-math.expm1(-dt / TREND_TAU_S), GAIN_MAX) / dt if dt > 0 else 0.0
+        if all_warm and not self.alarm.any():
+            np.multiply(residual, a_level, out=tmp)
+            self.level += tmp
+            tmp *= a_trend
+            self.trend += tmp
+            np.multiply(residual, residual, out=tmp)
+            tmp *= VARIANCE_ALPHA
+            self.var += tmp
+            self.var *= 1.0 - VARIANCE_ALPHA
+            return self.alarm
+        warm = self.warm[:, None]
+        calm = warm & ~self.alarm
+        gain = np.where(self.alarm, ALARM_LEARNING * a_level, a_level) * warm
+        self.level += residual * gain
+        self.trend += residual * (calm * (a_level * a_trend))
+        v_alpha = calm * VARIANCE_ALPHA
+        self.var += residual * residual * v_alpha
+        self.var *= 1.0 - v_alpha
+        return self.alarm
+    
+    def _learn(self, x: np.ndarray):
+        """Régression linéaire des rails en apprentissage, prévision posée à la fin
+        
+        Retourne True quand tous les rails sont appris.
+        """
+        rows = np.flatnonzero(~self.warm & (self.elapsed >= SETTLE_S))
+        if not len(rows):
+            return False
+        self.count[rows] += 1
+        first = rows[self.count[rows] == 1]
+        self.level[first] = x[first]
+        t = self.elapsed[rows]
+        dx = x[rows] - self.level[rows]
+        self._st[rows] += t
+        self._stt[rows] += t * t
+        self._sx[rows] += dx
+        self._stx[rows] += t[:, None] * dx
+        self._sxx[rows] += dx * dx
+        
+        done = rows[(self.count[rows] >= WARMUP_SAMPLES) & (self.elapsed[rows] >= WARMUP_S)]
+        if not len(done):
+            return False
+        n = self.count[done][:, None]
+        st, stt = self._st[done][:, None], self._stt[done][:, None]
+        sx, stx, sxx = self._sx[done], self._stx[done], self._sxx[done]
+        s_tt = np.maximum(stt - st * st / n, 1e-12)
+        s_tx = stx - st * sx / n
+        slope = s_tx / s_tt
+        self.trend[done] = slope
+        # Droite de régression évaluée à l'échantillon courant
+        self.level[done] += sx / n + slope * (self.elapsed[done][:, None] - st / n)
+        self.var[done] = np.maximum(sxx - sx * sx / n - slope * s_tx, 0.0) / (n - 2)
+        self.warm[done] = True
+        self._all_warm = bool(self.warm.all())
+        return self._all_warm
+    
+    def reset_rail(self, rail: int):
+        """Nouvelle consigne ou retour au nominal: la prévision est réapprise"""
+        self.count[rail] = 0
+        self.elapsed[rail] = 0.0
+        self.warm[rail] = False
+        self._all_warm = False
+        self._st[rail] = 0.0
+        self._stt[rail] = 0.0
+        for state in (self.level, self.trend, self.var, self.ewma, self.cusum_hi,
+                      self.cusum_lo, self.z, self._sx, self._stx, self._sxx):
+            state[rail] = 0.0
+        self.flags[rail] = 0
+        self.alarm[rail] = False
+    
+    def get_state(self) -> Dict[str, Any]:
+        return get_fields(self, self.STATE_FIELDS)
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, self.STATE_FIELDS)
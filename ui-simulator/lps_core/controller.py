@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+Co-simulation de la boucle firmware: checkProtections, fautes verrouillées, mode purist
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Sequence
+
+from .firmware import (
+    V_OUT_MAX, V_PRE_MAX, BACKFEED_THRESHOLD, I_MAX_HIGH_V,
+    TEMP_WARNING, TEMP_SHUTDOWN, TEMP_RESET,
+    OCP_DELAY_MS, OVP_DELAY_MS, PURIST_MEASURE_INTERVAL_MS, adc_voltage,
+)
+from .snapshots import get_fields, set_fields
+
+
+# =============================================================================
+# BOUCLE FIRMWARE (miroir de loop() / checkProtections)
+# =============================================================================
+
+FIRMWARE_LOOP_MS = 3           # 16 analogRead + 2 lectures INA219 I2C par readAllMeasures()
+IDLE_WAKE_MS = 1               # Purist: enterIdleMode() réveillé par le timer0 (~1.024 ms)
+
+# Types de faute de getActiveFaultType()
+FAULT_OVP = 0
+FAULT_OCP = 1
+FAULT_OTP = 2
+FAULT_BACKFEED = 3
+FAULT_OVP_PRE = 4
+FAULT_NONE = 255
+FAULT_CODES = ("OVP", "OCP", "OTP", "BACKFEED", "OVP PRE")
+
+
+class FirmwareController:
+    """État de protection du firmware, une itération de loop() par appel de step()
+    
+    Reprend variable pour variable checkProtections(): drapeaux verrouillés
+    par rail, temporisations `*_start` basées sur millis() (0 = désarmée),
+    OTP unique sur la CTN radiateur avec réarmement sous TEMP_RESET, sorties
+    pilotées comme setOutputEnable(). Les tensions passent par la
+    quantification ADC de readVoltageADC().
+    
+    L'état est fait de scalaires et de listes préallouées: une itération
+    n'alloue aucun conteneur. `run()` rejoue la boucle sur une durée à
+    mesures figées (bloqueur d'ordre zéro entre deux pas du modèle
+    physique); dès qu'une vérification a eu lieu sans temporisation armée,
+    les itérations restantes sont identiques et sont sautées d'un bloc.
+    """
+    
+    __slots__ = (
+        "n_rails", "loop_ms", "millis", "loops", "changes", "trips", "otp_resets",
+        "v_out", "v_pre", "raw_i", "i_out", "temp_radiator", "i_limit", "ina_ok",
+        "ovp", "ovp_pre", "ocp", "backfeed", "otp", "temp_warning", "output_enabled",
+        "purist", "_ovp_start", "_ovp_pre_start", "_ocp_start", "_otp_start",
+        "_last_purist_measure", "_checked", "_due",
+    )
+    # Instantanés: tout l'état hors dimensions
+    STATE_FIELDS = __slots__[1:]
+    
+    def __init__(self, n_rails: int = 2, loop_ms: int = FIRMWARE_LOOP_MS):
+        self.n_rails = n_rails
+        self.loop_ms = loop_ms
+        self.millis = 0
+        self.loops = 0                 # Itérations simulées (sautées comprises)
+        self.changes = 0               # Incrémenté à chaque changement de faute ou de sortie
+        self.trips = [0] * len(FAULT_CODES)
+        self.otp_resets = 0
+        
+        # Mesures (readAllMeasures)
+        self.v_out = [0.0] * n_rails
+        self.v_pre = [0.0] * n_rails
+        self.raw_i = [0.0] * n_rails   # Signé (backfeed)
+        self.i_out = [0.0] * n_rails   # Affiché, toujours ≥ 0
+        self.temp_radiator = 25.0
+        self.i_limit = [I_MAX_HIGH_V] * n_rails
+        self.ina_ok = [True] * n_rails
+        
+        # Fautes verrouillées et sorties
+        self.ovp = [False] * n_rails
+        self.ovp_pre = [False] * n_rails
+        self.ocp = [False] * n_rails
+        self.backfeed = [False] * n_rails
+        self.otp = False
+        self.temp_warning = False
+        self.output_enabled = [True] * n_rails
+        self.purist = False
+        
+        self._ovp_start = [0] * n_rails
+        self._ovp_pre_start = [0] * n_rails
+        self._ocp_start = [0] * n_rails
+        self._otp_start = 0
+        self._last_purist_measure = 0
+        self._checked = False
+        self._due = 0.0
+    
+    def get_state(self) -> Dict[str, Any]:
+        return get_fields(self, self.STATE_FIELDS)
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, self.STATE_FIELDS)
+    
+    # --- Mesures et sorties ---
+    
+    def measure(self, v_out: Sequence[float], v_pre: Sequence[float],
+                current_ma: Sequence[float], temp_radiator: float):
+        """readAllMeasures(): tensions quantifiées par l'ADC, courant signé"""
+        for r in range(self.n_rails):
+            self.v_out[r] = adc_voltage(float(v_out[r]))
+            self.v_pre[r] = adc_voltage(float(v_pre[r]))
+            raw = float(current_ma[r])
+            self.raw_i[r] = raw
+            self.i_out[r] = raw if raw > 0.0 else 0.0
+        self.temp_radiator = float(temp_radiator)
+        self._checked = False
+    
+    def _set_output(self, rail: int, enable: bool):
+        """setOutputEnable()"""
+        if self.output_enabled[rail] != enable:
+            self.output_enabled[rail] = enable
+            self.changes += 1
+    
+    def _trip(self, fault: int):
+        self.trips[fault] += 1
+        self.changes += 1
+    
+    # --- checkProtections() ---
+    
+    def check_protections(self):
+        """Une passe de checkProtections() à l'instant millis courant"""
+        now = self.millis
+        v_out, v_pre, i_out, raw_i = self.v_out, self.v_pre, self.i_out, self.raw_i
+        ovp, ovp_pre, ocp, backfeed = self.ovp, self.ovp_pre, self.ocp, self.backfeed
+        for r in range(self.n_rails):
+            # OVP sortie
+            if v_out[r] > V_OUT_MAX and not ovp[r]:
+                if self._ovp_start[r] == 0:
+                    self._ovp_start[r] = now
+                if now - self._ovp_start[r] > OVP_DELAY_MS:
+                    ovp[r] = True
+                    self._trip(FAULT_OVP)
+                    self._set_output(r, False)
+            else:
+                self._ovp_start[r] = 0
+            
+            # OVP pré-régulateur
+            if v_pre[r] > V_PRE_MAX and not ovp_pre[r]:
+                if self._ovp_pre_start[r] == 0:
+                    self._ovp_pre_start[r] = now
+                if now - self._ovp_pre_start[r] > OVP_DELAY_MS:
+                    ovp_pre[r] = True
+                    self._trip(FAULT_OVP_PRE)
+                    self._set_output(r, False)
+            else:
+                self._ovp_pre_start[r] = 0
+            
+            # OCP: limite adaptative selon la consigne (V2.4.1)
+            if self.ina_ok[r] and i_out[r] > self.i_limit[r] and not ocp[r]:
+                if self._ocp_start[r] == 0:
+                    self._ocp_start[r] = now
+                if now - self._ocp_start[r] > OCP_DELAY_MS:
+                    ocp[r] = True
+                    self._trip(FAULT_OCP)
+                    self._set_output(r, False)
+            else:
+                self._ocp_start[r] = 0
+            
+            # Backfeed: immédiat, sur le courant signé (V2.4.5)
+            if raw_i[r] < BACKFEED_THRESHOLD and not backfeed[r]:
+                backfeed[r] = True
+                self._trip(FAULT_BACKFEED)
+                self._set_output(r, False)
+        
+        # OTP: une seule CTN, coupe les deux rails, réarmement automatique
+        temp = self.temp_radiator
+        if temp > TEMP_SHUTDOWN and not self.otp:
+            if self._otp_start == 0:
+                self._otp_start = now
+            if now - self._otp_start > OVP_DELAY_MS:
+                self.otp = True
+                self._trip(FAULT_OTP)
+                for r in range(self.n_rails):
+                    self._set_output(r, False)
+        elif temp < TEMP_RESET and self.otp:
+            self.otp = False
+            self.otp_resets += 1
+            self.changes += 1
+            for r in range(self.n_rails):
+                if not self.rail_latched(r):
+                    self._set_output(r, True)
+        else:
+            self._otp_start = 0
+        
+        self.temp_warning = temp > TEMP_WARNING and not self.otp
+        self._checked = True
+    
+    # --- Lecture de l'état ---
+    
+    def rail_latched(self, rail: int) -> bool:
+        """Faute propre au rail (hors OTP)"""
+        return self.ovp[rail] or self.ocp[rail] or self.ovp_pre[rail] or self.backfeed[rail]
+    
+    def rail_fault(self, rail: int) -> bool:
+        """Écran du rail en mode faute (fault_A/fault_B de updateDisplays)"""
+        return self.otp or self.rail_latched(rail)
+    
+    def any_fault_active(self) -> bool:
+        """anyFaultActive()"""
+        return self.otp or any(self.rail_latched(r) for r in range(self.n_rails))
+    
+    def active_fault_type(self, rail: int) -> int:
+        """getActiveFaultType(): priorité OVP, OCP, OVP_PRE, backfeed, puis OTP"""
+        if self.ovp[rail]:
+            return FAULT_OVP
+        if self.ocp[rail]:
+            return FAULT_OCP
+        if self.ovp_pre[rail]:
+            return FAULT_OVP_PRE
+        if self.backfeed[rail]:
+            return FAULT_BACKFEED
+        if self.otp:
+            return FAULT_OTP
+        return FAULT_NONE
+    
+    @property
+    def armed(self) -> bool:
+        """Une temporisation de confirmation est en cours"""
+        return bool(self._otp_start or any(self._ovp_start) or
+                    any(self._ovp_pre_start) or any(self._ocp_start))
+    
+    # --- Actions utilisateur ---
+    
+    def retry(self):
+        """Clic « retry » (page de faute 3): efface OCP et backfeed
+        
+        Comme le firmware, la sortie est réactivée même si une OVP reste
+        verrouillée sur le même rail.
+        """
+        for r in range(self.n_rails):
+            if self.ocp[r] or self.backfeed[r]:
+                self.ocp[r] = False
+                self.backfeed[r] = False
+                self.changes += 1
+                self._set_output(r, True)
+        self._checked = False
+    
+    def reset_rail(self, rail: int):
+        """Cycle d'alimentation d'un rail (simulateur): toutes ses fautes et l'OTP effacées"""
+        self.ovp[rail] = self.ovp_pre[rail] = self.ocp[rail] = self.backfeed[rail] = False
+        self._ovp_start[rail] = self._ovp_pre_start[rail] = self._ocp_start[rail] = 0
+        self.otp = False
+        self._otp_start = 0
+        self.changes += 1
+        for r in range(self.n_rails):
+            if not self.rail_latched(r):
+                self._set_output(r, True)
+        self._checked = False
+    
+    def enter_purist(self):
+        """enterPuristMode(): écrans éteints, protections toutes les 200 ms"""
+        self.purist = True
+        self._last_purist_measure = self.millis
+        self.changes += 1
+        self._checked = False
+    
+    def exit_purist(self):
+        """exitPuristMode(): sorties sans faute réactivées"""
+        self.purist = False
+        self.changes += 1
+        for r in range(self.n_rails):
+            if not self.rail_fault(r):
+                self._set_output(r, True)
+        self._checked = False
+    
+    # --- Boucle ---
+    
+    @property
+    def period_ms(self) -> int:
+        """Durée d'une itération de loop() (veille idle en purist)"""
+        return IDLE_WAKE_MS if self.purist else self.loop_ms
+    
+    def step(self):
+        """Une itération de loop(), mesures déjà fournies par measure()"""
+        self.millis += self.period_ms
+        self.loops += 1
+        if not self.purist:
+            self.check_protections()
+        elif self.millis - self._last_purist_measure >= PURIST_MEASURE_INTERVAL_MS:
+            self.check_protections()
+            self._last_purist_measure = self.millis
+    
+    def run(self, duration_s: float, fast_forward: bool = True) -> int:
+        """Itère loop() sur duration_s à mesures figées, retourne les itérations exécutées
+        
+        Avec fast_forward, les itérations sans effet (état stable, ou veille
+        purist entre deux mesures) avancent millis sans être exécutées.
+        Sans fast_forward, chaque itération passe par step() (couverture).
+        """
+        self._due += duration_s * 1000.0
+        executed = 0
+        while True:
+            period = self.period_ms
+            n = int((self._due - self.millis) // period)
+            if n <= 0:
+                return executed
+            if fast_forward and self._checked and not self.armed:
+                self._skip(n, period)
+                return executed
+            if fast_forward and self.purist:
+                # Veille jusqu'à l'itération qui déclenche la prochaine mesure
+                idle = -(-(self._last_purist_measure + PURIST_MEASURE_INTERVAL_MS - self.millis)
+                         // period) - 1
+                if idle > 0:
+                    self._skip(min(idle, n), period)
+                    continue
+            self.step()
+            executed += 1
+    
+    def _skip(self, n: int, period: int):
+        """Avance de n itérations sans effet sur l'état"""
+        self.millis += n * period
+        self.loops += n
+        if self.purist:
+            # Les mesures purist sautées restent calées sur leur grille
+            interval = -(-PURIST_MEASURE_INTERVAL_MS // period) * period
+            self._last_purist_measure += (self.millis - self._last_purist_measure) // interval * interval
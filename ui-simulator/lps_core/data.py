@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Structures de données des rails et du système
+"""
+
+from datetime import datetime
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from typing import List
+
+
+# =============================================================================
+# SIMULATION DE DONNÉES
+# =============================================================================
+
+class SimulationMode(Enum):
+    """Modes de simulation de pannes"""
+    NORMAL = auto()
+    HOT = auto()      # Surchauffe (OTP)
+    RIPPLE = auto()   # Bruit excessif
+    LOAD = auto()     # Surcharge (OCP)
+    LOW_V = auto()    # Sous-tension
+    HIGH_V = auto()   # Surtension (OVP)
+
+
+@dataclass
+class RailData:
+    """Données d'un rail d'alimentation"""
+    voltage_target: float = 12.0
+    voltage_actual: float = 12.0
+    current_ma: float = 150.0
+    power_w: float = 1.8
+    temperature_c: float = 35.0
+    headroom_v: float = 2.0
+    ripple_uv: float = 5.0
+    noise_uv: float = 3.0
+    efficiency: float = 92.0
+    enabled: bool = True
+    
+    # Modèle physique: V_PRE (sortie LM338T), limite OCP adaptative, panne injectée
+    pre_voltage: float = 14.0
+    current_limit_ma: float = 500.0
+    simulation_mode: SimulationMode = SimulationMode.NORMAL
+    
+    # États de protection
+    ovp_active: bool = False
+    ocp_active: bool = False
+    otp_active: bool = False
+    backfeed_active: bool = False
+
+
+@dataclass  
+class SystemData:
+    """Données système globales"""
+    rail_a: RailData = field(default_factory=RailData)
+    rail_b: RailData = field(default_factory=RailData)
+    input_voltage: float = 24.0
+    ambient_temp: float = 25.0
+    uptime_seconds: int = 0
+    energy_wh: float = 0.0
+    energy_wh_a: float = 0.0   # Compteurs par rail persistés (energy_Wh_A/B)
+    energy_wh_b: float = 0.0
+    session_start: datetime = field(default_factory=datetime.now)
+    simulation_mode: SimulationMode = SimulationMode.NORMAL
+    
+    # Cache pour optimisation V92
+    _problems_cache: List[str] = field(default_factory=list)
+    _problems_cache_frame: int = -1
+
+
+@dataclass
+class FaultEvent:
+    """Apparition ou disparition d'une faute sur un rail"""
+    seq: int              # Numéro absolu, croissant depuis le démarrage
+    t: float              # Temps simulé (s)
+    rail: str             # "A" ou "B"
+    fault: str            # Code FAULT_CODES ou "RIPPLE"
+    active: bool          # True: apparition, False: disparition
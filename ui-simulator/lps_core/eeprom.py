@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+EEPROM ATmega328P émulée: image, usure par cellule, journal disque atomique
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import queue
+import struct
+import threading
+import zlib
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from .data import SystemData
+from .translations import Language
+
+
+# =============================================================================
+# EEPROM ÉMULÉE (carte mémoire alignée sur LPS_Audiophile_V2_4_5.ino)
+# =============================================================================
+
+EEPROM_SIZE = 1024             # ATmega328P
+EEPROM_ENDURANCE = 100_000     # Cycles écriture/effacement garantis par cellule
+EEPROM_ENERGY_A = 0            # float
+EEPROM_ENERGY_B = 4            # float
+EEPROM_UPTIME = 8              # unsigned long
+EEPROM_LANGUAGE = 12           # uint8_t
+EEPROM_V_SET_A = 13            # uint8_t
+EEPROM_V_SET_B = 14            # uint8_t
+EEPROM_SAVE_INTERVAL_S = 300.0  # saveEnergyToEEPROM() toutes les 5 min (loop)
+
+# Types AVR: float 32 bits et unsigned long 32 bits, petit-boutiste
+_ENERGY_STRUCT = struct.Struct("<ffI")
+
+# Octet EEPROM_LANGUAGE: LANG_EN/LANG_FR/LANG_DE du firmware, ES propre au simulateur
+LANGUAGE_CODES = (Language.EN, Language.FR, Language.DE, Language.ES)
+
+
+class EepromImage:
+    """Contenu de l'EEPROM et compteur d'usure par cellule
+    
+    `update()` a la sémantique d'EEPROM.update()/put(): seuls les octets
+    différents sont écrits, et seuls eux usent leur cellule. Une cellule
+    vierge vaut 0xFF.
+    """
+    
+    def __init__(self, size: int = EEPROM_SIZE):
+        self.data = bytearray(b"\xff" * size)
+        self.wear = array("I", bytes(4 * size))
+        self.byte_writes = 0       # Toutes sessions: toujours égal à sum(wear)
+    
+    def read(self, address: int, length: int) -> bytes:
+        return bytes(self.data[address:address + length])
+    
+    def update(self, address: int, payload: bytes) -> int:
+        """Écrit payload à address, retourne le nombre d'octets réellement écrits"""
+        written = 0
+        for offset, value in enumerate(payload):
+            cell = address + offset
+            if self.data[cell] != value:
+                self.data[cell] = value
+                self.wear[cell] += 1
+                written += 1
+        self.byte_writes += written
+        return written
+    
+    @property
+    def max_wear(self) -> int:
+        return max(self.wear)
+
+
+# =============================================================================
+# JOURNAL DISQUE (écriture anticipée + point de contrôle atomique)
+# =============================================================================
+
+class EepromJournal:
+    """Persistance disque d'une EepromImage
+    
+    Fichier image: en-tête, 1 Ko de données et compteurs d'usure. Chaque
+    écriture EEPROM est d'abord ajoutée au journal puis synchronisée: un
+    enregistrement porte l'adresse, les octets écrits, les compteurs de
+    sauvegardes et d'heures à cet instant et un CRC32, si bien qu'une
+    écriture et ses compteurs sont rejoués ensemble ou pas du tout. Un
+    point de contrôle réécrit l'image dans un fichier temporaire remplacé
+    atomiquement (os.replace) et vide le journal. Au chargement, les
+    enregistrements valides sont rejoués avec la sémantique EEPROM.put, ce
+    qui reproduit l'usure cellule par cellule; un enregistrement tronqué
+    ou corrompu (coupure pendant l'écriture) arrête la relecture.
+    """
+    
+    MAGIC = b"LPSE"
+    VERSION = 2                         # 1: journal sans compteurs (ignoré au chargement)
+    HEADER = struct.Struct("<4sHId")    # magic, version, sauvegardes, heures simulées
+    RECORD = struct.Struct("<HHId")     # adresse, longueur, sauvegardes, heures simulées
+    CRC = struct.Struct("<I")
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.records = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    
+    def load(self, image: EepromImage) -> Tuple[int, float]:
+        """Charge image et journal, retourne (sauvegardes, heures simulées)"""
+        saves, hours = 0, 0.0
+        size = len(image.data)
+        try:
+            with open(self.path, "rb") as f:
+                blob = f.read()
+            magic, version, saves, hours = self.HEADER.unpack_from(blob)
+            if magic != self.MAGIC or version not in (1, self.VERSION):
+                raise ValueError(f"{self.path}: image EEPROM inconnue")
+            offset = self.HEADER.size
+            image.data[:] = blob[offset:offset + size]
+            image.wear = array("I", blob[offset + size:offset + 5 * size])
+            if len(image.data) != size or len(image.wear) != size:
+                raise ValueError(f"{self.path}: image EEPROM tronquée")
+        except FileNotFoundError:
+            version = self.VERSION
+        image.byte_writes = sum(image.wear)
+        
+        try:
+            with open(self.journal_path, "rb") as f:
+                journal = f.read() if version == self.VERSION else b""
+        except FileNotFoundError:
+            journal = b""
+        offset = 0
+        while offset + self.RECORD.size <= len(journal):
+            address, length, record_saves, record_hours = self.RECORD.unpack_from(journal, offset)
+            end = offset + self.RECORD.size + length
+            if end + self.CRC.size > len(journal) or address + length > size:
+                break
+            (crc,) = self.CRC.unpack_from(journal, end)
+            if crc != zlib.crc32(journal[offset:end]):
+                break
+            image.update(address, journal[offset + self.RECORD.size:end])
+            saves, hours = record_saves, record_hours
+            offset = end + self.CRC.size
+            self.records += 1
+        return saves, hours
+    
+    def append(self, writes: List[Tuple[int, bytes, int, float]]):
+        """Ajoute un lot d'écritures (adresse, octets, sauvegardes, heures), puis un seul fsync"""
+        chunks = []
+        for address, payload, saves, hours in writes:
+            record = self.RECORD.pack(address, len(payload), saves, hours) + payload
+            chunks.append(record + self.CRC.pack(zlib.crc32(record)))
+        with open(self.journal_path, "ab") as f:
+            f.write(b"".join(chunks))
+            f.flush()
+            os.fsync(f.fileno())
+        self.records += len(chunks)
+    
+    def checkpoint(self, data: bytes, wear: bytes, saves: int, hours: float):
+        """Image complète écrite à part puis substituée; journal vidé ensuite"""
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, saves, hours))
+            f.write(data)
+            f.write(wear)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        with open(self.journal_path, "wb"):
+            pass
+        self.records = 0
+
+
+# =============================================================================
+# POLITIQUE DE SAUVEGARDE (miroir saveEnergyToEEPROM / loadEnergyFromEEPROM)
+# =============================================================================
+
+class EnergyPersistence:
+    """Énergie, uptime, consignes et langue persistés comme par le firmware
+    
+    La boucle appelle `tick()` à chaque pas (une comparaison): toutes les
+    `interval_s` secondes simulées, l'état courant est écrit dans l'image
+    avec la sémantique EEPROM.put (octets inchangés ignorés), ce qui
+    fusionne toutes les variations de la période en une seule écriture.
+    Les écritures effectives partent vers un thread d'écriture qui regroupe
+    les lots en attente avant chaque fsync: aucun accès disque dans la frame.
+    `saves` et `hours` couvrent toutes les sessions; ils sont journalisés
+    avec chaque écriture et ne reculent donc pas après une coupure.
+    
+    Sans chemin, l'EEPROM reste en mémoire (comparaison de politiques
+    d'usure en lot).
+    """
+    
+    CHECKPOINT_RECORDS = 256
+    
+    def __init__(self, path: Optional[str] = None,
+                 interval_s: float = EEPROM_SAVE_INTERVAL_S):
+        self.interval_s = interval_s
+        self.image = EepromImage()
+        self.journal = EepromJournal(path) if path else None
+        self.saves = 0
+        self.hours = 0.0           # Temps simulé couvert par l'image (toutes sessions)
+        self._last_save: Optional[float] = None
+        self._last_time = 0.0
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        if self.journal is not None:
+            self.saves, self.hours = self.journal.load(self.image)
+            self._writer = threading.Thread(target=self._write_loop, name="eeprom-journal",
+                                            daemon=True)
+            self._writer.start()
+    
+    # --- Accès firmware ---
+    
+    def restore(self, data: SystemData):
+        """loadEnergyFromEEPROM(): valeurs NaN/négatives (EEPROM vierge) remises à 0"""
+        energy_a, energy_b, uptime = _ENERGY_STRUCT.unpack(
+            self.image.read(EEPROM_ENERGY_A, _ENERGY_STRUCT.size))
+        data.energy_wh_a = 0.0 if math.isnan(energy_a) or energy_a < 0 else energy_a
+        data.energy_wh_b = 0.0 if math.isnan(energy_b) or energy_b < 0 else energy_b
+        data.energy_wh = data.energy_wh_a + data.energy_wh_b
+        # unsigned long vierge = 0xFFFFFFFF: le firmware ne le corrige pas, le simulateur si
+        data.uptime_seconds = 0 if uptime == 0xFFFFFFFF else uptime
+    
+    def voltage_settings(self) -> Tuple[Optional[int], Optional[int]]:
+        """Positions digipot sauvées (None si cellule vierge, défaut firmware)"""
+        pos_a, pos_b = self.image.read(EEPROM_V_SET_A, 2)
+        return (None if pos_a == 0xFF else pos_a, None if pos_b == 0xFF else pos_b)
+    
+    def save_voltage_settings(self, pos_a: int, pos_b: int):
+        """saveVoltageSettings() au clic de validation"""
+        self._write(EEPROM_V_SET_A, bytes((pos_a, pos_b)))
+    
+    def language(self) -> Optional[Language]:
+        """loadLanguage(): langue sauvée, None si cellule vierge ou code inconnu"""
+        (code,) = self.image.read(EEPROM_LANGUAGE, 1)
+        return LANGUAGE_CODES[code] if code < len(LANGUAGE_CODES) else None
+    
+    def save_language(self, language: Language):
+        """saveLanguage() à chaque changement de langue"""
+        self._write(EEPROM_LANGUAGE, bytes((LANGUAGE_CODES.index(language),)))
+    
+    def save(self, data: SystemData):
+        """saveEnergyToEEPROM()"""
+        payload = _ENERGY_STRUCT.pack(data.energy_wh_a, data.energy_wh_b,
+                                      data.uptime_seconds & 0xFFFFFFFF)
+        self.saves += 1
+        self._write(EEPROM_ENERGY_A, payload)
+    
+    # --- Boucle ---
+    
+    def tick(self, sim_time: float, data: SystemData):
+        """Appelé à chaque pas: sauvegarde quand la période est écoulée"""
+        self.hours += (sim_time - self._last_time) / 3600.0
+        self._last_time = sim_time
+        if self._last_save is None:
+            self._last_save = sim_time
+        elif sim_time - self._last_save >= self.interval_s:
+            self._last_save = sim_time
+            self.save(data)
+    
+    def close(self, data: SystemData):
+        """Sauvegarde finale, point de contrôle et arrêt du thread d'écriture"""
+        self.save(data)
+        if self._writer is not None:
+            self._queue.put(("checkpoint",) + self._snapshot())
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+    
+    def report(self) -> Dict[str, float]:
+        """Usure: écritures, cellule la plus sollicitée, durée de vie projetée"""
+        max_wear = self.image.max_wear
+        rate = max_wear / self.hours if self.hours > 0 else 0.0
+        return {
+            "saves": self.saves,
+            "byte_writes": self.image.byte_writes,
+            "max_cell_wear": max_wear,
+            "wear_pct": 100.0 * max_wear / EEPROM_ENDURANCE,
+            "simulated_hours": self.hours,
+            "lifetime_hours": (EEPROM_ENDURANCE - max_wear) / rate if rate > 0 else math.inf,
+        }
+    
+    # --- Écriture différée ---
+    
+    def _write(self, address: int, payload: bytes):
+        if self.image.update(address, payload) and self._writer is not None:
+            # Octets inchangés: rien au journal. Sinon le put() entier, rejoué à l'identique
+            self._queue.put(("write", address, bytes(payload), self.saves, self.hours))
+            if self.journal.records + self._queue.qsize() >= self.CHECKPOINT_RECORDS:
+                self._queue.put(("checkpoint",) + self._snapshot())
+    
+    def _snapshot(self) -> tuple:
+        return (bytes(self.image.data), self.image.wear.tobytes(), self.saves, self.hours)
+    
+    def _write_loop(self):
+        """Thread d'écriture: écritures en attente regroupées, un fsync par lot"""
+        running = True
+        while running:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            writes: List[Tuple[int, bytes, int, float]] = []
+            for item in items:
+                if item is None:
+                    running = False
+                elif item[0] == "write":
+                    writes.append(item[1:])
+                else:
+                    if writes:
+                        self.journal.append(writes)
+                        writes = []
+                    self.journal.checkpoint(*item[1:])
+            if writes:
+                self.journal.append(writes)
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+Journal persistant des fautes: SQLite indexé par rail, type et temps, écriture par lots
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .data import FaultEvent
+from .lazy import lazy_import
+
+sqlite3 = lazy_import("sqlite3")
+
+
+# =============================================================================
+# STOCKAGE (une table en ajout seul, un index par filtre)
+# =============================================================================
+
+FAULT_LOG_CHUNK = 256          # Lignes lues par bloc (défilement: un bloc voisin à la fois)
+FAULT_LOG_CACHE = 64           # Blocs gardés par vue filtrée
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS faults (
+    id INTEGER PRIMARY KEY,
+    session INTEGER NOT NULL,
+    wall REAL NOT NULL,
+    t REAL NOT NULL,
+    rail TEXT NOT NULL,
+    fault TEXT NOT NULL,
+    active INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS faults_rail ON faults (rail, id);
+CREATE INDEX IF NOT EXISTS faults_fault ON faults (fault, id);
+CREATE INDEX IF NOT EXISTS faults_rail_fault ON faults (rail, fault, id);
+CREATE INDEX IF NOT EXISTS faults_wall ON faults (wall);
+"""
+_COLUMNS = "id, session, wall, t, rail, fault, active"
+_INSERT = "INSERT INTO faults (session, wall, t, rail, fault, active) VALUES (?, ?, ?, ?, ?, ?)"
+
+
+@dataclass
+class FaultRecord:
+    """Événement de faute journalisé"""
+    id: int               # Rang d'insertion, croissant toutes sessions confondues
+    session: int          # Numéro de lancement du simulateur
+    wall: float           # Heure système de l'enregistrement (epoch, s)
+    t: float              # Temps simulé de la session (s)
+    rail: str
+    fault: str
+    active: bool
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    db = sqlite3.connect(path)
+    if path != ":memory:":
+        # WAL: la page lit pendant que le thread d'écriture valide ses lots
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+    return db
+
+
+class FaultLog:
+    """Historique des fautes de toutes les sessions, sur disque
+    
+    `ingest()` est appelé à chaque frame: il lit les nouveaux FaultEvent du
+    simulateur depuis son propre curseur (une comparaison sans événement)
+    et les confie à un thread d'écriture, qui insère tout ce qui attend en
+    un seul executemany par transaction: aucun accès disque dans la frame.
+    L'horodatage système est pris à l'ingestion, le temps simulé suit.
+    
+    Les lectures (`view()`) passent par une connexion propre au thread
+    d'affichage; un index (rail, id), (fault, id) ou (rail, fault, id) sert
+    chaque filtre dans l'ordre d'insertion, (wall) les recherches par date. Sans chemin, base en mémoire
+    écrite directement (traitement par lots, tests).
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = _connect(path or ":memory:")
+        self._db.executescript(_SCHEMA)
+        self.session = self._db.execute(
+            "SELECT COALESCE(MAX(session), 0) + 1 FROM faults").fetchone()[0]
+        self._cursor = 0
+        self.events = 0            # Événements reçus cette session
+        self.batches = 0           # Transactions d'écriture
+        self.committed = 0         # Lignes validées cette session (lu par les vues)
+        self._queue: "queue.Queue[Optional[List[tuple]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        if path:
+            self._writer = threading.Thread(target=self._write_loop, name="fault-log", daemon=True)
+            self._writer.start()
+    
+    # --- Écriture ---
+    
+    def ingest(self, simulator) -> int:
+        """Nouveaux événements du simulateur, retourne leur nombre"""
+        if simulator.fault_event_count == self._cursor:
+            return 0
+        if simulator.fault_event_count < self._cursor:
+            # Instantané restauré: compteur du simulateur revenu en arrière
+            self._cursor = simulator.fault_event_count
+            return 0
+        events = simulator.fault_events_since(self._cursor)
+        self._cursor = simulator.fault_event_count
+        self.add(events)
+        return len(events)
+    
+    def add(self, events: Sequence[FaultEvent], wall: Optional[float] = None):
+        """Journalise des événements (horodatés maintenant sauf wall donné)"""
+        if not events:
+            return
+        wall = time.time() if wall is None else wall
+        rows = [(self.session, wall, e.t, e.rail, e.fault, int(e.active)) for e in events]
+        self.events += len(rows)
+        if self._writer is not None:
+            self._queue.put(rows)
+        else:
+            self._insert(self._db, rows)
+    
+    def flush(self):
+        """Attend que tout ce qui a été ajouté soit validé"""
+        if self._writer is not None:
+            self._queue.join()
+    
+    def close(self):
+        """Vide la file, arrête le thread d'écriture et ferme la base"""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self._db.close()
+    
+    def report(self) -> Dict[str, int]:
+        return {
+            "session": self.session,
+            "events": self.events,
+            "batches": self.batches,
+            "rows": self._db.execute("SELECT COUNT(*) FROM faults").fetchone()[0],
+        }
+    
+    def _insert(self, db: sqlite3.Connection, rows: List[tuple]):
+        with db:
+            db.executemany(_INSERT, rows)
+        self.batches += 1
+        self.committed += len(rows)
+    
+    def _write_loop(self):
+        """Thread d'écriture: tous les lots en attente dans une transaction"""
+        db = _connect(self.path)
+        running = True
+        while running:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            rows = []
+            for item in items:
+                if item is None:
+                    running = False
+                else:
+                    rows.extend(item)
+            if rows:
+                self._insert(db, rows)
+            for _ in items:
+                self._queue.task_done()
+        db.close()
+    
+    # --- Lecture ---
+    
+    def view(self, rail: Optional[str] = None, fault: Optional[str] = None) -> FaultView:
+        """Événements filtrés (None: tous), du plus ancien au plus récent"""
+        return FaultView(self, rail, fault)
+    
+    def query(self, sql: str, args: Sequence = ()) -> List[tuple]:
+        return self._db.execute(sql, args).fetchall()
+
+
+# =============================================================================
+# VUE FILTRÉE (accès par rang, blocs en cache)
+# =============================================================================
+
+class FaultView:
+    """Liste virtuelle des événements d'un filtre, indexée par rang
+    
+    Le nombre d'événements est tenu à jour de façon incrémentale (lignes
+    d'id supérieur au dernier vu, via l'index). Les lignes sont lues par
+    blocs de FAULT_LOG_CHUNK: un bloc voisin d'un bloc en cache est lu par
+    clé (id > dernier, id < premier), un bloc isolé par OFFSET depuis
+    l'extrémité la plus proche. Défiler ne lit donc que les lignes
+    affichées, quelle que soit la taille du journal.
+    """
+    
+    def __init__(self, log: FaultLog, rail: Optional[str] = None, fault: Optional[str] = None):
+        self.log = log
+        self.rail = rail
+        self.fault = fault
+        clauses = [clause for clause, value in (("rail = ?", rail), ("fault = ?", fault))
+                   if value is not None]
+        self._args: Tuple = tuple(value for value in (rail, fault) if value is not None)
+        self._where = " AND ".join(clauses) or "1"
+        self._count = 0
+        self._last_id = 0
+        self._seen = -1
+        self._chunks: Dict[int, List[FaultRecord]] = {}
+        self.reads = 0             # Requêtes de lignes (mesure)
+    
+    def __len__(self) -> int:
+        self.refresh()
+        return self._count
+    
+    def refresh(self) -> bool:
+        """Prend en compte les lignes validées depuis le dernier appel"""
+        committed = self.log.committed
+        if committed == self._seen:
+            return False
+        self._seen = committed
+        count, last_id = self.log.query(
+            f"SELECT COUNT(*), MAX(id) FROM faults WHERE {self._where} AND id > ?",
+            self._args + (self._last_id,))[0]
+        if not count:
+            return False
+        # Le dernier bloc, incomplet, sera relu
+        self._chunks.pop(self._count // FAULT_LOG_CHUNK, None)
+        self._count += count
+        self._last_id = last_id
+        return True
+    
+    def rows(self, start: int, n: int) -> List[FaultRecord]:
+        """Événements de rang [start, start + n), 0 = le plus ancien"""
+        self.refresh()
+        start, stop = max(start, 0), min(start + n, self._count)
+        rows: List[FaultRecord] = []
+        while start < stop:
+            k, offset = divmod(start, FAULT_LOG_CHUNK)
+            chunk = self._chunk(k)
+            rows.extend(chunk[offset:offset + stop - start])
+            start = (k + 1) * FAULT_LOG_CHUNK
+        return rows
+    
+    def index_at(self, wall: float) -> int:
+        """Rang du premier événement enregistré à partir de l'heure donnée"""
+        first = self.log.query("SELECT id FROM faults WHERE wall >= ? ORDER BY wall LIMIT 1",
+                               (wall,))
+        if not first:
+            return len(self)
+        return self.log.query(f"SELECT COUNT(*) FROM faults WHERE {self._where} AND id < ?",
+                              self._args + (first[0][0],))[0][0]
+    
+    def _chunk(self, k: int) -> List[FaultRecord]:
+        chunk = self._chunks.get(k)
+        if chunk is not None:
+            return chunk
+        select = f"SELECT {_COLUMNS} FROM faults WHERE {self._where}"
+        before, after = self._chunks.get(k - 1), self._chunks.get(k + 1)
+        if before is not None:
+            rows = self.log.query(f"{select} AND id > ? ORDER BY id LIMIT ?",
+                                  self._args + (before[-1].id, FAULT_LOG_CHUNK))
+        elif after is not None:
+            rows = self.log.query(f"{select} AND id < ? ORDER BY id DESC LIMIT ?",
+                                  self._args + (after[0].id, FAULT_LOG_CHUNK))[::-1]
+        elif 2 * k * FAULT_LOG_CHUNK <= self._count:
+            rows = self.log.query(f"{select} ORDER BY id LIMIT ? OFFSET ?",
+                                  self._args + (FAULT_LOG_CHUNK, k * FAULT_LOG_CHUNK))
+        else:
+            end = min((k + 1) * FAULT_LOG_CHUNK, self._count)
+            rows = self.log.query(f"{select} ORDER BY id DESC LIMIT ? OFFSET ?",
+                                  self._args + (end - k * FAULT_LOG_CHUNK, self._count - end))[::-1]
+        self.reads += 1
+        if len(self._chunks) >= FAULT_LOG_CACHE:
+            # Bloc le plus éloigné de celui demandé
+            del self._chunks[max(self._chunks, key=lambda j: abs(j - k))]
+        chunk = self._chunks[k] = [FaultRecord(i, s, w, t, r, f, bool(a))
+                                   for i, s, w, t, r, f, a in rows]
+        return chunk
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Constantes firmware et limites de protection (LPS_Audiophile_V2_4_5.ino)
+"""
+
+from __future__ import annotations
+
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+# =============================================================================
+# CONSTANTES FIRMWARE (alignées sur LPS_Audiophile_V2_4_5.ino)
+# =============================================================================
+
+# Seuils protection
+V_OUT_MAX = 16.0
+V_OUT_RESET = 15.0
+V_PRE_MAX = 17.5
+BACKFEED_THRESHOLD = -20.0     # mA, courant INA219 signé (V2.4.5)
+
+# Limites courant adaptatives selon V_OUT (thermique pré-régulateur) V2.4.1
+I_MAX_LOW_V = 350.0    # V_OUT 5-6V: 350mA max
+I_MAX_MID_V = 450.0    # V_OUT 7-9V: 450mA max
+I_MAX_HIGH_V = 500.0   # V_OUT 10-15V: 500mA max
+
+# Seuils température
+TEMP_WARNING = 70.0
+TEMP_SHUTDOWN = 85.0
+TEMP_RESET = 60.0
+
+# Plage de réglage et headroom V_PRE - V_OUT
+V_OUT_MIN = 5.0
+V_OUT_MAX_SET = 15.0
+V_HEADROOM = 2.0
+
+# Délais de confirmation des protections (millis() firmware, puis secondes)
+OCP_DELAY_MS = 100
+OVP_DELAY_MS = 50              # Aussi utilisé pour l'OTP
+PURIST_MEASURE_INTERVAL_MS = 200
+OCP_DELAY_S = OCP_DELAY_MS / 1000.0
+OVP_DELAY_S = OVP_DELAY_MS / 1000.0
+
+# Mesure tension: pont diviseur sur ADC 10 bits
+V_DIV_RATIO = 4.03
+V_REF = 5.0
+ADC_RESOLUTION = 1023.0
+
+# Réglage tension: MCP41100 sur le feedback LM317 (V2.4.0)
+DIGIPOT_STEPS = 255
+R_FIXED_FB = 1100.0            # R_FIXED feedback (Ω)
+R1_FB = 240.0                  # R1 ADJ→GND (Ω)
+R_SHUNT_FB = 2000.0            # R_SHUNT parallèle digipot (Ω)
+R_DIGIPOT_FULL = 100000.0      # MCP41100 100kΩ
+V_REF_LM317 = 1.25
+
+# Lissage des mesures et indice qualité
+SMOOTH_FACTOR = 0.3            # EMA smooth_i_A/B (readAllMeasures)
+STABILITY_SMOOTH = 0.9         # EMA stability_score (updateStabilityScore)
+QUALITY_HIGH_CURRENT_MA = 400.0
+TEMP_GOOD = 45.0               # Libellé température « BON » en dessous
+
+
+def get_adaptive_current_limit(v_out_target: float) -> float:
+    """Limite courant adaptative selon V_OUT (miroir de getAdaptiveCurrentLimit)"""
+    if v_out_target < 7.0:
+        return I_MAX_LOW_V
+    elif v_out_target < 10.0:
+        return I_MAX_MID_V
+    return I_MAX_HIGH_V
+
+
+def adc_voltage(v: float) -> float:
+    """Tension vue par readVoltageADC() × V_DIV_RATIO (quantification 10 bits, saturation)"""
+    counts = min(max(int(v / V_DIV_RATIO * ADC_RESOLUTION / V_REF + 0.5), 0), int(ADC_RESOLUTION))
+    return counts * V_REF / ADC_RESOLUTION * V_DIV_RATIO
+
+
+def digipot_to_voltage(pos: int) -> float:
+    """V_OUT pour une position digipot (miroir de digipotToVoltage)"""
+    r_wiper = pos * (R_DIGIPOT_FULL / DIGIPOT_STEPS)
+    r_eff = 0.0
+    if r_wiper > 0:
+        r_eff = (r_wiper * R_SHUNT_FB) / (r_wiper + R_SHUNT_FB)
+    r2 = R_FIXED_FB + r_eff
+    v_pre = V_REF_LM317 * (1.0 + r2 / R1_FB)
+    return min(max(v_pre - V_HEADROOM, V_OUT_MIN), V_OUT_MAX_SET)
+
+
+def voltage_to_digipot(v_out: float) -> int:
+    """Position digipot la plus proche d'une tension (miroir de voltageToDigipot)"""
+    v_out = min(max(v_out, V_OUT_MIN), V_OUT_MAX_SET)
+    v_pre = v_out + V_HEADROOM
+    r2 = (v_pre / V_REF_LM317 - 1.0) * R1_FB
+    r_eff = max(r2 - R_FIXED_FB, 0.0)
+    denom = R_SHUNT_FB - r_eff
+    if denom <= 0:
+        return DIGIPOT_STEPS
+    r_wiper = (r_eff * R_SHUNT_FB) / denom
+    pos = int(r_wiper / (R_DIGIPOT_FULL / DIGIPOT_STEPS) + 0.5)
+    return min(max(pos, 0), DIGIPOT_STEPS)
+
+
+def digipot_voltages(positions) -> np.ndarray:
+    """digipot_to_voltage() sur un tableau de positions (balayages, tables)"""
+    r_wiper = np.asarray(positions, dtype=float) * (R_DIGIPOT_FULL / DIGIPOT_STEPS)
+    r_eff = r_wiper * R_SHUNT_FB / (r_wiper + R_SHUNT_FB)
+    v_pre = V_REF_LM317 * (1.0 + (R_FIXED_FB + r_eff) / R1_FB)
+    return np.clip(v_pre - V_HEADROOM, V_OUT_MIN, V_OUT_MAX_SET)
+
+
+def voltages_to_digipot(voltages) -> np.ndarray:
+    """voltage_to_digipot() sur un tableau de tensions"""
+    v_out = np.clip(np.asarray(voltages, dtype=float), V_OUT_MIN, V_OUT_MAX_SET)
+    r2 = ((v_out + V_HEADROOM) / V_REF_LM317 - 1.0) * R1_FB
+    r_eff = np.maximum(r2 - R_FIXED_FB, 0.0)
+    denom = R_SHUNT_FB - r_eff
+    r_wiper = np.where(denom > 0, r_eff * R_SHUNT_FB / np.where(denom > 0, denom, 1.0),
+                       R_DIGIPOT_FULL)
+    pos = np.floor(r_wiper / (R_DIGIPOT_FULL / DIGIPOT_STEPS) + 0.5)
+    return np.clip(pos, 0, DIGIPOT_STEPS).astype(int)
+
+
+def quality_index(stability_score: float, temp_radiator: float,
+                  smooth_i_a: float, smooth_i_b: float) -> float:
+    """Indice qualité 0-100 (miroir de displayQualityScreen)"""
+    quality = stability_score
+    if temp_radiator > TEMP_WARNING:
+        quality -= 20.0
+    if smooth_i_a > QUALITY_HIGH_CURRENT_MA or smooth_i_b > QUALITY_HIGH_CURRENT_MA:
+        quality -= 10.0
+    return min(max(quality, 0.0), 100.0)
+
+
+def quality_label_key(quality: float) -> str:
+    """Clé de traduction du libellé qualité (OPTIMAL / BON / CORRECT / DÉGRADÉ)"""
+    if quality >= 90.0:
+        return "quality_optimal"
+    if quality >= 70.0:
+        return "quality_good"
+    if quality >= 50.0:
+        return "quality_correct"
+    return "quality_degraded"
+
+
+def temperature_label_key(temp_radiator: float) -> str:
+    """Clé de traduction de l'état thermique de l'écran QUALITÉ"""
+    if temp_radiator < TEMP_GOOD:
+        return "temp_good"
+    if temp_radiator < TEMP_WARNING:
+        return "temp_warm"
+    return "temp_hot"
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Historique multi-résolution des rails (pyramides min/max/moyenne)
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .allocations import BufferPool
+from .lazy import lazy_import
+from .snapshots import get_fields, set_fields
+
+np = lazy_import("numpy")
+
+
+# =============================================================================
+# HISTORIQUE MULTI-RÉSOLUTION
+# =============================================================================
+
+TREND_CHANNELS = ("voltage", "current", "temperature", "ripple")
+# (période du seau en s, nombre de seaux conservés): 2 h, 48 h, 30 jours
+TREND_LEVELS = ((1.0, 7200), (60.0, 2880), (3600.0, 720))
+TREND_MAX_BUCKETS = 4096       # Seaux lus au plus par requête (coût de rendu borné)
+
+
+class _TrendLevel:
+    """Un niveau de la pyramide: anneau de seaux clos + seau en cours
+    
+    Les seaux sont indexés en absolu (t // période); l'anneau garde les
+    `capacity` derniers. La moyenne d'un seau parent est celle des seaux
+    enfants (pondération par durée, pas par nombre d'échantillons).
+    """
+    
+    STATE_FIELDS = ("mins", "maxs", "means", "last", "current", "_min", "_max", "_sum", "_n")
+    
+    def __init__(self, period: float, capacity: int, n_channels: int,
+                 parent: Optional['_TrendLevel'] = None):
+        self.period = period
+        self.capacity = capacity
+        self.parent = parent
+        self.ratio = int(round(parent.period / period)) if parent is not None else 1
+        self.mins = np.full((capacity, n_channels), np.nan)
+        self.maxs = np.full((capacity, n_channels), np.nan)
+        self.means = np.full((capacity, n_channels), np.nan)
+        self.last = -1                  # Dernier seau clos (index absolu)
+        self.current: Optional[int] = None
+        self._min = np.empty(n_channels)
+        self._max = np.empty(n_channels)
+        self._sum = np.zeros(n_channels)
+        self._n = 0
+    
+    def get_state(self) -> Dict[str, Any]:
+        return get_fields(self, self.STATE_FIELDS)
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, self.STATE_FIELDS)
+    
+    @property
+    def oldest(self) -> int:
+        """Plus ancien seau encore présent dans l'anneau"""
+        return self.last - self.capacity + 1
+    
+    def add(self, index: int, vmin, vmax, vsum, n: int):
+        """Agrège (min, max, somme, poids) dans le seau `index`"""
+        if self.current is not None and index != self.current:
+            self._close()
+        if self.current is None:
+            self.current = index
+            self._min[:] = vmin
+            self._max[:] = vmax
+            self._sum[:] = vsum
+            self._n = n
+            return
+        np.minimum(self._min, vmin, out=self._min)
+        np.maximum(self._max, vmax, out=self._max)
+        self._sum += vsum
+        self._n += n
+    
+    def fill(self, first: int, last: int, values):
+        """Seaux first..last (inclus) tous égaux à values, sans échantillon réel"""
+        if self.current is not None:
+            self._close()
+        start = max(first, last - self.capacity + 1)
+        slots = np.arange(start, last + 1) % self.capacity
+        self.mins[slots] = values
+        self.maxs[slots] = values
+        self.means[slots] = values
+        self.last = last
+        if self.parent is not None:
+            for p in range(first // self.ratio, last // self.ratio + 1):
+                k = min(last, (p + 1) * self.ratio - 1) - max(first, p * self.ratio) + 1
+                self.parent.add(p, values, values, values * k, k)
+    
+    def _close(self):
+        slot = self.current % self.capacity
+        mean = self._sum / self._n
+        self.mins[slot] = self._min
+        self.maxs[slot] = self._max
+        self.means[slot] = mean
+        self.last = self.current
+        self.current = None
+        if self.parent is not None:
+            self.parent.add(self.last // self.ratio, self._min, self._max, mean, 1)
+    
+    def read(self, first: int, last: int, index: np.ndarray, buffers: BufferPool
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Seaux first..last (NaN hors historique), seau en cours compris
+        
+        index: rangs absolus first..last; résultats écrits dans buffers.
+        """
+        n = last - first + 1
+        # Seaux valides contigus: [max(oldest, 0), last] ramené à la fenêtre
+        lo = min(max(max(self.oldest, 0) - first, 0), n)
+        hi = max(min(self.last - first + 1, n), lo)
+        out = []
+        for name, ring in (("mins", self.mins), ("maxs", self.maxs), ("means", self.means)):
+            values = buffers.get(name, (n, ring.shape[1]))
+            # mode="wrap": modulo capacité sans tableau d'indices intermédiaire
+            np.take(ring, index, axis=0, out=values, mode="wrap")
+            values[:lo] = np.nan
+            values[hi:] = np.nan
+            out.append(values)
+        mins, maxs, means = out
+        if self.current is not None and first <= self.current <= last:
+            i = self.current - first
+            mins[i] = self._min
+            maxs[i] = self._max
+            np.divide(self._sum, self._n, out=means[i])
+        return mins, maxs, means
+
+
+class TrendStore:
+    """Historique des rails en pyramide min/max/moyenne (1 s, 1 min, 1 h)
+    
+    `add()` est appelé à chaque pas de simulation: l'échantillon est agrégé
+    dans le seau d'une seconde en cours, et chaque seau clos remonte dans le
+    niveau supérieur. Le coût par pas est constant (hors seaux sautés en
+    accéléré, remplis en bloc). `window()` lit le niveau le plus fin dont le
+    nombre de seaux sur la plage reste sous TREND_MAX_BUCKETS, puis réduit
+    par colonne d'écran: le rendu ne dépend pas de la durée affichée.
+    Lecture et réduction écrivent dans des tampons réutilisés (BufferPool):
+    rien n'est alloué d'une frame à l'autre.
+    """
+    
+    def __init__(self, n_rails: int = 2, levels: Sequence[Tuple[float, int]] = TREND_LEVELS):
+        self.n_rails = n_rails
+        n_channels = n_rails * len(TREND_CHANNELS)
+        self.levels: List[_TrendLevel] = []
+        parent = None
+        for period, capacity in reversed(levels):
+            parent = _TrendLevel(period, capacity, n_channels, parent)
+            self.levels.insert(0, parent)
+        self.t_first: Optional[float] = None
+        self.t_last = 0.0
+        self.buffers = BufferPool()
+        self._ramp = np.arange(TREND_MAX_BUCKETS + 2)
+    
+    def get_state(self) -> Dict[str, Any]:
+        state = get_fields(self, ("t_first", "t_last"))
+        state["levels"] = [level.get_state() for level in self.levels]
+        return state
+    
+    def set_state(self, state: Dict[str, Any]):
+        if len(state["levels"]) != len(self.levels):
+            raise ValueError("snapshot history levels do not match")
+        set_fields(self, state, ("t_first", "t_last"))
+        for level, level_state in zip(self.levels, state["levels"]):
+            level.set_state(level_state)
+    
+    @staticmethod
+    def channel(rail: int, name: str) -> int:
+        """Index de voie pour (rail, grandeur)"""
+        return rail * len(TREND_CHANNELS) + TREND_CHANNELS.index(name)
+    
+    def add(self, t: float, values):
+        """Échantillon à l'instant t (s, temps simulé), voies rail par rail"""
+        values = np.asarray(values, dtype=float)
+        base = self.levels[0]
+        index = int(t // base.period)
+        if self.t_first is None:
+            self.t_first = t
+        elif base.current is not None and index > base.current + 1:
+            # Pas accéléré: les secondes sautées reprennent l'échantillon courant
+            base.fill(base.current + 1, index - 1, values)
+        base.add(index, values, values, values, 1)
+        self.t_last = t
+    
+    def level_for(self, t_start: float, t_end: float) -> _TrendLevel:
+        """Niveau le plus fin couvrant la plage sous TREND_MAX_BUCKETS seaux"""
+        for level in self.levels:
+            if (t_end - t_start) / level.period > TREND_MAX_BUCKETS:
+                continue
+            # Niveau utilisable si la plage n'a pas encore été évincée de l'anneau
+            evicted = self.t_first is not None and level.oldest > int(self.t_first // level.period)
+            if not evicted or int(t_start // level.period) >= level.oldest:
+                return level
+        return self.levels[-1]
+    
+    def window(self, t_start: float, t_end: float, columns: int
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(instants, min, max, moyenne) sur au plus `columns` colonnes
+        
+        Les tableaux de valeurs sont (colonnes, voies), NaN sans donnée.
+        Ce sont des vues sur les tampons du store, valables jusqu'à l'appel
+        suivant.
+        """
+        buffers = self.buffers
+        level = self.level_for(t_start, t_end)
+        t_start = max(t_start, t_end - TREND_MAX_BUCKETS * level.period)
+        first = int(t_start // level.period)
+        last = max(first, int(math.ceil(t_end / level.period)) - 1)
+        n = last - first + 1
+        ramp = self._arange(max(n, columns))
+        index = buffers.get("index", (n,), np.intp)
+        np.add(ramp[:n], first, out=index)
+        mins, maxs, means = level.read(first, last, index, buffers)
+        if n <= columns:
+            times = buffers.get("times", (n,))
+            np.add(index, 0.5, out=times)
+            times *= level.period
+            return times, mins, maxs, means
+        
+        # Regroupement par colonne: fmin/fmax ignorent les NaN
+        shape = (columns, means.shape[1])
+        starts = buffers.get("starts", (columns,), np.intp)
+        np.multiply(ramp[:columns], n, out=starts)
+        starts //= columns
+        # Poids 0/1 en flottants: réductions sans conversion de type (ni tampon caché)
+        missing = buffers.get("missing", means.shape, bool)
+        np.isnan(means, out=missing)
+        weights = buffers.get("weights", means.shape)
+        weights.fill(1.0)
+        np.copyto(weights, 0.0, where=missing)
+        counts = buffers.get("counts", shape)
+        np.add.reduceat(weights, starts, axis=0, out=counts)
+        np.copyto(means, 0.0, where=missing)
+        sums = buffers.get("sums", shape)
+        np.add.reduceat(means, starts, axis=0, out=sums)
+        empty = buffers.get("empty", shape, bool)
+        np.equal(counts, 0, out=empty)
+        np.maximum(counts, 1, out=counts)
+        out_means = buffers.get("column_means", shape)
+        np.divide(sums, counts, out=out_means)
+        np.copyto(out_means, np.nan, where=empty)
+        times = buffers.get("times", (columns,))
+        np.add(starts, first, out=times)
+        times += 0.5 * n / columns
+        times *= level.period
+        return (times, np.fmin.reduceat(mins, starts, axis=0, out=buffers.get("column_mins", shape)),
+                np.fmax.reduceat(maxs, starts, axis=0, out=buffers.get("column_maxs", shape)),
+                out_means)
+    
+    def _arange(self, n: int) -> np.ndarray:
+        """0..n-1 sans réallocation (rampe agrandie au besoin)"""
+        if len(self._ramp) < n:
+            self._ramp = np.arange(2 * n)
+        return self._ramp
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Import différé des dépendances lourdes (NumPy, pygame)
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name: str):
+    """Import différé: le module n'est exécuté qu'au premier accès d'attribut
+    
+    Les outils sans écran (DataSimulator, Translations) n'initialisent ainsi
+    jamais SDL, et NumPy n'est chargé qu'à la première simulation.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
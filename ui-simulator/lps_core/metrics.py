@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Métriques en flux: EMA, variance de Welford, extrema glissants et score de stabilité
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .controller import FIRMWARE_LOOP_MS
+from .data import RailData
+from .firmware import (
+    SMOOTH_FACTOR, STABILITY_SMOOTH, PURIST_MEASURE_INTERVAL_MS,
+    quality_index, quality_label_key, temperature_label_key,
+)
+from .snapshots import get_fields, set_fields
+
+
+# =============================================================================
+# PRIMITIVES EN FLUX (O(1) par échantillon)
+# =============================================================================
+
+ROLLING_WINDOW = 256           # Échantillons des extrema glissants
+ROLLING_WINDOW_S = 8.0         # Fenêtre des extrema du MetricsEngine (temps simulé)
+
+
+class Ema:
+    """Moyenne exponentielle au format firmware: s = s·(1-α) + x·α
+    
+    `update(x, n)` équivaut à n mises à jour successives avec la même
+    valeur (α converti en 1-(1-α)^n): la constante de temps ne dépend pas
+    de la cadence des appels. n peut être fractionnaire.
+    """
+    
+    def __init__(self, alpha: float, initial: float = 0.0):
+        self.alpha = alpha
+        self.value = initial
+    
+    def update(self, x: float, n: float = 1.0) -> float:
+        if n == 1.0:
+            self.value = self.value * (1.0 - self.alpha) + x * self.alpha
+        else:
+            keep = (1.0 - self.alpha) ** n
+            self.value = self.value * keep + x * (1.0 - keep)
+        return self.value
+    
+    def get_state(self) -> Dict[str, Any]:
+        return get_fields(self, ("value",))
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, ("value",))
+
+
+class Welford:
+    """Moyenne et variance cumulées, numériquement stables (Welford)
+    
+    Un poids entier k équivaut à k échantillons identiques (poids de
+    fréquence, forme pondérée de West).
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def get_state(self) -> Dict[str, Any]:
+        return get_fields(self, ("count", "mean", "_m2"))
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, ("count", "mean", "_m2"))
+    
+    def update(self, x: float, weight: float = 1):
+        if weight <= 0:
+            return
+        self.count += weight
+        delta = x - self.mean
+        self.mean += delta * weight / self.count
+        self._m2 += weight * delta * (x - self.mean)
+    
+    @property
+    def variance(self) -> float:
+        """Variance d'échantillon (n-1), 0 avant deux échantillons"""
+        # Valeurs identiques: la moyenne peut dépasser x d'un ulp et M2 passer sous 0
+        return max(self._m2, 0.0) / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class RollingExtrema:
+    """Min et max sur une fenêtre glissante de `window` (files monotones)
+    
+    Chaque échantillon couvre `span` unités (1 par défaut: fenêtre en
+    échantillons) et reste dans la fenêtre tant que sa fin n'en est pas
+    sortie. Chaque file garde des (fin, valeur) strictement ordonnées: un
+    nouvel échantillon évince en queue ceux qu'il domine, la tête sort
+    quand elle quitte la fenêtre. Coût amorti O(1) par échantillon.
+    """
+    
+    def __init__(self, window: float = ROLLING_WINDOW):
+        self.window = window
+        self.count = 0
+        self.position = 0.0
+        self._min: Deque[Tuple[float, float]] = deque()
+        self._max: Deque[Tuple[float, float]] = deque()
+    
+    def get_state(self) -> Dict[str, Any]:
+        return get_fields(self, ("count", "position", "_min", "_max"))
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, ("count", "position", "_min", "_max"))
+    
+    def update(self, x: float, span: float = 1):
+        self.count += 1
+        self.position += span
+        end = self.position
+        lows, highs = self._min, self._max
+        while lows and lows[-1][1] >= x:
+            lows.pop()
+        lows.append((end, x))
+        while highs and highs[-1][1] <= x:
+            highs.pop()
+        highs.append((end, x))
+        oldest = end - self.window
+        while lows[0][0] <= oldest:
+            lows.popleft()
+        while highs[0][0] <= oldest:
+            highs.popleft()
+    
+    @property
+    def min(self) -> float:
+        return self._min[0][1] if self._min else 0.0
+    
+    @property
+    def max(self) -> float:
+        return self._max[0][1] if self._max else 0.0
+
+
+# =============================================================================
+# MOTEUR DE MÉTRIQUES (miroir firmware)
+# =============================================================================
+
+class StabilityScore:
+    """Score de stabilité (miroir de updateStabilityScore)
+    
+    instabilité = Σ|Δi| / 10 entre deux mesures, lissée par EMA 0.9 vers
+    100 - instabilité. Avec des courants tenus pendant n itérations, seule
+    la première voit le saut: les n-1 suivantes tirent le score vers 100.
+    """
+    
+    def __init__(self, n_rails: int = 2):
+        self.score = Ema(1.0 - STABILITY_SMOOTH, 100.0)
+        self.prev_i = [0.0] * n_rails
+    
+    def update(self, currents_ma: Sequence[float], loops: float = 1.0) -> float:
+        instability = sum(abs(i - prev) for i, prev in zip(currents_ma, self.prev_i)) / 10.0
+        self.prev_i = list(currents_ma)
+        self.score.update(100.0 - min(max(instability, 0.0), 100.0), min(loops, 1.0))
+        if loops > 1.0:
+            self.score.update(100.0, loops - 1.0)
+        return self.score.value
+    
+    @property
+    def value(self) -> float:
+        return self.score.value
+    
+    def get_state(self) -> Dict[str, Any]:
+        return {"score": self.score.value, "prev_i": self.prev_i}
+    
+    def set_state(self, state: Dict[str, Any]):
+        self.score.value = float(state["score"])
+        self.prev_i = [float(i) for i in state["prev_i"]]
+
+
+class MetricsEngine:
+    """Métriques qualité des rails, cadencées comme la boucle firmware
+    
+    Reproduit la boucle firmware readAllMeasures() → updateStabilityScore():
+    smooth_i (EMA 0.3, départ à 0 comme le firmware) et stability_score,
+    d'où l'indice de displayQualityScreen. En plus, par rail: moyenne et
+    écart-type de la tension depuis la dernière consigne (Welford) et
+    extrema glissants de tension et de courant sur ROLLING_WINDOW_S.
+    
+    Une mise à jour couvre `dt` secondes simulées à mesures tenues
+    (bloqueur d'ordre zéro): elle équivaut aux dt / FIRMWARE_LOOP_MS
+    itérations de loop() correspondantes, quels que soient la cadence
+    d'affichage et time_scale. En purist, le firmware ne mesure que toutes
+    les PURIST_MEASURE_INTERVAL_MS et ne met pas à jour stability_score.
+    """
+    
+    def __init__(self, n_rails: int = 2, window_s: float = ROLLING_WINDOW_S):
+        self.n_rails = n_rails
+        self.smooth_i = [Ema(SMOOTH_FACTOR) for _ in range(n_rails)]
+        self.stability = StabilityScore(n_rails)
+        self.voltage_stats = [Welford() for _ in range(n_rails)]
+        window = window_s * 1000.0 / FIRMWARE_LOOP_MS
+        self.voltage_range = [RollingExtrema(window) for _ in range(n_rails)]
+        self.current_range = [RollingExtrema(window) for _ in range(n_rails)]
+        self.temp_radiator = 0.0
+        self.samples = 0
+    
+    def update(self, rails: Sequence[RailData], dt: Optional[float] = None,
+               purist: bool = False):
+        """Mesures des rails tenues pendant dt secondes (une itération de loop() sans dt)"""
+        loops = 1.0 if dt is None else dt * 1000.0 / FIRMWARE_LOOP_MS
+        if loops <= 0.0:
+            return
+        # readAllMeasures(): à chaque itération, toutes les 200 ms en purist
+        measures = loops * FIRMWARE_LOOP_MS / PURIST_MEASURE_INTERVAL_MS if purist else loops
+        currents: List[float] = []
+        for idx, rail in enumerate(rails):
+            current = max(rail.current_ma, 0.0)
+            currents.append(current)
+            self.smooth_i[idx].update(current, measures)
+            self.voltage_stats[idx].update(rail.voltage_actual, loops)
+            self.voltage_range[idx].update(rail.voltage_actual, loops)
+            self.current_range[idx].update(current, loops)
+        if not purist:
+            self.stability.update(currents, loops)
+        # Une seule CTN radiateur sur la carte: le rail le plus chaud
+        self.temp_radiator = max(rail.temperature_c for rail in rails)
+        self.samples += 1
+    
+    def reset_rail(self, rail: int):
+        """Nouvelle consigne ou nouveau mode: statistiques de tension repartent à zéro"""
+        self.voltage_stats[rail] = Welford()
+    
+    _PER_RAIL = ("smooth_i", "voltage_stats", "voltage_range", "current_range")
+    
+    def get_state(self) -> Dict[str, Any]:
+        state = get_fields(self, ("temp_radiator", "samples"))
+        state["stability"] = self.stability.get_state()
+        for name in self._PER_RAIL:
+            state[name] = [item.get_state() for item in getattr(self, name)]
+        return state
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, ("temp_radiator", "samples"))
+        self.stability.set_state(state["stability"])
+        for name in self._PER_RAIL:
+            items = getattr(self, name)
+            if len(state[name]) != len(items):
+                raise ValueError(f"snapshot '{name}' does not match {self.n_rails} rails")
+            for item, item_state in zip(items, state[name]):
+                item.set_state(item_state)
+    
+    @property
+    def quality(self) -> float:
+        return quality_index(self.stability.value, self.temp_radiator,
+                             self.smooth_i[0].value, self.smooth_i[-1].value)
+    
+    @property
+    def quality_label(self) -> str:
+        return quality_label_key(self.quality)
+    
+    @property
+    def temperature_label(self) -> str:
+        return temperature_label_key(self.temp_radiator)
@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+"""
+Modèle physique vectorisé des rails: chaîne de régulation et réseau thermique
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .lazy import lazy_import
+from .controller import FirmwareController
+from .firmware import I_MAX_LOW_V, I_MAX_MID_V, I_MAX_HIGH_V, TEMP_SHUTDOWN, V_HEADROOM
+from .data import RailData, SimulationMode
+from .snapshots import get_fields, set_fields
+from .streams import RailStreams
+
+np = lazy_import("numpy")
+
+
+# =============================================================================
+# MODÈLE PHYSIQUE DES RAILS
+# =============================================================================
+
+# Entrée non régulée: transfo 2×18VAC → pont → réservoir (Circuit V2.4.1)
+MAINS_FREQ_HZ = 50.0           # Redressement double alternance → ripple 100 Hz
+R_SOURCE_OHM = 2.0             # Impédance transfo + pont vue du réservoir
+C_RESERVOIR_F = 4700e-6
+
+# Chaîne de régulation: LM338T (pré-régulateur) → 6× LT3045 en parallèle
+LM338_DROPOUT_V = 2.0
+LT3045_DROPOUT_V = 0.26
+LT3045_COUNT = 6
+LT3045_NOISE_UV = 0.8          # Bruit d'un LT3045 seul (µV RMS)
+PSRR_PRE_DB = 60.0             # Réjection LM338T à 100 Hz (C_ADJ présent)
+PSRR_LDO_DB = 36.0             # Réjection effective du banc LT3045 à 100 Hz
+PSRR_MIN_DB = 20.0             # Réjection résiduelle en dropout
+PSRR_KNEE_V = 1.0              # Marge sous laquelle la réjection s'effondre
+
+# Pertes hors régulateurs
+TRANSFO_CORE_LOSS_W = 1.2      # Pertes fer du torique 30VA
+RECT_FORM_FACTOR = 1.6         # I_rms² / I_dc² côté secondaire (redresseur + réservoir)
+BRIDGE_VF_V = 0.45             # Pont Schottky, deux diodes conductrices
+
+# Dynamique
+V_SLEW_TAU_S = 0.020           # Établissement de la sortie
+DISCHARGE_TAU_S = 0.100        # Décharge de la sortie après coupure
+LOAD_TAU_S = 0.015             # Variation du courant de charge
+MODE_TRANSITION_TAU_S = 0.250  # Apparition/disparition d'une panne injectée
+PHYSICS_STEP_S = 0.005         # Pas d'intégration (résout les délais OVP/OCP)
+SETTLED_STEP_S = 0.050         # Pas en régime établi (aucun transitoire ni temporisation)
+MAX_SUBSTEPS = 64
+
+# Mesure (bruit ADC / INA219 / NTC)
+MEAS_NOISE_V = 0.005
+MEAS_NOISE_MA = 2.0
+MEAS_NOISE_C = 0.2
+MEAS_NOISE_RIPPLE = 0.1        # Relatif
+MEAS_CHANNELS = 4              # Tension, courant, température, ripple
+
+
+class ThermalNetwork:
+    """Réseau RC thermique multi-nœuds (transfo, LM338T, dissipateur, LT3045, boîtier)
+    
+    C·dT/dt = -G·T + P + g_ext·T_ext est discrétisé exactement pour un pas h:
+    T[k+1] = Ad·T[k] + Bd·u[k]. G est symétrique, donc S = C^-½·G·C^-½ se
+    diagonalise (eigh) et Ad, Bd s'obtiennent sans série de Padé. La
+    décomposition est mise en cache par configuration (facteurs Rth), les
+    coefficients par pas h: chaque tick se réduit à deux produits
+    matrice-vecteur.
+    """
+    
+    # Capacités thermiques (J/°C)
+    C_ENCLOSURE = 300.0            # Air + châssis alu
+    C_TRANSFO = 400.0              # Torique 30VA
+    C_LM338 = 2.0                  # Puce + boîtier TO-220
+    C_HEATSINK = 100.0             # Alu 50×40×20 (≈110 g)
+    C_LT3045 = 5.0                 # 6× DFN + cuivre PCB
+    
+    # Résistances thermiques (°C/W)
+    RTH_ENCLOSURE_EXT = 1.5        # Boîtier → pièce
+    RTH_TRANSFO = 5.0              # Transfo → air interne
+    RTH_LM338_HS = 1.5             # Jonction → dissipateur (Rth jc + pad)
+    RTH_HEATSINK = 8.0             # Dissipateur → air interne
+    RTH_LT3045 = 34.0 / LT3045_COUNT  # 34°C/W par DFN, 6 en parallèle
+    
+    ENCLOSURE = 0
+    TRANSFO = 1
+    NODES_PER_RAIL = 3             # LM338T, dissipateur, banc LT3045
+    
+    MAX_CACHED_STEPS = 64
+    
+    def __init__(self, n_rails: int = 2, room_temp: float = 25.0):
+        self.n_rails = n_rails
+        self.room_temp = room_temp
+        self.names = ["ENCLOSURE", "TRANSFO"]
+        capacity = [self.C_ENCLOSURE, self.C_TRANSFO]
+        for rail in "AB"[:n_rails]:
+            self.names += [f"LM338_{rail}", f"HEATSINK_{rail}", f"LT3045_{rail}"]
+            capacity += [self.C_LM338, self.C_HEATSINK, self.C_LT3045]
+        self.n_nodes = len(self.names)
+        self.capacity = np.array(capacity)
+        self._c_sqrt = np.sqrt(self.capacity)
+        
+        rails = np.arange(n_rails)
+        self.lm338 = 2 + rails * self.NODES_PER_RAIL
+        self.heatsink = self.lm338 + 1
+        self.lt3045 = self.lm338 + 2
+        
+        self.temps = np.full(self.n_nodes, room_temp)
+        self.power = np.zeros(self.n_nodes)
+        self._u = np.zeros(self.n_nodes)
+        self._config: Tuple[float, ...] = (1.0,) * n_rails + (1.0,)
+        self._eigen_cache: Dict[Tuple[float, ...], Tuple[np.ndarray, ...]] = {}
+        self._step_cache: Dict[Tuple[Tuple[float, ...], float], Tuple[np.ndarray, np.ndarray]] = {}
+    
+    def __getstate__(self):
+        # Caches recalculés à la demande (résultats identiques): hors copie
+        state = self.__dict__.copy()
+        state["_eigen_cache"] = {}
+        state["_step_cache"] = {}
+        return state
+    
+    def get_state(self) -> Dict[str, Any]:
+        return get_fields(self, ("room_temp", "temps", "power", "_config"))
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, ("room_temp", "temps", "power", "_config"))
+    
+    def set_config(self, heatsink_factors, vent_factor: float):
+        """Facteurs multiplicatifs de Rth (dissipateurs par rail, ventilation boîtier)"""
+        self._config = tuple(float(f) for f in heatsink_factors) + (float(vent_factor),)
+    
+    def _conductance(self, config: Tuple[float, ...]) -> Tuple[np.ndarray, float]:
+        """Matrice de conductance G (W/°C) et conductance vers la pièce"""
+        g = np.zeros((self.n_nodes, self.n_nodes))
+        
+        def link(a: int, b: int, rth: float):
+            g[a, a] += 1.0 / rth
+            g[b, b] += 1.0 / rth
+            g[a, b] -= 1.0 / rth
+            g[b, a] -= 1.0 / rth
+        
+        link(self.TRANSFO, self.ENCLOSURE, self.RTH_TRANSFO)
+        for r in range(self.n_rails):
+            link(self.lm338[r], self.heatsink[r], self.RTH_LM338_HS)
+            link(self.heatsink[r], self.ENCLOSURE, self.RTH_HEATSINK * config[r])
+            link(self.lt3045[r], self.ENCLOSURE, self.RTH_LT3045)
+        g_ext = 1.0 / (self.RTH_ENCLOSURE_EXT * config[-1])
+        g[self.ENCLOSURE, self.ENCLOSURE] += g_ext
+        return g, g_ext
+    
+    def _eigen(self, config: Tuple[float, ...]) -> Tuple[np.ndarray, ...]:
+        """Décomposition spectrale de S = C^-½·G·C^-½ (mise en cache)"""
+        cached = self._eigen_cache.get(config)
+        if cached is None:
+            g, g_ext = self._conductance(config)
+            s = g / np.outer(self._c_sqrt, self._c_sqrt)
+            lam, vec = np.linalg.eigh(s)
+            cached = (lam, vec, g, g_ext)
+            self._eigen_cache[config] = cached
+        return cached
+    
+    def _coefficients(self, h: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Coefficients discrets (Ad, Bd) pour un pas h"""
+        key = (self._config, h)
+        cached = self._step_cache.get(key)
+        if cached is None:
+            lam, vec, _, _ = self._eigen(self._config)
+            decay = np.exp(-lam * h)
+            # ∫0^h e^(-λs) ds, limite h quand λ → 0
+            gain = np.where(lam > 1e-12, -np.expm1(-lam * h) / np.maximum(lam, 1e-12), h)
+            left = vec / self._c_sqrt[:, None]     # C^-½·V
+            right_t = vec * self._c_sqrt[:, None]  # C^½·V
+            ad = (left * decay) @ right_t.T
+            bd = (left * gain) @ left.T
+            if len(self._step_cache) >= self.MAX_CACHED_STEPS:
+                self._step_cache.clear()
+            cached = (ad, bd)
+            self._step_cache[key] = cached
+        return cached
+    
+    def _input(self) -> np.ndarray:
+        """Vecteur d'entrée u = P + g_ext·T_pièce"""
+        _, _, _, g_ext = self._eigen(self._config)
+        self._u[:] = self.power
+        self._u[self.ENCLOSURE] += g_ext * self.room_temp
+        return self._u
+    
+    def step(self, h: float):
+        """Avance de h secondes avec les puissances courantes (exact si P constant)"""
+        ad, bd = self._coefficients(h)
+        self.temps = ad @ self.temps + bd @ self._input()
+    
+    def steady_state(self) -> np.ndarray:
+        """Températures d'équilibre pour les puissances courantes"""
+        _, _, g, _ = self._eigen(self._config)
+        return np.linalg.solve(g, self._input())
+    
+    def _response(self) -> Callable[[float], np.ndarray]:
+        """Réponse libre T(t) = T_ss + C^-½·V·e^(-Λt)·Vᵀ·C^½·(T0 - T_ss)"""
+        lam, vec, _, _ = self._eigen(self._config)
+        t_ss = self.steady_state()
+        modal = vec.T @ (self._c_sqrt * (self.temps - t_ss))
+        return lambda t: t_ss + (vec @ (np.exp(-lam * t) * modal)) / self._c_sqrt
+    
+    def temperatures_at(self, t: float) -> np.ndarray:
+        """Températures dans t secondes, puissances figées (forme close)"""
+        return self._response()(t)
+    
+    def time_to_threshold(self, node: int, threshold: float,
+                          horizon: float = 4 * 3600.0) -> Optional[float]:
+        """Instant où un nœud franchira threshold (None si jamais dans l'horizon)
+        
+        Les réponses d'un réseau RC passif sont des sommes d'exponentielles:
+        une recherche par dichotomie sur la forme close suffit.
+        """
+        if self.temps[node] >= threshold:
+            return 0.0
+        response = self._response()
+        if response(horizon)[node] < threshold:
+            return None
+        lo, hi = 0.0, horizon
+        for _ in range(40):
+            mid = 0.5 * (lo + hi)
+            if response(mid)[node] >= threshold:
+                hi = mid
+            else:
+                lo = mid
+        return hi
+
+
+class RailPhysicsModel:
+    """Modèle physique vectorisé des rails (une case de tableau par rail)
+    
+    Chaque mode de SimulationMode est traduit en perturbation physique
+    (charge, secteur, réservoir, ventilation, contre-réaction) au lieu de
+    forcer directement les drapeaux. Les protections sont décidées par un
+    FirmwareController co-simulé à chaque sous-pas (mesures quantifiées,
+    boucle firmware rejouée sur la durée du sous-pas): les sorties suivent
+    exactement les setOutputEnable() du firmware.
+    """
+    
+    # Colonnes: facteur charge, facteur secteur, facteur réservoir,
+    # facteur Rth dissipateur, facteur Rth ventilation boîtier, défaut contre-réaction
+    MODE_PARAMS = {
+        SimulationMode.NORMAL: (1.0, 1.0, 1.0, 1.0, 1.0, 0.0),
+        SimulationMode.HOT: (1.0, 1.0, 1.0, 5.0, 3.0, 0.0),      # Ventilation obstruée
+        SimulationMode.RIPPLE: (1.0, 1.0, 0.05, 1.0, 1.0, 0.0),  # Réservoir desséché
+        SimulationMode.LOAD: (4.0, 1.0, 1.0, 1.0, 1.0, 0.0),     # Surcharge
+        SimulationMode.LOW_V: (1.0, 0.6, 1.0, 1.0, 1.0, 0.0),    # Creux secteur
+        SimulationMode.HIGH_V: (1.0, 1.0, 1.0, 1.0, 1.0, 1.0),   # ADJ LM338T ouvert
+    }
+    RTH_COLUMN = 3
+    VENT_COLUMN = 4
+    STATE_FIELDS = ("input_voltage", "ambient_temp", "load_nominal_ma", "_mode_idx", "_params",
+                    "v_target", "v_in", "v_pre", "v_out", "current_ma", "current_limit_ma",
+                    "ripple_uv", "noise_uv", "ovp", "ovp_pre", "ocp", "otp", "backfeed",
+                    "_enabled", "_changes", "_settled")
+    
+    def __init__(self, n_rails: int = 2, input_voltage: float = 24.0,
+                 ambient_temp: float = 25.0, load_ma: Tuple[float, ...] = (150.0, 100.0),
+                 seeds: Optional[Sequence] = None):
+        self.n_rails = n_rails
+        self.input_voltage = input_voltage
+        self.ambient_temp = ambient_temp
+        # Bruit de mesure: un flux par rail (SeedSequence), tiré par blocs
+        if seeds is None:
+            seeds = np.random.SeedSequence().spawn(n_rails)
+        self.noise = RailStreams(seeds, MEAS_CHANNELS)
+        
+        self._modes = list(SimulationMode)
+        self._mode_table = np.array([self.MODE_PARAMS[m] for m in self._modes])
+        self._mode_idx = np.zeros(n_rails, dtype=np.intp)
+        self._params = self._mode_table[self._mode_idx].copy()
+        
+        self.load_nominal_ma = np.array(load_ma, dtype=float)
+        self.v_target = np.zeros(n_rails)
+        self.v_in = np.full(n_rails, input_voltage)
+        self.v_pre = np.zeros(n_rails)
+        self.v_out = np.zeros(n_rails)
+        self.current_ma = np.zeros(n_rails)
+        self.current_limit_ma = np.full(n_rails, I_MAX_HIGH_V)
+        self.thermal = ThermalNetwork(n_rails, room_temp=ambient_temp)
+        self.ripple_uv = np.zeros(n_rails)
+        self.noise_uv = np.zeros(n_rails)
+        
+        # Logique de protection du firmware; copies vectorielles de son état
+        self.controller = FirmwareController(n_rails)
+        self.ovp = np.zeros(n_rails, dtype=bool)
+        self.ovp_pre = np.zeros(n_rails, dtype=bool)
+        self.ocp = np.zeros(n_rails, dtype=bool)
+        self.otp = np.zeros(n_rails, dtype=bool)
+        self.backfeed = np.zeros(n_rails, dtype=bool)
+        self._enabled = np.ones(n_rails, dtype=bool)
+        self._changes = self.controller.changes
+        self._settled = False
+    
+    @property
+    def enabled(self) -> np.ndarray:
+        """Sortie active (PIN_OUT_EN piloté par le firmware)"""
+        return self._enabled
+    
+    @property
+    def temp_c(self) -> np.ndarray:
+        """Température NTC de chaque rail (nœud dissipateur)"""
+        return self.thermal.temps[self.thermal.heatsink]
+    
+    def otp_eta(self, rail: int) -> Optional[float]:
+        """Délai avant OTP (s) si les puissances restaient figées, None sinon"""
+        if self.otp[rail]:
+            return 0.0
+        return self.thermal.time_to_threshold(self.thermal.heatsink[rail], TEMP_SHUTDOWN)
+    
+    def get_state(self) -> Dict[str, Any]:
+        state = get_fields(self, self.STATE_FIELDS)
+        state["noise"] = self.noise.get_state()
+        state["thermal"] = self.thermal.get_state()
+        state["controller"] = self.controller.get_state()
+        return state
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, self.STATE_FIELDS)
+        self.noise.set_state(state["noise"])
+        self.thermal.set_state(state["thermal"])
+        self.controller.set_state(state["controller"])
+    
+    def set_mode(self, rail: int, mode: SimulationMode):
+        """Injecte une panne sur un rail (transition continue)"""
+        self._mode_idx[rail] = self._modes.index(mode)
+    
+    def reset_faults(self, rail: int):
+        """Réarme les protections d'un rail (cycle d'alimentation du rail)"""
+        self.controller.reset_rail(rail)
+        self._sync_controller()
+    
+    def step(self, dt: float, v_targets):
+        """Avance le modèle de dt secondes (sous-pas fixes, tous rails à la fois)"""
+        if dt <= 0:
+            return
+        # Nouvelle consigne (setDigipot): transitoire, retour au pas fin
+        if np.any(self.v_target != v_targets):
+            self._settled = False
+        self.v_target[:] = v_targets
+        # Limite OCP calculée sur la consigne, comme le firmware
+        self.current_limit_ma = np.where(
+            self.v_target < 7.0, I_MAX_LOW_V,
+            np.where(self.v_target < 10.0, I_MAX_MID_V, I_MAX_HIGH_V))
+        self.controller.i_limit[:] = self.current_limit_ma.tolist()
+        
+        # Régime établi: filtres exacts et réseau thermique discrétisé
+        # exactement, seul le délai des protections exige le pas fin
+        step_s = SETTLED_STEP_S if self._settled else PHYSICS_STEP_S
+        n = min(MAX_SUBSTEPS, max(1, int(math.ceil(dt / step_s))))
+        h = dt / n
+        target_params = self._mode_table[self._mode_idx]
+        # Les Rth changent d'un coup (obstruction): coefficients thermiques en cache
+        self.thermal.set_config(target_params[:, self.RTH_COLUMN],
+                                target_params[:, self.VENT_COLUMN].max())
+        self.thermal.room_temp = self.ambient_temp
+        k_mode = 1.0 - math.exp(-h / MODE_TRANSITION_TAU_S)
+        k_load = 1.0 - math.exp(-h / LOAD_TAU_S)
+        for _ in range(n):
+            self._params += (target_params - self._params) * k_mode
+            self._substep(h, k_load)
+        self._settled = (self._settled and
+                         np.abs(target_params - self._params).max() < 1e-4 and
+                         not self.controller.armed)
+    
+    def _substep(self, h: float, k_load: float):
+        """Un pas d'intégration vectorisé"""
+        load_f, mains_f, reservoir_f, _, _, fb_fault = self._params.T
+        i_a = self.current_ma / 1000.0
+        
+        # Entrée non régulée (chute source + ripple du réservoir)
+        self.v_in = self.input_voltage * mains_f - i_a * R_SOURCE_OHM
+        ripple_pp = i_a / (2.0 * MAINS_FREQ_HZ * C_RESERVOIR_F * reservoir_f)
+        v_in_valley = self.v_in - ripple_pp / 2.0
+        
+        # Pré-régulateur LM338T: V_PRE = consigne + headroom, limité par le dropout
+        v_pre_cmd = self.v_target + V_HEADROOM
+        v_pre_cmd += (self.v_in - LM338_DROPOUT_V - v_pre_cmd) * fb_fault
+        pre_margin = v_in_valley - LM338_DROPOUT_V - v_pre_cmd
+        self.v_pre = np.minimum(v_pre_cmd, v_in_valley - LM338_DROPOUT_V)
+        psrr_pre = PSRR_MIN_DB + (PSRR_PRE_DB - PSRR_MIN_DB) * np.clip(pre_margin / PSRR_KNEE_V, 0.0, 1.0)
+        
+        # Banc 6× LT3045: régule la consigne tant que V_PRE garde 260 mV de dropout
+        v_out_reg = np.maximum(0.0, np.minimum(self.v_target, self.v_pre - LT3045_DROPOUT_V))
+        enabled = self.enabled
+        v_goal = np.where(enabled, v_out_reg, 0.0)
+        tau = np.where(enabled, V_SLEW_TAU_S, DISCHARGE_TAU_S)
+        self.v_out += (v_goal - self.v_out) * (1.0 - np.exp(-h / tau))
+        
+        # Charge résistive: courant proportionnel à la tension de sortie
+        ratio = np.clip(self.v_out / np.maximum(self.v_target, 0.1), 0.0, None)
+        i_goal = self.load_nominal_ma * load_f * ratio
+        self.current_ma += (i_goal - self.current_ma) * k_load
+        self._settled = (np.abs(v_goal - self.v_out).max() < 1e-4 and
+                         np.abs(i_goal - self.current_ma).max() < 1e-2)
+        
+        # Thermique: puissances injectées dans le réseau RC
+        thermal = self.thermal
+        power = thermal.power
+        power[thermal.lm338] = np.maximum(0.0, self.v_in - self.v_pre) * i_a
+        power[thermal.lt3045] = np.maximum(0.0, self.v_pre - self.v_out) * i_a
+        power[thermal.TRANSFO] = TRANSFO_CORE_LOSS_W + RECT_FORM_FACTOR * R_SOURCE_OHM * np.dot(i_a, i_a)
+        power[thermal.ENCLOSURE] = 2.0 * BRIDGE_VF_V * i_a.sum()
+        thermal.step(h)
+        
+        # Qualité de sortie
+        attenuation = 10.0 ** (-(psrr_pre + PSRR_LDO_DB) / 20.0)
+        self.ripple_uv = np.where(enabled, ripple_pp * 1e6 * attenuation, 0.0)
+        t_ldo = np.sqrt((thermal.temps[thermal.lt3045] + 273.15) / 298.15)
+        self.noise_uv = np.where(enabled, LT3045_NOISE_UV / math.sqrt(LT3045_COUNT) * t_ldo, 0.0)
+        
+        self._check_protections(h)
+    
+    def _check_protections(self, h: float):
+        """Boucle firmware rejouée sur le sous-pas (mesures figées, une seule CTN)"""
+        controller = self.controller
+        controller.measure(self.v_out, self.v_pre, self.current_ma, self.temp_c.max())
+        controller.run(h)
+        if controller.changes != self._changes:
+            self._sync_controller()
+    
+    def _sync_controller(self):
+        """Recopie fautes et sorties du firmware dans les tableaux du modèle"""
+        controller = self.controller
+        self.ovp[:] = controller.ovp
+        self.ovp_pre[:] = controller.ovp_pre
+        self.ocp[:] = controller.ocp
+        self.backfeed[:] = controller.backfeed
+        self.otp[:] = controller.otp
+        self._enabled[:] = controller.output_enabled
+        self._changes = controller.changes
+    
+    def write_rails(self, rails: List[RailData]):
+        """Recopie l'état (avec bruit de mesure) dans les RailData"""
+        meas = self.noise.next().T
+        v_meas = np.maximum(0.0, self.v_out + meas[0] * MEAS_NOISE_V)
+        i_meas = np.maximum(0.0, self.current_ma + meas[1] * MEAS_NOISE_MA)
+        t_meas = self.temp_c + meas[2] * MEAS_NOISE_C
+        ripple_meas = np.maximum(0.0, self.ripple_uv * (1.0 + meas[3] * MEAS_NOISE_RIPPLE))
+        efficiency = np.where(self.v_in > 0, 100.0 * self.v_out / np.maximum(self.v_in, 1e-6), 0.0)
+        enabled = self.enabled
+        
+        for i, rail in enumerate(rails):
+            rail.voltage_actual = float(v_meas[i])
+            rail.pre_voltage = float(self.v_pre[i])
+            rail.current_ma = float(i_meas[i])
+            rail.current_limit_ma = float(self.current_limit_ma[i])
+            rail.temperature_c = float(t_meas[i])
+            rail.headroom_v = float(self.v_pre[i] - self.v_out[i]) if enabled[i] else 0.0
+            rail.ripple_uv = float(ripple_meas[i])
+            rail.noise_uv = float(self.noise_uv[i])
+            rail.efficiency = float(efficiency[i])
+            rail.enabled = bool(enabled[i])
+            rail.ovp_active = bool(self.ovp[i] or self.ovp_pre[i])
+            rail.ocp_active = bool(self.ocp[i])
+            rail.otp_active = bool(self.otp[i])
+            rail.backfeed_active = bool(self.backfeed[i])
+            rail.simulation_mode = self._modes[self._mode_idx[i]]
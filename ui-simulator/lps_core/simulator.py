@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+"""
+Générateur de données: pilote le modèle physique et la synthèse pour l'UI
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+import zlib
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from .lazy import lazy_import
+from .allocations import BufferPool
+from .anomaly import AnomalyDetector
+from .controller import FAULT_CODES, FAULT_NONE
+from .data import FaultEvent, RailData, SystemData, SimulationMode
+from .eeprom import EnergyPersistence
+from .firmware import digipot_to_voltage, voltage_to_digipot
+from .history import TrendStore
+from .metrics import MetricsEngine
+from .physics import MEAS_NOISE_C, MEAS_NOISE_MA, MEAS_NOISE_V, RailPhysicsModel
+from .snapshots import get_fields, pack, set_fields, unpack
+from .streams import rail_seeds
+from .synthesis import NoiseSynthesizer, SCOPE_DECIMATION, nice_full_scale
+
+np = lazy_import("numpy")
+
+FAULT_EVENT_BUFFER = 1024      # Événements de faute conservés pour les lecteurs
+RIPPLE_ALARM_UV = 50.0          # Seuil "Ripple élevé"
+
+# Métriques surveillées par rail (ordre des colonnes de l'historique) et
+# plancher de σ de chacune: bruit de mesure, ripple ±10% de ~5 µV
+ANOMALY_METRICS = ("voltage", "current", "temperature", "ripple")
+ANOMALY_FLOORS = (MEAS_NOISE_V, MEAS_NOISE_MA, MEAS_NOISE_C, 0.5)
+
+SNAPSHOT_MAGIC = b"LPSS"
+SNAPSHOT_VERSION = 4
+_SNAPSHOT_HEADER = struct.Struct("<4sHI")   # magic, version, CRC32 des données
+
+
+# =============================================================================
+# GÉNÉRATEUR DE DONNÉES
+# =============================================================================
+
+class DataSimulator:
+    """Générateur de données simulées"""
+    
+    RAILS = ('A', 'B')
+    TIME_SCALES = (1.0, 10.0, 60.0, 600.0)
+    OTP_ETA_REFRESH_FRAMES = 15
+    STATE_FIELDS = ("data", "frame_count", "time_scale", "_uptime_accum", "sim_time",
+                    "_otp_eta", "_otp_eta_frame", "_scope_scale", "fault_event_count")
+    COMPONENTS = ("model", "synth", "history", "metrics", "anomaly")
+    
+    def __init__(self, persistence: Optional[EnergyPersistence] = None,
+                 seed: Optional[int] = None):
+        self.data = SystemData()
+        # Consignes 12V / 5V ramenées au pas du MCP41100 le plus proche
+        self.data.rail_a.voltage_target = digipot_to_voltage(voltage_to_digipot(12.0))
+        self.data.rail_b.voltage_target = digipot_to_voltage(voltage_to_digipot(5.0))
+        
+        # EEPROM émulée: énergie, uptime et consignes de la session précédente
+        self.persistence = persistence
+        if persistence is not None:
+            persistence.restore(self.data)
+            for rail, pos in zip(self.rails(), persistence.voltage_settings()):
+                if pos is not None:
+                    rail.voltage_target = digipot_to_voltage(pos)
+        self.frame_count = 0
+        self.time_scale = self.TIME_SCALES[0]  # Accélération du temps simulé
+        self._uptime_accum = 0.0
+        self.sim_time = 0.0            # Temps simulé écoulé (s), horloge de l'historique
+        self._otp_eta: List[Optional[float]] = [None, None]
+        self._otp_eta_frame = -1
+        # Aléa: par rail, un flux de bruit de mesure et un flux de synthèse
+        self.seed, seeds = rail_seeds(seed, len(self.RAILS), 2)
+        self.model = RailPhysicsModel(input_voltage=self.data.input_voltage,
+                                      ambient_temp=self.data.ambient_temp,
+                                      seeds=[rail[0] for rail in seeds])
+        self.synth = NoiseSynthesizer(seeds=[rail[1] for rail in seeds])
+        self.buffers = BufferPool()    # Tracés écran (oscilloscope, spectre)
+        self._scope_scale = [1.0] * len(self.RAILS)
+        self.history = TrendStore(len(self.RAILS))
+        self.metrics = MetricsEngine(len(self.RAILS))
+        self.anomaly = AnomalyDetector(len(self.RAILS), ANOMALY_FLOORS)
+        # Journal des transitions de fautes: chaque lecteur garde sa position (seq)
+        self.fault_events: Deque[FaultEvent] = deque(maxlen=FAULT_EVENT_BUFFER)
+        self.fault_event_count = 0
+        self._faults: Set[Tuple[str, str]] = set()
+    
+    def next_time_scale(self):
+        """Passe à l'accélération suivante (x1, x10, x60, x600)"""
+        idx = self.TIME_SCALES.index(self.time_scale) if self.time_scale in self.TIME_SCALES else -1
+        self.time_scale = self.TIME_SCALES[(idx + 1) % len(self.TIME_SCALES)]
+    
+    def rails(self) -> Tuple[RailData, RailData]:
+        """Rails dans l'ordre du modèle physique"""
+        return (self.data.rail_a, self.data.rail_b)
+    
+    def update(self, dt: float):
+        """Met à jour les données simulées"""
+        self.frame_count += 1
+        sim_dt = dt * self.time_scale
+        
+        # Modèle physique des deux rails en un pas vectorisé
+        rails = self.rails()
+        self.model.step(sim_dt, [r.voltage_target for r in rails])
+        self.model.write_rails(rails)
+        
+        # Uptime en secondes entières (accumulateur comme updateEnergy())
+        self._uptime_accum += sim_dt
+        whole = int(self._uptime_accum)
+        self.data.uptime_seconds += whole
+        self._uptime_accum -= whole
+        
+        # Calcul puissance et énergie
+        self.data.rail_a.power_w = (self.data.rail_a.voltage_actual * 
+                                     self.data.rail_a.current_ma / 1000)
+        self.data.rail_b.power_w = (self.data.rail_b.voltage_actual * 
+                                     self.data.rail_b.current_ma / 1000)
+        self.data.energy_wh_a += self.data.rail_a.power_w * sim_dt / 3600
+        self.data.energy_wh_b += self.data.rail_b.power_w * sim_dt / 3600
+        self.data.energy_wh = self.data.energy_wh_a + self.data.energy_wh_b
+        
+        # Métriques qualité (smooth_i, stability_score): pas couvert à la cadence de loop()
+        self.metrics.update(rails, sim_dt, self.purist)
+        
+        # Historique tendances: un échantillon par pas, agrégé en seaux de 1 s
+        self.sim_time += sim_dt
+        sample = [(r.voltage_actual, r.current_ma, r.temperature_c, r.ripple_uv) for r in rails]
+        self.history.add(self.sim_time, [value for row in sample for value in row])
+        # Alertes précoces: écarts à la prévision de chaque métrique
+        self.anomaly.update(np.array(sample), sim_dt)
+        if self.persistence is not None:
+            self.persistence.tick(self.sim_time, self.data)
+        
+        # Bruit + ripple synthétisés en temps réel (cadence du scope)
+        self.synth.update(dt, self.model.ripple_uv, self.model.noise_uv)
+        
+        self._track_faults()
+    
+    def get_scope_scale(self, rail: str) -> float:
+        """Pleine échelle (±µV) de la dernière trace du rail"""
+        return self._scope_scale[self.RAILS.index(rail)]
+    
+    def get_oscilloscope_points(self, rail: str, width: int, height: int, 
+                                 x_offset: int, y_offset: int) -> List[List[int]]:
+        """Retourne les points pour draw.lines() (liste réutilisée, valable jusqu'à l'appel suivant)"""
+        idx = self.RAILS.index(rail)
+        n = width * SCOPE_DECIMATION
+        block = self.buffers.get("scope", (len(self.RAILS), n))
+        trace = self.synth.ring.read(self.synth.last_block_start(), block)[idx, ::SCOPE_DECIMATION]
+        
+        # Calibre 1-2-5 automatique, trace centrée sur la consigne
+        ys = self.buffers.get("scope_y", trace.shape)
+        full_scale = nice_full_scale(float(np.abs(trace, out=ys).max()) * 1.2)
+        self._scope_scale[idx] = full_scale
+        np.multiply(trace, -height / 2.0 / full_scale, out=ys)
+        ys += y_offset + height // 2
+        np.clip(ys, y_offset, y_offset + height, out=ys)
+        return self._trace_points(f"scope_{rail}", range(x_offset, x_offset + len(ys)), ys)
+    
+    def get_spectrum_points(self, rail: str, width: int, height: int,
+                            x_offset: int, y_offset: int,
+                            db_range: Tuple[float, float] = (-40.0, 40.0)) -> List[List[int]]:
+        """Spectre du dernier bloc synthétisé, axe log 10 Hz - Nyquist (liste réutilisée)"""
+        freqs = self.synth.freqs[1:]
+        xs = self.buffers.get("spectrum_x", freqs.shape)
+        np.divide(freqs, freqs[0], out=xs)
+        np.log10(xs, out=xs)
+        xs /= math.log10(freqs[-1] / freqs[0])
+        xs *= width - 1
+        xs += x_offset
+        db = self.synth.amplitude_db(self.buffers.get("spectrum_db", self.synth.spectrum.shape))
+        lo, hi = db_range
+        ys = np.clip(db[self.RAILS.index(rail), 1:], lo, hi, out=self.buffers.get("spectrum_y", freqs.shape))
+        ys -= lo
+        ys /= hi - lo
+        ys *= height
+        np.subtract(y_offset + height, ys, out=ys)
+        xs = self._pixels("spectrum_x", xs).tolist()
+        return self._trace_points(f"spectrum_{rail}", xs, ys)
+    
+    def _pixels(self, name: str, values: np.ndarray) -> np.ndarray:
+        """Coordonnées entières (troncature) dans un tampon réutilisé"""
+        pixels = self.buffers.get(name + "_px", values.shape, np.intp)
+        np.copyto(pixels, values, casting="unsafe")
+        return pixels
+    
+    def _trace_points(self, name: str, xs, ys: np.ndarray) -> List[List[int]]:
+        """Points [x, y] d'un tracé, mis à jour dans la liste gardée pour ce nom"""
+        points = self.buffers.points(name, len(ys))
+        for point, x, y in zip(points, xs, self._pixels(name, ys).tolist()):
+            point[0] = x
+            point[1] = y
+        return points
+    
+    def get_otp_eta(self) -> List[Optional[float]]:
+        """Délai prédit avant OTP par rail (temps simulé) - rafraîchi 2×/s"""
+        if (self._otp_eta_frame < 0 or
+                self.frame_count - self._otp_eta_frame >= self.OTP_ETA_REFRESH_FRAMES):
+            self._otp_eta = [self.model.otp_eta(i) for i in range(len(self.RAILS))]
+            self._otp_eta_frame = self.frame_count
+        return self._otp_eta
+    
+    def get_all_problems(self) -> List[str]:
+        """Retourne la liste des problèmes - avec cache V92"""
+        if self.data._problems_cache_frame == self.frame_count:
+            return self.data._problems_cache
+        
+        problems = [f"Ripple élevé {name}" if code == "RIPPLE" else f"{code} Rail {name}"
+                    for name, code in self.active_faults()]
+        
+        self.data._problems_cache = problems
+        self.data._problems_cache_frame = self.frame_count
+        return problems
+    
+    def active_faults(self) -> List[Tuple[str, str]]:
+        """Fautes en cours (rail, code), dans l'ordre d'affichage"""
+        # Une faute par rail, celle qu'afficherait l'écran (getActiveFaultType)
+        faults = []
+        for idx, name in enumerate(self.RAILS):
+            fault = self.model.controller.active_fault_type(idx)
+            if fault != FAULT_NONE:
+                faults.append((name, FAULT_CODES[fault]))
+        for name, rail in zip(self.RAILS, self.rails()):
+            if rail.ripple_uv > RIPPLE_ALARM_UV:
+                faults.append((name, "RIPPLE"))
+        return faults
+    
+    def _track_faults(self):
+        """Enregistre les apparitions/disparitions de fautes depuis le pas précédent"""
+        active = set(self.active_faults())
+        if active == self._faults:
+            return
+        for rail, fault in sorted(self._faults - active):
+            self._add_fault_event(rail, fault, False)
+        for rail, fault in sorted(active - self._faults):
+            self._add_fault_event(rail, fault, True)
+        self._faults = active
+    
+    def _add_fault_event(self, rail: str, fault: str, active: bool):
+        self.fault_events.append(FaultEvent(self.fault_event_count, self.sim_time,
+                                            rail, fault, active))
+        self.fault_event_count += 1
+    
+    def fault_events_since(self, seq: int) -> List[FaultEvent]:
+        """Événements de numéro >= seq encore en mémoire (les plus anciens sont perdus)"""
+        first = self.fault_event_count - len(self.fault_events)
+        return list(islice(self.fault_events, max(seq - first, 0), None))
+    
+    def anomalies(self) -> List[Tuple[str, str, float]]:
+        """Alertes précoces (rail, métrique, écart lissé en σ) des sorties actives
+        
+        Dérives détectées avant qu'une protection ne coupe le rail; un rail
+        déjà coupé n'en remonte plus (sa faute est dans get_all_problems).
+        """
+        anomaly = self.anomaly
+        return [(self.RAILS[i], ANOMALY_METRICS[j], float(anomaly.ewma[i, j]))
+                for i, j in zip(*np.nonzero(anomaly.alarm))
+                if self.rails()[i].enabled]
+    
+    def get_digipot(self, rail: str) -> int:
+        """Position MCP41100 correspondant à la consigne du rail"""
+        return voltage_to_digipot(self.rails()[self.RAILS.index(rail)].voltage_target)
+    
+    def set_digipot(self, rail: str, pos: int):
+        """Applique une position digipot (setDigipot): la consigne suit digipotToVoltage"""
+        idx = self.RAILS.index(rail)
+        self.rails()[idx].voltage_target = digipot_to_voltage(pos)
+        self.metrics.reset_rail(idx)
+        self.anomaly.reset_rail(idx)
+        if self.persistence is not None:
+            self.persistence.save_voltage_settings(*(self.get_digipot(name) for name in self.RAILS))
+    
+    @property
+    def purist(self) -> bool:
+        return self.model.controller.purist
+    
+    def set_purist(self, enabled: bool):
+        """Mode purist: écrans éteints, protections toutes les 200 ms"""
+        controller = self.model.controller
+        if enabled and not controller.purist:
+            # enterPuristMode() sauvegarde l'énergie avant d'éteindre les écrans
+            if self.persistence is not None:
+                self.persistence.save(self.data)
+            controller.enter_purist()
+        elif not enabled and controller.purist:
+            controller.exit_purist()
+    
+    def close(self):
+        """Fin de session: dernière sauvegarde EEPROM (comme enterPuristMode)"""
+        if self.persistence is not None:
+            self.persistence.close(self.data)
+    
+    # --- Instantanés ---
+    
+    def get_state(self) -> Dict[str, Any]:
+        """État explicite (hors EEPROM et tampons de tracé), voir snapshots"""
+        state = get_fields(self, self.STATE_FIELDS)
+        state["seed"] = self.seed
+        state["faults"] = sorted(self._faults)
+        state["fault_events"] = list(self.fault_events)
+        for name in self.COMPONENTS:
+            state[name] = getattr(self, name).get_state()
+        return state
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, self.STATE_FIELDS)
+        self.seed = state["seed"]
+        self._faults = {tuple(fault) for fault in state["faults"]}
+        self.fault_events.clear()
+        self.fault_events.extend(FaultEvent(**event) for event in state["fault_events"])
+        for name in self.COMPONENTS:
+            getattr(self, name).set_state(state[name])
+    
+    def snapshot(self) -> bytes:
+        """État complet sérialisé (hors EEPROM): reprise exacte ou embranchement
+        
+        Générateurs, tampons de tirages, modèle, firmware, synthèse, métriques
+        et historique: update() avec les mêmes dt repart à l'identique.
+        Archive np.savez (tableaux) + JSON (scalaires, états des générateurs):
+        aucune donnée exécutable, relue sans pickle.
+        """
+        payload = pack(self.get_state())
+        return _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                     zlib.crc32(payload)) + payload
+    
+    @staticmethod
+    def _load_state(blob: bytes) -> Dict[str, Any]:
+        if len(blob) < _SNAPSHOT_HEADER.size:
+            raise ValueError("snapshot too short")
+        magic, version, crc = _SNAPSHOT_HEADER.unpack_from(blob)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"not a version {SNAPSHOT_VERSION} simulator snapshot")
+        payload = memoryview(blob)[_SNAPSHOT_HEADER.size:]
+        if zlib.crc32(payload) != crc:
+            raise ValueError("corrupt snapshot (CRC mismatch)")
+        return unpack(payload)
+    
+    def restore(self, blob: bytes):
+        """Reprend l'état d'un instantané, sur place
+        
+        Les tableaux sont recopiés dans ceux du simulateur: l'anneau
+        d'échantillons garde son identité et les lecteurs (audio, Welch)
+        suivent sans être reconstruits. Un instantané incohérent lève
+        ValueError sans rien modifier (validé d'abord sur un simulateur neuf).
+        """
+        state = self._load_state(blob)
+        self._from_state(state)
+        self.set_state(state)
+    
+    @classmethod
+    def from_snapshot(cls, blob: bytes,
+                      persistence: Optional[EnergyPersistence] = None) -> "DataSimulator":
+        """Nouveau simulateur repris d'un instantané (embranchement)"""
+        simulator = cls._from_state(cls._load_state(blob))
+        simulator.persistence = persistence
+        return simulator
+    
+    @classmethod
+    def _from_state(cls, state: Dict[str, Any]) -> "DataSimulator":
+        try:
+            simulator = cls(seed=state["seed"])
+            simulator.set_state(state)
+        except (KeyError, TypeError, IndexError) as exc:
+            raise ValueError(f"invalid snapshot: {exc!r}") from exc
+        return simulator
+    
+    def set_simulation_mode(self, mode: SimulationMode, rails: str = "AB"):
+        """Change le mode de simulation des rails indiqués ("A", "B" ou "AB")"""
+        for idx, name in enumerate(self.RAILS):
+            if name in rails:
+                # Reset des états (réarmement des protections verrouillées)
+                self.model.reset_faults(idx)
+                self.model.set_mode(idx, mode)
+                self.metrics.reset_rail(idx)
+                rail = self.rails()[idx]
+                # Une panne injectée doit rester un écart à la prévision; retour
+                # au nominal ou réarmement d'un rail coupé: prévision réapprise
+                if mode == SimulationMode.NORMAL or not rail.enabled:
+                    self.anomaly.reset_rail(idx)
+                rail.ovp_active = False
+                rail.ocp_active = False
+                rail.otp_active = False
+                rail.backfeed_active = False
+                rail.simulation_mode = mode
+        self.data.simulation_mode = mode
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Instantanés sans pickle: état explicite, scalaires en JSON, tableaux en .npy
+
+Chaque composant expose `get_state()` (dictionnaire de champs nommés) et
+`set_state(state)`. `pack()` range les tableaux dans une archive np.savez
+et le reste en JSON; `unpack()` relit l'archive avec allow_pickle=False:
+un instantané ne contient que des données, jamais de code à exécuter.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from collections import deque
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable
+
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+
+_ARRAY = "__array__"            # {"__array__": "a3"}: tableau a3 de l'archive
+_STATE = "state"                # Entrée de l'archive portant le JSON (uint8)
+
+
+# =============================================================================
+# CHAMPS NOMMÉS
+# =============================================================================
+
+def get_fields(obj, names: Iterable[str]) -> Dict[str, Any]:
+    """Valeurs des attributs nommés (converties par pack())"""
+    return {name: getattr(obj, name) for name in names}
+
+
+def set_fields(obj, state: Dict[str, Any], names: Iterable[str]):
+    """Réaffecte les attributs nommés, au type de leur valeur courante
+    
+    Les tableaux sont recopiés sur place (même forme exigée): les vues et
+    les lecteurs gardés ailleurs (anneau d'échantillons) restent valides.
+    """
+    for name in names:
+        if name not in state:
+            raise ValueError(f"snapshot is missing '{name}'")
+        setattr(obj, name, _typed(getattr(obj, name), state[name], name))
+
+
+def _typed(current, value, name: str):
+    if isinstance(current, np.ndarray):
+        value = np.asarray(value)
+        if value.shape != current.shape:
+            raise ValueError(f"snapshot '{name}' has shape {value.shape}, "
+                             f"expected {current.shape}")
+        current[...] = value
+        return current
+    if isinstance(current, Enum):
+        return type(current)[value]
+    if isinstance(current, datetime):
+        return datetime.fromisoformat(value)
+    if is_dataclass(current):
+        set_fields(current, value, _value_fields(current))
+        return current
+    if isinstance(current, tuple):
+        return tuple(value)
+    if isinstance(current, deque):
+        return deque((tuple(v) if isinstance(v, list) else v for v in value),
+                     maxlen=current.maxlen)
+    return value
+
+
+def _value_fields(obj) -> Iterable[str]:
+    """Champs d'une dataclass hors caches (préfixe _)"""
+    return [f.name for f in fields(obj) if not f.name.startswith("_")]
+
+
+# =============================================================================
+# ARCHIVE
+# =============================================================================
+
+def pack(state: Dict[str, Any]) -> bytes:
+    """État imbriqué → archive .npz (tableaux + JSON)"""
+    arrays: Dict[str, np.ndarray] = {}
+    
+    def plain(value):
+        if isinstance(value, np.ndarray):
+            key = f"a{len(arrays)}"
+            arrays[key] = value
+            return {_ARRAY: key}
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, Enum):
+            return value.name
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if is_dataclass(value):
+            return {name: plain(getattr(value, name)) for name in _value_fields(value)}
+        if isinstance(value, dict):
+            return {str(k): plain(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple, deque)):
+            return [plain(v) for v in value]
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        raise TypeError(f"cannot snapshot {type(value).__name__}")
+    
+    text = json.dumps(plain(state), separators=(",", ":"))
+    arrays[_STATE] = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    out = io.BytesIO()
+    np.savez(out, **arrays)
+    return out.getvalue()
+
+
+def unpack(payload) -> Dict[str, Any]:
+    """Archive .npz → état imbriqué (ValueError si illisible)"""
+    try:
+        with np.load(io.BytesIO(bytes(payload)), allow_pickle=False) as archive:
+            arrays = {key: archive[key] for key in archive.files}
+        state = json.loads(arrays.pop(_STATE).tobytes().decode("utf-8"))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as exc:
+        raise ValueError(f"unreadable snapshot: {exc}") from exc
+    
+    def restore(value):
+        if isinstance(value, dict):
+            if _ARRAY in value:
+                return arrays[value[_ARRAY]]
+            return {k: restore(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [restore(v) for v in value]
+        return value
+    
+    return restore(state)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Flux aléatoires reproductibles: une graine, des générateurs indépendants par rail
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from .lazy import lazy_import
+from .snapshots import get_fields, set_fields
+
+np = lazy_import("numpy")
+
+
+# =============================================================================
+# FLUX ALÉATOIRES PAR RAIL
+# =============================================================================
+
+STREAM_BLOCK = 1024            # Tirages par rail et par remplissage du tampon
+
+
+def rail_seeds(seed: Optional[int], n_rails: int, n_streams: int):
+    """Graine racine et SeedSequence [rail][flux] dérivées
+    
+    Chaque rail reçoit sa propre branche de l'arbre SeedSequence: modifier
+    la consommation d'un rail (panne injectée, consigne) ne décale jamais
+    les tirages d'un autre. Sans graine, l'entropie tirée est retournée
+    pour pouvoir rejouer la session.
+    """
+    root = np.random.SeedSequence(seed)
+    return root.entropy, [rail.spawn(n_streams) for rail in root.spawn(n_rails)]
+
+
+def generators(seeds: Sequence) -> List:
+    """Un générateur PCG64 par SeedSequence"""
+    return [np.random.Generator(np.random.PCG64(seed)) for seed in seeds]
+
+
+def generator_states(gens: Sequence) -> List[Dict[str, Any]]:
+    """États des générateurs (dictionnaires d'entiers, sérialisables en JSON)"""
+    return [generator.bit_generator.state for generator in gens]
+
+
+def set_generator_states(gens: Sequence, states: Sequence[Dict[str, Any]]):
+    if len(states) != len(gens):
+        raise ValueError(f"snapshot has {len(states)} random streams, expected {len(gens)}")
+    for generator, state in zip(gens, states):
+        generator.bit_generator.state = state
+
+
+class RailStreams:
+    """Tirages gaussiens par rail, générés par blocs et consommés ligne à ligne
+    
+    Chaque rail remplit sa tranche contiguë du tampon depuis son propre
+    générateur, STREAM_BLOCK lignes à la fois; next() ne fait ensuite
+    qu'avancer un index.
+    """
+    
+    def __init__(self, seeds: Sequence, width: int, block: int = STREAM_BLOCK):
+        self.generators = generators(seeds)
+        self.width = width
+        self.block = block
+        self._buffer = np.empty((len(self.generators), block, width))
+        self._pos = block
+    
+    def next(self) -> np.ndarray:
+        """Tirages suivants (n_rails, width), vue valable jusqu'à l'appel suivant"""
+        if self._pos == self.block:
+            for generator, rows in zip(self.generators, self._buffer):
+                generator.standard_normal(out=rows)
+            self._pos = 0
+        row = self._buffer[:, self._pos]
+        self._pos += 1
+        return row
+    
+    def get_state(self) -> Dict[str, Any]:
+        state = get_fields(self, ("_buffer", "_pos"))
+        state["generators"] = generator_states(self.generators)
+        return state
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_generator_states(self.generators, state["generators"])
+        set_fields(self, state, ("_buffer", "_pos"))
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Synthèse spectrale du bruit et du ripple, anneau d'échantillons et analyse Welch
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .lazy import lazy_import
+from .physics import MAINS_FREQ_HZ
+from .snapshots import get_fields, set_fields
+from .streams import generator_states, generators, set_generator_states
+
+np = lazy_import("numpy")
+
+
+# =============================================================================
+# SYNTHÈSE SPECTRALE BRUIT / RIPPLE
+# =============================================================================
+
+SYNTH_SAMPLE_RATE = 10240      # Hz: raies de 10 Hz, 100 et 120 Hz tombent sur un bin
+SYNTH_BLOCK = 1024             # 0.1 s = nombre entier de périodes de ripple
+SYNTH_RING = 8 * SYNTH_BLOCK
+RIPPLE_HARMONICS = 8           # Harmoniques de 2×f_secteur (dents de scie ~1/h)
+NOISE_CORNER_HZ = 30.0         # Coin 1/f du banc LT3045
+SPEC_NOISE_UV_RMS = 0.46       # Bruit de sortie annoncé (README)
+SCOPE_DECIMATION = 2           # 300 px ≈ 59 ms ≈ 6 périodes de ripple
+
+
+class SampleRing:
+    """Tampon circulaire multi-voies: un écrivain, lecteurs à position propre
+    
+    `written` est un compteur monotone mis à jour après la copie des
+    échantillons: un lecteur qui le lit ne voit que des données complètes.
+    """
+    
+    def __init__(self, n_channels: int, capacity: int):
+        self.capacity = capacity
+        self.buffer = np.zeros((n_channels, capacity))
+        self.written = 0
+    
+    def get_state(self) -> Dict[str, Any]:
+        return get_fields(self, ("buffer", "written"))
+    
+    def set_state(self, state: Dict[str, Any]):
+        set_fields(self, state, ("buffer", "written"))
+    
+    def write(self, block: np.ndarray):
+        """Ajoute un bloc (n_channels, n)"""
+        n = block.shape[1]
+        start = self.written % self.capacity
+        first = min(n, self.capacity - start)
+        self.buffer[:, start:start + first] = block[:, :first]
+        if first < n:
+            self.buffer[:, :n - first] = block[:, first:]
+        self.written += n
+    
+    def read(self, position: int, out: np.ndarray) -> np.ndarray:
+        """Copie out.shape[1] échantillons depuis la position absolue donnée"""
+        n = out.shape[1]
+        start = position % self.capacity
+        first = min(n, self.capacity - start)
+        out[:, :first] = self.buffer[:, start:start + first]
+        if first < n:
+            out[:, first:] = self.buffer[:, :n - first]
+        return out
+
+
+class NoiseSynthesizer:
+    """Synthèse par blocs du bruit coloré + ripple de redressement (rfft/irfft)
+    
+    Chaque bloc est construit dans le domaine fréquentiel pour les deux rails
+    à la fois: bruit gaussien complexe mis en forme (plat + 1/f) et raies
+    de ripple à k×2×f_secteur, puis une seule irfft. Les gabarits spectraux
+    et les tampons sont préalloués; aucun travail Python par échantillon.
+    Chaque rail tire son bruit de son propre générateur (seeds).
+    """
+    
+    def __init__(self, n_rails: int = 2, mains_hz: float = MAINS_FREQ_HZ,
+                 seeds: Optional[Sequence] = None):
+        self.n_rails = n_rails
+        if seeds is None:
+            seeds = np.random.SeedSequence().spawn(n_rails)
+        self.generators = generators(seeds)
+        self.freqs = np.fft.rfftfreq(SYNTH_BLOCK, 1.0 / SYNTH_SAMPLE_RATE)
+        n_bins = len(self.freqs)
+        
+        # Gabarit bruit normalisé à 1 µV RMS (Parseval, DC et Nyquist exclus)
+        shape = np.sqrt(1.0 + NOISE_CORNER_HZ / np.maximum(self.freqs, self.freqs[1]))
+        shape[0] = shape[-1] = 0.0
+        self._noise_shape = shape * SYNTH_BLOCK / np.sqrt(2.0 * np.sum(shape ** 2))
+        
+        # Gabarit ripple normalisé à 1 µV crête-à-crête, comme ripple_uv du modèle:
+        # dent de scie tronquée (sinus en 1/h), phase calée sur le bloc
+        self._ripple_template = np.zeros(n_bins, dtype=complex)
+        bin_hz = self.freqs[1]
+        self.ripple_freqs: Tuple[float, ...] = ()
+        for h in range(1, RIPPLE_HARMONICS + 1):
+            k = int(round(h * 2.0 * mains_hz / bin_hz))
+            if k < n_bins - 1:
+                self._ripple_template[k] = -1j / h
+                self.ripple_freqs += (float(self.freqs[k]),)
+        wave = np.fft.irfft(self._ripple_template, n=SYNTH_BLOCK)
+        self._ripple_template /= wave.max() - wave.min()
+        
+        self._gauss = np.empty((n_rails, 2, n_bins))   # Tranche contiguë par rail
+        self.spectrum = np.zeros((n_rails, n_bins), dtype=complex)
+        self.ring = SampleRing(n_rails, SYNTH_RING)
+        self.blocks = 0
+        self._pending = 0.0
+    
+    def update(self, dt: float, ripple_uv: np.ndarray, noise_uv: np.ndarray):
+        """Produit autant de blocs que le temps écoulé en exige"""
+        self._pending += dt * SYNTH_SAMPLE_RATE
+        if self.blocks == 0:
+            self._pending = max(self._pending, SYNTH_BLOCK)
+        while self._pending >= SYNTH_BLOCK:
+            self._generate(ripple_uv, noise_uv)
+            self._pending -= SYNTH_BLOCK
+    
+    def _generate(self, ripple_uv: np.ndarray, noise_uv: np.ndarray):
+        """Un bloc pour tous les rails: X = bruit mis en forme + raies de ripple"""
+        for generator, gauss in zip(self.generators, self._gauss):
+            generator.standard_normal(out=gauss)
+        gain = (noise_uv / math.sqrt(2.0))[:, None] * self._noise_shape
+        np.multiply(self._gauss[:, 0], gain, out=self.spectrum.real)
+        np.multiply(self._gauss[:, 1], gain, out=self.spectrum.imag)
+        self.spectrum += ripple_uv[:, None] * self._ripple_template
+        self.ring.write(np.fft.irfft(self.spectrum, n=SYNTH_BLOCK, axis=1))
+        self.blocks += 1
+    
+    def get_state(self) -> Dict[str, Any]:
+        state = get_fields(self, ("spectrum", "blocks", "_pending"))
+        state["generators"] = generator_states(self.generators)
+        state["ring"] = self.ring.get_state()
+        return state
+    
+    def set_state(self, state: Dict[str, Any]):
+        """Reprise sur place: l'anneau garde son identité (lecteurs audio, Welch)"""
+        set_generator_states(self.generators, state["generators"])
+        set_fields(self, state, ("spectrum", "blocks", "_pending"))
+        self.ring.set_state(state["ring"])
+    
+    def last_block_start(self) -> int:
+        """Position absolue du dernier bloc (phase ripple nulle: déclenchement stable)"""
+        return max(0, self.ring.written - SYNTH_BLOCK)
+    
+    def amplitude_db(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Amplitude par raie du dernier bloc (dBµV), dans out si fourni"""
+        mag = np.abs(self.spectrum, out=out)
+        mag *= 2.0 / SYNTH_BLOCK
+        mag += 1e-6
+        return np.multiply(np.log10(mag, out=mag), 20.0, out=mag)
+
+
+class WelchSpectrum:
+    """Densité spectrale de Welch glissante, calculée au fil de l'eau
+    
+    Lit le SampleRing du synthétiseur depuis sa propre position: seuls les
+    nouveaux segments (Hann, recouvrement 50%) sont transformés, en un rfft
+    groupé. Les périodogrammes des WELCH_SEGMENTS derniers segments sont
+    gardés en anneau avec leur somme courante (moyenne glissante en O(1)).
+    """
+    
+    NPERSEG = 1024
+    HOP = NPERSEG // 2
+    WELCH_SEGMENTS = 16
+    MAX_BATCH = 8                  # Segments traités au plus par mise à jour
+    
+    def __init__(self, ring: SampleRing, sample_rate: float = SYNTH_SAMPLE_RATE):
+        self.ring = ring
+        self.sample_rate = sample_rate
+        n_channels = ring.buffer.shape[0]
+        self.freqs = np.fft.rfftfreq(self.NPERSEG, 1.0 / sample_rate)
+        n_bins = len(self.freqs)
+        
+        self.window = np.hanning(self.NPERSEG)
+        # Densité unilatérale: 2·|X|² / (fs·Σw²), DC et Nyquist non doublés
+        self._scale = np.full(n_bins, 2.0 / (sample_rate * np.sum(self.window ** 2)))
+        self._scale[0] /= 2.0
+        self._scale[-1] /= 2.0
+        
+        self._frames = np.zeros((self.MAX_BATCH, n_channels, self.NPERSEG))
+        self._history = np.zeros((self.WELCH_SEGMENTS, n_channels, n_bins))
+        self._sum = np.zeros((n_channels, n_bins))
+        self.psd = np.zeros((n_channels, n_bins))
+        self._slot = 0
+        self.count = 0
+        self.position = max(0, ring.written - self.NPERSEG)
+    
+    def update(self) -> int:
+        """Intègre les segments disponibles, retourne leur nombre"""
+        written = self.ring.written
+        # Lecteur en retard (page masquée): reprendre sur les données récentes
+        # ou anneau revenu en arrière (restauration d'un instantané)
+        oldest = written - self.ring.capacity
+        if (self.position < oldest or self.position > written or
+                written - self.position > (self.MAX_BATCH + 1) * self.HOP):
+            self.position = max(0, written - self.NPERSEG - (self.MAX_BATCH - 1) * self.HOP)
+        
+        k = 0
+        while k < self.MAX_BATCH and self.position + self.NPERSEG <= written:
+            self.ring.read(self.position, self._frames[k])
+            self.position += self.HOP
+            k += 1
+        if k == 0:
+            return 0
+        
+        frames = self._frames[:k]
+        np.multiply(frames, self.window, out=frames)
+        spectra = np.fft.rfft(frames, axis=-1)
+        periodograms = spectra.real ** 2 + spectra.imag ** 2
+        for p in periodograms:
+            self._sum -= self._history[self._slot]
+            self._history[self._slot] = p
+            self._sum += p
+            self._slot = (self._slot + 1) % self.WELCH_SEGMENTS
+            if self._slot == 0:
+                # Resynchronisation périodique (dérive d'arrondi de la somme courante)
+                np.sum(self._history, axis=0, out=self._sum)
+        self.count = min(self.count + k, self.WELCH_SEGMENTS)
+        np.multiply(self._sum, self._scale / self.count, out=self.psd)
+        return k
+    
+    def density_nv(self) -> np.ndarray:
+        """Densité de bruit en nV/√Hz (échantillons en µV)"""
+        return np.sqrt(self.psd) * 1000.0
+    
+    def band_rms_uv(self, f_lo: float, f_hi: float, exclude_hz: Tuple[float, ...] = (),
+                    exclude_bins: int = 2) -> np.ndarray:
+        """Bruit intégré (µV RMS) sur [f_lo, f_hi], raies exclues puis extrapolées"""
+        df = self.freqs[1]
+        band = (self.freqs >= f_lo) & (self.freqs <= f_hi)
+        keep = band.copy()
+        for f in exclude_hz:
+            keep &= np.abs(self.freqs - f) > exclude_bins * df
+        n_keep = max(1, int(keep.sum()))
+        power = self.psd[:, keep].sum(axis=1) * df * (band.sum() / n_keep)
+        return np.sqrt(power)
+
+
+def nice_full_scale(peak: float) -> float:
+    """Pleine échelle 1-2-5 immédiatement supérieure à peak (minimum 1)"""
+    if peak <= 1.0:
+        return 1.0
+    decade = 10.0 ** math.floor(math.log10(peak))
+    for step in (1.0, 2.0, 5.0, 10.0):
+        if peak <= step * decade:
+            return step * decade
+    return 10.0 * decade
@@ -0,0 +1,635 @@
+# -*- coding: utf-8 -*-
+"""
+Serveur de télémétrie local: diffusion des données système aux outils externes
+
+Une boucle asyncio sur un thread dédié, liée à 127.0.0.1:
+    ws://127.0.0.1:8765/stream        instantanés SystemData + événements de faute
+    ws://127.0.0.1:8765/control       commandes de pilotage et réponses
+    http://127.0.0.1:8765/snapshot    dernier instantané complet (JSON)
+    http://127.0.0.1:8765/faults      derniers événements de faute (JSON)
+    POST http://127.0.0.1:8765/command  lot de commandes, réponses groupées
+
+Flux: un message texte JSON par lot et par client,
+    {"seq": 42, "base": 41, "delta": {...}, "events": [...], "lost": 0}
+"delta" ne contient que les champs modifiés depuis l'instantané "base"
+déjà reçu par ce client (base = -1: instantané complet). Un client lent
+n'accumule pas de retard: tant que son tampon d'écriture est plein, les
+instantanés suivants sont fusionnés et seul le dernier part (seq - base > 1).
+"lost" compte les événements de faute sortis du tampon avant l'envoi.
+
+Pilotage: un message (ou corps POST) JSON par lot, objet ou liste d'objets
+    [{"id": 1, "cmd": "page", "index": 2}, {"id": 2, "cmd": "capture"}]
+Un lot est remis d'un bloc à la boucle principale (poll_commands()), qui
+l'applique entre deux frames et répond par commande (reply()):
+    {"id": 1, "ok": true, "frame": 812, "result": {...}}
+Le pilotage exige l'en-tête "Authorization: Bearer <jeton>" (jeton tiré à
+chaque lancement) et refuse toute requête portant un en-tête Origin: une
+page web ouverte dans un navigateur ne peut ni ouvrir /control ni poster
+sur /command. POST /command exige "Content-Type: application/json".
+
+La boucle de rendu ne fait que construire l'instantané (décimé) et le
+confier au thread serveur. Bibliothèque standard uniquement (WebSocket
+RFC 6455 minimal, côté serveur).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import queue
+import secrets
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import fields
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .data import RailData
+
+
+# =============================================================================
+# CONSTANTES
+# =============================================================================
+
+TELEMETRY_HOST = "127.0.0.1"
+TELEMETRY_PORT = 8765
+TELEMETRY_INTERVAL_S = 0.1      # Cadence de publication (10 Hz)
+SNAPSHOT_DIGITS = 3             # Quantification des flottants (deltas plus courts)
+SNAPSHOT_HISTORY = 16           # Instantanés gardés comme base de delta (1,6 s)
+EVENT_BUFFER = 256              # Événements de faute gardés pour les clients
+CLIENT_BUFFER = 16 * 1024       # Tampon d'écriture par client avant fusion
+MAX_CLIENTS = 1024
+HANDSHAKE_TIMEOUT_S = 5.0
+COMMAND_TIMEOUT_S = 10.0        # Attente des réponses d'un POST /command
+WS_MAX_INCOMING = 64 * 1024     # Taille maximale d'un message reçu (fragments réassemblés)
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+WS_CONTINUATION = 0x0
+WS_TEXT = 0x1
+WS_CLOSE = 0x8
+WS_PING = 0x9
+WS_PONG = 0xA
+WS_PROTOCOL_ERROR = 1002        # Codes de fermeture (RFC 6455, 7.4.1)
+WS_TOO_BIG = 1009
+
+RAIL_FIELDS = tuple(f.name for f in fields(RailData))
+
+
+# =============================================================================
+# INSTANTANÉS
+# =============================================================================
+
+def _value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, float):
+        return round(value, SNAPSHOT_DIGITS)
+    return value
+
+
+def snapshot(simulator) -> Dict[str, Any]:
+    """Instantané plat et quantifié de SystemData ("a.voltage_actual", ...)"""
+    data = simulator.data
+    snap = {
+        "t": round(simulator.sim_time, SNAPSHOT_DIGITS),
+        "frame": simulator.frame_count,
+        "mode": data.simulation_mode.name,
+        "purist": simulator.purist,
+        "uptime_s": data.uptime_seconds,
+        "input_voltage": _value(data.input_voltage),
+        "ambient_temp": _value(data.ambient_temp),
+        "energy_wh": _value(data.energy_wh),
+        "energy_wh_a": _value(data.energy_wh_a),
+        "energy_wh_b": _value(data.energy_wh_b),
+    }
+    for name, rail in zip(simulator.RAILS, simulator.rails()):
+        prefix = name.lower() + "."
+        for key in RAIL_FIELDS:
+            snap[prefix + key] = _value(getattr(rail, key))
+    return snap
+
+
+def event_dict(event) -> Dict[str, Any]:
+    """FaultEvent -> JSON"""
+    return {"seq": event.seq, "t": round(event.t, SNAPSHOT_DIGITS), "rail": event.rail,
+            "fault": event.fault, "active": event.active}
+
+
+def delta(base: Dict[str, Any], snap: Dict[str, Any]) -> Dict[str, Any]:
+    """Champs de snap différents de base"""
+    return {key: value for key, value in snap.items() if base.get(key) != value}
+
+
+# =============================================================================
+# WEBSOCKET (RFC 6455, CÔTÉ SERVEUR)
+# =============================================================================
+
+def ws_accept_key(key: str) -> str:
+    """Sec-WebSocket-Accept correspondant à Sec-WebSocket-Key"""
+    digest = hashlib.sha1((key + WS_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def ws_frame(payload: bytes, opcode: int = WS_TEXT) -> bytes:
+    """Trame finale non masquée (serveur -> client)"""
+    n = len(payload)
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 0x10000:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return header + payload
+
+
+class _WsFailure(ConnectionError):
+    """Connexion à fermer avec un code d'erreur (trame refusée)"""
+    
+    def __init__(self, code: int, reason: str):
+        super().__init__(reason)
+        self.code = code
+
+
+async def ws_read_frame(reader: asyncio.StreamReader) -> Tuple[bool, int, bytes]:
+    """Lit une trame client: (FIN, opcode, charge utile démasquée)
+    
+    Une trame client non masquée ou une trame de contrôle fragmentée
+    (ou de plus de 125 octets) échoue en 1002, une trame trop grande en 1009.
+    """
+    head = await reader.readexactly(2)
+    fin = bool(head[0] & 0x80)
+    opcode = head[0] & 0x0F
+    if not head[1] & 0x80:
+        raise _WsFailure(WS_PROTOCOL_ERROR, "unmasked client frame")
+    n = head[1] & 0x7F
+    if opcode & 0x8 and (not fin or n > 125):
+        raise _WsFailure(WS_PROTOCOL_ERROR, "invalid control frame")
+    if n == 126:
+        n = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif n == 127:
+        n = struct.unpack("!Q", await reader.readexactly(8))[0]
+    if n > WS_MAX_INCOMING:
+        raise _WsFailure(WS_TOO_BIG, "frame too large")
+    mask = await reader.readexactly(4)
+    payload = await reader.readexactly(n)
+    if n:
+        key = (mask * (n // 4 + 1))[:n]
+        payload = (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(n, "big")
+    return fin, opcode, payload
+
+
+def _json(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# =============================================================================
+# SERVEUR
+# =============================================================================
+
+class _Client:
+    """Abonné au flux: position dans les instantanés et les événements"""
+    
+    __slots__ = ("writer", "snap_seq", "event_seq", "paused")
+    
+    def __init__(self, writer: asyncio.StreamWriter, event_seq: int):
+        self.writer = writer
+        self.snap_seq = -1       # Dernier instantané envoyé (base du prochain delta)
+        self.event_seq = event_seq
+        self.paused = False      # Tampon d'écriture plein: envois fusionnés
+
+
+class RemoteCommand:
+    """Commande de pilotage reçue par le serveur, exécutée par la boucle principale"""
+    
+    __slots__ = ("name", "args", "id", "respond")
+    
+    def __init__(self, name: Any, args: Dict[str, Any], id: Any = None):
+        self.name = name
+        self.args = args
+        self.id = id
+        self.respond: Callable[[Dict[str, Any]], None] = lambda message: None
+
+
+def parse_commands(payload: bytes) -> List[RemoteCommand]:
+    """Lot JSON (objet ou liste) -> commandes; ValueError si JSON invalide"""
+    body = json.loads(payload)
+    commands = []
+    for item in body if isinstance(body, list) else [body]:
+        args = dict(item) if isinstance(item, dict) else {}
+        name = args.pop("cmd", None)
+        commands.append(RemoteCommand(name, args, args.pop("id", None)))
+    return commands
+
+
+class TelemetryServer:
+    """Diffusion locale de SystemData et des fautes (WebSocket + HTTP)"""
+    
+    def __init__(self, host: str = TELEMETRY_HOST, port: int = TELEMETRY_PORT,
+                 interval: float = TELEMETRY_INTERVAL_S, token: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.interval = interval
+        # Jeton de pilotage (Authorization: Bearer), tiré à chaque lancement par défaut
+        self.token = token or secrets.token_urlsafe(16)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._last_publish = -float("inf")
+        self._event_cursor = 0
+        
+        # État du thread serveur
+        self._clients: List[_Client] = []
+        self._seq = -1
+        self._snapshots: Dict[int, Dict[str, Any]] = {}
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=EVENT_BUFFER)
+        self._event_next = 0
+        self._frames: Dict[Tuple[int, int], bytes] = {}
+        
+        # Pilotage: lots de commandes vers la boucle principale
+        self._commands: "queue.SimpleQueue[List[RemoteCommand]]" = queue.SimpleQueue()
+        self.on_command: Optional[Callable[[], None]] = None   # Réveil (thread serveur)
+        
+        # Statistiques
+        self.publishes = 0
+        self.messages = 0
+        self.bytes_sent = 0
+        self.conflated = 0
+        self.peak_clients = 0
+        self.commands = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+    
+    @property
+    def clients(self) -> int:
+        return len(self._clients)
+    
+    # -------------------------------------------------------------------------
+    # Thread principal
+    # -------------------------------------------------------------------------
+    
+    def start(self) -> int:
+        """Démarre le thread serveur; retourne le port effectif (port 0 = libre)"""
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            raise self._error
+        return self.port
+    
+    def stop(self):
+        """Ferme les connexions et arrête le thread"""
+        loop = self._loop
+        if loop is None:
+            return
+        self._loop = None
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+    
+    def publish(self, simulator, now: Optional[float] = None) -> bool:
+        """Appelé à chaque image: instantané décimé à la cadence de publication"""
+        loop = self._loop
+        now = time.perf_counter() if now is None else now
+        if loop is None or now - self._last_publish < self.interval:
+            return False
+        self._last_publish = now
+        events = [event_dict(e) for e in simulator.fault_events_since(self._event_cursor)]
+        self._event_cursor = simulator.fault_event_count
+        loop.call_soon_threadsafe(self._broadcast, snapshot(simulator), events)
+        return True
+    
+    def poll_commands(self) -> List[RemoteCommand]:
+        """Commandes reçues depuis l'appel précédent, lots dans l'ordre d'arrivée"""
+        commands: List[RemoteCommand] = []
+        while True:
+            try:
+                commands.extend(self._commands.get_nowait())
+            except queue.Empty:
+                return commands
+    
+    def reply(self, command: RemoteCommand, result: Any = None, error: Optional[str] = None,
+              frame: Optional[int] = None):
+        """Réponse à une commande, transmise par le thread serveur"""
+        message: Dict[str, Any] = {"id": command.id, "ok": error is None}
+        if frame is not None:
+            message["frame"] = frame
+        if error is None:
+            message["result"] = result
+        else:
+            message["error"] = error
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(command.respond, message)
+    
+    def report(self) -> str:
+        return (f"{self.clients} clients (peak {self.peak_clients}), "
+                f"{self.publishes} snapshots, {self.messages} messages, "
+                f"{self.bytes_sent / 1024:.0f} KiB, {self.conflated} conflated, "
+                f"{self.commands} commands")
+    
+    # -------------------------------------------------------------------------
+    # Thread serveur
+    # -------------------------------------------------------------------------
+    
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            server = loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port, reuse_address=True))
+        except OSError as exc:
+            self._error = exc
+            loop.close()
+            self._ready.set()
+            return
+        self.port = server.sockets[0].getsockname()[1]
+        self._loop = loop
+        self._ready.set()
+        loop.run_forever()
+        
+        server.close()
+        for client in self._clients:
+            client.writer.transport.abort()
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.run_until_complete(server.wait_closed())
+        loop.close()
+    
+    def _broadcast(self, snap: Dict[str, Any], events: List[Dict[str, Any]]):
+        self._seq += 1
+        self._snapshots[self._seq] = snap
+        self._snapshots.pop(self._seq - SNAPSHOT_HISTORY, None)
+        self._events.extend(events)
+        if events:
+            self._event_next = events[-1]["seq"] + 1
+        self._frames.clear()
+        self.publishes += 1
+        for client in self._clients:
+            if not client.paused:
+                self._send(client)
+    
+    def _submit(self, commands: List[RemoteCommand]):
+        if commands:
+            self._commands.put(commands)
+            self.commands += len(commands)
+            if self.on_command is not None:
+                self.on_command()
+    
+    def _frame_for(self, client: _Client) -> bytes:
+        """Lot à envoyer au client, partagé par tous les clients à la même position"""
+        key = (client.snap_seq, client.event_seq)
+        frame = self._frames.get(key)
+        if frame is None:
+            base = self._snapshots.get(client.snap_seq)
+            snap = self._snapshots[self._seq]
+            first = self._events[0]["seq"] if self._events else self._event_next
+            start = max(client.event_seq - first, 0)
+            message = {
+                "seq": self._seq,
+                "base": client.snap_seq if base is not None else -1,
+                "delta": delta(base, snap) if base is not None else snap,
+                "events": list(self._events)[start:],
+                "lost": max(first - client.event_seq, 0),
+            }
+            frame = self._frames[key] = ws_frame(_json(message))
+        return frame
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), HANDSHAKE_TIMEOUT_S)
+            lines = request.decode("latin-1").split("\r\n")
+            method, path, _ = lines[0].split(" ", 2)
+        except (asyncio.CancelledError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError, ConnectionError, ValueError):
+            writer.close()
+            return
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        
+        try:
+            if headers.get("upgrade", "").lower() != "websocket":
+                await self._serve_http(method, path, headers, reader, writer)
+            elif path == "/stream":
+                await self._serve_stream(reader, writer, headers)
+            elif path == "/control":
+                await self._serve_control(reader, writer, headers)
+            else:
+                writer.write(b"HTTP/1.1 404 Not Found\r\nConnection: close\r\n\r\n")
+                writer.close()
+        except asyncio.CancelledError:
+            writer.close()      # Arrêt du serveur
+    
+    async def _serve_http(self, method: str, path: str, headers: Dict[str, str],
+                          reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        if method == "POST" and path == "/command":
+            status, body = await self._http_command(headers, reader)
+        elif method != "GET":
+            status, body = "405 Method Not Allowed", {"error": "method not allowed"}
+        elif path == "/snapshot":
+            status, body = "200 OK", {"seq": self._seq,
+                                      "snapshot": self._snapshots.get(self._seq, {})}
+        elif path == "/faults":
+            status, body = "200 OK", {"events": list(self._events)}
+        else:
+            status, body = "404 Not Found", {"error": "not found"}
+        payload = _json(body)
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n"
+                     .encode("latin-1") + payload)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+    
+    async def _http_command(self, headers: Dict[str, str],
+                            reader: asyncio.StreamReader) -> Tuple[str, Any]:
+        """POST /command: un lot, réponse quand toutes ses commandes ont abouti"""
+        denied = self._control_denied(headers)
+        if denied is not None:
+            return denied[0], {"error": denied[1]}
+        if headers.get("content-type", "").partition(";")[0].strip().lower() != "application/json":
+            return "415 Unsupported Media Type", {"error": "Content-Type must be application/json"}
+        try:
+            length = int(headers.get("content-length", "0"))
+            if length > WS_MAX_INCOMING:
+                return "413 Payload Too Large", {"error": "payload too large"}
+            commands = parse_commands(await reader.readexactly(length))
+        except (ValueError, asyncio.IncompleteReadError):
+            return "400 Bad Request", {"error": "invalid JSON"}
+        replies: List[Optional[Dict[str, Any]]] = [None] * len(commands)
+        done = asyncio.get_running_loop().create_future()
+        
+        def store(index: int, message: Dict[str, Any]):
+            replies[index] = message
+            if all(r is not None for r in replies) and not done.done():
+                done.set_result(None)
+        
+        for index, command in enumerate(commands):
+            command.respond = lambda message, index=index: store(index, message)
+        if not commands:
+            return "200 OK", {"replies": []}
+        self._submit(commands)
+        try:
+            await asyncio.wait_for(done, COMMAND_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            return "504 Gateway Timeout", {"error": "no reply from the main loop"}
+        return "200 OK", {"replies": replies}
+    
+    def _control_denied(self, headers: Dict[str, str]) -> Optional[Tuple[str, str]]:
+        """(statut HTTP, motif) si le pilotage est refusé, None sinon
+        
+        Un navigateur envoie toujours Origin (WebSocket, POST d'une autre
+        origine); les outils de test n'en envoient pas et présentent le jeton.
+        """
+        if "origin" in headers:
+            return "403 Forbidden", "browser origin not allowed"
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+                token.strip().encode("latin-1"), self.token.encode("utf-8")):
+            return "401 Unauthorized", "missing or invalid token"
+        return None
+    
+    def _accept_websocket(self, writer: asyncio.StreamWriter, headers: Dict[str, str]) -> bool:
+        key = headers.get("sec-websocket-key")
+        if key is None or len(self._clients) >= MAX_CLIENTS:
+            writer.write(b"HTTP/1.1 503 Service Unavailable\r\nConnection: close\r\n\r\n")
+            writer.close()
+            return False
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                      "Connection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {ws_accept_key(key)}\r\n\r\n").encode("latin-1"))
+        return True
+    
+    async def _serve_control(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                             headers: Dict[str, str]):
+        """Pilotage: chaque message texte est un lot, chaque commande une réponse"""
+        denied = self._control_denied(headers)
+        if denied is not None:
+            writer.write(f"HTTP/1.1 {denied[0]}\r\nConnection: close\r\n\r\n".encode("latin-1"))
+            writer.close()
+            return
+        if not self._accept_websocket(writer, headers):
+            return
+        
+        def respond(message: Dict[str, Any]):
+            if not writer.is_closing():
+                writer.write(ws_frame(_json(message)))
+        
+        def on_text(payload: bytes):
+            try:
+                commands = parse_commands(payload)
+            except ValueError:
+                respond({"id": None, "ok": False, "error": "invalid JSON"})
+                return
+            for command in commands:
+                command.respond = respond
+            self._submit(commands)
+        
+        try:
+            await self._read_loop(reader, writer, on_text)
+        finally:
+            writer.close()
+    
+    async def _serve_stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                            headers: Dict[str, str]):
+        if not self._accept_websocket(writer, headers):
+            return
+        # Tampons noyau et asyncio bornés: un client lent est vite mis en pause
+        writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF,
+                                                   CLIENT_BUFFER)
+        writer.transport.set_write_buffer_limits(high=CLIENT_BUFFER)
+        
+        first = self._events[0]["seq"] if self._events else self._event_next
+        client = _Client(writer, first)
+        self._clients.append(client)
+        self.peak_clients = max(self.peak_clients, len(self._clients))
+        if self._seq >= 0:
+            self._send(client)
+        try:
+            await self._read_loop(reader, writer)
+        finally:
+            self._clients.remove(client)
+            writer.close()
+    
+    async def _read_loop(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                         on_text: Optional[Callable[[bytes], None]] = None):
+        """Trames du client: ping, fermeture et texte (on_text), le reste est ignoré
+        
+        Les messages fragmentés sont réassemblés (contrôles intercalés servis
+        au passage) jusqu'à WS_MAX_INCOMING au total.
+        """
+        message_opcode: Optional[int] = None
+        parts: List[bytes] = []
+        size = 0
+        try:
+            while True:
+                fin, opcode, payload = await ws_read_frame(reader)
+                if opcode == WS_CLOSE:
+                    writer.write(ws_frame(payload[:2], WS_CLOSE))
+                    return
+                if opcode == WS_PING:
+                    writer.write(ws_frame(payload, WS_PONG))
+                    continue
+                if opcode & 0x8:
+                    continue
+                if opcode == WS_CONTINUATION:
+                    if message_opcode is None:
+                        raise _WsFailure(WS_PROTOCOL_ERROR, "unexpected continuation frame")
+                elif message_opcode is not None:
+                    raise _WsFailure(WS_PROTOCOL_ERROR, "new message inside a fragmented one")
+                else:
+                    message_opcode = opcode
+                size += len(payload)
+                if size > WS_MAX_INCOMING:
+                    raise _WsFailure(WS_TOO_BIG, "message too large")
+                parts.append(payload)
+                if fin:
+                    if message_opcode == WS_TEXT and on_text is not None:
+                        on_text(b"".join(parts))
+                    message_opcode = None
+                    parts.clear()
+                    size = 0
+        except _WsFailure as exc:
+            if not writer.is_closing():
+                writer.write(ws_frame(struct.pack("!H", exc.code), WS_CLOSE))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+    
+    def _send(self, client: _Client):
+        """Écrit le lot courant; tampon plein: pause jusqu'au drain (fusion)"""
+        if client.snap_seq == self._seq or client.writer.is_closing():
+            return
+        if client.snap_seq >= 0:
+            self.conflated += self._seq - client.snap_seq - 1
+        frame = self._frame_for(client)
+        client.snap_seq = self._seq
+        client.event_seq = self._event_next
+        client.writer.write(frame)
+        self.messages += 1
+        self.bytes_sent += len(frame)
+        if client.writer.transport.get_write_buffer_size() > CLIENT_BUFFER:
+            client.paused = True
+            asyncio.ensure_future(self._resume(client))
+    
+    async def _resume(self, client: _Client):
+        try:
+            await client.writer.drain()
+        except ConnectionError:
+            client.writer.close()
+            return
+        client.paused = False
+        self._send(client)
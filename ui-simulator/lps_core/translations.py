@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Système de traductions FR/EN/ES/DE de l'interface LPS DUO PRO
+"""
+
+import json
+import os
+from enum import Enum
+from typing import Callable, Dict, Mapping
+
+
+# =============================================================================
+# SYSTÈME DE TRADUCTIONS
+# =============================================================================
+
+class Language(Enum):
+    """Langues supportées"""
+    FR = "Français"
+    EN = "English"
+    ES = "Español"
+    DE = "Deutsch"
+
+
+class Translations:
+    """Système de traductions multi-langues"""
+    
+    STRINGS = {
+        # Pages principales
+        "page_listen": {"FR": "ÉCOUTE", "EN": "LISTEN", "ES": "ESCUCHA", "DE": "HÖREN"},
+        "page_details": {"FR": "DÉTAILS", "EN": "DETAILS", "ES": "DETALLES", "DE": "DETAILS"},
+        "page_health": {"FR": "SANTÉ", "EN": "HEALTH", "ES": "SALUD", "DE": "STATUS"},
+        "page_session": {"FR": "SESSION", "EN": "SESSION", "ES": "SESIÓN", "DE": "SITZUNG"},
+        "page_config": {"FR": "CONFIG", "EN": "CONFIG", "ES": "CONFIG", "DE": "CONFIG"},
+        "page_spectrum": {"FR": "SPECTRE", "EN": "SPECTRUM", "ES": "ESPECTRO", "DE": "SPEKTRUM"},
+        "page_setting": {"FR": "RÉGLAGE", "EN": "SETTING", "ES": "AJUSTE", "DE": "EINSTELLUNG"},
+        "page_trend": {"FR": "TENDANCES", "EN": "TRENDS", "ES": "TENDENCIAS", "DE": "VERLAUF"},
+        "page_quality": {"FR": "QUALITÉ", "EN": "QUALITY", "ES": "CALIDAD", "DE": "QUALITÄT"},
+        "page_history": {"FR": "HISTORIQUE", "EN": "HISTORY", "ES": "HISTORIAL", "DE": "PROTOKOLL"},
+        
+        # Labels communs
+        "rail_a": {"FR": "RAIL A", "EN": "RAIL A", "ES": "RAIL A", "DE": "KANAL A"},
+        "rail_b": {"FR": "RAIL B", "EN": "RAIL B", "ES": "RAIL B", "DE": "KANAL B"},
+        "voltage": {"FR": "TENSION", "EN": "VOLTAGE", "ES": "VOLTAJE", "DE": "SPANNUNG"},
+        "current": {"FR": "COURANT", "EN": "CURRENT", "ES": "CORRIENTE", "DE": "STROM"},
+        "power": {"FR": "PUISSANCE", "EN": "POWER", "ES": "POTENCIA", "DE": "LEISTUNG"},
+        "temperature": {"FR": "TEMPÉRATURE", "EN": "TEMPERATURE", "ES": "TEMPERATURA", "DE": "TEMPERATUR"},
+        "headroom": {"FR": "RÉSERVE", "EN": "HEADROOM", "ES": "RESERVA", "DE": "RESERVE"},
+        "ripple": {"FR": "ONDULATION", "EN": "RIPPLE", "ES": "RIZADO", "DE": "WELLIGKEIT"},
+        "noise": {"FR": "BRUIT", "EN": "NOISE", "ES": "RUIDO", "DE": "RAUSCHEN"},
+        "efficiency": {"FR": "RENDEMENT", "EN": "EFFICIENCY", "ES": "EFICIENCIA", "DE": "EFFIZIENZ"},
+        "noise_rms": {"FR": "BRUIT INTÉGRÉ", "EN": "INTEGRATED NOISE", "ES": "RUIDO INTEGRADO",
+                      "DE": "INTEGR. RAUSCHEN"},
+        
+        # États
+        "ok": {"FR": "OK", "EN": "OK", "ES": "OK", "DE": "OK"},
+        "warning": {"FR": "ATTENTION", "EN": "WARNING", "ES": "ALERTA", "DE": "WARNUNG"},
+        "error": {"FR": "ERREUR", "EN": "ERROR", "ES": "ERROR", "DE": "FEHLER"},
+        "active": {"FR": "ACTIF", "EN": "ACTIVE", "ES": "ACTIVO", "DE": "AKTIV"},
+        "standby": {"FR": "VEILLE", "EN": "STANDBY", "ES": "ESPERA", "DE": "BEREIT"},
+        "off": {"FR": "ARRÊT", "EN": "OFF", "ES": "APAGADO", "DE": "AUS"},
+        
+        # Protections
+        "ovp": {"FR": "SURTENSION", "EN": "OVERVOLTAGE", "ES": "SOBRETENSIÓN", "DE": "ÜBERSPANNUNG"},
+        "ocp": {"FR": "SURINTENSITÉ", "EN": "OVERCURRENT", "ES": "SOBRECORRIENTE", "DE": "ÜBERSTROM"},
+        "otp": {"FR": "SURCHAUFFE", "EN": "OVERTEMP", "ES": "SOBRETEMPERATURA", "DE": "ÜBERTEMPERATUR"},
+        "otp_eta": {"FR": "OTP dans", "EN": "OTP in", "ES": "OTP en", "DE": "OTP in"},
+        "early_warning": {"FR": "VIGILANCE", "EN": "WATCH", "ES": "VIGILANCIA", "DE": "VORWARNUNG"},
+        "early_warnings": {"FR": "ALERTES PRÉCOCES", "EN": "EARLY WARNINGS",
+                           "ES": "ALERTAS TEMPRANAS", "DE": "FRÜHWARNUNGEN"},
+        "backfeed": {"FR": "RETOUR COURANT", "EN": "BACKFEED", "ES": "RETORNO", "DE": "RÜCKSTROM"},
+        "purist": {"FR": "MODE PURIST", "EN": "PURIST MODE", "ES": "MODO PURISTA", "DE": "PURIST-MODUS"},
+        "purist_help": {"FR": "Écrans éteints - Clic / P: reprendre",
+                        "EN": "Screens off - Click / P: resume",
+                        "ES": "Pantallas apagadas - Clic / P: reanudar",
+                        "DE": "Bildschirme aus - Klick / P: fortsetzen"},
+        "dashboard": {"FR": "TABLEAU DE BORD", "EN": "DASHBOARD", "ES": "PANEL", "DE": "ÜBERSICHT"},
+        "dashboard_help": {"FR": "Clic: ouvrir la page / D: retour",
+                           "EN": "Click: open page / D: back",
+                           "ES": "Clic: abrir página / D: volver",
+                           "DE": "Klick: Seite öffnen / D: zurück"},
+        "protection_active": {"FR": "PROTECTION ACTIVE", "EN": "PROTECTION ACTIVE", 
+                             "ES": "PROTECCIÓN ACTIVA", "DE": "SCHUTZ AKTIV"},
+        
+        # Session
+        "uptime": {"FR": "DURÉE", "EN": "UPTIME", "ES": "TIEMPO", "DE": "LAUFZEIT"},
+        "energy": {"FR": "ÉNERGIE", "EN": "ENERGY", "ES": "ENERGÍA", "DE": "ENERGIE"},
+        "session_start": {"FR": "DÉBUT SESSION", "EN": "SESSION START", 
+                         "ES": "INICIO SESIÓN", "DE": "SITZUNGSSTART"},
+        "eeprom_saves": {"FR": "sauvegardes", "EN": "saves", "ES": "guardados", "DE": "Speicherungen"},
+        "eeprom_wear": {"FR": "usure max", "EN": "max wear", "ES": "desgaste máx", "DE": "max. Verschleiß"},
+        "eeprom_life": {"FR": "durée de vie", "EN": "lifetime", "ES": "vida útil", "DE": "Lebensdauer"},
+        "years": {"FR": "ans", "EN": "years", "ES": "años", "DE": "Jahre"},
+        
+        # Config
+        "language": {"FR": "LANGUE", "EN": "LANGUAGE", "ES": "IDIOMA", "DE": "SPRACHE"},
+        "brightness": {"FR": "LUMINOSITÉ", "EN": "BRIGHTNESS", "ES": "BRILLO", "DE": "HELLIGKEIT"},
+        "auto_off": {"FR": "ARRÊT AUTO", "EN": "AUTO OFF", "ES": "APAGADO AUTO", "DE": "AUTO AUS"},
+        "simulation": {"FR": "SIMULATION", "EN": "SIMULATION", "ES": "SIMULACIÓN", "DE": "SIMULATION"},
+        "reset": {"FR": "RÉINITIALISER", "EN": "RESET", "ES": "REINICIAR", "DE": "ZURÜCKSETZEN"},
+        "about": {"FR": "À PROPOS", "EN": "ABOUT", "ES": "ACERCA DE", "DE": "ÜBER"},
+        
+        # Simulations de pannes
+        "sim_normal": {"FR": "NORM", "EN": "NORM", "ES": "NORM", "DE": "NORM"},
+        "sim_hot": {"FR": "HOT", "EN": "HOT", "ES": "HOT", "DE": "HEISS"},
+        "sim_ripple": {"FR": "RIP", "EN": "RIP", "ES": "RIP", "DE": "RIP"},
+        "sim_load": {"FR": "LOAD", "EN": "LOAD", "ES": "CARGA", "DE": "LAST"},
+        "sim_lo_v": {"FR": "LO-V", "EN": "LO-V", "ES": "LO-V", "DE": "LO-V"},
+        "sim_hi_v": {"FR": "HI-V", "EN": "HI-V", "ES": "HI-V", "DE": "HI-V"},
+        "sim_target": {"FR": "CIBLE", "EN": "TARGET", "ES": "OBJETIVO", "DE": "ZIEL"},
+        "time_scale": {"FR": "VITESSE", "EN": "SPEED", "ES": "VELOCIDAD", "DE": "TEMPO"},
+        
+        # Réglage tension
+        "setting_step": {"FR": "pas", "EN": "step", "ES": "paso", "DE": "Schritt"},
+        "setting_pending": {"FR": "EN ATTENTE", "EN": "PENDING", "ES": "PENDIENTE", "DE": "AUSSTEHEND"},
+        "setting_applied": {"FR": "APPLIQUÉ", "EN": "APPLIED", "ES": "APLICADO", "DE": "ÜBERNOMMEN"},
+        "setting_help": {"FR": "Glisser / <- ->: pas digipot  HAUT/BAS: rail  ENTER: appliquer",
+                         "EN": "Drag / <- ->: digipot step  UP/DOWN: rail  ENTER: apply",
+                         "ES": "Arrastrar / <- ->: paso digipot  ARRIBA/ABAJO: rail  ENTER: aplicar",
+                         "DE": "Ziehen / <- ->: Digipot-Schritt  AUF/AB: Kanal  ENTER: übernehmen"},
+        
+        # Qualité (libellés de l'écran QUALITÉ du firmware)
+        "quality_optimal": {"FR": "OPTIMAL", "EN": "OPTIMAL", "ES": "ÓPTIMO", "DE": "OPTIMAL"},
+        "quality_good": {"FR": "BON", "EN": "GOOD", "ES": "BUENO", "DE": "GUT"},
+        "quality_correct": {"FR": "CORRECT", "EN": "CORRECT", "ES": "CORRECTO", "DE": "KORREKT"},
+        "quality_degraded": {"FR": "DÉGRADÉ", "EN": "DEGRADED", "ES": "DEGRADADO", "DE": "SCHLECHT"},
+        "temp_good": {"FR": "BON", "EN": "GOOD", "ES": "BUENO", "DE": "GUT"},
+        "temp_warm": {"FR": "TIÈDE", "EN": "WARM", "ES": "TIBIO", "DE": "WARM"},
+        "temp_hot": {"FR": "CHAUD", "EN": "HOT", "ES": "CALIENTE", "DE": "HEISS"},
+        "stability": {"FR": "STABILITÉ", "EN": "STABILITY", "ES": "ESTABILIDAD", "DE": "STABILITÄT"},
+        "smooth_i": {"FR": "I lissé", "EN": "Smoothed I", "ES": "I suavizada", "DE": "I geglättet"},
+        "quality_v_mean": {"FR": "V moy ± σ", "EN": "V mean ± σ", "ES": "V media ± σ", "DE": "V Mittel ± σ"},
+        "quality_v_window": {"FR": "V fenêtre", "EN": "V window", "ES": "V ventana", "DE": "V Fenster"},
+        "quality_i_window": {"FR": "I fenêtre", "EN": "I window", "ES": "I ventana", "DE": "I Fenster"},
+        
+        # Tendances
+        "trend_live": {"FR": "DIRECT", "EN": "LIVE", "ES": "EN VIVO", "DE": "LIVE"},
+        "trend_span": {"FR": "fenêtre", "EN": "span", "ES": "ventana", "DE": "Fenster"},
+        "trend_resolution": {"FR": "résolution", "EN": "resolution", "ES": "resolución",
+                             "DE": "Auflösung"},
+        "trend_mean": {"FR": "moy", "EN": "mean", "ES": "media", "DE": "Mittel"},
+        "trend_no_data": {"FR": "Pas encore de données", "EN": "No data yet",
+                          "ES": "Aún sin datos", "DE": "Noch keine Daten"},
+        "trend_help": {"FR": "Glisser / <- ->: déplacer  HAUT/BAS, molette: zoom  C: grandeur  ENTER: direct",
+                       "EN": "Drag / <- ->: pan  UP/DOWN, wheel: zoom  C: quantity  ENTER: live",
+                       "ES": "Arrastrar / <- ->: mover  ARRIBA/ABAJO, rueda: zoom  C: magnitud  ENTER: en vivo",
+                       "DE": "Ziehen / <- ->: verschieben  AUF/AB, Rad: Zoom  C: Größe  ENTER: live"},
+        
+        # Historique des fautes
+        "history_all": {"FR": "TOUS", "EN": "ALL", "ES": "TODOS", "DE": "ALLE"},
+        "history_date": {"FR": "Date", "EN": "Date", "ES": "Fecha", "DE": "Datum"},
+        "history_session": {"FR": "Session", "EN": "Session", "ES": "Sesión", "DE": "Sitzung"},
+        "history_sim_time": {"FR": "T simulé", "EN": "Sim time", "ES": "T simulado", "DE": "Sim-Zeit"},
+        "history_rail": {"FR": "Rail", "EN": "Rail", "ES": "Rail", "DE": "Kanal"},
+        "history_fault": {"FR": "Faute", "EN": "Fault", "ES": "Fallo", "DE": "Fehler"},
+        "history_state": {"FR": "État", "EN": "State", "ES": "Estado", "DE": "Zustand"},
+        "history_raised": {"FR": "APPARUE", "EN": "RAISED", "ES": "ACTIVADA", "DE": "AUSGELÖST"},
+        "history_cleared": {"FR": "DISPARUE", "EN": "CLEARED", "ES": "DESPEJADA", "DE": "BEHOBEN"},
+        "history_events": {"FR": "événements", "EN": "events", "ES": "eventos", "DE": "Ereignisse"},
+        "history_empty": {"FR": "Aucune faute enregistrée", "EN": "No fault recorded",
+                          "ES": "Ningún fallo registrado", "DE": "Keine Fehler aufgezeichnet"},
+        "history_help": {"FR": "Glisser / molette / HAUT BAS PG: défiler  R: rail  F: faute  ENTER: récents",
+                         "EN": "Drag / wheel / UP DOWN PG: scroll  R: rail  F: fault  ENTER: latest",
+                         "ES": "Arrastrar / rueda / ARRIBA ABAJO PG: desplazar  R: rail  F: fallo  ENTER: recientes",
+                         "DE": "Ziehen / Rad / AUF AB BILD: blättern  R: Kanal  F: Fehler  ENTER: neueste"},
+        
+        # Aide
+        "help_title": {"FR": "AIDE", "EN": "HELP", "ES": "AYUDA", "DE": "HILFE"},
+        "help_nav": {"FR": "Navigation: Touches 1-9", "EN": "Navigation: Keys 1-9",
+                    "ES": "Navegación: Teclas 1-9", "DE": "Navigation: Tasten 1-9"},
+        "help_esc": {"FR": "ESC: Fermer popup", "EN": "ESC: Close popup",
+                    "ES": "ESC: Cerrar popup", "DE": "ESC: Popup schließen"},
+        
+        # Unités
+        "unit_v": {"FR": "V", "EN": "V", "ES": "V", "DE": "V"},
+        "unit_ma": {"FR": "mA", "EN": "mA", "ES": "mA", "DE": "mA"},
+        "unit_w": {"FR": "W", "EN": "W", "ES": "W", "DE": "W"},
+        "unit_c": {"FR": "°C", "EN": "°C", "ES": "°C", "DE": "°C"},
+        "unit_uv": {"FR": "µV", "EN": "µV", "ES": "µV", "DE": "µV"},
+        "unit_wh": {"FR": "Wh", "EN": "Wh", "ES": "Wh", "DE": "Wh"},
+        "unit_percent": {"FR": "%", "EN": "%", "ES": "%", "DE": "%"},
+    }
+    
+    _current_lang = Language.FR
+    
+    # Tables compilées: une table plate clé → texte par langue, repli EN déjà
+    # résolu. get() ne fait qu'une recherche dans la table courante.
+    _tables: Dict[Language, Dict[str, str]] = {}
+    _table: Dict[str, str] = {}
+    # Textes des catalogues chargés, réappliqués par chaque compile()
+    _catalogs: Dict[Language, Dict[str, str]] = {}
+    
+    # Chargeurs de catalogues externes par extension de fichier
+    _loaders: Dict[str, Callable[[str], Mapping[str, Mapping[str, str]]]] = {}
+    
+    @classmethod
+    def compile(cls):
+        """Construit les tables par langue à partir de STRINGS et des catalogues chargés"""
+        cls._tables = {
+            lang: {key: entry.get(lang.name, entry.get("EN", key))
+                   for key, entry in cls.STRINGS.items()}
+            for lang in Language
+        }
+        for lang, strings in cls._catalogs.items():
+            cls._tables[lang].update(strings)
+        cls._table = cls._tables[cls._current_lang]
+    
+    @classmethod
+    def set_language(cls, lang: Language):
+        """Change la langue actuelle (bascule de table en une affectation)"""
+        cls._current_lang = lang
+        cls._table = cls._tables[lang]
+    
+    @classmethod
+    def get(cls, key: str) -> str:
+        """Récupère une traduction pour la langue actuelle"""
+        return cls._table.get(key, key)
+    
+    @classmethod
+    def get_current_language(cls) -> Language:
+        """Retourne la langue actuelle"""
+        return cls._current_lang
+    
+    @classmethod
+    def next_language(cls):
+        """Passe à la langue suivante"""
+        langs = list(Language)
+        idx = langs.index(cls._current_lang)
+        cls.set_language(langs[(idx + 1) % len(langs)])
+    
+    @classmethod
+    def register_loader(cls, extension: str,
+                        loader: Callable[[str], Mapping[str, Mapping[str, str]]]):
+        """Associe un chargeur de catalogue à une extension (".json", ".po"...)
+        
+        Le chargeur reçoit le chemin et retourne {code langue: {clé: texte}}.
+        """
+        cls._loaders[extension.lower()] = loader
+    
+    @classmethod
+    def load_catalog(cls, path: str):
+        """Charge un catalogue externe et remplace les tables des langues fournies
+        
+        Un catalogue ne fait que surcharger des langues de `Language`: leur
+        code sert aussi à l'octet EEPROM_LANGUAGE, aux mises en page et au
+        pilotage distant. Un code inconnu lève ValueError.
+        
+        Chaque langue du catalogue doit couvrir toutes les clés de STRINGS:
+        les clés manquantes lèvent ValueError au chargement plutôt que
+        d'afficher des clés brutes à l'écran. Les clés en plus sont acceptées.
+        Le catalogue est validé en entier avant d'être appliqué: en cas
+        d'erreur, aucune table ne change. Les textes chargés survivent à
+        un nouvel appel de compile().
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in cls._loaders:
+            raise ValueError(f"No translation loader for '{extension}' files")
+        catalog = cls._loaders[extension](path)
+        
+        tables = {}
+        for code, strings in catalog.items():
+            if code not in Language.__members__:
+                raise ValueError(f"Unknown language '{code}' in {path} "
+                                 f"(catalogs can only override {', '.join(Language.__members__)})")
+            missing = sorted(set(cls.STRINGS) - set(strings))
+            if missing:
+                raise ValueError(f"{path}: {code} is missing {len(missing)} keys: "
+                                 + ", ".join(missing))
+            tables[Language[code]] = dict(strings)
+        
+        # Catalogue entièrement validé: remplacement des tables
+        for lang, strings in tables.items():
+            cls._catalogs[lang] = dict(cls._catalogs.get(lang, {}), **strings)
+            cls._tables[lang] = dict(cls._tables[lang], **strings)
+        cls._table = cls._tables[cls._current_lang]
+
+
+def _load_json_catalog(path: str) -> Mapping[str, Mapping[str, str]]:
+    """Catalogue JSON: {"DE": {"page_listen": "HÖREN", ...}, ...}"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+Translations.register_loader(".json", _load_json_catalog)
+Translations.compile()
+
+
+# Alias pour faciliter l'usage
+T = Translations.get
@@ -16,7 +16,8 @@ Architecture du système:
 Optimisations V92:
 - draw.lines() pour oscilloscopes (690->3 appels/frame)
 - Cache get_all_problems() par frame
-- Layout centralisé (ECOUTE_LAYOUT, DETAILS_LAYOUT, etc.)
+- Layout centralisé (ECOUTE_LAYOUT, DETAILS_LAYOUT, etc.), résolu par LayoutEngine
+  pour la taille d'écran courante
 - LCD agrandi 95px
 - Headroom 2.0V conforme circuit V2.4.5
 
@@ -24,32 +25,66 @@ Version: 92
 Auteur: LPS Audiophile Team
 """
 
-import pygame
+from __future__ import annotations
+
+import base64
+import io
 import math
 import time
-import random
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Any, Callable
-from dataclasses import dataclass, field
-from enum import Enum, auto
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Any, Callable
+from dataclasses import dataclass
+
+_IMPORT_START = time.perf_counter()
+
+# Cœur sans pygame: traductions, données, modèle physique, synthèse, simulateur
+from lps_core import (
+    Translations, T, Language, SimulationMode, RailData, DataSimulator,
+    SampleRing, WelchSpectrum, SYNTH_SAMPLE_RATE, SYNTH_BLOCK, SPEC_NOISE_UV_RMS,
+    DIGIPOT_STEPS, V_OUT_MIN, V_OUT_MAX_SET, digipot_to_voltage, voltage_to_digipot,
+    digipot_voltages,
+    TrendStore, TREND_CHANNELS, EnergyPersistence,
+    BufferPool, AllocationTracker,
+    FaultLog, FaultView, FaultRecord, FAULT_CODES,
+    lazy_import,
+)
+
+# Télémétrie (asyncio) importée seulement avec --telemetry
+if TYPE_CHECKING:
+    from lps_core import TelemetryServer, RemoteCommand
 
 # =============================================================================
 # CONFIGURATION AUDIO ENGINE
 # =============================================================================
 
-# Tentative d'import sounddevice pour audio avancé
+pygame = lazy_import("pygame")
+
+# NumPy est requis par le modèle physique vectorisé des rails
+np = lazy_import("numpy")
+
+# sounddevice (audio avancé) est sondé au premier besoin: charger PortAudio
+# coûte plus que tout le reste du démarrage
 AUDIO_ENGINE = "pygame"  # Default fallback
-try:
-    import sounddevice as sd
-    import numpy as np
-    AUDIO_ENGINE = "sounddevice"
-except ImportError:
-    try:
-        import numpy as np
-    except ImportError:
-        np = None
+sd = None
+_audio_probed = False
+
+
+def probe_audio_engine() -> str:
+    """Tente l'import sounddevice une seule fois et retourne le moteur retenu"""
+    global AUDIO_ENGINE, sd, _audio_probed
+    if not _audio_probed:
+        _audio_probed = True
+        try:
+            import sounddevice
+            sd = sounddevice
+            AUDIO_ENGINE = "sounddevice"
+        except (ImportError, OSError):
+            # OSError: module présent mais bibliothèque PortAudio introuvable
+            pass
+    return AUDIO_ENGINE
+
 
 # =============================================================================
 # CONSTANTES GLOBALES
@@ -211,313 +246,192 @@ class BitmapFont:
 
 
 # =============================================================================
-# SYSTÈME DE TRADUCTIONS
+# SONIFICATION AUDIO
 # =============================================================================
 
-class Language(Enum):
-    """Langues supportées"""
-    FR = "Français"
-    EN = "English"
-    ES = "Español"
-    DE = "Deutsch"
-
-
-class Translations:
-    """Système de traductions multi-langues"""
-    
-    STRINGS = {
-        # Pages principales
-        "page_listen": {"FR": "ÉCOUTE", "EN": "LISTEN", "ES": "ESCUCHA", "DE": "HÖREN"},
-        "page_details": {"FR": "DÉTAILS", "EN": "DETAILS", "ES": "DETALLES", "DE": "DETAILS"},
-        "page_health": {"FR": "SANTÉ", "EN": "HEALTH", "ES": "SALUD", "DE": "STATUS"},
-        "page_session": {"FR": "SESSION", "EN": "SESSION", "ES": "SESIÓN", "DE": "SITZUNG"},
-        "page_config": {"FR": "CONFIG", "EN": "CONFIG", "ES": "CONFIG", "DE": "CONFIG"},
-        
-        # Labels communs
-        "rail_a": {"FR": "RAIL A", "EN": "RAIL A", "ES": "RAIL A", "DE": "KANAL A"},
-        "rail_b": {"FR": "RAIL B", "EN": "RAIL B", "ES": "RAIL B", "DE": "KANAL B"},
-        "voltage": {"FR": "TENSION", "EN": "VOLTAGE", "ES": "VOLTAJE", "DE": "SPANNUNG"},
-        "current": {"FR": "COURANT", "EN": "CURRENT", "ES": "CORRIENTE", "DE": "STROM"},
-        "power": {"FR": "PUISSANCE", "EN": "POWER", "ES": "POTENCIA", "DE": "LEISTUNG"},
-        "temperature": {"FR": "TEMPÉRATURE", "EN": "TEMPERATURE", "ES": "TEMPERATURA", "DE": "TEMPERATUR"},
-        "headroom": {"FR": "RÉSERVE", "EN": "HEADROOM", "ES": "RESERVA", "DE": "RESERVE"},
-        "ripple": {"FR": "ONDULATION", "EN": "RIPPLE", "ES": "RIZADO", "DE": "WELLIGKEIT"},
-        "noise": {"FR": "BRUIT", "EN": "NOISE", "ES": "RUIDO", "DE": "RAUSCHEN"},
-        "efficiency": {"FR": "RENDEMENT", "EN": "EFFICIENCY", "ES": "EFICIENCIA", "DE": "EFFIZIENZ"},
-        
-        # États
-        "ok": {"FR": "OK", "EN": "OK", "ES": "OK", "DE": "OK"},
-        "warning": {"FR": "ATTENTION", "EN": "WARNING", "ES": "ALERTA", "DE": "WARNUNG"},
-        "error": {"FR": "ERREUR", "EN": "ERROR", "ES": "ERROR", "DE": "FEHLER"},
-        "active": {"FR": "ACTIF", "EN": "ACTIVE", "ES": "ACTIVO", "DE": "AKTIV"},
-        "standby": {"FR": "VEILLE", "EN": "STANDBY", "ES": "ESPERA", "DE": "BEREIT"},
-        "off": {"FR": "ARRÊT", "EN": "OFF", "ES": "APAGADO", "DE": "AUS"},
-        
-        # Protections
-        "ovp": {"FR": "SURTENSION", "EN": "OVERVOLTAGE", "ES": "SOBRETENSIÓN", "DE": "ÜBERSPANNUNG"},
-        "ocp": {"FR": "SURINTENSITÉ", "EN": "OVERCURRENT", "ES": "SOBRECORRIENTE", "DE": "ÜBERSTROM"},
-        "otp": {"FR": "SURCHAUFFE", "EN": "OVERTEMP", "ES": "SOBRETEMPERATURA", "DE": "ÜBERTEMPERATUR"},
-        "protection_active": {"FR": "PROTECTION ACTIVE", "EN": "PROTECTION ACTIVE", 
-                             "ES": "PROTECCIÓN ACTIVA", "DE": "SCHUTZ AKTIV"},
-        
-        # Session
-        "uptime": {"FR": "DURÉE", "EN": "UPTIME", "ES": "TIEMPO", "DE": "LAUFZEIT"},
-        "energy": {"FR": "ÉNERGIE", "EN": "ENERGY", "ES": "ENERGÍA", "DE": "ENERGIE"},
-        "session_start": {"FR": "DÉBUT SESSION", "EN": "SESSION START", 
-                         "ES": "INICIO SESIÓN", "DE": "SITZUNGSSTART"},
-        
-        # Config
-        "language": {"FR": "LANGUE", "EN": "LANGUAGE", "ES": "IDIOMA", "DE": "SPRACHE"},
-        "brightness": {"FR": "LUMINOSITÉ", "EN": "BRIGHTNESS", "ES": "BRILLO", "DE": "HELLIGKEIT"},
-        "auto_off": {"FR": "ARRÊT AUTO", "EN": "AUTO OFF", "ES": "APAGADO AUTO", "DE": "AUTO AUS"},
-        "simulation": {"FR": "SIMULATION", "EN": "SIMULATION", "ES": "SIMULACIÓN", "DE": "SIMULATION"},
-        "reset": {"FR": "RÉINITIALISER", "EN": "RESET", "ES": "REINICIAR", "DE": "ZURÜCKSETZEN"},
-        "about": {"FR": "À PROPOS", "EN": "ABOUT", "ES": "ACERCA DE", "DE": "ÜBER"},
-        
-        # Simulations de pannes
-        "sim_normal": {"FR": "NORM", "EN": "NORM", "ES": "NORM", "DE": "NORM"},
-        "sim_hot": {"FR": "HOT", "EN": "HOT", "ES": "HOT", "DE": "HEISS"},
-        "sim_ripple": {"FR": "RIP", "EN": "RIP", "ES": "RIP", "DE": "RIP"},
-        "sim_load": {"FR": "LOAD", "EN": "LOAD", "ES": "CARGA", "DE": "LAST"},
-        "sim_lo_v": {"FR": "LO-V", "EN": "LO-V", "ES": "LO-V", "DE": "LO-V"},
-        "sim_hi_v": {"FR": "HI-V", "EN": "HI-V", "ES": "HI-V", "DE": "HI-V"},
-        
-        # Aide
-        "help_title": {"FR": "AIDE", "EN": "HELP", "ES": "AYUDA", "DE": "HILFE"},
-        "help_nav": {"FR": "Navigation: Touches 1-5", "EN": "Navigation: Keys 1-5",
-                    "ES": "Navegación: Teclas 1-5", "DE": "Navigation: Tasten 1-5"},
-        "help_esc": {"FR": "ESC: Fermer popup", "EN": "ESC: Close popup",
-                    "ES": "ESC: Cerrar popup", "DE": "ESC: Popup schließen"},
-        
-        # Unités
-        "unit_v": {"FR": "V", "EN": "V", "ES": "V", "DE": "V"},
-        "unit_ma": {"FR": "mA", "EN": "mA", "ES": "mA", "DE": "mA"},
-        "unit_w": {"FR": "W", "EN": "W", "ES": "W", "DE": "W"},
-        "unit_c": {"FR": "°C", "EN": "°C", "ES": "°C", "DE": "°C"},
-        "unit_uv": {"FR": "µV", "EN": "µV", "ES": "µV", "DE": "µV"},
-        "unit_wh": {"FR": "Wh", "EN": "Wh", "ES": "Wh", "DE": "Wh"},
-        "unit_percent": {"FR": "%", "EN": "%", "ES": "%", "DE": "%"},
-    }
-    
-    _current_lang = Language.FR
-    
-    @classmethod
-    def set_language(cls, lang: Language):
-        """Change la langue actuelle"""
-        cls._current_lang = lang
-    
-    @classmethod
-    def get(cls, key: str) -> str:
-        """Récupère une traduction pour la langue actuelle"""
-        if key in cls.STRINGS:
-            lang_code = cls._current_lang.name
-            if lang_code in cls.STRINGS[key]:
-                return cls.STRINGS[key][lang_code]
-            # Fallback to English
-            return cls.STRINGS[key].get("EN", key)
-        return key
-    
-    @classmethod
-    def get_current_language(cls) -> Language:
-        """Retourne la langue actuelle"""
-        return cls._current_lang
-    
-    @classmethod
-    def next_language(cls):
-        """Passe à la langue suivante"""
-        langs = list(Language)
-        idx = langs.index(cls._current_lang)
-        cls._current_lang = langs[(idx + 1) % len(langs)]
-
-
-# Alias pour faciliter l'usage
-T = Translations.get
-
-
-# =============================================================================
-# SIMULATION DE DONNÉES
-# =============================================================================
-
-class SimulationMode(Enum):
-    """Modes de simulation de pannes"""
-    NORMAL = auto()
-    HOT = auto()      # Surchauffe (OTP)
-    RIPPLE = auto()   # Bruit excessif
-    LOAD = auto()     # Surcharge (OCP)
-    LOW_V = auto()    # Sous-tension
-    HIGH_V = auto()   # Surtension (OVP)
-
-
-@dataclass
-class RailData:
-    """Données d'un rail d'alimentation"""
-    voltage_target: float = 12.0
-    voltage_actual: float = 12.0
-    current_ma: float = 150.0
-    power_w: float = 1.8
-    temperature_c: float = 35.0
-    headroom_v: float = 2.0
-    ripple_uv: float = 5.0
-    noise_uv: float = 3.0
-    efficiency: float = 92.0
-    enabled: bool = True
-    
-    # États de protection
-    ovp_active: bool = False
-    ocp_active: bool = False
-    otp_active: bool = False
-
-
-@dataclass  
-class SystemData:
-    """Données système globales"""
-    rail_a: RailData = field(default_factory=RailData)
-    rail_b: RailData = field(default_factory=RailData)
-    input_voltage: float = 24.0
-    ambient_temp: float = 25.0
-    uptime_seconds: int = 0
-    energy_wh: float = 0.0
-    session_start: datetime = field(default_factory=datetime.now)
-    simulation_mode: SimulationMode = SimulationMode.NORMAL
-    
-    # Cache pour optimisation V92
-    _problems_cache: List[str] = field(default_factory=list)
-    _problems_cache_frame: int = -1
-
-
-class DataSimulator:
-    """Générateur de données simulées"""
-    
-    def __init__(self):
-        self.data = SystemData()
-        self.data.rail_a.voltage_target = 12.0
-        self.data.rail_b.voltage_target = 5.0
-        self.frame_count = 0
-        self._oscilloscope_data_a: List[float] = []
-        self._oscilloscope_data_b: List[float] = []
-        self._init_oscilloscope_data()
-    
-    def _init_oscilloscope_data(self):
-        """Initialise les données d'oscilloscope"""
-        for _ in range(200):
-            self._oscilloscope_data_a.append(0.0)
-            self._oscilloscope_data_b.append(0.0)
-    
-    def update(self, dt: float):
-        """Met à jour les données simulées"""
-        self.frame_count += 1
-        self.data.uptime_seconds += int(dt)
-        
-        mode = self.data.simulation_mode
-        
-        # Simulation normale avec variations réalistes
-        noise_a = random.gauss(0, 0.01)
-        noise_b = random.gauss(0, 0.01)
-        
-        # Rail A
-        if mode == SimulationMode.NORMAL:
-            self.data.rail_a.voltage_actual = self.data.rail_a.voltage_target + noise_a
-            self.data.rail_a.current_ma = 150 + random.gauss(0, 5)
-            self.data.rail_a.temperature_c = 35 + random.gauss(0, 1)
-            self.data.rail_a.ripple_uv = 5 + random.gauss(0, 1)
-        elif mode == SimulationMode.HOT:
-            self.data.rail_a.temperature_c = 90 + random.gauss(0, 2)
-            self.data.rail_a.otp_active = True
-        elif mode == SimulationMode.RIPPLE:
-            self.data.rail_a.ripple_uv = 100 + random.gauss(0, 20)
-        elif mode == SimulationMode.LOAD:
-            self.data.rail_a.current_ma = 600 + random.gauss(0, 20)
-            self.data.rail_a.ocp_active = True
-        elif mode == SimulationMode.LOW_V:
-            self.data.rail_a.voltage_actual = self.data.rail_a.voltage_target * 0.8
-        elif mode == SimulationMode.HIGH_V:
-            self.data.rail_a.voltage_actual = 17.0 + random.gauss(0, 0.2)
-            self.data.rail_a.ovp_active = True
-        
-        # Rail B (similaire)
-        self.data.rail_b.voltage_actual = self.data.rail_b.voltage_target + noise_b
-        self.data.rail_b.current_ma = 100 + random.gauss(0, 3)
-        self.data.rail_b.temperature_c = 32 + random.gauss(0, 1)
-        
-        # Calcul puissance et énergie
-        self.data.rail_a.power_w = (self.data.rail_a.voltage_actual * 
-                                     self.data.rail_a.current_ma / 1000)
-        self.data.rail_b.power_w = (self.data.rail_b.voltage_actual * 
-                                     self.data.rail_b.current_ma / 1000)
-        self.data.energy_wh += (self.data.rail_a.power_w + self.data.rail_b.power_w) * dt / 3600
-        
-        # Update oscilloscope data
-        self._oscilloscope_data_a.pop(0)
-        self._oscilloscope_data_a.append(self.data.rail_a.voltage_actual)
-        self._oscilloscope_data_b.pop(0)
-        self._oscilloscope_data_b.append(self.data.rail_b.voltage_actual)
-    
-    def get_oscilloscope_points(self, rail: str, width: int, height: int, 
-                                 x_offset: int, y_offset: int) -> List[Tuple[int, int]]:
-        """Retourne les points pour draw.lines() - Optimisation V92"""
-        data = self._oscilloscope_data_a if rail == 'A' else self._oscilloscope_data_b
-        target = self.data.rail_a.voltage_target if rail == 'A' else self.data.rail_b.voltage_target
-        
-        points = []
-        for i, v in enumerate(data[-width:]):
-            x = x_offset + i
-            # Normaliser autour de la cible
-            deviation = (v - target) * 50  # Amplifier la déviation
-            y = y_offset + height // 2 - int(deviation)
-            y = max(y_offset, min(y_offset + height, y))
-            points.append((x, y))
-        return points
-    
-    def get_all_problems(self) -> List[str]:
-        """Retourne la liste des problèmes - avec cache V92"""
-        if self.data._problems_cache_frame == self.frame_count:
-            return self.data._problems_cache
-        
-        problems = []
-        if self.data.rail_a.ovp_active:
-            problems.append("OVP Rail A")
-        if self.data.rail_a.ocp_active:
-            problems.append("OCP Rail A")
-        if self.data.rail_a.otp_active:
-            problems.append("OTP Rail A")
-        if self.data.rail_b.ovp_active:
-            problems.append("OVP Rail B")
-        if self.data.rail_b.ocp_active:
-            problems.append("OCP Rail B")
-        if self.data.rail_b.otp_active:
-            problems.append("OTP Rail B")
-        if self.data.rail_a.ripple_uv > 50:
-            problems.append("Ripple élevé A")
-        if self.data.rail_b.ripple_uv > 50:
-            problems.append("Ripple élevé B")
-        
-        self.data._problems_cache = problems
-        self.data._problems_cache_frame = self.frame_count
-        return problems
-    
-    def set_simulation_mode(self, mode: SimulationMode):
-        """Change le mode de simulation"""
-        # Reset des états
-        self.data.rail_a.ovp_active = False
-        self.data.rail_a.ocp_active = False
-        self.data.rail_a.otp_active = False
-        self.data.rail_b.ovp_active = False
-        self.data.rail_b.ocp_active = False
-        self.data.rail_b.otp_active = False
-        self.data.simulation_mode = mode
+AUDIO_SAMPLE_RATE = 44100
+AUDIO_BLOCK = 512                          # Trames par callback (~12 ms)
+AUDIO_LATENCY_SAMPLES = 2 * SYNTH_BLOCK    # Retard du lecteur dans l'anneau (échantillons synthé)
+AUDIO_FULL_SCALE_UV = 20.0                 # µV rendus à pleine échelle
+MIXER_CHUNK = 2048                         # Trames par Sound en repli pygame.mixer
+
+
+class AudioSonifier:
+    """Rend audibles ripple et bruit des rails (rail A à gauche, B à droite)
+    
+    Avec sounddevice, un callback PortAudio tire les échantillons; en repli
+    pygame.mixer, pump() met des Sound en file depuis la boucle principale.
+    Le lecteur suit l'anneau du synthétiseur à sa propre position (ré-échantillonnage
+    linéaire) sans verrou: seul le compteur `ring.written` est partagé.
+    """
+    
+    def __init__(self, ring: SampleRing, source_rate: int = SYNTH_SAMPLE_RATE):
+        self.ring = ring
+        self.source_rate = source_rate
+        self.volume = 0.5
+        self.engine: Optional[str] = None
+        self.active = False
+        self.underruns = 0
+        self.overruns = 0
+        self.position = 0.0
+        self._stream = None
+        self._channel = None
+        self._primed = False
+        self._set_rate(AUDIO_SAMPLE_RATE)
+    
+    def _set_rate(self, rate: int):
+        self.rate = rate
+        self.step = self.source_rate / rate
+        self._alloc(max(AUDIO_BLOCK, MIXER_CHUNK))
+    
+    def _alloc(self, frames: int):
+        # Position de départ fractionnaire + échantillon suivant pour l'interpolation
+        self._ramp = np.arange(frames) * self.step
+        self._src = np.empty((self.ring.buffer.shape[0], int(frames * self.step) + 3))
+    
+    def _resync(self):
+        self.position = float(max(0, self.ring.written - AUDIO_LATENCY_SAMPLES))
+    
+    def render(self, frames: int) -> np.ndarray:
+        """Prochaines trames audio (frames, voies) en float32 dans [-1, 1]"""
+        written = self.ring.written
+        if written - self.position > self.ring.capacity - SYNTH_BLOCK:
+            # L'écrivain a rattrapé le lecteur (callback en retard)
+            self.overruns += 1
+            self._resync()
+        if frames > len(self._ramp):
+            self._alloc(frames)
+        start = int(self.position)
+        t = self._ramp[:frames] + (self.position - start)
+        n = int(t[-1]) + 2
+        if start + n > written:
+            # Synthé en retard: silence et on reprend avec la marge de latence
+            self.underruns += 1
+            self._resync()
+            return np.zeros((frames, self._src.shape[0]), dtype=np.float32)
+        
+        src = self.ring.read(start, self._src[:, :n])
+        idx = t.astype(int)
+        frac = t - idx
+        out = src[:, idx] + (src[:, idx + 1] - src[:, idx]) * frac
+        self.position += frames * self.step
+        out *= self.volume / AUDIO_FULL_SCALE_UV
+        np.clip(out, -1.0, 1.0, out=out)
+        return out.T.astype(np.float32)
+    
+    def _callback(self, outdata, frames, time_info, status):
+        """Callback PortAudio (thread audio)"""
+        if status.output_underflow:
+            self.underruns += 1
+        outdata[:] = self.render(frames)
+    
+    def start(self) -> bool:
+        """Démarre le moteur préféré, repli pygame.mixer sinon"""
+        if self.active:
+            return True
+        self.underruns = self.overruns = 0
+        self._resync()
+        if probe_audio_engine() == "sounddevice":
+            try:
+                self._set_rate(AUDIO_SAMPLE_RATE)
+                self._stream = sd.OutputStream(
+                    samplerate=AUDIO_SAMPLE_RATE, blocksize=AUDIO_BLOCK,
+                    channels=self.ring.buffer.shape[0], dtype="float32",
+                    latency="low", callback=self._callback)
+                self._stream.start()
+                self.engine = "sounddevice"
+                self.active = True
+                return True
+            except Exception:
+                self._stream = None
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=AUDIO_SAMPLE_RATE, size=-16, channels=2)
+            self._set_rate(pygame.mixer.get_init()[0])
+            self._channel = pygame.mixer.Channel(0)
+            self._primed = False
+            self.engine = "pygame"
+            self.active = True
+        except pygame.error:
+            self.engine = None
+        return self.active
+    
+    def stop(self):
+        """Arrête le flux audio"""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        if self._channel is not None:
+            self._channel.stop()
+            self._channel = None
+        self.active = False
+    
+    def toggle(self) -> bool:
+        if self.active:
+            self.stop()
+            return False
+        return self.start()
+    
+    def pump(self):
+        """Alimente la file pygame.mixer (sans effet avec sounddevice)"""
+        if not self.active or self._channel is None:
+            return
+        if not self._channel.get_busy():
+            if self._primed:
+                # File vidée entre deux frames: trou audible
+                self.underruns += 1
+            self._channel.play(self._make_sound())
+            self._primed = True
+        if self._channel.get_queue() is None:
+            self._channel.queue(self._make_sound())
+    
+    def _make_sound(self) -> pygame.mixer.Sound:
+        samples = (self.render(MIXER_CHUNK) * 32767).astype(np.int16)
+        if pygame.mixer.get_init()[2] == 1:
+            samples = samples.mean(axis=1).astype(np.int16)
+        return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
 
 
 # =============================================================================
 # LAYOUTS CENTRALISÉS V92
 # =============================================================================
+# Coordonnées de référence 800x480 (écran ESP32-8048S050C), mises à l'échelle
+# de l'écran réel par LayoutEngine. Convention des clés: "x", "*_x" et
+# "*width" suivent la largeur; "y", "*_y", "*height" et "*spacing" la
+# hauteur; un dict {x, y, width, height} devient un pygame.Rect. Les autres
+# valeurs (nombres d'éléments...) sont recopiées telles quelles.
+
+# Layout commun: barre de navigation, écrans boot et purist
+APP_LAYOUT = {
+    "nav_height": 35,
+    "nav_x": 20,
+    "nav_gap_x": 20,
+    "nav_text_offset_y": 10,
+    "nav_reserve_width": 160,
+    "margin_x": 10,
+    "boot_title_y": 150,
+    "boot_subtitle_y": 230,
+    "boot_version_y": 280,
+    "boot_loading_y": 350,
+    "boot_help_y": 420,
+    "purist_offsets_y": (-20, 10),
+    "tile_label_offset_y": 16,
+}
 
 # Layout page ÉCOUTE
 ECOUTE_LAYOUT = {
     "title_y": 10,
     "gauge_a": {"x": 50, "y": 60, "width": 300, "height": 180},
     "gauge_b": {"x": 450, "y": 60, "width": 300, "height": 180},
-    "lcd_y": 260,
-    "lcd_height": 95,
+    "label_offset_y": 25,
+    "lcd": {"x": 50, "y": 260, "width": 700, "height": 95},
+    "trace_a_x": 70,
+    "trace_b_x": 430,
+    "trace_y": 268,
+    "trace_width": 300,
+    "trace_height": 80,
+    "status_x": 50,
     "status_y": 380,
 }
 
@@ -527,6 +441,10 @@ DETAILS_LAYOUT = {
     "rail_a_x": 20,
     "rail_b_x": 410,
     "metrics_y": 50,
+    "header_height": 30,
+    "value_offset_x": 120,
+    "bar_offset_x": 220,
+    "bar_width": 150,
     "bar_height": 20,
     "spacing": 35,
 }
@@ -534,7 +452,15 @@ DETAILS_LAYOUT = {
 # Layout page SANTÉ
 HEALTH_LAYOUT = {
     "title_y": 10,
+    "status_x": 50,
     "status_y": 50,
+    "problems_offset_y": 40,
+    "item_x": 70,
+    "eta_x": 260,
+    "warning_x": 430,
+    "warning_item_x": 450,
+    "header_height": 30,
+    "line_height": 25,
     "protection_y": 150,
     "temp_y": 280,
 }
@@ -543,18 +469,200 @@ HEALTH_LAYOUT = {
 SESSION_LAYOUT = {
     "title_y": 10,
     "timer_y": 80,
+    "timer_label_offset_y": 60,
     "energy_y": 180,
+    "energy_label_offset_y": 40,
+    "stats_x": 50,
     "stats_y": 280,
+    "line_height": 25,
 }
 
 # Layout page CONFIG
 CONFIG_LAYOUT = {
     "title_y": 10,
+    "options_x": 50,
     "options_y": 60,
     "option_height": 45,
+    "sim_buttons_x": 50,
     "sim_buttons_y": 350,
+    "button_pitch_x": 120,
+    "button_width": 100,
+    "button_height": 40,
+    "label_offset_y": 35,
+    "target_x": 650,
+    "target_offset_y": 45,
+    "target_width": 100,
+    "target_height": 35,
+}
+
+# Layout page SPECTRE
+SPECTRUM_LAYOUT = {
+    "title_y": 10,
+    "plot": {"x": 80, "y": 55, "width": 680, "height": 280},
+    "legend_y": 370,
+    "legend_line_height": 25,
+    "legend_pitch_x": 340,
+}
+
+# Layout page RÉGLAGE
+SETTING_LAYOUT = {
+    "title_y": 10,
+    "rails_y": (60, 215),
+    "slider_x": 80,
+    "slider_offset_y": 40,
+    "slider_width": 640,
+    "slider_height": 36,
+    "info_offset_y": 30,
+    "help_y": 400,
+}
+
+# Layout page QUALITÉ
+QUALITY_LAYOUT = {
+    "title_y": 10,
+    "score_x": 60,
+    "score_y": 60,
+    "label_offset_y": 70,
+    "indicators_x": 420,
+    "indicators_offset_y": 10,
+    "bar_offset_y": 30,
+    "bar_width": 300,
+    "bar_height": 16,
+    "temp_offset_y": 65,
+    "rails_y": 215,
+    "rail_a_x": 40,
+    "rail_b_x": 420,
+    "value_offset_x": 130,
+    "row_height": 30,
+}
+
+# Layout page TENDANCES
+TREND_LAYOUT = {
+    "title_y": 10,
+    "plot": {"x": 80, "y": 55, "width": 680, "height": 290},
+    "legend_y": 375,
+    "legend_line_height": 25,
+    "legend_pitch_x": 340,
+    "help_offset_y": 50,
+}
+
+# Layout page HISTORIQUE
+HISTORY_LAYOUT = {
+    "title_y": 10,
+    "rail_button": {"x": 40, "y": 50, "width": 170, "height": 32},
+    "fault_button": {"x": 220, "y": 50, "width": 200, "height": 32},
+    "count_right_x": 760,
+    "count_y": 58,
+    "header_y": 95,
+    "list": {"x": 40, "y": 118, "width": 720, "height": 275},
+    "row_height": 25,
+    "column_x": (8, 200, 290, 400, 470, 580),
+    "scrollbar_width": 8,
+    "help_y": 420,
+}
+
+# Tables résolues par LayoutEngine, par nom
+PAGE_LAYOUTS = {
+    "app": APP_LAYOUT,
+    "ecoute": ECOUTE_LAYOUT,
+    "details": DETAILS_LAYOUT,
+    "health": HEALTH_LAYOUT,
+    "session": SESSION_LAYOUT,
+    "config": CONFIG_LAYOUT,
+    "spectrum": SPECTRUM_LAYOUT,
+    "setting": SETTING_LAYOUT,
+    "quality": QUALITY_LAYOUT,
+    "trend": TREND_LAYOUT,
+    "history": HISTORY_LAYOUT,
 }
 
+# Tailles des polices à la résolution de référence
+FONT_SIZES = {"small": 20, "medium": 28, "large": 36, "xlarge": 72}
+
+
+class LayoutEngine:
+    """Géométrie des pages résolue une fois par taille d'écran et langue
+    
+    Les layouts de référence sont mis à l'échelle en tables d'entiers et de
+    pygame.Rect à chaque changement de taille; les pages lisent ces tables
+    sans rien recalculer. Les titres, seuls textes centrés qui ne dépendent
+    que de la langue, sont rendus et placés une fois par taille et langue.
+    """
+    
+    def __init__(self, layouts: Dict[str, Dict[str, Any]],
+                 reference: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.layouts = layouts
+        self.reference = reference
+        self.size: Optional[Tuple[int, int]] = None
+        self.language: Optional[Language] = None
+        self.scale_x = self.scale_y = self.scale = 1.0
+        self.resolutions = 0
+        self._tables: Dict[str, Dict[str, Any]] = {}
+        self._titles: Dict[Tuple[str, int], Tuple[pygame.Surface, Tuple[int, int]]] = {}
+    
+    @property
+    def width(self) -> int:
+        return self.size[0]
+    
+    @property
+    def height(self) -> int:
+        return self.size[1]
+    
+    @property
+    def center_x(self) -> int:
+        return self.size[0] // 2
+    
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        return self._tables[name]
+    
+    def resolve(self, size: Tuple[int, int], language: Language) -> bool:
+        """Recalcule les tables si la taille ou la langue a changé"""
+        size = tuple(size)
+        if size == self.size and language == self.language:
+            return False
+        if size != self.size:
+            self.size = size
+            self.scale_x = size[0] / self.reference[0]
+            self.scale_y = size[1] / self.reference[1]
+            self.scale = min(self.scale_x, self.scale_y)
+            self._tables = {name: {key: self._scale(key, value) for key, value in layout.items()}
+                            for name, layout in self.layouts.items()}
+        self.language = language
+        self._titles.clear()
+        self.resolutions += 1
+        return True
+    
+    def _scale(self, key: str, value: Any) -> Any:
+        if isinstance(value, dict):
+            return pygame.Rect(self.x(value["x"]), self.y(value["y"]),
+                               self.x(value["width"]), self.y(value["height"]))
+        if key == "x" or key.endswith(("_x", "width")):
+            axis = self.x
+        elif key == "y" or key.endswith(("_y", "height", "spacing")):
+            axis = self.y
+        else:
+            return value
+        return tuple(axis(v) for v in value) if isinstance(value, tuple) else axis(value)
+    
+    def x(self, value: float) -> int:
+        """Abscisse ou largeur de référence en pixels écran"""
+        return int(round(value * self.scale_x))
+    
+    def y(self, value: float) -> int:
+        """Ordonnée ou hauteur de référence en pixels écran"""
+        return int(round(value * self.scale_y))
+    
+    def font_size(self, name: str) -> int:
+        return max(8, int(round(FONT_SIZES[name] * self.scale)))
+    
+    def title(self, key: str, font: pygame.font.Font,
+              y: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Titre de page traduit, rendu et centré une fois par taille et langue"""
+        cached = self._titles.get((key, y))
+        if cached is None:
+            surf = font.render(T(key), True, Colors.AMBER)
+            cached = self._titles[(key, y)] = (surf, (self.center_x - surf.get_width() // 2, y))
+        return cached
+
 
 # =============================================================================
 # COMPOSANTS UI
@@ -628,8 +736,11 @@ class VUMeter:
 class NixieBar:
     """Barre de progression style Nixie tube"""
     
-    @staticmethod
-    def draw(surface: pygame.Surface, x: int, y: int, width: int, height: int,
+    # Teintes du dégradé par (couleur, nombre de segments), calculées une fois
+    _gradients: Dict[Tuple[Tuple[int, int, int], int], List[Tuple[int, ...]]] = {}
+    
+    @classmethod
+    def draw(cls, surface: pygame.Surface, x: int, y: int, width: int, height: int,
              value: float, max_value: float, color: Tuple[int, int, int] = Colors.AMBER):
         """Dessine une barre Nixie"""
         # Fond
@@ -643,9 +754,12 @@ class NixieBar:
         if fill_width > 0:
             # Dégradé simulé avec segments
             segments = fill_width // 3
-            for i in range(segments):
-                intensity = 0.7 + 0.3 * (i / max(1, segments - 1))
-                seg_color = tuple(int(c * intensity) for c in color)
+            gradient = cls._gradients.get((color, segments))
+            if gradient is None:
+                gradient = cls._gradients[(color, segments)] = [
+                    tuple(int(c * (0.7 + 0.3 * (i / max(1, segments - 1)))) for c in color)
+                    for i in range(segments)]
+            for i, seg_color in enumerate(gradient):
                 pygame.draw.rect(surface, seg_color,
                                (x + 2 + i * 3, y + 2, 2, height - 4))
 
@@ -693,7 +807,7 @@ class Button:
         pygame.draw.rect(surface, color, self.rect)
         pygame.draw.rect(surface, Colors.AMBER, self.rect, 2)
         
-        text_surf = font.render(self.text, True, text_color)
+        text_surf = TextCache.get(font, self.text, text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
 
@@ -705,9 +819,20 @@ class Button:
 class BasePage:
     """Classe de base pour les pages"""
     
+    LAYOUT = ""                    # Table de LayoutEngine propre à la page
+    
     def __init__(self, app: 'LPSDuoProApp'):
         self.app = app
     
+    @property
+    def layout(self) -> Dict[str, Any]:
+        """Géométrie de la page à la taille d'écran courante"""
+        return self.app.layout[self.LAYOUT]
+    
+    def relayout(self):
+        """Taille d'écran ou langue changée: géométrie précalculée à refaire"""
+        pass
+    
     def update(self, dt: float):
         """Mise à jour logique"""
         pass
@@ -719,18 +844,51 @@ class BasePage:
     def handle_event(self, event: pygame.event.Event):
         """Gestion des événements"""
         pass
+    
+    def display_state(self) -> Optional[tuple]:
+        """Valeurs affichées à leur résolution, None si la page est animée"""
+        return None
+    
+    def handle_gesture(self, gesture: Gesture) -> bool:
+        """Geste tactile, True si consommé par la page"""
+        return False
+    
+    def _label(self, text: str, color: Tuple[int, int, int],
+               font: Optional[pygame.font.Font] = None) -> pygame.Surface:
+        """Texte rendu une fois par valeur (petite police par défaut), partagé via TextCache"""
+        return TextCache.get(font or self.app.font_small, text, color)
+    
+    def _draw_title(self, surface: pygame.Surface, key: str):
+        """Titre centré, résolu une fois par taille et langue"""
+        surface.blit(*self.app.layout.title(key, self.app.font_large, self.layout["title_y"]))
 
 
 class PageEcoute(BasePage):
     """Page ÉCOUTE - Jauges VU-mètre principales"""
     
+    LAYOUT = "ecoute"
+    
     def __init__(self, app: 'LPSDuoProApp'):
         super().__init__(app)
-        layout = ECOUTE_LAYOUT
-        self.vu_a = VUMeter(layout["gauge_a"]["x"], layout["gauge_a"]["y"],
-                           layout["gauge_a"]["width"], layout["gauge_a"]["height"])
-        self.vu_b = VUMeter(layout["gauge_b"]["x"], layout["gauge_b"]["y"],
-                           layout["gauge_b"]["width"], layout["gauge_b"]["height"])
+        self.vu_a = VUMeter(*self.layout["gauge_a"])
+        self.vu_b = VUMeter(*self.layout["gauge_b"])
+        self.show_spectrum = False
+    
+    def relayout(self):
+        super().relayout()
+        for vu, key in ((self.vu_a, "gauge_a"), (self.vu_b, "gauge_b")):
+            vu.x, vu.y, vu.width, vu.height = self.layout[key]
+    
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_s:
+            self.show_spectrum = not self.show_spectrum
+    
+    def handle_gesture(self, gesture: Gesture) -> bool:
+        # Appui long: équivalent tactile de la touche S
+        if gesture.kind == "long_press":
+            self.show_spectrum = not self.show_spectrum
+            return True
+        return False
     
     def update(self, dt: float):
         data = self.app.simulator.data
@@ -738,45 +896,46 @@ class PageEcoute(BasePage):
         self.vu_b.update(data.rail_b.voltage_actual, data.rail_b.voltage_target)
     
     def draw(self, surface: pygame.Surface):
-        layout = ECOUTE_LAYOUT
+        layout = self.layout
         data = self.app.simulator.data
         
         # Titre
-        title = T("page_listen")
-        title_surf = self.app.font_large.render(title, True, Colors.AMBER)
-        surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 
-                                  layout["title_y"]))
+        self._draw_title(surface, "page_listen")
         
         # Labels rails
         label_a = f"{T('rail_a')}: {data.rail_a.voltage_actual:.2f}V"
         label_b = f"{T('rail_b')}: {data.rail_b.voltage_actual:.2f}V"
         
-        surf_a = self.app.font_medium.render(label_a, True, Colors.GREEN)
-        surf_b = self.app.font_medium.render(label_b, True, Colors.CYAN)
+        surf_a = self._label(label_a, Colors.GREEN, self.app.font_medium)
+        surf_b = self._label(label_b, Colors.CYAN, self.app.font_medium)
         
-        surface.blit(surf_a, (layout["gauge_a"]["x"], layout["gauge_a"]["y"] - 25))
-        surface.blit(surf_b, (layout["gauge_b"]["x"], layout["gauge_b"]["y"] - 25))
+        surface.blit(surf_a, (layout["gauge_a"].x, layout["gauge_a"].y - layout["label_offset_y"]))
+        surface.blit(surf_b, (layout["gauge_b"].x, layout["gauge_b"].y - layout["label_offset_y"]))
         
         # VU-mètres
         self.vu_a.draw(surface)
         self.vu_b.draw(surface)
         
         # Zone LCD avec oscilloscope - Optimisation V92 avec draw.lines()
-        lcd_rect = pygame.Rect(50, layout["lcd_y"], 700, layout["lcd_height"])
+        lcd_rect = layout["lcd"]
         pygame.draw.rect(surface, Colors.LCD_BG, lcd_rect)
         pygame.draw.rect(surface, Colors.LCD_BORDER, lcd_rect, 2)
         
-        # Oscilloscope Rail A (gauche)
-        points_a = self.app.simulator.get_oscilloscope_points(
-            'A', 300, 80, 70, layout["lcd_y"] + 8)
-        if len(points_a) > 1:
-            pygame.draw.lines(surface, Colors.GREEN, False, points_a, 1)
-        
-        # Oscilloscope Rail B (droite)  
-        points_b = self.app.simulator.get_oscilloscope_points(
-            'B', 300, 80, 430, layout["lcd_y"] + 8)
-        if len(points_b) > 1:
-            pygame.draw.lines(surface, Colors.CYAN, False, points_b, 1)
+        # Oscilloscope (bruit + ripple synthétisés) ou spectre, touche S
+        simulator = self.app.simulator
+        width, height, y = layout["trace_width"], layout["trace_height"], layout["trace_y"]
+        traces = (('A', layout["trace_a_x"], Colors.GREEN), ('B', layout["trace_b_x"], Colors.CYAN))
+        for rail, x, color in traces:
+            if self.show_spectrum:
+                points = simulator.get_spectrum_points(rail, width, height, x, y)
+                scale_text = "dBµV"
+            else:
+                points = simulator.get_oscilloscope_points(rail, width, height, x, y)
+                scale_text = f"±{simulator.get_scope_scale(rail):g}µV"
+            if len(points) > 1:
+                pygame.draw.lines(surface, color, False, points, 1)
+            scale_surf = self._label(scale_text, Colors.LIGHT_GRAY)
+            surface.blit(scale_surf, (x + width - scale_surf.get_width(), lcd_rect.y + 4))
         
         # Status bar
         problems = self.app.simulator.get_all_problems()
@@ -787,22 +946,30 @@ class PageEcoute(BasePage):
             status = "OK - " + T("active")
             status_color = Colors.GREEN
         
-        status_surf = self.app.font_small.render(status, True, status_color)
-        surface.blit(status_surf, (50, layout["status_y"]))
+        status_surf = self._label(status, status_color)
+        surface.blit(status_surf, (layout["status_x"], layout["status_y"]))
 
 
 class PageDetails(BasePage):
     """Page DÉTAILS - Métriques détaillées avec Nixie bars"""
     
+    LAYOUT = "details"
+    # (clé de traduction, attribut RailData, format, unité, pleine échelle de la barre)
+    METRICS = (
+        ("voltage", "voltage_actual", ".2f", "V", 15.0),
+        ("current", "current_ma", ".0f", "mA", 500.0),
+        ("power", "power_w", ".2f", "W", 5.0),
+        ("temperature", "temperature_c", ".1f", "°C", 100.0),
+        ("ripple", "ripple_uv", ".1f", "µV", 50.0),
+        ("headroom", "headroom_v", ".1f", "V", 5.0),
+    )
+    
     def draw(self, surface: pygame.Surface):
-        layout = DETAILS_LAYOUT
+        layout = self.layout
         data = self.app.simulator.data
         
         # Titre
-        title = T("page_details")
-        title_surf = self.app.font_large.render(title, True, Colors.AMBER)
-        surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2,
-                                  layout["title_y"]))
+        self._draw_title(surface, "page_details")
         
         # Rail A
         self._draw_rail_details(surface, data.rail_a, T("rail_a"), 
@@ -812,36 +979,33 @@ class PageDetails(BasePage):
         self._draw_rail_details(surface, data.rail_b, T("rail_b"),
                                layout["rail_b_x"], layout["metrics_y"], Colors.CYAN)
     
+    def display_state(self) -> Optional[tuple]:
+        data = self.app.simulator.data
+        return tuple(tuple(format(getattr(rail, attr), fmt) for _, attr, fmt, _, _ in self.METRICS)
+                     for rail in (data.rail_a, data.rail_b))
+    
     def _draw_rail_details(self, surface: pygame.Surface, rail: RailData,
                           title: str, x: int, y: int, color: Tuple[int, int, int]):
-        layout = DETAILS_LAYOUT
+        layout = self.layout
         
         # Titre rail
-        title_surf = self.app.font_medium.render(title, True, color)
+        title_surf = self._label(title, color, self.app.font_medium)
         surface.blit(title_surf, (x, y))
-        y += 30
-        
-        metrics = [
-            (T("voltage"), f"{rail.voltage_actual:.2f}", "V", rail.voltage_actual, 15.0),
-            (T("current"), f"{rail.current_ma:.0f}", "mA", rail.current_ma, 500.0),
-            (T("power"), f"{rail.power_w:.2f}", "W", rail.power_w, 5.0),
-            (T("temperature"), f"{rail.temperature_c:.1f}", "°C", rail.temperature_c, 100.0),
-            (T("ripple"), f"{rail.ripple_uv:.1f}", "µV", rail.ripple_uv, 50.0),
-            (T("headroom"), f"{rail.headroom_v:.1f}", "V", rail.headroom_v, 5.0),
-        ]
+        y += layout["header_height"]
         
-        for label, value, unit, current, max_val in metrics:
+        for key, attr, fmt, unit, max_val in self.METRICS:
+            current = getattr(rail, attr)
             # Label
-            label_surf = self.app.font_small.render(f"{label}:", True, Colors.LIGHT_GRAY)
+            label_surf = self._label(f"{T(key)}:", Colors.LIGHT_GRAY)
             surface.blit(label_surf, (x, y))
             
             # Valeur
-            val_surf = self.app.font_small.render(f"{value} {unit}", True, Colors.WHITE)
-            surface.blit(val_surf, (x + 120, y))
+            val_surf = self._label(f"{current:{fmt}} {unit}", Colors.WHITE)
+            surface.blit(val_surf, (x + layout["value_offset_x"], y))
             
             # Barre Nixie
-            NixieBar.draw(surface, x + 220, y + 2, 150, layout["bar_height"] - 4,
-                         current, max_val, color)
+            NixieBar.draw(surface, x + layout["bar_offset_x"], y + 2, layout["bar_width"],
+                         layout["bar_height"] - 4, current, max_val, color)
             
             y += layout["spacing"]
 
@@ -849,61 +1013,92 @@ class PageDetails(BasePage):
 class PageHealth(BasePage):
     """Page SANTÉ - Statut système et protections"""
     
+    LAYOUT = "health"
+    
+    def display_state(self) -> Optional[tuple]:
+        data = self.app.simulator.data
+        rails = (data.rail_a, data.rail_b)
+        return (tuple(self.app.simulator.get_all_problems()),
+                tuple((rail, metric, f"{deviation:+.1f}")
+                      for rail, metric, deviation in self.app.simulator.anomalies()),
+                tuple((r.ovp_active, r.ocp_active, r.otp_active, r.backfeed_active,
+                       f"{r.temperature_c:.1f}")
+                      for r in rails),
+                tuple(None if eta is None else int(eta)
+                      for eta in self.app.simulator.get_otp_eta()))
+    
     def draw(self, surface: pygame.Surface):
-        layout = HEALTH_LAYOUT
+        layout = self.layout
         data = self.app.simulator.data
+        line = layout["line_height"]
         
         # Titre
-        title = T("page_health")
-        title_surf = self.app.font_large.render(title, True, Colors.AMBER)
-        surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2,
-                                  layout["title_y"]))
+        self._draw_title(surface, "page_health")
         
-        # Statut global
+        # Statut global: fautes, sinon alertes précoces, sinon OK
         problems = self.app.simulator.get_all_problems()
+        anomalies = self.app.simulator.anomalies()
         if problems:
             status = T("warning")
             status_color = Colors.RED
+        elif anomalies:
+            status = T("early_warning")
+            status_color = Colors.ORANGE
         else:
             status = T("ok")
             status_color = Colors.GREEN
         
-        status_surf = self.app.font_large.render(f"SYSTÈME: {status}", True, status_color)
-        surface.blit(status_surf, (50, layout["status_y"]))
+        status_surf = self._label(f"SYSTÈME: {status}", status_color, self.app.font_large)
+        surface.blit(status_surf, (layout["status_x"], layout["status_y"]))
         
         # Liste des problèmes
-        y = layout["status_y"] + 40
+        y = layout["status_y"] + layout["problems_offset_y"]
         if problems:
             for prob in problems:
-                prob_surf = self.app.font_small.render(f"⚠ {prob}", True, Colors.RED)
-                surface.blit(prob_surf, (70, y))
-                y += 25
+                prob_surf = self._label(f"⚠ {prob}", Colors.RED)
+                surface.blit(prob_surf, (layout["item_x"], y))
+                y += line
+        
+        # Alertes précoces: dérives détectées avant le déclenchement d'une protection
+        y = layout["protection_y"]
+        warn_title = self._label(f"{T('early_warnings')}:", Colors.AMBER, self.app.font_medium)
+        surface.blit(warn_title, (layout["warning_x"], y))
+        y += layout["header_height"]
+        if not anomalies:
+            surface.blit(self._label(T("ok"), Colors.GREEN),
+                         (layout["warning_item_x"], y))
+        for rail, metric, deviation in anomalies:
+            text = f"{T('rail_' + rail.lower())} {T(metric)} {deviation:+.1f}σ"
+            surface.blit(self._label(text, Colors.ORANGE),
+                         (layout["warning_item_x"], y))
+            y += line
         
         # Protections
         y = layout["protection_y"]
-        prot_title = self.app.font_medium.render("PROTECTIONS:", True, Colors.AMBER)
-        surface.blit(prot_title, (50, y))
-        y += 30
+        prot_title = self._label("PROTECTIONS:", Colors.AMBER, self.app.font_medium)
+        surface.blit(prot_title, (layout["status_x"], y))
+        y += layout["header_height"]
         
         protections = [
             (T("ovp"), data.rail_a.ovp_active or data.rail_b.ovp_active),
             (T("ocp"), data.rail_a.ocp_active or data.rail_b.ocp_active),
             (T("otp"), data.rail_a.otp_active or data.rail_b.otp_active),
+            (T("backfeed"), data.rail_a.backfeed_active or data.rail_b.backfeed_active),
         ]
         
         for name, active in protections:
             color = Colors.RED if active else Colors.GREEN
             status_text = T("active") if active else T("ok")
             text = f"{name}: {status_text}"
-            text_surf = self.app.font_small.render(text, True, color)
-            surface.blit(text_surf, (70, y))
-            y += 25
+            text_surf = self._label(text, color)
+            surface.blit(text_surf, (layout["item_x"], y))
+            y += line
         
         # Températures
         y = layout["temp_y"]
-        temp_title = self.app.font_medium.render(f"{T('temperature')}:", True, Colors.AMBER)
-        surface.blit(temp_title, (50, y))
-        y += 30
+        temp_title = self._label(f"{T('temperature')}:", Colors.AMBER, self.app.font_medium)
+        surface.blit(temp_title, (layout["status_x"], y))
+        y += layout["header_height"]
         
         temp_a = f"{T('rail_a')}: {data.rail_a.temperature_c:.1f}°C"
         temp_b = f"{T('rail_b')}: {data.rail_b.temperature_c:.1f}°C"
@@ -911,49 +1106,62 @@ class PageHealth(BasePage):
         color_a = Colors.RED if data.rail_a.temperature_c > 70 else Colors.GREEN
         color_b = Colors.RED if data.rail_b.temperature_c > 70 else Colors.GREEN
         
-        surface.blit(self.app.font_small.render(temp_a, True, color_a), (70, y))
-        surface.blit(self.app.font_small.render(temp_b, True, color_b), (70, y + 25))
+        surface.blit(self._label(temp_a, color_a), (layout["item_x"], y))
+        surface.blit(self._label(temp_b, color_b), (layout["item_x"], y + line))
+        
+        # Prédiction OTP (réseau thermique, puissances actuelles figées)
+        for i, eta in enumerate(self.app.simulator.get_otp_eta()):
+            if eta is None or eta <= 0:
+                continue
+            minutes, seconds = divmod(int(eta), 60)
+            eta_text = f"{T('otp_eta')} {minutes}:{seconds:02d}"
+            surface.blit(self._label(eta_text, Colors.ORANGE),
+                         (layout["eta_x"], y + line * i))
 
 
 class PageSession(BasePage):
     """Page SESSION - Timer et énergie"""
     
+    LAYOUT = "session"
+    
+    def display_state(self) -> Optional[tuple]:
+        data = self.app.simulator.data
+        persistence = self.app.simulator.persistence
+        return (data.uptime_seconds, f"{data.energy_wh:.2f}",
+                f"{data.rail_a.power_w:.2f}", f"{data.rail_b.power_w:.2f}",
+                persistence.saves if persistence is not None else None)
+    
     def draw(self, surface: pygame.Surface):
-        layout = SESSION_LAYOUT
+        layout = self.layout
         data = self.app.simulator.data
+        center_x = self.app.layout.center_x
         
         # Titre
-        title = T("page_session")
-        title_surf = self.app.font_large.render(title, True, Colors.AMBER)
-        surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2,
-                                  layout["title_y"]))
+        self._draw_title(surface, "page_session")
         
-        # Timer
-        uptime = timedelta(seconds=data.uptime_seconds)
-        hours = uptime.seconds // 3600
-        minutes = (uptime.seconds % 3600) // 60
-        seconds = uptime.seconds % 60
+        # Timer (uptime cumulé restauré de l'EEPROM: heures au-delà de 24)
+        hours = data.uptime_seconds // 3600
+        minutes = (data.uptime_seconds % 3600) // 60
+        seconds = data.uptime_seconds % 60
         
         timer_text = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        timer_surf = self.app.font_xlarge.render(timer_text, True, Colors.GREEN)
-        surface.blit(timer_surf, (SCREEN_WIDTH // 2 - timer_surf.get_width() // 2,
-                                  layout["timer_y"]))
+        timer_surf = self._label(timer_text, Colors.GREEN, self.app.font_xlarge)
+        surface.blit(timer_surf, (center_x - timer_surf.get_width() // 2, layout["timer_y"]))
         
         uptime_label = T("uptime")
-        label_surf = self.app.font_medium.render(uptime_label, True, Colors.LIGHT_GRAY)
-        surface.blit(label_surf, (SCREEN_WIDTH // 2 - label_surf.get_width() // 2,
-                                  layout["timer_y"] + 60))
+        label_surf = self._label(uptime_label, Colors.LIGHT_GRAY, self.app.font_medium)
+        surface.blit(label_surf, (center_x - label_surf.get_width() // 2,
+                                  layout["timer_y"] + layout["timer_label_offset_y"]))
         
         # Énergie
         energy_text = f"{data.energy_wh:.2f} Wh"
-        energy_surf = self.app.font_large.render(energy_text, True, Colors.CYAN)
-        surface.blit(energy_surf, (SCREEN_WIDTH // 2 - energy_surf.get_width() // 2,
-                                   layout["energy_y"]))
+        energy_surf = self._label(energy_text, Colors.CYAN, self.app.font_large)
+        surface.blit(energy_surf, (center_x - energy_surf.get_width() // 2, layout["energy_y"]))
         
         energy_label = T("energy")
-        energy_label_surf = self.app.font_medium.render(energy_label, True, Colors.LIGHT_GRAY)
-        surface.blit(energy_label_surf, (SCREEN_WIDTH // 2 - energy_label_surf.get_width() // 2,
-                                         layout["energy_y"] + 40))
+        energy_label_surf = self._label(energy_label, Colors.LIGHT_GRAY, self.app.font_medium)
+        surface.blit(energy_label_surf, (center_x - energy_label_surf.get_width() // 2,
+                                         layout["energy_y"] + layout["energy_label_offset_y"]))
         
         # Stats
         y = layout["stats_y"]
@@ -962,17 +1170,27 @@ class PageSession(BasePage):
             (f"{T('power')} A", f"{data.rail_a.power_w:.2f} W"),
             (f"{T('power')} B", f"{data.rail_b.power_w:.2f} W"),
         ]
+        persistence = self.app.simulator.persistence
+        if persistence is not None:
+            report = persistence.report()
+            life = report["lifetime_hours"]
+            life_text = f"{life / 8760:.1f} {T('years')}" if math.isfinite(life) else "-"
+            stats.append(("EEPROM", f"{report['saves']} {T('eeprom_saves')} | "
+                                    f"{T('eeprom_wear')} {report['wear_pct']:.2f}% | "
+                                    f"{T('eeprom_life')} {life_text}"))
         
         for label, value in stats:
             text = f"{label}: {value}"
-            text_surf = self.app.font_small.render(text, True, Colors.LIGHT_GRAY)
-            surface.blit(text_surf, (50, y))
-            y += 25
+            text_surf = self._label(text, Colors.LIGHT_GRAY)
+            surface.blit(text_surf, (layout["stats_x"], y))
+            y += layout["line_height"]
 
 
 class PageConfig(BasePage):
     """Page CONFIG - Paramètres et simulations"""
     
+    LAYOUT = "config"
+    
     def __init__(self, app: 'LPSDuoProApp'):
         super().__init__(app)
         self.sim_modes = [
@@ -983,54 +1201,1402 @@ class PageConfig(BasePage):
             (SimulationMode.LOW_V, "sim_lo_v"),
             (SimulationMode.HIGH_V, "sim_hi_v"),
         ]
-        self.buttons: List[Button] = []
+        self.sim_targets = ["AB", "A", "B"]
+        self.sim_target = self.sim_targets[0]
+        self._create_buttons()
+    
+    def relayout(self):
+        super().relayout()
+        # Boutons refaits: nouvelle géométrie et libellés dans la langue courante
         self._create_buttons()
     
     def _create_buttons(self):
-        layout = CONFIG_LAYOUT
-        x = 50
+        layout = self.layout
+        self.buttons: List[Button] = []
+        x = layout["sim_buttons_x"]
         for mode, key in self.sim_modes:
-            btn = Button(x, layout["sim_buttons_y"], 100, 40, T(key),
-                        lambda m=mode: self.app.simulator.set_simulation_mode(m))
+            btn = Button(x, layout["sim_buttons_y"], layout["button_width"], layout["button_height"],
+                         T(key), lambda m=mode: self.app.simulator.set_simulation_mode(m, self.sim_target))
             self.buttons.append(btn)
-            x += 120
+            x += layout["button_pitch_x"]
+        
+        # Sélection du rail ciblé par les pannes (A+B, A, B)
+        self.target_button = Button(layout["target_x"], layout["sim_buttons_y"] - layout["target_offset_y"],
+                                    layout["target_width"], layout["target_height"],
+                                    self._target_label(), self._next_target)
+        self.buttons.append(self.target_button)
+        self.button_grid = ButtonGrid(self.buttons)
+    
+    def _target_label(self) -> str:
+        return "A+B" if self.sim_target == "AB" else self.sim_target
+    
+    def _next_target(self):
+        idx = self.sim_targets.index(self.sim_target)
+        self.sim_target = self.sim_targets[(idx + 1) % len(self.sim_targets)]
+        self.target_button.text = self._target_label()
     
     def handle_event(self, event: pygame.event.Event):
-        for btn in self.buttons:
-            btn.handle_event(event)
+        self.button_grid.handle_event(event)
+    
+    def display_state(self) -> Optional[tuple]:
+        data = self.app.simulator.data
+        return (data.rail_a.simulation_mode, data.rail_b.simulation_mode,
+                self.app.simulator.time_scale, self.sim_target)
     
     def draw(self, surface: pygame.Surface):
-        layout = CONFIG_LAYOUT
+        layout = self.layout
         
         # Titre
-        title = T("page_config")
-        title_surf = self.app.font_large.render(title, True, Colors.AMBER)
-        surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2,
-                                  layout["title_y"]))
+        self._draw_title(surface, "page_config")
         
         # Options
         y = layout["options_y"]
+        data = self.app.simulator.data
         options = [
             (T("language"), Translations.get_current_language().value),
             (T("brightness"), "80%"),
-            (T("simulation"), self.app.simulator.data.simulation_mode.name),
+            (T("simulation"), f"A={data.rail_a.simulation_mode.name}  "
+                              f"B={data.rail_b.simulation_mode.name}"),
+            (T("time_scale"), f"x{self.app.simulator.time_scale:g}"),
         ]
         
         for label, value in options:
             text = f"{label}: {value}"
-            text_surf = self.app.font_medium.render(text, True, Colors.WHITE)
-            surface.blit(text_surf, (50, y))
+            text_surf = self._label(text, Colors.WHITE, self.app.font_medium)
+            surface.blit(text_surf, (layout["options_x"], y))
             y += layout["option_height"]
         
         # Label simulation
-        sim_label = self.app.font_medium.render(T("simulation") + ":", True, Colors.AMBER)
-        surface.blit(sim_label, (50, layout["sim_buttons_y"] - 35))
+        label_y = layout["sim_buttons_y"] - layout["label_offset_y"]
+        sim_label = self._label(T("simulation") + ":", Colors.AMBER, self.app.font_medium)
+        surface.blit(sim_label, (layout["sim_buttons_x"], label_y))
+        
+        target_label = self._label(T("sim_target") + ":", Colors.LIGHT_GRAY)
+        surface.blit(target_label, (layout["target_x"] - target_label.get_width() - 10, label_y))
         
         # Boutons simulation
         for btn in self.buttons:
             btn.draw(surface, self.app.font_small)
 
 
+class PageSpectrum(BasePage):
+    """Page SPECTRE - Densité de bruit (Welch) comparée à la spec 0.46 µV RMS"""
+    
+    LAYOUT = "spectrum"
+    F_MIN = 10.0
+    DENSITY_RANGE = (1.0, 1e5)     # nV/√Hz, axe log
+    
+    def __init__(self, app: 'LPSDuoProApp'):
+        super().__init__(app)
+        synth = app.simulator.synth
+        self.welch = WelchSpectrum(synth.ring)
+        self.ripple_freqs = synth.ripple_freqs
+        self.noise_rms = np.zeros(len(app.simulator.RAILS))
+        self._buffers = BufferPool()                # Densités et tracés écran
+        
+        freqs = self.welch.freqs
+        self.f_max = float(freqs[-1])
+        # Raies affichées: fréquences croissantes, une tranche (vue sans copie)
+        self._bins = slice(int(np.searchsorted(freqs, self.F_MIN)), None)
+        lo, hi = self.DENSITY_RANGE
+        self._log_lo = math.log10(lo)
+        self._decades = math.log10(hi) - self._log_lo
+        self.relayout()
+        
+        # Spec README ramenée à une densité plate sur la bande simulée
+        self.spec_density = SPEC_NOISE_UV_RMS * 1000.0 / math.sqrt(self.f_max - self.F_MIN)
+    
+    def relayout(self):
+        super().relayout()
+        # Axe fréquence log précalculé (abscisses fixes à une taille d'écran)
+        plot = self.layout["plot"]
+        xs = plot.x + (np.log10(self.welch.freqs[self._bins] / self.F_MIN) /
+                       math.log10(self.f_max / self.F_MIN) * (plot.width - 1))
+        self._xs = xs.astype(int).tolist()
+    
+    def update(self, dt: float):
+        if self.welch.update():
+            self.noise_rms = self.welch.band_rms_uv(self.F_MIN, self.f_max, self.ripple_freqs)
+    
+    def _density_y(self, density, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Ordonnée écran d'une densité (calcul sur place dans out si fourni)"""
+        plot = self.layout["plot"]
+        lo, hi = self.DENSITY_RANGE
+        frac = np.log10(np.clip(density, lo, hi, out=out), out=out)
+        frac -= self._log_lo
+        frac /= self._decades
+        frac *= plot.height - 1
+        return np.subtract(plot.y + plot.height - 1, frac, out=out)
+    
+    def _freq_x(self, f: float) -> int:
+        plot = self.layout["plot"]
+        return int(plot.x + math.log10(f / self.F_MIN) /
+                   math.log10(self.f_max / self.F_MIN) * (plot.width - 1))
+    
+    def _create_grid(self) -> pygame.Surface:
+        """Fond du graphe (grille décades + graduations), rendu une seule fois"""
+        rect = self.layout["plot"]
+        grid = SurfacePool.acquire(self.app.layout.size, pygame.SRCALPHA)
+        grid.fill((0, 0, 0, 0))
+        pygame.draw.rect(grid, Colors.LCD_BG, rect)
+        
+        for f, label in ((10, "10"), (100, "100"), (1000, "1k")):
+            x = self._freq_x(f)
+            pygame.draw.line(grid, Colors.LCD_BORDER, (x, rect.top), (x, rect.bottom))
+            text = self.app.font_small.render(label, True, Colors.LIGHT_GRAY)
+            grid.blit(text, (x - text.get_width() // 2, rect.bottom + 4))
+        hz = self.app.font_small.render("Hz", True, Colors.LIGHT_GRAY)
+        grid.blit(hz, (rect.right - hz.get_width(), rect.bottom + 4))
+        
+        for exp in range(6):
+            y = int(self._density_y(10.0 ** exp))
+            pygame.draw.line(grid, Colors.LCD_BORDER, (rect.left, y), (rect.right, y))
+            label = f"{10 ** exp:g}" if exp < 3 else f"{10 ** (exp - 3):g}k"
+            text = self.app.font_small.render(label, True, Colors.LIGHT_GRAY)
+            grid.blit(text, (rect.left - text.get_width() - 6, y - text.get_height() // 2))
+        
+        pygame.draw.rect(grid, Colors.LCD_BORDER, rect, 2)
+        return grid
+    
+    def draw(self, surface: pygame.Surface):
+        layout = self.layout
+        plot = layout["plot"]
+        
+        # Titre
+        self._draw_title(surface, "page_spectrum")
+        
+        surface.blit(StaticCache.get_or_create("spectrum_grid", self._create_grid), (0, 0))
+        unit = self._label("nV/√Hz", Colors.LIGHT_GRAY)
+        surface.blit(unit, (plot.x + 6, plot.y + 4))
+        
+        # Référence spec (pointillés)
+        y_spec = int(self._density_y(self.spec_density))
+        for x in range(plot.x, plot.right, 12):
+            pygame.draw.line(surface, Colors.AMBER_DIM, (x, y_spec), (x + 6, y_spec))
+        
+        # Densités des deux rails
+        if self.welch.count:
+            psd = self.welch.psd[:, self._bins]
+            density = np.sqrt(psd, out=self._buffers.get("density", psd.shape))
+            density *= 1000.0
+            ys = self._density_y(density, out=density)
+            pixels = self._buffers.get("pixels", ys.shape, np.intp)
+            np.copyto(pixels, ys, casting="unsafe")
+            for idx, color in enumerate((Colors.GREEN, Colors.CYAN)):
+                points = self._buffers.points(f"density_{idx}", len(self._xs))
+                for point, x, y in zip(points, self._xs, pixels[idx].tolist()):
+                    point[0] = x
+                    point[1] = y
+                pygame.draw.lines(surface, color, False, points, 1)
+        
+        # Bruit intégré hors raies de ripple vs spec
+        y = layout["legend_y"]
+        band = f"{self.F_MIN:g} Hz - {self.f_max / 1000:.1f} kHz"
+        header = f"{T('noise_rms')} ({band}) - SPEC {SPEC_NOISE_UV_RMS:.2f} µV RMS"
+        surface.blit(self._label(header, Colors.AMBER), (plot.x, y))
+        x = plot.x
+        for idx, (key, color) in enumerate((("rail_a", Colors.GREEN), ("rail_b", Colors.CYAN))):
+            rms = float(self.noise_rms[idx])
+            ok = rms <= SPEC_NOISE_UV_RMS
+            text = f"{T(key)}: {rms:.2f} µV RMS  {T('ok') if ok else T('warning')}"
+            text_surf = self._label(text, color if ok else Colors.RED)
+            surface.blit(text_surf, (x, y + layout["legend_line_height"]))
+            x += layout["legend_pitch_x"]
+
+
+class PageSetting(BasePage):
+    """Page RÉGLAGE - Consignes au pas réel du MCP41100 (displaySettingScreen)
+    
+    Le curseur se déplace en tension et s'aimante sur les positions digipot
+    atteignables. L'aperçu suit le doigt à chaque frame; la consigne n'est
+    transmise au simulateur (setDigipot) qu'après APPLY_DEBOUNCE_S sans
+    changement, au relâcher ou sur ENTER, comme le clic encodeur du firmware.
+    """
+    
+    LAYOUT = "setting"
+    APPLY_DEBOUNCE_S = 0.3
+    # Au-delà de cette position, R_SHUNT // R_digipot sature à 15V
+    POS_MAX = voltage_to_digipot(V_OUT_MAX_SET)
+    TOUCH_MARGIN_PX = 12
+    
+    def __init__(self, app: 'LPSDuoProApp'):
+        super().__init__(app)
+        simulator = app.simulator
+        self.positions = [simulator.get_digipot(rail) for rail in simulator.RAILS]
+        self.selected = 0
+        self.relayout()
+        self._drag: Optional[Tuple[int, int]] = None      # (contact, rail)
+        self._changed_at: Dict[int, float] = {}           # rail → modif. non appliquée
+    
+    def relayout(self):
+        super().relayout()
+        layout = self.layout
+        self.slider_rects = [pygame.Rect(layout["slider_x"], y + layout["slider_offset_y"],
+                                         layout["slider_width"], layout["slider_height"])
+                             for y in layout["rails_y"]]
+    
+    # --- Conversions écran ↔ digipot ---
+    
+    def _voltage_x(self, rail: int, v_out: float) -> int:
+        rect = self.slider_rects[rail]
+        frac = (v_out - V_OUT_MIN) / (V_OUT_MAX_SET - V_OUT_MIN)
+        return rect.x + int(frac * (rect.width - 1))
+    
+    def _x_position(self, rail: int, x: float) -> int:
+        """Position digipot la plus proche de l'abscisse x"""
+        rect = self.slider_rects[rail]
+        frac = min(max((x - rect.x) / (rect.width - 1), 0.0), 1.0)
+        return voltage_to_digipot(V_OUT_MIN + frac * (V_OUT_MAX_SET - V_OUT_MIN))
+    
+    def _slider_at(self, pos: Tuple[float, float]) -> Optional[int]:
+        for rail, rect in enumerate(self.slider_rects):
+            if rect.inflate(self.TOUCH_MARGIN_PX, 2 * self.TOUCH_MARGIN_PX).collidepoint(pos):
+                return rail
+        return None
+    
+    # --- Aperçu et application ---
+    
+    def _preview(self, rail: int, pos: int):
+        pos = min(max(pos, 0), self.POS_MAX)
+        if pos != self.positions[rail]:
+            self.positions[rail] = pos
+            self._changed_at[rail] = time.perf_counter()
+    
+    def _apply(self, rail: int):
+        if self._changed_at.pop(rail, None) is not None:
+            simulator = self.app.simulator
+            simulator.set_digipot(simulator.RAILS[rail], self.positions[rail])
+    
+    def update(self, dt: float):
+        now = time.perf_counter()
+        for rail, changed_at in list(self._changed_at.items()):
+            if now - changed_at >= self.APPLY_DEBOUNCE_S:
+                self._apply(rail)
+        # Rails au repos: la page reflète la consigne courante du simulateur
+        simulator = self.app.simulator
+        for rail, name in enumerate(simulator.RAILS):
+            if rail not in self._changed_at and (self._drag is None or self._drag[1] != rail):
+                self.positions[rail] = simulator.get_digipot(name)
+    
+    def handle_event(self, event: pygame.event.Event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            step = 1 if event.key == pygame.K_RIGHT else -1
+            self._preview(self.selected, self.positions[self.selected] + step)
+        elif event.key in (pygame.K_UP, pygame.K_DOWN):
+            self.selected = (self.selected + 1) % len(self.positions)
+        elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            self._apply(self.selected)
+    
+    def handle_gesture(self, gesture: Gesture) -> bool:
+        if gesture.kind in ("tap", "drag_start"):
+            rail = self._slider_at(gesture.pos)
+            if rail is None:
+                return False
+            self.selected = rail
+            if gesture.kind == "drag_start":
+                self._drag = (gesture.contact, rail)
+            else:
+                self._preview(rail, self._x_position(rail, gesture.pos[0]))
+                self._apply(rail)
+            return True
+        
+        if self._drag is None or self._drag[0] != gesture.contact:
+            return False
+        rail = self._drag[1]
+        if gesture.kind == "drag":
+            self._preview(rail, self._x_position(rail, gesture.pos[0]))
+        elif gesture.kind == "drag_end":
+            self._preview(rail, self._x_position(rail, gesture.pos[0]))
+            self._apply(rail)
+            self._drag = None
+        return True
+    
+    def display_state(self) -> Optional[tuple]:
+        rails = self.app.simulator.rails()
+        return (tuple(self.positions), self.selected, tuple(sorted(self._changed_at)),
+                tuple(f"{rail.voltage_actual:.2f}" for rail in rails))
+    
+    # --- Rendu ---
+    
+    def _create_track(self) -> pygame.Surface:
+        """Pistes, graduations 5V/15V et une marque par position digipot atteignable"""
+        track = SurfacePool.acquire(self.app.layout.size, pygame.SRCALPHA)
+        track.fill((0, 0, 0, 0))
+        steps = digipot_voltages(range(self.POS_MAX + 1)).tolist()
+        for rail, rect in enumerate(self.slider_rects):
+            pygame.draw.rect(track, Colors.LCD_BG, rect)
+            pygame.draw.rect(track, Colors.LCD_BORDER, rect, 2)
+            for v_out in steps:
+                x = self._voltage_x(rail, v_out)
+                pygame.draw.line(track, Colors.MID_GRAY, (x, rect.bottom - 6), (x, rect.bottom - 3))
+            for v_out in range(int(V_OUT_MIN), int(V_OUT_MAX_SET) + 1):
+                x = self._voltage_x(rail, v_out)
+                pygame.draw.line(track, Colors.LIGHT_GRAY, (x, rect.bottom), (x, rect.bottom + 4))
+            for v_out in (V_OUT_MIN, V_OUT_MAX_SET):
+                text = self.app.font_small.render(f"{v_out:.0f}V", True, Colors.LIGHT_GRAY)
+                x = self._voltage_x(rail, v_out) - text.get_width() // 2
+                track.blit(text, (x, rect.bottom + 6))
+        return track
+    
+    def draw(self, surface: pygame.Surface):
+        layout = self.layout
+        
+        # Titre
+        self._draw_title(surface, "page_setting")
+        
+        surface.blit(StaticCache.get_or_create("setting_track", self._create_track), (0, 0))
+        
+        rails = self.app.simulator.rails()
+        styles = (("rail_a", Colors.GREEN, Colors.GREEN_DARK), ("rail_b", Colors.CYAN, Colors.BLUE_DARK))
+        for idx, (key, color, fill) in enumerate(styles):
+            y = layout["rails_y"][idx]
+            rect = self.slider_rects[idx]
+            pos = self.positions[idx]
+            v_set = digipot_to_voltage(pos)
+            pending = idx in self._changed_at
+            
+            # Consigne (2 décimales comme le firmware) et tension mesurée
+            header = self._label(f"{T(key)}: {v_set:.2f}V", color, self.app.font_medium)
+            surface.blit(header, (rect.x, y))
+            measured = self._label(f"{T('voltage')}: {rails[idx].voltage_actual:.2f}V", Colors.WHITE)
+            surface.blit(measured, (rect.right - measured.get_width(), y + 6))
+            
+            # Remplissage, consigne appliquée et curseur
+            x = self._voltage_x(idx, v_set)
+            if x > rect.x + 2:
+                pygame.draw.rect(surface, fill, (rect.x + 2, rect.y + 2, x - rect.x - 2, rect.height - 10))
+            if pending:
+                x_applied = self._voltage_x(idx, rails[idx].voltage_target)
+                pygame.draw.line(surface, Colors.AMBER_DIM, (x_applied, rect.y - 4),
+                                 (x_applied, rect.bottom + 3), 2)
+            cursor = Colors.WHITE if self._drag is not None and self._drag[1] == idx else color
+            pygame.draw.rect(surface, cursor, (x - 3, rect.y - 4, 6, rect.height + 8))
+            if idx == self.selected:
+                pygame.draw.rect(surface, Colors.AMBER, rect.inflate(8, 14), 1)
+            
+            # Position MCP41100, pas local et état d'application
+            step_pos = pos + 1 if pos < self.POS_MAX else pos - 1
+            step_mv = abs(digipot_to_voltage(step_pos) - v_set) * 1000.0
+            info = f"MCP41100 {pos}/{DIGIPOT_STEPS}  |  {T('setting_step')} {step_mv:.0f} mV"
+            info_y = rect.bottom + layout["info_offset_y"]
+            surface.blit(self._label(info, Colors.LIGHT_GRAY), (rect.x, info_y))
+            state = T("setting_pending") if pending else T("setting_applied")
+            state_surf = self._label(state, Colors.AMBER if pending else Colors.GREEN_DIM)
+            surface.blit(state_surf, (rect.right - state_surf.get_width(), info_y))
+        
+        help_surf = self._label(T("setting_help"), Colors.LIGHT_GRAY)
+        surface.blit(help_surf, (self.app.layout.center_x - help_surf.get_width() // 2,
+                                 layout["help_y"]))
+
+
+def format_duration(seconds: float) -> str:
+    """Durée courte pour les axes: 45s, 10min, 6h"""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}min"
+    return f"{seconds / 3600:.0f}h"
+
+
+class PageTrend(BasePage):
+    """Page TENDANCES - Historique min/max/moyenne des deux rails
+    
+    Lecture dans la pyramide TrendStore du simulateur (seaux 1 s, 1 min,
+    1 h) réduite à une colonne d'écran par point: le rendu coûte autant
+    sur 1 min que sur 48 h, en zoom comme en déplacement. Bande min-max
+    atténuée, moyenne en trait plein, échelle verticale sur la plage visible.
+    """
+    
+    LAYOUT = "trend"
+    SPANS = (60.0, 600.0, 3600.0, 6 * 3600.0, 24 * 3600.0, 48 * 3600.0)
+    UNITS = {"voltage": "V", "current": "mA", "temperature": "°C", "ripple": "µV"}
+    DECIMALS = {"voltage": 3, "current": 1, "temperature": 1, "ripple": 1}
+    MIN_RANGE = {"voltage": 0.01, "current": 1.0, "temperature": 0.5, "ripple": 1.0}
+    
+    def __init__(self, app: 'LPSDuoProApp'):
+        super().__init__(app)
+        self.channel = 0
+        self.span_idx = 2
+        self.t_end: Optional[float] = None          # None: suit le direct
+        self._drag: Optional[Tuple[int, float, float]] = None  # (contact, x0, fin0)
+        self._buffers = BufferPool()                # Abscisses et ordonnées écran
+    
+    @property
+    def plot_rect(self) -> pygame.Rect:
+        return self.layout["plot"]
+    
+    @property
+    def span(self) -> float:
+        return self.SPANS[self.span_idx]
+    
+    def _window_end(self) -> float:
+        return self.app.simulator.sim_time if self.t_end is None else self.t_end
+    
+    def _set_end(self, t_end: float):
+        """Fin de fenêtre bornée au début de l'historique; le présent rend le direct"""
+        simulator = self.app.simulator
+        t_end = max(t_end, (simulator.history.t_first or 0.0) + self.span)
+        self.t_end = None if t_end >= simulator.sim_time else t_end
+    
+    def _zoom(self, step: int):
+        self.span_idx = min(max(self.span_idx + step, 0), len(self.SPANS) - 1)
+    
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.MOUSEWHEEL:
+            self._zoom(-1 if event.y > 0 else 1)
+        elif event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                step = self.span / 4 if event.key == pygame.K_RIGHT else -self.span / 4
+                self._set_end(self._window_end() + step)
+            elif event.key in (pygame.K_UP, pygame.K_DOWN):
+                self._zoom(-1 if event.key == pygame.K_UP else 1)
+            elif event.key == pygame.K_c:
+                self.channel = (self.channel + 1) % len(TREND_CHANNELS)
+            elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                self.t_end = None
+    
+    def handle_gesture(self, gesture: Gesture) -> bool:
+        if gesture.kind == "long_press":
+            self.t_end = None
+            return True
+        if gesture.kind in ("tap", "drag_start"):
+            if not self.plot_rect.collidepoint(gesture.pos):
+                return False
+            if gesture.kind == "tap":
+                self.channel = (self.channel + 1) % len(TREND_CHANNELS)
+            else:
+                self._drag = (gesture.contact, gesture.pos[0], self._window_end())
+            return True
+        
+        if self._drag is None or self._drag[0] != gesture.contact:
+            return False
+        # Glisser vers la droite: retour dans le passé
+        contact, x0, end0 = self._drag
+        self._set_end(end0 - (gesture.pos[0] - x0) * self.span / self.plot_rect.width)
+        if gesture.kind == "drag_end":
+            self._drag = None
+        return True
+    
+    def display_state(self) -> Optional[tuple]:
+        # Nouvelle donnée visible quand la fenêtre avance d'une colonne
+        column = int(self._window_end() * self.plot_rect.width / self.span)
+        return (self.channel, self.span_idx, self.t_end, column)
+    
+    def _create_grid(self) -> pygame.Surface:
+        """Fond du graphe: 4 divisions horizontales et verticales"""
+        rect = self.plot_rect
+        grid = SurfacePool.acquire(self.app.layout.size, pygame.SRCALPHA)
+        grid.fill((0, 0, 0, 0))
+        pygame.draw.rect(grid, Colors.LCD_BG, rect)
+        for i in range(1, 4):
+            x = rect.x + rect.width * i // 4
+            y = rect.y + rect.height * i // 4
+            pygame.draw.line(grid, Colors.LCD_BORDER, (x, rect.top), (x, rect.bottom))
+            pygame.draw.line(grid, Colors.LCD_BORDER, (rect.left, y), (rect.right, y))
+        pygame.draw.rect(grid, Colors.LCD_BORDER, rect, 2)
+        return grid
+    
+    def _to_int(self, name: str, values: np.ndarray) -> np.ndarray:
+        """Pixels entiers (troncature comme astype) dans un tampon réutilisé"""
+        pixels = self._buffers.get(name + "_px", values.shape, np.intp)
+        np.copyto(pixels, values, casting="unsafe")
+        return pixels
+    
+    @staticmethod
+    def _finite_runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+        """Plages [début, fin) consécutives où mask est vrai"""
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+        return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+    
+    def draw(self, surface: pygame.Surface):
+        layout = self.layout
+        rect = self.plot_rect
+        name = TREND_CHANNELS[self.channel]
+        unit = self.UNITS[name]
+        decimals = self.DECIMALS[name]
+        
+        # Titre
+        self._draw_title(surface, "page_trend")
+        
+        surface.blit(StaticCache.get_or_create("trend_grid", self._create_grid), (0, 0))
+        
+        # Fenêtre lue dans la pyramide: au plus une valeur par colonne
+        history = self.app.simulator.history
+        t_end = self._window_end()
+        t_start = t_end - self.span
+        level = history.level_for(t_start, t_end)
+        times, mins, maxs, means = history.window(t_start, t_end, rect.width)
+        # Voie de la grandeur pour chaque rail: vue à pas fixe, sans copie
+        q, stride = TrendStore.channel(0, name), len(TREND_CHANNELS)
+        mins, maxs, means = mins[:, q::stride], maxs[:, q::stride], means[:, q::stride]
+        
+        xs = self._buffers.get("x", times.shape)
+        np.subtract(times, t_start, out=xs)
+        xs *= (rect.width - 1) / self.span
+        xs += rect.x
+        xs = self._to_int("xs", xs)
+        has_data = not np.isnan(means).all()
+        if has_data:
+            lo, hi = float(np.nanmin(mins)), float(np.nanmax(maxs))
+            pad = max(hi - lo, self.MIN_RANGE[name]) * 0.1
+            lo, hi = lo - pad, hi + pad
+            if hi - lo < self.MIN_RANGE[name]:
+                mid = (hi + lo) / 2
+                lo, hi = mid - self.MIN_RANGE[name] / 2, mid + self.MIN_RANGE[name] / 2
+            scale = (rect.height - 5) / (hi - lo)
+            
+            def to_y(name: str, values: np.ndarray) -> np.ndarray:
+                ys = self._buffers.get(name, values.shape)
+                np.subtract(values, lo, out=ys)
+                ys *= -scale
+                ys += rect.bottom - 3
+                # Seau vide: bas du graphe (tracé hors plages valides de toute façon)
+                np.nan_to_num(ys, copy=False, nan=rect.bottom - 3)
+                return self._to_int(name, ys)
+            
+            styles = ((Colors.GREEN, Colors.GREEN_DARK), (Colors.CYAN, Colors.BLUE_DARK))
+            for rail, (color, band) in enumerate(styles):
+                y_min, y_max, y_mean = (to_y("y_min", mins[:, rail]), to_y("y_max", maxs[:, rail]),
+                                        to_y("y_mean", means[:, rail]))
+                for start, stop in self._finite_runs(~np.isnan(means[:, rail])):
+                    x = xs[start:stop].tolist()
+                    top = list(zip(x, y_max[start:stop].tolist()))
+                    bottom = list(zip(x, y_min[start:stop].tolist()))
+                    if stop - start > 1:
+                        pygame.draw.polygon(surface, band, top + bottom[::-1])
+                        pygame.draw.lines(surface, color, False,
+                                          list(zip(x, y_mean[start:stop].tolist())), 2)
+                    else:
+                        pygame.draw.line(surface, color, top[0], bottom[0], 2)
+            
+            # Graduations verticales
+            for frac in (0.0, 0.5, 1.0):
+                value = lo + pad + frac * (hi - lo - 2 * pad)
+                y = int(rect.bottom - 3 - (value - lo) * scale)
+                text = self._label(f"{value:.{decimals}f}", Colors.LIGHT_GRAY)
+                surface.blit(text, (rect.x - text.get_width() - 6, y - text.get_height() // 2))
+        else:
+            text = self._label(T("trend_no_data"), Colors.LIGHT_GRAY)
+            surface.blit(text, (rect.centerx - text.get_width() // 2, rect.centery))
+        
+        # Axe temps relatif au présent
+        now = self.app.simulator.sim_time
+        right = T("trend_live") if self.t_end is None else f"-{format_duration(now - t_end)}"
+        for frac, text in ((0.0, f"-{format_duration(now - t_start)}"),
+                           (0.5, f"-{format_duration(now - t_start - self.span / 2)}"),
+                           (1.0, right)):
+            surf = self._label(text, Colors.AMBER if frac == 1.0 and self.t_end is None
+                               else Colors.LIGHT_GRAY)
+            x = rect.x + int(frac * rect.width) - surf.get_width() // 2
+            surface.blit(surf, (min(max(x, rect.x), rect.right - surf.get_width()), rect.bottom + 4))
+        
+        # Légende: grandeur, résolution lue, stats de la fenêtre par rail
+        y = layout["legend_y"]
+        header = (f"{T(name)} ({unit})  |  {T('trend_span')} {format_duration(self.span)}"
+                  f"  |  {T('trend_resolution')} {format_duration(level.period)}")
+        surface.blit(self._label(header, Colors.AMBER), (rect.x, y))
+        x = rect.x
+        for rail, (key, color) in enumerate((("rail_a", Colors.GREEN), ("rail_b", Colors.CYAN))):
+            if has_data and not np.isnan(means[:, rail]).all():
+                text = (f"{T(key)}: min {np.nanmin(mins[:, rail]):.{decimals}f}  "
+                        f"{T('trend_mean')} {np.nanmean(means[:, rail]):.{decimals}f}  "
+                        f"max {np.nanmax(maxs[:, rail]):.{decimals}f}")
+                surface.blit(self._label(text, color),
+                             (x, y + layout["legend_line_height"]))
+            x += layout["legend_pitch_x"]
+        help_surf = self._label(T("trend_help"), Colors.LIGHT_GRAY)
+        surface.blit(help_surf, (self.app.layout.center_x - help_surf.get_width() // 2,
+                                 y + layout["help_offset_y"]))
+
+
+class PageQuality(BasePage):
+    """Page QUALITÉ - Indice et stabilité (displayQualityScreen)
+    
+    Toutes les valeurs viennent du MetricsEngine du simulateur, mis à jour à
+    chaque pas en O(1) à la cadence de loop(): smooth_i et stability_score
+    aux définitions du firmware, statistiques de tension (Welford) et
+    extrema glissants.
+    """
+    
+    LAYOUT = "quality"
+    QUALITY_COLORS = {
+        "quality_optimal": Colors.GREEN,
+        "quality_good": Colors.GREEN_DIM,
+        "quality_correct": Colors.AMBER,
+        "quality_degraded": Colors.RED,
+    }
+    TEMP_COLORS = {"temp_good": Colors.GREEN, "temp_warm": Colors.AMBER, "temp_hot": Colors.RED}
+    
+    def _rail_rows(self, rail: int) -> List[Tuple[str, str]]:
+        """(libellé, valeur) par rail, à la résolution affichée"""
+        metrics = self.app.simulator.metrics
+        stats = metrics.voltage_stats[rail]
+        v_range = metrics.voltage_range[rail]
+        i_range = metrics.current_range[rail]
+        return [
+            ("smooth_i", f"{int(metrics.smooth_i[rail].value)} mA"),
+            ("quality_v_mean", f"{stats.mean:.3f} V ± {stats.std * 1000:.1f} mV"),
+            ("quality_v_window", f"{v_range.min:.3f} - {v_range.max:.3f} V "
+                                 f"({(v_range.max - v_range.min) * 1000:.0f} mV pp)"),
+            ("quality_i_window", f"{i_range.min:.0f} - {i_range.max:.0f} mA"),
+        ]
+    
+    def display_state(self) -> Optional[tuple]:
+        metrics = self.app.simulator.metrics
+        # Entiers comme l'écran OLED: le rendu ne suit que les changements visibles
+        return (int(metrics.quality), int(metrics.stability.value), metrics.temperature_label,
+                tuple(tuple(self._rail_rows(rail)) for rail in range(metrics.n_rails)))
+    
+    def draw(self, surface: pygame.Surface):
+        layout = self.layout
+        metrics = self.app.simulator.metrics
+        
+        # Titre
+        self._draw_title(surface, "page_quality")
+        
+        # Indice qualité (entier) et libellé
+        quality = metrics.quality
+        color = self.QUALITY_COLORS[metrics.quality_label]
+        score_surf = self._label(f"{int(quality)}%", color, self.app.font_xlarge)
+        surface.blit(score_surf, (layout["score_x"], layout["score_y"]))
+        label_surf = self._label(T(metrics.quality_label), color, self.app.font_medium)
+        surface.blit(label_surf, (layout["score_x"], layout["score_y"] + layout["label_offset_y"]))
+        
+        # Indicateurs: stabilité et état thermique du radiateur
+        x, y = layout["indicators_x"], layout["score_y"] + layout["indicators_offset_y"]
+        stability = metrics.stability.value
+        stab_surf = self._label(f"{T('stability')}: {int(stability)}%", Colors.WHITE, self.app.font_medium)
+        surface.blit(stab_surf, (x, y))
+        NixieBar.draw(surface, x, y + layout["bar_offset_y"], layout["bar_width"], layout["bar_height"],
+                      stability, 100.0, color)
+        temp_key = metrics.temperature_label
+        temp_text = f"{T('temperature')}: {T(temp_key)} ({metrics.temp_radiator:.0f}°C)"
+        temp_surf = self._label(temp_text, self.TEMP_COLORS[temp_key], self.app.font_medium)
+        surface.blit(temp_surf, (x, y + layout["temp_offset_y"]))
+        
+        # Détail par rail
+        for rail, (key, rail_color, x) in enumerate((("rail_a", Colors.GREEN, layout["rail_a_x"]),
+                                                     ("rail_b", Colors.CYAN, layout["rail_b_x"]))):
+            y = layout["rails_y"]
+            surface.blit(self._label(T(key), rail_color, self.app.font_medium), (x, y))
+            y += layout["row_height"] + 5
+            for label, value in self._rail_rows(rail):
+                surface.blit(self._label(f"{T(label)}:", Colors.LIGHT_GRAY), (x, y))
+                surface.blit(self._label(value, Colors.WHITE),
+                             (x + layout["value_offset_x"], y))
+                y += layout["row_height"]
+
+
+class PageHistory(BasePage):
+    """Page HISTORIQUE - Journal des fautes de toutes les sessions
+    
+    Liste virtuelle sur le FaultLog de l'application: seules les lignes
+    visibles sont lues (FaultView, blocs en cache) et dessinées, avec des
+    libellés rendus une fois par valeur. Le défilement coûte donc autant
+    sur dix événements que sur cent mille. Le plus récent est en haut;
+    sans défilement la liste suit les nouvelles fautes, sinon elle reste
+    sur les mêmes lignes. Filtres rail et type de faute (boutons, R et F).
+    """
+    
+    LAYOUT = "history"
+    RAILS = (None, "A", "B")
+    FAULTS = (None,) + FAULT_CODES + ("RIPPLE",)
+    WHEEL_ROWS = 3
+    
+    def __init__(self, app: 'LPSDuoProApp'):
+        super().__init__(app)
+        self.rail_idx = 0
+        self.fault_idx = 0
+        self.top: Optional[int] = None              # Rang de la ligne du haut, None: suit le récent
+        self._views: Dict[Tuple[Optional[str], Optional[str]], FaultView] = {}
+        self._drag: Optional[Tuple[int, float, int, bool]] = None  # (contact, y0, haut0, ascenseur)
+        self._create_buttons()
+    
+    def relayout(self):
+        super().relayout()
+        self._create_buttons()
+    
+    def _create_buttons(self):
+        layout = self.layout
+        self.rail_button = Button(*layout["rail_button"], self._rail_label(), self._next_rail)
+        self.fault_button = Button(*layout["fault_button"], self._fault_label(), self._next_fault)
+        self.buttons = [self.rail_button, self.fault_button]
+        self.button_grid = ButtonGrid(self.buttons)
+    
+    # --- Filtres ---
+    
+    @property
+    def view(self) -> FaultView:
+        """Vue du filtre courant, gardée par filtre (comptage incrémental)"""
+        key = (self.RAILS[self.rail_idx], self.FAULTS[self.fault_idx])
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = self.app.fault_log.view(*key)
+        return view
+    
+    def _rail_label(self) -> str:
+        rail = self.RAILS[self.rail_idx]
+        return f"{T('history_rail')}: {T('history_all') if rail is None else rail}"
+    
+    def _fault_label(self) -> str:
+        fault = self.FAULTS[self.fault_idx]
+        return f"{T('history_fault')}: {T('history_all') if fault is None else fault}"
+    
+    def _next_rail(self):
+        self.rail_idx = (self.rail_idx + 1) % len(self.RAILS)
+        self.rail_button.text = self._rail_label()
+        self.top = None
+    
+    def _next_fault(self):
+        self.fault_idx = (self.fault_idx + 1) % len(self.FAULTS)
+        self.fault_button.text = self._fault_label()
+        self.top = None
+    
+    # --- Défilement ---
+    
+    @property
+    def rows_visible(self) -> int:
+        return self.layout["list"].height // self.layout["row_height"]
+    
+    def _top_rank(self, count: int) -> int:
+        return count - 1 if self.top is None else min(self.top, count - 1)
+    
+    def _set_top(self, rank: int):
+        """Ligne du haut bornée à une page pleine; la plus récente rend le suivi"""
+        count = len(self.view)
+        rank = max(rank, min(self.rows_visible, count) - 1)
+        self.top = None if rank >= count - 1 else rank
+    
+    def _scroll(self, rows: int):
+        """rows > 0: vers les plus anciens"""
+        self._set_top(self._top_rank(len(self.view)) - rows)
+    
+    def _bar_rank(self, y: float) -> int:
+        """Rang de la ligne du haut pour une position sur l'ascenseur"""
+        rect = self.layout["list"]
+        count, visible = len(self.view), self.rows_visible
+        frac = min(max((y - rect.y) / rect.height, 0.0), 1.0)
+        return count - 1 - int(round(frac * max(count - visible, 0)))
+    
+    def handle_event(self, event: pygame.event.Event):
+        self.button_grid.handle_event(event)
+        if event.type == pygame.MOUSEWHEEL:
+            self._scroll(-self.WHEEL_ROWS if event.y > 0 else self.WHEEL_ROWS)
+        elif event.type == pygame.KEYDOWN:
+            page = self.rows_visible
+            steps = {pygame.K_UP: -1, pygame.K_DOWN: 1, pygame.K_PAGEUP: -page,
+                     pygame.K_PAGEDOWN: page}
+            if event.key in steps:
+                self._scroll(steps[event.key])
+            elif event.key == pygame.K_HOME:
+                self._set_top(0)
+            elif event.key in (pygame.K_END, pygame.K_RETURN, pygame.K_KP_ENTER):
+                self.top = None
+            elif event.key == pygame.K_r:
+                self._next_rail()
+            elif event.key == pygame.K_f:
+                self._next_fault()
+    
+    def handle_gesture(self, gesture: Gesture) -> bool:
+        rect = self.layout["list"]
+        if gesture.kind == "long_press":
+            self.top = None
+            return True
+        if gesture.kind == "drag_start":
+            if not rect.collidepoint(gesture.pos):
+                return False
+            on_bar = gesture.pos[0] >= rect.right - self.layout["scrollbar_width"] * 3
+            self._drag = (gesture.contact, gesture.pos[1],
+                          self._top_rank(len(self.view)), on_bar)
+            return True
+        if gesture.kind == "tap":
+            return rect.collidepoint(gesture.pos)
+        
+        if self._drag is None or self._drag[0] != gesture.contact:
+            return False
+        # Glisser vers le bas: retour vers les récents; ascenseur: position absolue
+        contact, y0, top0, on_bar = self._drag
+        if on_bar:
+            self._set_top(self._bar_rank(gesture.pos[1]))
+        else:
+            self._set_top(top0 + int(round((gesture.pos[1] - y0) / self.layout["row_height"])))
+        if gesture.kind == "drag_end":
+            self._drag = None
+        return True
+    
+    def display_state(self) -> Optional[tuple]:
+        count = len(self.view)
+        return (self.rail_idx, self.fault_idx, count, self._top_rank(count),
+                tuple(button.pressed or button.hover for button in self.buttons))
+    
+    # --- Rendu ---
+    
+    def _draw_row(self, surface: pygame.Surface, record: FaultRecord, y: int):
+        x = self.layout["list"].x
+        columns = self.layout["column_x"]
+        hours, rest = divmod(int(record.t), 3600)
+        color = Colors.RED if record.active else Colors.GREEN
+        cells = (
+            (time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record.wall)), Colors.LIGHT_GRAY),
+            (f"#{record.session}", Colors.LIGHT_GRAY),
+            (f"{hours}:{rest // 60:02d}:{rest % 60:02d}", Colors.LIGHT_GRAY),
+            (record.rail, Colors.GREEN if record.rail == "A" else Colors.CYAN),
+            (record.fault, Colors.WHITE),
+            (T("history_raised") if record.active else T("history_cleared"), color),
+        )
+        for (text, text_color), column in zip(cells, columns):
+            surface.blit(self._label(text, text_color), (x + column, y))
+    
+    def draw(self, surface: pygame.Surface):
+        layout = self.layout
+        rect = layout["list"]
+        line = layout["row_height"]
+        view = self.view
+        count = len(view)
+        
+        # Titre, filtres et nombre d'événements du filtre
+        self._draw_title(surface, "page_history")
+        for button in self.buttons:
+            button.draw(surface, self.app.font_small)
+        count_surf = self._label(f"{count} {T('history_events')}", Colors.AMBER)
+        surface.blit(count_surf, (layout["count_right_x"] - count_surf.get_width(), layout["count_y"]))
+        
+        # En-têtes de colonnes
+        headers = ("history_date", "history_session", "history_sim_time",
+                   "history_rail", "history_fault", "history_state")
+        for key, column in zip(headers, layout["column_x"]):
+            surface.blit(self._label(T(key), Colors.AMBER), (rect.x + column, layout["header_y"]))
+        
+        pygame.draw.rect(surface, Colors.LCD_BG, rect)
+        pygame.draw.rect(surface, Colors.LCD_BORDER, rect, 1)
+        top = self._top_rank(count)
+        if not count:
+            text = self._label(T("history_empty"), Colors.LIGHT_GRAY)
+            surface.blit(text, (rect.centerx - text.get_width() // 2, rect.centery))
+        else:
+            # Seules les lignes visibles sont lues et dessinées, la plus récente en haut
+            visible = self.rows_visible
+            first = max(top - visible + 1, 0)
+            pad = (line - self.app.font_small.get_height()) // 2
+            for i, record in enumerate(reversed(view.rows(first, top - first + 1))):
+                y = rect.y + i * line
+                if i % 2:
+                    pygame.draw.rect(surface, Colors.DARK_GRAY, (rect.x + 1, y, rect.width - 2, line))
+                self._draw_row(surface, record, y + pad)
+            
+            # Ascenseur: position de la page dans le filtre
+            if count > visible:
+                bar = layout["scrollbar_width"]
+                height = max(rect.height * visible // count, 3 * bar)
+                offset = (rect.height - height) * (count - 1 - top) // (count - visible)
+                pygame.draw.rect(surface, Colors.AMBER,
+                                 (rect.right - bar - 2, rect.y + offset, bar, height))
+        
+        # Suivi du direct ou position dans l'historique
+        status = T("trend_live") if self.top is None else f"{count - top}/{count}"
+        status_surf = self._label(status, Colors.AMBER if self.top is None else Colors.LIGHT_GRAY)
+        surface.blit(status_surf, (rect.right - status_surf.get_width(), rect.bottom + 4))
+        help_surf = self._label(T("history_help"), Colors.LIGHT_GRAY)
+        surface.blit(help_surf, (self.app.layout.center_x - help_surf.get_width() // 2,
+                                 layout["help_y"]))
+
+
+# =============================================================================
+# GESTION DES ENTRÉES
+# =============================================================================
+
+def coalesce_motion(events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+    """Fusionne les MOUSEMOTION consécutifs (position finale, rel cumulé)
+    
+    L'ordre relatif avec les clics et touches est conservé: seule une suite
+    ininterrompue de mouvements devient un seul événement par frame.
+    """
+    merged: List[pygame.event.Event] = []
+    for event in events:
+        if (event.type == pygame.MOUSEMOTION and merged
+                and merged[-1].type == pygame.MOUSEMOTION):
+            prev = merged[-1]
+            merged[-1] = pygame.event.Event(
+                pygame.MOUSEMOTION, pos=event.pos,
+                rel=(prev.rel[0] + event.rel[0], prev.rel[1] + event.rel[1]),
+                buttons=event.buttons, touch=getattr(event, "touch", False))
+        else:
+            merged.append(event)
+    return merged
+
+
+class ButtonGrid:
+    """Index spatial (grille) des boutons d'une page
+    
+    Un événement souris n'est transmis qu'au bouton sous le pointeur et aux
+    boutons encore survolés ou pressés: coût constant quel que soit le
+    nombre de widgets de la page.
+    """
+    
+    CELL = 64
+    
+    def __init__(self, buttons: Optional[List[Button]] = None):
+        self.cells: Dict[Tuple[int, int], List[Button]] = {}
+        self._tracked: List[Button] = []
+        for button in buttons or []:
+            self.add(button)
+    
+    def add(self, button: Button):
+        """Inscrit le bouton dans toutes les cellules que couvre son rect"""
+        rect = button.rect
+        for cx in range(rect.left // self.CELL, (rect.right - 1) // self.CELL + 1):
+            for cy in range(rect.top // self.CELL, (rect.bottom - 1) // self.CELL + 1):
+                self.cells.setdefault((cx, cy), []).append(button)
+    
+    def hit(self, pos: Tuple[int, int]) -> Optional[Button]:
+        """Bouton sous la position donnée"""
+        for button in self.cells.get((pos[0] // self.CELL, pos[1] // self.CELL), ()):
+            if button.rect.collidepoint(pos):
+                return button
+        return None
+    
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Transmet l'événement aux boutons concernés, True si clic"""
+        if event.type not in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                              pygame.MOUSEMOTION):
+            return False
+        targets = list(self._tracked)
+        hit = self.hit(event.pos)
+        if hit is not None and hit not in targets:
+            targets.append(hit)
+        clicked = False
+        for button in targets:
+            clicked |= button.handle_event(event)
+        self._tracked = [b for b in targets if b.hover or b.pressed]
+        return clicked
+
+
+# Gestes tactiles (dalle capacitive ESP32-8048S050C)
+LONG_PRESS_S = 0.6
+TAP_SLOP_PX = 12.0             # Déplacement toléré d'un appui immobile
+SWIPE_MIN_PX = 120.0
+SWIPE_MIN_SPEED = 500.0        # px/s au relâcher
+SWIPE_MAX_PAUSE_S = 0.1        # Arrêt avant relâcher: plus un swipe
+VELOCITY_SMOOTHING = 0.5       # EMA des vitesses instantanées
+MOUSE_CONTACT = -1             # Souris émulée comme un doigt
+
+
+@dataclass
+class Gesture:
+    """Geste reconnu: tap, long_press, swipe, drag_start, drag, drag_end"""
+    kind: str
+    pos: Tuple[float, float]
+    contact: int
+    velocity: Tuple[float, float] = (0.0, 0.0)
+    direction: int = 0             # swipe: -1 vers la gauche, +1 vers la droite
+
+
+class _Contact:
+    """Suivi d'un doigt (ou de la souris) entre appui et relâcher"""
+    
+    __slots__ = ("start", "start_time", "pos", "time", "vx", "vy",
+                 "pending", "dragging", "long_fired", "claimed")
+    
+    def __init__(self, pos: Tuple[float, float], now: float):
+        self.start = self.pos = pos
+        self.start_time = self.time = now
+        self.vx = self.vy = 0.0
+        self.pending: Optional[Tuple[float, float]] = None
+        self.dragging = False
+        self.long_fired = False
+        self.claimed = False
+
+
+class GestureRecognizer:
+    """Reconnaissance de gestes multi-contacts par lots d'événements
+    
+    Les FINGER* SDL (coordonnées normalisées) et la souris (hors événements
+    synthétisés depuis le tactile) alimentent des contacts. Les mouvements
+    d'une frame sont fusionnés par contact avant le calcul incrémental de la
+    vitesse (EMA), ce qui borne le coût par frame quel que soit le débit de
+    la dalle.
+    """
+    
+    def __init__(self, size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.size = size
+        self.contacts: Dict[int, _Contact] = {}
+        self._peak_contacts = 0
+    
+    def claim(self, contact: int):
+        """Un widget s'approprie le contact: il ne déclenchera pas de swipe"""
+        if contact in self.contacts:
+            self.contacts[contact].claimed = True
+    
+    def process(self, events: List[pygame.event.Event], now: float) -> List[Gesture]:
+        """Traite le lot d'événements d'une frame et retourne les gestes"""
+        gestures: List[Gesture] = []
+        for event in events:
+            kind = event.type
+            if kind in (pygame.FINGERDOWN, pygame.FINGERMOTION, pygame.FINGERUP):
+                cid = event.finger_id
+                pos = (event.x * self.size[0], event.y * self.size[1])
+                down, up = kind == pygame.FINGERDOWN, kind == pygame.FINGERUP
+            elif kind in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
+                if getattr(event, "touch", False):
+                    continue
+                if kind != pygame.MOUSEMOTION and event.button != 1:
+                    continue
+                cid, pos = MOUSE_CONTACT, event.pos
+                down, up = kind == pygame.MOUSEBUTTONDOWN, kind == pygame.MOUSEBUTTONUP
+            else:
+                continue
+            
+            if down:
+                self.contacts[cid] = _Contact(pos, now)
+                self._peak_contacts = max(self._peak_contacts, len(self.contacts))
+                continue
+            contact = self.contacts.get(cid)
+            if contact is None:
+                continue
+            contact.pending = pos
+            if up:
+                # Un relâcher sur place n'est pas un mouvement: ni vitesse diluée,
+                # ni horodatage rafraîchi (l'arrêt avant relâcher reste mesurable)
+                if pos != contact.pos:
+                    self._advance(cid, contact, now, gestures)
+                self._release(cid, contact, now, gestures)
+        
+        # Mouvements fusionnés: une mise à jour de vitesse par contact et par frame
+        for cid, contact in self.contacts.items():
+            if contact.pending is not None:
+                self._advance(cid, contact, now, gestures)
+            elif (not contact.dragging and not contact.long_fired
+                  and now - contact.start_time >= LONG_PRESS_S):
+                contact.long_fired = True
+                gestures.append(Gesture("long_press", contact.pos, cid))
+        return gestures
+    
+    def _advance(self, cid: int, contact: _Contact, now: float, gestures: List[Gesture]):
+        pos, contact.pending = contact.pending, None
+        dt = now - contact.time
+        if dt > 0:
+            k = VELOCITY_SMOOTHING
+            contact.vx += ((pos[0] - contact.pos[0]) / dt - contact.vx) * k
+            contact.vy += ((pos[1] - contact.pos[1]) / dt - contact.vy) * k
+            contact.time = now
+        contact.pos = pos
+        if (not contact.dragging and not contact.long_fired and
+                math.hypot(pos[0] - contact.start[0], pos[1] - contact.start[1]) > TAP_SLOP_PX):
+            contact.dragging = True
+            gestures.append(Gesture("drag_start", contact.start, cid))
+        if contact.dragging:
+            gestures.append(Gesture("drag", pos, cid, (contact.vx, contact.vy)))
+    
+    def _release(self, cid: int, contact: _Contact, now: float, gestures: List[Gesture]):
+        del self.contacts[cid]
+        single = self._peak_contacts == 1
+        if not self.contacts:
+            self._peak_contacts = 0
+        if not contact.dragging:
+            if not contact.long_fired:
+                gestures.append(Gesture("tap", contact.pos, cid))
+            return
+        
+        velocity = (contact.vx, contact.vy)
+        # contact.time: dernier mouvement effectif
+        if now - contact.time > SWIPE_MAX_PAUSE_S:
+            velocity = (0.0, 0.0)
+        dx = contact.pos[0] - contact.start[0]
+        dy = contact.pos[1] - contact.start[1]
+        if (single and not contact.claimed and abs(dx) >= SWIPE_MIN_PX
+                and abs(dx) > 2.0 * abs(dy) and abs(velocity[0]) >= SWIPE_MIN_SPEED):
+            gestures.append(Gesture("swipe", contact.pos, cid, velocity, 1 if dx > 0 else -1))
+        gestures.append(Gesture("drag_end", contact.pos, cid, velocity))
+
+
+# =============================================================================
+# ORDONNANCEUR DE RENDU ADAPTATIF
+# =============================================================================
+
+DISPLAY_INTERVAL_S = 0.200     # Rafraîchissement des mesures (DISPLAY_INTERVAL_MS firmware)
+ACTIVE_HOLD_S = 0.5            # Plein régime maintenu après une entrée
+
+
+class FrameScheduler:
+    """Ne redessine que sur entrée ou changement de l'affichage
+    
+    Une page animée (display_state() à None) tourne à TARGET_FPS. Sinon la
+    boucle dort jusqu'à la prochaine entrée ou au prochain rafraîchissement
+    des mesures, et le rendu est sauté si les valeurs affichées (à leur
+    résolution d'affichage) n'ont pas changé.
+    """
+    
+    def __init__(self, fps: int = TARGET_FPS, idle_interval: float = DISPLAY_INTERVAL_S,
+                 adaptive: bool = True):
+        self.frame_interval = 1.0 / fps
+        self.idle_interval = idle_interval
+        self.adaptive = adaptive
+        self.active = True
+        self.frames = 0
+        self.rendered = 0
+        self._last_frame = time.perf_counter()
+        self._last_input = self._last_frame
+        self._last_state: Any = None
+        self._render_cost = 0.0
+        self._wall_start: Optional[float] = None
+        self._cpu_start = 0.0
+        
+        # Latence entrée → affichage: arrivée de la première entrée du lot
+        self.input_time: Optional[float] = None
+        self.latency_count = 0
+        self.latency_max = 0.0
+        self._latency_sum = 0.0
+    
+    def wait_events(self) -> List[pygame.event.Event]:
+        """Attend la prochaine frame et retourne les événements reçus
+        
+        En régime actif la cadence est plafonnée à TARGET_FPS; au repos la
+        boucle se réveille dès la première entrée ou au prochain intervalle.
+        L'attente se fait sur la file SDL pour horodater l'arrivée des entrées.
+        """
+        if self._wall_start is None:
+            # Mesures à partir de la première frame (init exclue)
+            self._wall_start = time.perf_counter()
+            self._cpu_start = time.process_time()
+        events = pygame.event.get()
+        # Arrivées pendant le traitement précédent: majorant de la latence
+        self.input_time = self._last_frame if events else None
+        interval = self.frame_interval if self.active else self.idle_interval
+        
+        while True:
+            deadline = self._last_frame + (self.frame_interval if events else interval)
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            event = pygame.event.wait(max(1, int(remaining * 1000)))
+            if event.type == pygame.NOEVENT:
+                break
+            if self.input_time is None:
+                self.input_time = time.perf_counter()
+            events.append(event)
+        
+        self._last_frame = time.perf_counter()
+        if events:
+            self._last_input = self._last_frame
+        self.frames += 1
+        return events
+    
+    def should_draw(self, state: Any, had_input: bool) -> bool:
+        """Décide du rendu et du régime de la prochaine attente"""
+        recent_input = self._last_frame - self._last_input < ACTIVE_HOLD_S
+        self.active = state is None or recent_input or not self.adaptive
+        if not self.adaptive:
+            return True
+        if state is None or recent_input or had_input or state != self._last_state:
+            self._last_state = state
+            return True
+        return False
+    
+    def record_render(self, cost: float):
+        """Temps CPU d'une frame rendue (update + draw)"""
+        self.rendered += 1
+        self._render_cost += cost
+    
+    def record_latency(self):
+        """Clôt la mesure entrée → image pour la frame qui vient d'être affichée"""
+        if self.input_time is None:
+            return
+        latency = time.perf_counter() - self.input_time
+        self.input_time = None
+        self.latency_count += 1
+        self._latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+    
+    def report(self) -> Dict[str, float]:
+        """Frames rendues/sautées et CPU mesuré vs estimation à cadence fixe"""
+        wall = max(time.perf_counter() - (self._wall_start or 0.0), 1e-9)
+        cpu = time.process_time() - self._cpu_start
+        avg_cost = self._render_cost / self.rendered if self.rendered else 0.0
+        fixed_cpu = min(avg_cost / self.frame_interval, 1.0)
+        return {
+            "frames": self.frames,
+            "rendered": self.rendered,
+            "skipped_pct": 100.0 * (1.0 - self.rendered / self.frames) if self.frames else 0.0,
+            "cpu_pct": 100.0 * cpu / wall,
+            "fixed_rate_cpu_pct": 100.0 * fixed_cpu,
+            "latency_mean_ms": (1000.0 * self._latency_sum / self.latency_count
+                                if self.latency_count else 0.0),
+            "latency_max_ms": 1000.0 * self.latency_max,
+        }
+
+
+# =============================================================================
+# TABLEAU DE BORD MULTI-PAGES
+# =============================================================================
+
+DASHBOARD_COLUMNS = 3
+DASHBOARD_BUDGET_S = 0.010     # Rendu des pages par frame (~1/3 de frame à 30 FPS)
+
+
+class Dashboard:
+    """Toutes les pages en mosaïque, rendues hors écran (touche D)
+    
+    Les pages partagent la mise à jour unique du simulateur de la frame et
+    dessinent tour à tour sur un même canevas pleine taille, réduit aussitôt
+    dans la tuile de la page. L'écran ne fait que recomposer les tuiles en
+    cache: une tuile n'est redessinée que si sa page est animée ou si son
+    display_state a changé. Les tuiles périmées passent de la plus ancienne à
+    la plus récente tant que leur coût estimé (EMA par page) tient dans le
+    budget de la frame: les pages lourdes sont étalées sur plusieurs frames,
+    et la plus ancienne avance toujours (pas de famine).
+    """
+    
+    COST_SMOOTHING = 0.2           # EMA du coût de rendu par page
+    
+    def __init__(self, app: 'LPSDuoProApp', budget_s: float = DASHBOARD_BUDGET_S,
+                 columns: int = DASHBOARD_COLUMNS):
+        self.app = app
+        self.active = False
+        self.budget = budget_s
+        self.columns = columns
+        n_pages = len(app.page_classes)
+        self._canvas: Optional[pygame.Surface] = None
+        self.tiles: List[Optional[pygame.Surface]] = []
+        self.relayout()
+        
+        self._keys: List[Any] = [None] * n_pages
+        self._rendered_at = [0] * n_pages
+        self._stale: Optional[List[Tuple[int, int, Any]]] = None
+        self.cost = [0.0] * n_pages
+        self.renders = [0] * n_pages
+        self.frames = 0
+        self.deferred = 0
+        self.frame_cost = 0.0
+        self._cost_sum = 0.0
+    
+    def relayout(self):
+        """Tuiles à la taille d'écran courante; surfaces allouées à la première activation"""
+        layout = self.app.layout
+        n_pages = len(self.app.page_classes)
+        rows = -(-n_pages // self.columns)
+        self.content = pygame.Rect(0, 0, layout.width, layout.height - layout["app"]["nav_height"])
+        self.tile_size = (layout.width // self.columns, self.content.height // rows)
+        tw, th = self.tile_size
+        self.rects = [pygame.Rect(i % self.columns * tw, i // self.columns * th, tw, th)
+                      for i in range(n_pages)]
+        # Surfaces de l'ancienne taille rendues au pool (retrouvées au retour à cette taille)
+        for surface in [self._canvas] + self.tiles:
+            SurfacePool.release(surface)
+        self._canvas = None
+        self.tiles = [None] * n_pages
+        self._stale = None
+    
+    def toggle(self):
+        self.active = not self.active
+    
+    def page_at(self, pos: Tuple[float, float]) -> Optional[int]:
+        """Index de la page sous le point, None hors tuiles"""
+        for index, rect in enumerate(self.rects):
+            if rect.collidepoint(pos):
+                return index
+        return None
+    
+    def update(self, dt: float):
+        """Toutes les pages suivent le même état du simulateur"""
+        for index in range(len(self.rects)):
+            self.app.get_page(index).update(dt)
+        self._stale = None
+    
+    def _collect(self) -> List[Tuple[int, int, Any]]:
+        """Tuiles périmées (frame du dernier rendu, index, clé), plus anciennes d'abord"""
+        if self._stale is None:
+            lang = Translations.get_current_language()
+            stale = []
+            for index in range(len(self.rects)):
+                state = self.app.get_page(index).display_state()
+                key = None if state is None else (lang, state)
+                if key is None or key != self._keys[index] or self.tiles[index] is None:
+                    stale.append((self._rendered_at[index], index, key))
+            stale.sort(key=lambda item: item[:2])
+            self._stale = stale
+        return self._stale
+    
+    def display_state(self) -> Optional[tuple]:
+        """None tant qu'une tuile reste à redessiner"""
+        if self._collect():
+            return None
+        return ("dashboard", self.app.current_page, Translations.get_current_language())
+    
+    def _render_tile(self, index: int):
+        """Page dessinée sur le canevas puis réduite dans sa tuile"""
+        if self._canvas is None:
+            self._canvas = SurfacePool.acquire(self.app.layout.size, like=self.app.screen)
+        if self.tiles[index] is None:
+            self.tiles[index] = SurfacePool.acquire(self.tile_size, like=self._canvas)
+        self._canvas.fill(Colors.BLACK)
+        self.app.draw_page(index, self._canvas)
+        pygame.transform.smoothscale(self._canvas.subsurface(self.content),
+                                     self.tile_size, self.tiles[index])
+    
+    def render(self) -> int:
+        """Redessine les tuiles périmées dans le budget, retourne leur nombre"""
+        self.frames += 1
+        spent = 0.0
+        done = 0
+        for _, index, key in self._collect():
+            if done and spent + self.cost[index] > self.budget:
+                # Reportée: plus ancienne, elle passera en tête d'une frame suivante
+                self.deferred += 1
+                continue
+            start = time.perf_counter()
+            self._render_tile(index)
+            cost = time.perf_counter() - start
+            self.cost[index] = (cost if not self.renders[index] else
+                                self.cost[index] + self.COST_SMOOTHING * (cost - self.cost[index]))
+            self.renders[index] += 1
+            self._keys[index] = key
+            self._rendered_at[index] = self.frames
+            spent += cost
+            done += 1
+        self._stale = None
+        self.frame_cost = spent
+        self._cost_sum += spent
+        return done
+    
+    def draw(self, surface: pygame.Surface):
+        """Recompose les tuiles et la barre d'état"""
+        self.render()
+        font = self.app.font_small
+        layout = self.app.layout["app"]
+        for index, rect in enumerate(self.rects):
+            tile = self.tiles[index]
+            if tile is not None:
+                surface.blit(tile, rect)
+            number = TextCache.get(font, str(index + 1), Colors.LIGHT_GRAY)
+            surface.blit(number, (rect.right - number.get_width() - 4,
+                                  rect.bottom - layout["tile_label_offset_y"]))
+            pygame.draw.rect(surface, Colors.MID_GRAY, rect, 1)
+        pygame.draw.rect(surface, Colors.AMBER, self.rects[self.app.current_page], 2)
+        
+        width = self.app.layout.width
+        bar_y = self.content.bottom
+        text_y = bar_y + layout["nav_text_offset_y"]
+        pygame.draw.rect(surface, Colors.DARK_GRAY, (0, bar_y, width, layout["nav_height"]))
+        pygame.draw.line(surface, Colors.MID_GRAY, (0, bar_y), (width, bar_y))
+        title = TextCache.get(font, f"{T('dashboard')} - {T('dashboard_help')}", Colors.AMBER)
+        surface.blit(title, (layout["nav_x"], text_y))
+        budget = TextCache.get(font, f"{self.frame_cost * 1000:.1f} / {self.budget * 1000:.0f} ms",
+                               Colors.LIGHT_GRAY)
+        surface.blit(budget, (width - budget.get_width() - layout["margin_x"], text_y))
+    
+    def report(self) -> Dict[str, Any]:
+        """Rendus par page, coût moyen par frame et tuiles reportées"""
+        return {
+            "frames": self.frames,
+            "mean_frame_ms": 1000.0 * self._cost_sum / self.frames if self.frames else 0.0,
+            "deferred": self.deferred,
+            "renders": list(self.renders),
+            "cost_ms": [1000.0 * cost for cost in self.cost],
+        }
+
+
 # =============================================================================
 # APPLICATION PRINCIPALE
 # =============================================================================
@@ -1038,95 +2604,423 @@ class PageConfig(BasePage):
 class LPSDuoProApp:
     """Application principale LPS DUO PRO"""
     
-    def __init__(self):
+    def __init__(self, adaptive: bool = True, eeprom_path: Optional[str] = None,
+                 dashboard: bool = False, size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT),
+                 telemetry_port: Optional[int] = None, seed: Optional[int] = None,
+                 fault_log_path: Optional[str] = None, alloc_trace: bool = False,
+                 remote_dir: Optional[str] = None):
+        init_start = time.perf_counter()
         pygame.init()
         pygame.display.set_caption("LPS DUO PRO - Simulateur V92")
         
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
+        self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        self.scheduler = FrameScheduler(adaptive=adaptive)
         self.running = True
         
-        # Fonts
-        self.font_small = pygame.font.Font(None, 20)
-        self.font_medium = pygame.font.Font(None, 28)
-        self.font_large = pygame.font.Font(None, 36)
-        self.font_xlarge = pygame.font.Font(None, 72)
-        
-        # Simulateur de données
-        self.simulator = DataSimulator()
-        
-        # Pages
-        self.pages: List[BasePage] = [
-            PageEcoute(self),
-            PageDetails(self),
-            PageHealth(self),
-            PageSession(self),
-            PageConfig(self),
+        # Simulateur de données (EEPROM émulée persistée si un chemin est donné,
+        # graine affichée au démarrage pour rejouer la session avec --seed)
+        persistence = EnergyPersistence(eeprom_path) if eeprom_path else None
+        self.simulator = DataSimulator(persistence, seed=seed)
+        # loadLanguage(): langue de la session précédente avant toute mise en page
+        if persistence is not None and persistence.language() is not None:
+            Translations.set_language(persistence.language())
+        
+        # Géométrie résolue pour la taille de l'écran (polices comprises)
+        self.layout = LayoutEngine(PAGE_LAYOUTS)
+        self._font_scale: Optional[float] = None
+        self.layout.resolve(self.screen.get_size(), Translations.get_current_language())
+        self._load_fonts()
+        # Journal des fautes de toutes les sessions (en mémoire sans chemin)
+        self.fault_log = FaultLog(fault_log_path)
+        
+        # Sonification des rails (touche M)
+        self.audio = AudioSonifier(self.simulator.synth.ring)
+        
+        # Allocations par page et par frame dessinée (--alloc-trace): tas Python
+        # et NumPy via tracemalloc, surfaces créées et textes rastérisés par compteurs
+        self.allocations: Optional[AllocationTracker] = None
+        if alloc_trace:
+            self.allocations = AllocationTracker({
+                "surfaces": lambda: SurfacePool.created,
+                "texts": lambda: TextCache.renders,
+            })
+            self.allocations.start()
+        
+        # Télémétrie locale (--telemetry): flux WebSocket, instantané HTTP, pilotage
+        # (jeton LPS_TELEMETRY_TOKEN ou tiré au lancement; fichiers dans remote_dir seul)
+        self.telemetry: Optional[TelemetryServer] = None
+        self.remote_dir = remote_dir
+        self._remote_event = pygame.event.custom_type()
+        if telemetry_port is not None:
+            from lps_core import telemetry
+            server = telemetry.TelemetryServer(port=telemetry_port,
+                                               token=os.environ.get("LPS_TELEMETRY_TOKEN"))
+            # Une commande réveille la boucle comme une entrée (SDL_PushEvent, multi-thread)
+            server.on_command = lambda: pygame.event.post(pygame.event.Event(self._remote_event))
+            try:
+                port = server.start()
+            except OSError as exc:
+                print(f"Télémétrie indisponible: {exc}")
+            else:
+                self.telemetry = server
+                print(f"Télémétrie: ws://{server.host}:{port}/stream | "
+                      f"ws://{server.host}:{port}/control | "
+                      f"http://{server.host}:{port}/snapshot")
+                print(f"Pilotage: Authorization: Bearer {server.token}")
+        
+        # Pilotage distant: commande → action(**arguments) → résultat JSON
+        self.remote_commands: Dict[str, Callable[..., Any]] = {
+            "start": self.remote_start,
+            "page": self.remote_page,
+            "voltage": self.remote_voltage,
+            "mode": self.remote_mode,
+            "language": self.remote_language,
+            "status": self.remote_status,
+            "checkpoint": self.remote_checkpoint,
+            "restore": self.remote_restore,
+            "quit": self.quit,
+        }
+        self._captures: List[RemoteCommand] = []   # Servies après le rendu de la frame
+        
+        # Raccourcis clavier (hors écran boot): touche → action
+        self.keymap: Dict[int, Callable[[], Any]] = {
+            pygame.K_ESCAPE: self.quit,
+            pygame.K_l: self.cycle_language,
+            pygame.K_t: self.simulator.next_time_scale,
+            pygame.K_m: self.audio.toggle,
+            pygame.K_p: self.toggle_purist,
+            pygame.K_d: self.toggle_dashboard,
+        }
+        
+        # Pages: construites à la première visite
+        self.page_classes: List[type] = [
+            PageEcoute,
+            PageDetails,
+            PageHealth,
+            PageSession,
+            PageConfig,
+            PageSpectrum,
+            PageSetting,
+            PageTrend,
+            PageQuality,
+            PageHistory,
         ]
+        self.pages: List[Optional[BasePage]] = [None] * len(self.page_classes)
         self.current_page = 0
+        # Gestes tactiles (swipe entre pages, appui long, glisser)
+        self.gestures = GestureRecognizer(self.layout.size)
+        # Mosaïque de toutes les pages (touche D)
+        self.dashboard = Dashboard(self)
+        self.dashboard.active = dashboard
+        
+        # Touches 1-9 puis 0 pour la dixième page; au-delà, pages au swipe
+        for index in range(min(len(self.page_classes), 10)):
+            go = lambda i=index: self.navigate(i)
+            self.keymap[getattr(pygame, f"K_{(index + 1) % 10}")] = go
+            self.keymap[getattr(pygame, f"K_KP{(index + 1) % 10}")] = go
+        
+        self._nav_labels: Tuple[Any, List[str]] = (None, [])
         
         # État boot
         self.boot_screen = True
         self.boot_start = time.time()
+        
+        # Temps de démarrage (s): import module, init app, première frame
+        self.startup_times: Dict[str, float] = {
+            "import": IMPORT_TIME_S,
+            "init": time.perf_counter() - init_start,
+        }
     
-    def handle_events(self):
-        """Gestion des événements"""
-        for event in pygame.event.get():
+    def _load_fonts(self):
+        """Polices à l'échelle de l'écran (rechargées seulement si l'échelle change)"""
+        if self.layout.scale == self._font_scale:
+            return
+        self._font_scale = self.layout.scale
+        self.font_small = pygame.font.Font(None, self.layout.font_size("small"))
+        self.font_medium = pygame.font.Font(None, self.layout.font_size("medium"))
+        self.font_large = pygame.font.Font(None, self.layout.font_size("large"))
+        self.font_xlarge = pygame.font.Font(None, self.layout.font_size("xlarge"))
+    
+    def apply_layout(self):
+        """Redimensionnement ou changement de langue: seul moment où la géométrie est refaite"""
+        if not self.layout.resolve(self.screen.get_size(), Translations.get_current_language()):
+            return
+        self._load_fonts()
+        self.gestures.size = self.layout.size
+        StaticCache.clear()
+        TextCache.clear()
+        for page in self.pages:
+            if page is not None:
+                page.relayout()
+        self.dashboard.relayout()
+    
+    def resize(self, size: Tuple[int, int]):
+        """Nouvelle taille de fenêtre"""
+        if tuple(size) != self.screen.get_size():
+            self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        self.apply_layout()
+    
+    def get_page(self, index: int) -> BasePage:
+        """Page à l'index donné, instanciée au premier appel"""
+        page = self.pages[index]
+        if page is None:
+            page = self.pages[index] = self.page_classes[index](self)
+        return page
+    
+    def draw_page(self, index: int, surface: pygame.Surface):
+        """Dessine une page, mesurée sous son nom de layout si le suivi est actif"""
+        page = self.get_page(index)
+        if self.allocations is None:
+            page.draw(surface)
+        else:
+            self.allocations.begin(page.LAYOUT)
+            page.draw(surface)
+            self.allocations.end(page.LAYOUT)
+    
+    def navigate(self, index: int):
+        """Affiche la page d'index donné (quitte le tableau de bord)"""
+        self.current_page = index
+        self.dashboard.active = False
+    
+    def quit(self):
+        self.running = False
+    
+    def toggle_dashboard(self):
+        self.dashboard.toggle()
+    
+    def toggle_purist(self):
+        """Mode purist (appui long 3 s sur le firmware): écrans éteints"""
+        self.simulator.set_purist(not self.simulator.purist)
+    
+    def cycle_language(self):
+        """cycleLanguage(): langue suivante, sauvée aussitôt"""
+        Translations.next_language()
+        self.save_language()
+    
+    def save_language(self):
+        """saveLanguage(): EEPROM.update, aucune écriture si la langue n'a pas changé"""
+        if self.simulator.persistence is not None:
+            self.simulator.persistence.save_language(Translations.get_current_language())
+    
+    # --- Pilotage distant (appliqué entre deux frames) ---
+    
+    def apply_remote_commands(self) -> bool:
+        """Applique en lot les commandes reçues depuis la frame précédente
+        
+        Retourne True si une capture attend le rendu de cette frame.
+        """
+        if self.telemetry is None:
+            return False
+        frame = self.scheduler.frames
+        for command in self.telemetry.poll_commands():
+            if command.name == "capture":
+                self._captures.append(command)
+                continue
+            action = self.remote_commands.get(command.name)
+            if action is None:
+                self.telemetry.reply(command, error=f"unknown command: {command.name}",
+                                     frame=frame)
+                continue
+            try:
+                result = action(**command.args)
+            except (KeyError, ValueError, IndexError, TypeError, OSError) as exc:
+                self.telemetry.reply(command, error=f"{type(exc).__name__}: {exc}", frame=frame)
+            else:
+                self.telemetry.reply(command, result, frame=frame)
+        return bool(self._captures)
+    
+    def complete_captures(self):
+        """Captures demandées: image de la frame qui vient d'être dessinée"""
+        for command in self._captures:
+            path = command.args.get("path")
+            try:
+                if path:
+                    pygame.image.save(self.screen, self.remote_path(path, create=True))
+                    result = {"path": path}
+                else:
+                    buffer = io.BytesIO()
+                    pygame.image.save(self.screen, buffer, "capture.png")
+                    result = {"png": base64.b64encode(buffer.getvalue()).decode("ascii")}
+            except (pygame.error, OSError, ValueError) as exc:
+                self.telemetry.reply(command, error=str(exc), frame=self.scheduler.frames)
+                continue
+            result["size"] = list(self.screen.get_size())
+            self.telemetry.reply(command, result, frame=self.scheduler.frames)
+        self._captures.clear()
+    
+    def remote_start(self) -> Dict[str, Any]:
+        """Quitte l'écran de démarrage (ENTER)"""
+        self.boot_screen = False
+        return self.remote_status()
+    
+    def remote_page(self, index: int) -> Dict[str, Any]:
+        """Page d'index donné (0 = ÉCOUTE), y compris au-delà des touches 1-9 et 0"""
+        if not 0 <= index < len(self.page_classes):
+            raise IndexError(f"page {index} out of range")
+        self.navigate(index)
+        return {"page": index}
+    
+    def remote_voltage(self, rail: str, volts: float) -> Dict[str, Any]:
+        """Consigne ramenée au pas digipot le plus proche, comme la page RÉGLAGE"""
+        pos = voltage_to_digipot(float(volts))
+        self.simulator.set_digipot(rail, pos)
+        return {"rail": rail, "digipot": pos, "volts": digipot_to_voltage(pos)}
+    
+    def remote_mode(self, mode: str, rails: str = "AB") -> Dict[str, Any]:
+        """Injection d'un SimulationMode sur les rails indiqués"""
+        self.simulator.set_simulation_mode(SimulationMode[mode], rails)
+        return {"mode": mode, "rails": rails}
+    
+    def remote_language(self, language: str) -> Dict[str, Any]:
+        Translations.set_language(Language[language])
+        self.save_language()
+        return {"language": language}
+    
+    def remote_path(self, name: str, create: bool = False) -> str:
+        """Chemin d'un fichier de pilotage, toujours dans remote_dir
+        
+        Seul un nom de fichier simple est accepté: ni chemin absolu, ni
+        sous-dossier, ni "..". Un appelant distant ne lit ni n'écrit
+        ailleurs que dans ce dossier.
+        """
+        if self.remote_dir is None:
+            raise ValueError("remote file access disabled (no remote directory)")
+        if (not isinstance(name, str) or name in ("", ".", "..") or
+                os.path.basename(name) != name or "\\" in name or os.path.isabs(name)):
+            raise ValueError(f"invalid file name: {name!r} (plain name inside the remote directory)")
+        root = os.path.realpath(self.remote_dir)
+        if create:
+            os.makedirs(root, exist_ok=True)
+        path = os.path.realpath(os.path.join(root, name))
+        if os.path.dirname(path) != root:
+            raise ValueError(f"invalid file name: {name!r} (leaves the remote directory)")
+        return path
+    
+    def remote_checkpoint(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """Instantané du simulateur, écrit dans remote_dir ou retourné en base64"""
+        blob = self.simulator.snapshot()
+        if path:
+            with open(self.remote_path(path, create=True), "wb") as f:
+                f.write(blob)
+            return {"path": path, "bytes": len(blob)}
+        return {"state": base64.b64encode(blob).decode("ascii"), "bytes": len(blob)}
+    
+    def remote_restore(self, path: Optional[str] = None, state: Optional[str] = None) -> Dict[str, Any]:
+        """Reprend un instantané (fichier de remote_dir ou base64) à cette frame
+        
+        Un instantané n'est que des données (npz + JSON, sans pickle): un
+        état reçu du réseau est validé puis recopié, jamais exécuté.
+        """
+        if path:
+            with open(self.remote_path(path), "rb") as f:
+                blob = f.read()
+        elif state:
+            blob = base64.b64decode(state, validate=True)
+        else:
+            raise ValueError("path or state required")
+        self.simulator.restore(blob)
+        return {"sim_time": self.simulator.sim_time, "frame": self.simulator.frame_count}
+    
+    def remote_status(self) -> Dict[str, Any]:
+        return {
+            "frame": self.scheduler.frames,
+            "seed": self.simulator.seed,
+            "boot": self.boot_screen,
+            "page": self.current_page,
+            "pages": len(self.page_classes),
+            "dashboard": self.dashboard.active,
+            "purist": self.simulator.purist,
+            "language": Translations.get_current_language().name,
+            "mode": self.simulator.data.simulation_mode.name,
+        }
+    
+    def handle_events(self, events: Optional[List[pygame.event.Event]] = None):
+        """Gestion des événements (mouvements souris fusionnés par frame)"""
+        events = pygame.event.get() if events is None else events
+        for event in coalesce_motion(events):
             if event.type == pygame.QUIT:
                 self.running = False
             
+            elif event.type == pygame.VIDEORESIZE:
+                self.resize(event.size)
+            
             elif event.type == pygame.KEYDOWN:
                 if self.boot_screen:
                     if event.key == pygame.K_RETURN:
                         self.boot_screen = False
                 else:
-                    if event.key == pygame.K_ESCAPE:
-                        self.running = False
-                    elif event.key in (pygame.K_1, pygame.K_KP1):
-                        self.current_page = 0
-                    elif event.key in (pygame.K_2, pygame.K_KP2):
-                        self.current_page = 1
-                    elif event.key in (pygame.K_3, pygame.K_KP3):
-                        self.current_page = 2
-                    elif event.key in (pygame.K_4, pygame.K_KP4):
-                        self.current_page = 3
-                    elif event.key in (pygame.K_5, pygame.K_KP5):
-                        self.current_page = 4
-                    elif event.key == pygame.K_l:
-                        Translations.next_language()
+                    action = self.keymap.get(event.key)
+                    if action is not None:
+                        action()
             
-            # Passer les événements à la page courante
-            if not self.boot_screen and self.current_page < len(self.pages):
-                self.pages[self.current_page].handle_event(event)
+            elif event.type == pygame.MOUSEBUTTONUP and self.simulator.purist:
+                # Comme le firmware: un clic quitte le mode purist
+                self.simulator.set_purist(False)
+                continue
+            
+            # Passer les événements à la page courante (écrans éteints en purist,
+            # pages en lecture seule dans le tableau de bord)
+            if (not self.boot_screen and not self.simulator.purist and not self.dashboard.active
+                    and self.current_page < len(self.pages)):
+                self.get_page(self.current_page).handle_event(event)
+        
+        if not self.boot_screen and not self.simulator.purist:
+            for gesture in self.gestures.process(events, time.perf_counter()):
+                self.handle_gesture(gesture)
+    
+    def handle_gesture(self, gesture: Gesture):
+        """La page courante d'abord; un swipe non consommé change de page"""
+        if self.dashboard.active:
+            # Tableau de bord: un tap ouvre la page de la tuile
+            if gesture.kind == "tap":
+                index = self.dashboard.page_at(gesture.pos)
+                if index is not None:
+                    self.navigate(index)
+            return
+        if self.get_page(self.current_page).handle_gesture(gesture):
+            if gesture.kind == "drag_start":
+                self.gestures.claim(gesture.contact)
+            return
+        if gesture.kind == "swipe":
+            # Doigt vers la gauche: page suivante
+            self.navigate((self.current_page - gesture.direction) % len(self.page_classes))
     
     def update(self, dt: float):
         """Mise à jour logique"""
         if not self.boot_screen:
             self.simulator.update(dt)
-            if self.current_page < len(self.pages):
-                self.pages[self.current_page].update(dt)
+            self.fault_log.ingest(self.simulator)
+            self.audio.pump()
+            if self.telemetry is not None:
+                self.telemetry.publish(self.simulator)
+            if self.dashboard.active:
+                self.dashboard.update(dt)
+            elif self.current_page < len(self.pages):
+                self.get_page(self.current_page).update(dt)
     
     def draw_boot_screen(self):
         """Dessine l'écran de démarrage"""
         self.screen.fill(Colors.BLACK)
+        layout = self.layout["app"]
+        center_x = self.layout.center_x
         
         # Logo / Titre
         title = "LPS DUO PRO"
         title_surf = self.font_xlarge.render(title, True, Colors.AMBER)
         self.screen.blit(title_surf, 
-                        (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 150))
+                        (center_x - title_surf.get_width() // 2, layout["boot_title_y"]))
         
         # Sous-titre
         subtitle = "Alimentation Linéaire Audiophile"
         sub_surf = self.font_medium.render(subtitle, True, Colors.LIGHT_GRAY)
         self.screen.blit(sub_surf,
-                        (SCREEN_WIDTH // 2 - sub_surf.get_width() // 2, 230))
+                        (center_x - sub_surf.get_width() // 2, layout["boot_subtitle_y"]))
         
         # Version
         version = "Simulateur PyGame V92"
         ver_surf = self.font_small.render(version, True, Colors.MID_GRAY)
         self.screen.blit(ver_surf,
-                        (SCREEN_WIDTH // 2 - ver_surf.get_width() // 2, 280))
+                        (center_x - ver_surf.get_width() // 2, layout["boot_version_y"]))
         
         # Animation de chargement
         elapsed = time.time() - self.boot_start
@@ -1134,66 +3028,201 @@ class LPSDuoProApp:
         loading = f"Initialisation{dots}"
         load_surf = self.font_medium.render(loading, True, Colors.GREEN)
         self.screen.blit(load_surf,
-                        (SCREEN_WIDTH // 2 - load_surf.get_width() // 2, 350))
+                        (center_x - load_surf.get_width() // 2, layout["boot_loading_y"]))
         
         # Instruction
         instruction = "Appuyez sur ENTER pour démarrer"
         inst_surf = self.font_small.render(instruction, True, Colors.AMBER)
         self.screen.blit(inst_surf,
-                        (SCREEN_WIDTH // 2 - inst_surf.get_width() // 2, 420))
+                        (center_x - inst_surf.get_width() // 2, layout["boot_help_y"]))
+    
+    def draw_purist_screen(self):
+        """Mode purist: écrans OLED éteints, simple rappel discret"""
+        center_y = self.layout.height // 2
+        offsets = self.layout["app"]["purist_offsets_y"]
+        for text, dy in zip((T("purist"), T("purist_help")), offsets):
+            surf = TextCache.get(self.font_small, text, Colors.MID_GRAY)
+            self.screen.blit(surf, (self.layout.center_x - surf.get_width() // 2, center_y + dy))
     
     def draw_nav_bar(self):
         """Dessine la barre de navigation"""
-        nav_y = SCREEN_HEIGHT - 35
+        layout = self.layout["app"]
+        width = self.layout.width
+        nav_y = self.layout.height - layout["nav_height"]
+        text_y = nav_y + layout["nav_text_offset_y"]
         pygame.draw.rect(self.screen, Colors.DARK_GRAY,
-                        (0, nav_y, SCREEN_WIDTH, 35))
+                        (0, nav_y, width, layout["nav_height"]))
         pygame.draw.line(self.screen, Colors.MID_GRAY,
-                        (0, nav_y), (SCREEN_WIDTH, nav_y))
-        
-        pages = [
-            T("page_listen"), T("page_details"), T("page_health"),
-            T("page_session"), T("page_config")
-        ]
-        
-        x = 20
-        for i, name in enumerate(pages):
+                        (0, nav_y), (width, nav_y))
+        
+        # Libellés complets s'ils tiennent, sinon seul celui de la page courante;
+        # recalculés seulement quand la page, la langue ou la police change
+        gap = layout["nav_gap_x"]
+        key = (self.current_page, Translations.get_current_language(), self.font_small, width)
+        if self._nav_labels[0] != key:
+            pages = [
+                T("page_listen"), T("page_details"), T("page_health"),
+                T("page_session"), T("page_config"), T("page_spectrum"),
+                T("page_setting"), T("page_trend"), T("page_quality"),
+                T("page_history"),
+            ]
+            labels = [f"[{(i + 1) % 10}] {name}" for i, name in enumerate(pages)]
+            labels_width = sum(self.font_small.size(text)[0] + gap for text in labels)
+            if labels_width > width - layout["nav_reserve_width"]:
+                labels = [text if i == self.current_page else f"[{(i + 1) % 10}]"
+                          for i, text in enumerate(labels)]
+            self._nav_labels = (key, labels)
+        labels = self._nav_labels[1]
+        
+        x = layout["nav_x"]
+        for i, text in enumerate(labels):
             color = Colors.AMBER if i == self.current_page else Colors.LIGHT_GRAY
-            text = f"[{i+1}] {name}"
-            text_surf = self.font_small.render(text, True, color)
-            self.screen.blit(text_surf, (x, nav_y + 10))
-            x += text_surf.get_width() + 20
+            text_surf = TextCache.get(self.font_small, text, color)
+            self.screen.blit(text_surf, (x, text_y))
+            x += text_surf.get_width() + gap
+        
+        # Indicateur audio: moteur et nombre de trous
+        if self.audio.active:
+            text = f"AUDIO {self.audio.engine} U:{self.audio.underruns}"
+            text_surf = TextCache.get(self.font_small, text, Colors.GREEN)
+            self.screen.blit(text_surf, (width - text_surf.get_width() - layout["margin_x"], text_y))
     
     def draw(self):
         """Rendu graphique"""
+        self.apply_layout()
         self.screen.fill(Colors.BLACK)
         
         if self.boot_screen:
             self.draw_boot_screen()
+        elif self.simulator.purist:
+            self.draw_purist_screen()
+        elif self.dashboard.active:
+            self.dashboard.draw(self.screen)
         else:
             # Page courante
             if self.current_page < len(self.pages):
-                self.pages[self.current_page].draw(self.screen)
+                self.draw_page(self.current_page, self.screen)
             
             # Barre de navigation
-            self.draw_nav_bar()
+            if self.allocations is None:
+                self.draw_nav_bar()
+            else:
+                self.allocations.begin("nav")
+                self.draw_nav_bar()
+                self.allocations.end("nav")
         
+        if self.allocations is not None:
+            self.allocations.end_frame()
         pygame.display.flip()
     
+    def display_state(self) -> Optional[tuple]:
+        """État affiché complet pour l'ordonnanceur (None: rendu à chaque frame)"""
+        if self.boot_screen:
+            return ("boot", int((time.time() - self.boot_start) * 2) % 4)
+        if self.simulator.purist:
+            return ("purist", Translations.get_current_language())
+        if self.dashboard.active:
+            state = self.dashboard.display_state()
+        else:
+            page_state = self.get_page(self.current_page).display_state()
+            state = (None if page_state is None else
+                     (self.current_page, Translations.get_current_language(), page_state))
+        if state is None or self.audio.active or self.gestures.contacts:
+            # Page animée (ou tuile à redessiner), audio qui exige un synthé
+            # alimenté en continu, ou contact en cours (appui long à détecter à temps)
+            return None
+        return state
+    
+    def print_render_report(self):
+        """Affiche les frames sautées et l'économie CPU mesurée"""
+        report = self.scheduler.report()
+        print(f"Rendu: {report['rendered']}/{report['frames']} frames "
+              f"({report['skipped_pct']:.0f}% sautées) | CPU {report['cpu_pct']:.1f}% "
+              f"(cadence fixe estimée {report['fixed_rate_cpu_pct']:.1f}%)")
+        print(f"Latence entrée → affichage: moy {report['latency_mean_ms']:.1f} ms | "
+              f"max {report['latency_max_ms']:.1f} ms")
+        report = self.dashboard.report()
+        if report["frames"]:
+            renders = " ".join(f"{n}:{count}/{cost:.1f}ms" for n, (count, cost)
+                               in enumerate(zip(report["renders"], report["cost_ms"]), 1))
+            print(f"Tableau de bord: {report['frames']} frames | moy {report['mean_frame_ms']:.1f} ms/frame "
+                  f"(budget {self.dashboard.budget * 1000:.0f} ms) | {report['deferred']} tuiles "
+                  f"reportées | rendus/coût par page {renders}")
+    
+    def print_eeprom_report(self):
+        """Affiche l'usure EEPROM cumulée et la durée de vie projetée"""
+        if self.simulator.persistence is None:
+            return
+        report = self.simulator.persistence.report()
+        print(f"EEPROM: {report['saves']} sauvegardes | {report['byte_writes']} octets écrits "
+              f"(session) | cellule max {report['max_cell_wear']} cycles "
+              f"({report['wear_pct']:.3f}%) | durée de vie projetée "
+              f"{report['lifetime_hours']:.0f} h sur {report['simulated_hours']:.1f} h simulées")
+    
+    def print_fault_log_report(self):
+        """Affiche les fautes journalisées (session et total) après écriture"""
+        self.fault_log.flush()
+        report = self.fault_log.report()
+        print(f"Journal des fautes: session {report['session']} | {report['events']} événements "
+              f"en {report['batches']} lots | {report['rows']} au total")
+    
+    def print_allocation_report(self):
+        """Affiche les allocations moyennes et maximales par frame, page par page"""
+        if self.allocations is None:
+            return
+        self.allocations.stop()
+        print(f"Allocations ({self.allocations.frames} frames dessinées): "
+              f"surfaces créées {SurfacePool.created}, réutilisées {SurfacePool.reused} | "
+              f"textes rendus {TextCache.renders}")
+        for name, entry in sorted(self.allocations.report().items()):
+            print(f"  {name:10s} {entry['frames']:6d} frames | alloué {entry['allocated'] / 1024:7.1f} Ko "
+                  f"(max {entry['allocated_max'] / 1024:.1f}) | conservé {entry['retained']:+.0f} o | "
+                  f"surfaces {entry['surfaces']:.2f} | textes {entry['texts']:.2f}")
+    
+    def print_startup_report(self):
+        """Affiche les temps de démarrage en console"""
+        times = self.startup_times
+        print(f"Démarrage: import {times['import'] * 1000:.1f} ms | "
+              f"init {times['init'] * 1000:.1f} ms | "
+              f"première frame {times['first_frame'] * 1000:.1f} ms | "
+              f"graine {self.simulator.seed}")
+    
     def run(self):
         """Boucle principale"""
         last_time = time.time()
+        frame_start = time.perf_counter()
         
         while self.running:
+            events = self.scheduler.wait_events()
             current_time = time.time()
             dt = current_time - last_time
             last_time = current_time
             
-            self.handle_events()
+            cpu_start = time.process_time()
+            self.handle_events(events)
+            capture = self.apply_remote_commands()
             self.update(dt)
-            self.draw()
+            if self.scheduler.should_draw(self.display_state(), bool(events)) or capture:
+                self.draw()
+                self.scheduler.record_render(time.process_time() - cpu_start)
+                self.scheduler.record_latency()
+            if capture:
+                self.complete_captures()
             
-            self.clock.tick(TARGET_FPS)
-        
+            if "first_frame" not in self.startup_times:
+                self.startup_times["first_frame"] = time.perf_counter() - frame_start
+                self.print_startup_report()
+        
+        self.print_render_report()
+        self.print_allocation_report()
+        if self.telemetry is not None:
+            self.telemetry.stop()
+            print(f"Télémétrie: {self.telemetry.report()}")
+        self.simulator.close()
+        self.print_eeprom_report()
+        self.print_fault_log_report()
+        self.fault_log.close()
+        self.audio.stop()
         pygame.quit()
 
 
@@ -1267,14 +3296,96 @@ class StaticCache:
     
     @classmethod
     def clear(cls):
-        """Vide le cache"""
+        """Vide le cache (surfaces rendues au pool pour la prochaine création)"""
+        for surface in cls._cache.values():
+            SurfacePool.release(surface)
+        cls._cache.clear()
+
+
+class SurfacePool:
+    """Surfaces hors écran réutilisées par taille et format
+    
+    `acquire()` rend une surface libérée de même taille, mêmes drapeaux
+    (SRCALPHA) et même format de pixels, ou en crée une: fonds de graphe,
+    canevas et tuiles du tableau de bord. Le contenu n'est pas effacé,
+    l'appelant la remplit. Un redimensionnement aller-retour ou un
+    changement de langue ne réalloue donc aucun pixel.
+    """
+    
+    _free: Dict[tuple, List[pygame.Surface]] = {}
+    _formats: Dict[int, pygame.Surface] = {}
+    created = 0
+    reused = 0
+    
+    @staticmethod
+    def _key(size: Tuple[int, int], flags: int, like: pygame.Surface) -> tuple:
+        return (tuple(size), flags & pygame.SRCALPHA, like.get_bitsize(), like.get_masks())
+    
+    @classmethod
+    def acquire(cls, size: Tuple[int, int], flags: int = 0,
+                like: Optional[pygame.Surface] = None) -> pygame.Surface:
+        """Surface de la taille donnée, au format de like (format par défaut sinon)"""
+        if like is None:
+            like = cls._formats.get(flags)
+            if like is None:
+                like = cls._formats[flags] = pygame.Surface((1, 1), flags)
+        free = cls._free.get(cls._key(size, flags, like))
+        if free:
+            cls.reused += 1
+            return free.pop()
+        cls.created += 1
+        return pygame.Surface(size, flags, like)
+    
+    @classmethod
+    def release(cls, surface: Optional[pygame.Surface]):
+        """Rend une surface au pool (None ignoré)"""
+        if surface is not None:
+            key = cls._key(surface.get_size(), surface.get_flags(), surface)
+            cls._free.setdefault(key, []).append(surface)
+
+
+class TextCache:
+    """Textes rendus, partagés par valeur entre pages, tuiles et barre de navigation
+    
+    pygame.font ne rend pas dans une surface existante: un texte est gardé
+    par (police, texte, couleur) et rastérisé une seule fois par valeur
+    affichée, quelle que soit la page qui le dessine. Au-delà de LIMIT
+    entrées, les plus anciennes sont évincées; vidé au changement de
+    taille ou de langue (polices et libellés changent).
+    """
+    
+    LIMIT = 2048
+    _cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+    renders = 0
+    
+    @classmethod
+    def get(cls, font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (font, text, color)
+        surf = cls._cache.get(key)
+        if surf is None:
+            if len(cls._cache) >= cls.LIMIT:
+                del cls._cache[next(iter(cls._cache))]
+            surf = cls._cache[key] = font.render(text, True, color)
+            cls.renders += 1
+        return surf
+    
+    @classmethod
+    def clear(cls):
         cls._cache.clear()
 
 
+IMPORT_TIME_S = time.perf_counter() - _IMPORT_START
+
+
 # =============================================================================
 # POINT D'ENTRÉE
 # =============================================================================
 
+DEFAULT_EEPROM_PATH = os.path.join(os.path.expanduser("~"), ".lps_duo_pro", "eeprom.bin")
+DEFAULT_FAULT_LOG_PATH = os.path.join(os.path.expanduser("~"), ".lps_duo_pro", "faults.db")
+DEFAULT_REMOTE_DIR = os.path.join(os.path.expanduser("~"), ".lps_duo_pro", "remote")
+
+
 def main():
     """Point d'entrée principal"""
     print("=" * 60)
@@ -1286,13 +3397,61 @@ def main():
     print("L'interface production tourne sur ESP32-8048S050C avec LVGL.")
     print()
     print("Raccourcis:")
-    print("  1-5    : Navigation entre les pages")
+    print("  1-9, 0 : Navigation entre les pages")
     print("  L      : Changer la langue")
+    print("  S      : Oscilloscope / spectre (page ÉCOUTE)")
+    print("  T      : Accélérer le temps simulé (x1/x10/x60/x600)")
+    print("  M      : Écouter les rails (A gauche, B droite)")
+    print("  D      : Tableau de bord (toutes les pages en mosaïque)")
     print("  ESC    : Quitter")
     print("  ENTER  : Démarrer (écran boot)")
     print()
     
-    app = LPSDuoProApp()
+    # --eeprom CHEMIN: image EEPROM (énergie, uptime, consignes); --no-eeprom: session vierge
+    eeprom_path: Optional[str] = DEFAULT_EEPROM_PATH
+    if "--no-eeprom" in sys.argv:
+        eeprom_path = None
+    elif "--eeprom" in sys.argv[:-1]:
+        eeprom_path = sys.argv[sys.argv.index("--eeprom") + 1]
+    
+    # --faults CHEMIN: journal des fautes (SQLite); --no-faults: historique de la session seule
+    fault_log_path: Optional[str] = DEFAULT_FAULT_LOG_PATH
+    if "--no-faults" in sys.argv:
+        fault_log_path = None
+    elif "--faults" in sys.argv[:-1]:
+        fault_log_path = sys.argv[sys.argv.index("--faults") + 1]
+    
+    # --fixed-fps: ancienne boucle à cadence fixe (référence des mesures CPU)
+    # --size LxH: autre écran (1024x600, 480x272...), fenêtre redimensionnable ensuite
+    size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    if "--size" in sys.argv[:-1]:
+        size = tuple(int(v) for v in sys.argv[sys.argv.index("--size") + 1].split("x"))
+    
+    # --telemetry [PORT]: serveur local de télémétrie (port 8765 par défaut)
+    telemetry_port: Optional[int] = None
+    if "--telemetry" in sys.argv:
+        index = sys.argv.index("--telemetry") + 1
+        from lps_core import TELEMETRY_PORT
+        telemetry_port = TELEMETRY_PORT
+        if index < len(sys.argv) and sys.argv[index].isdigit():
+            telemetry_port = int(sys.argv[index])
+    
+    # --remote-dir DOSSIER: seul dossier des fichiers checkpoint/restore/capture du pilotage
+    remote_dir = DEFAULT_REMOTE_DIR
+    if "--remote-dir" in sys.argv[:-1]:
+        remote_dir = sys.argv[sys.argv.index("--remote-dir") + 1]
+    
+    # --seed N: aléa reproductible (graine affichée au démarrage sinon)
+    seed: Optional[int] = None
+    if "--seed" in sys.argv[:-1]:
+        seed = int(sys.argv[sys.argv.index("--seed") + 1])
+    
+    # --dashboard: démarrer sur la mosaïque de toutes les pages
+    # --alloc-trace: allocations par page et par frame (tracemalloc, rapport en sortie)
+    app = LPSDuoProApp(adaptive="--fixed-fps" not in sys.argv, eeprom_path=eeprom_path,
+                       dashboard="--dashboard" in sys.argv, size=size,
+                       telemetry_port=telemetry_port, seed=seed, fault_log_path=fault_log_path,
+                       alloc_trace="--alloc-trace" in sys.argv, remote_dir=remote_dir)
     app.run()
 
 